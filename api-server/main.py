@@ -976,6 +976,52 @@ async def send_monitoring_report(_: bool = Depends(verify_api_key)):
         }
 
 
+@app.get("/api/system/metrics/latency")
+async def get_latency_metrics(merge: bool = True, _: bool = Depends(verify_api_key)):
+    """구간별 지연 시간 통계 조회 (API 키 인증 필요)
+
+    스케줄러/매매 프로세스가 주기적으로 기록한 스냅샷과 api-server 자체 통계를 반환합니다.
+
+    Args:
+        merge: 프로세스별 통계를 구간 이름 기준으로 병합한 요약 포함 여부
+
+    Returns:
+        프로세스별 구간 통계 (count, mean/p50/p90/p99/max ms)
+    """
+    try:
+        from core.utils.latency_metrics import (
+            get_latency_registry, load_snapshots, merge_snapshots,
+        )
+        registry = get_latency_registry()
+        snapshots = [
+            s for s in load_snapshots(registry.config.snapshot_dir)
+            if s.get('pid') != os.getpid()
+        ]
+        snapshots.append({**registry.snapshot(include_buckets=True), 'service': 'api-server'})
+
+        response = {
+            "success": True,
+            "services": {
+                s.get('service', 'unknown'): {
+                    "timestamp": s.get('timestamp'),
+                    "since": s.get('since'),
+                    "sample_rate": s.get('sample_rate'),
+                    "stages": {
+                        name: {k: v for k, v in data.items() if k not in ('buckets', 'total_us')}
+                        for name, data in s.get('stages', {}).items()
+                    },
+                }
+                for s in snapshots
+            },
+        }
+        if merge:
+            response["merged"] = merge_snapshots(snapshots)
+        return response
+    except Exception as e:
+        logger.error(f"지연 시간 통계 조회 실패: {e}", exc_info=True)
+        return {"success": False, "services": {}, "message": str(e)}
+
+
 @app.get("/api/system/status", response_model=SystemStatus)
 async def get_system_status():
     """실시간 시스템 상태"""
@@ -0,0 +1,6 @@
+"""
+성능 벤치마크 모음
+
+스크리닝/선정/백테스트/실시간 지표/캐시/DB 핫 패스를 합성 데이터로 오프라인 측정합니다.
+실행: python -m benchmarks.run --help
+"""
@@ -0,0 +1,19 @@
+"""
+백테스트 엔진 벤치마크
+"""
+
+from benchmarks.harness import benchmark
+from benchmarks.synthetic import make_universe
+
+BACKTEST_STOCKS = 20
+BACKTEST_DAYS = 500
+
+
+@benchmark("backtest.engine_ma_cross", items=BACKTEST_STOCKS * BACKTEST_DAYS, repeat=3)
+def backtest_engine_run():
+    from core.backtest import BacktestConfig, BacktestEngine, MACrossStrategy
+
+    data = make_universe(BACKTEST_STOCKS, days=BACKTEST_DAYS)
+    engine = BacktestEngine(BacktestConfig())
+    strategy = MACrossStrategy(short_period=5, long_period=20)
+    return lambda: engine.run(strategy, data)
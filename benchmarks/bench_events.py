@@ -0,0 +1,91 @@
+"""
+EventBus 디스패치 벤치마크
+
+- events.publish_drain_*: 대량 틱 발행 후 전부 처리될 때까지 (처리량)
+- events.sparse_latency: 워커가 유휴 상태일 때 한 건 발행 → 핸들러 호출까지 (지연, 건당)
+"""
+
+import asyncio
+from datetime import datetime
+
+from benchmarks.harness import benchmark
+
+EVENTS = 5000
+SPARSE_EVENTS = 50
+
+
+def _price_event(seq: int, event_type=None):
+    from core.events import EventType, PriceEvent
+
+    return PriceEvent(
+        event_id=f"bench-{seq}", event_type=event_type or EventType.PRICE_UPDATE,
+        timestamp=datetime.now(), source="bench", stock_code=f"{seq % 200:06d}", price=float(seq),
+    )
+
+
+def _publish_drain(inline: bool, handlers: int):
+    from core.events import EventBus, EventType
+    from core.events.handler import AsyncEventHandler
+
+    events = [_price_event(seq) for seq in range(EVENTS)]
+
+    async def scenario():
+        done = asyncio.Event()
+        counter = {"n": 0}
+
+        def handle(event):
+            counter["n"] += 1
+            if counter["n"] == EVENTS * handlers:
+                done.set()
+            return True
+
+        bus = EventBus(max_queue_size=EVENTS, max_workers=4)
+        for i in range(handlers):
+            handler = AsyncEventHandler(f"bench-{i}", [EventType.PRICE_UPDATE], handle)
+            bus.subscribe(EventType.PRICE_UPDATE, handler, inline=inline)
+        await bus.start()
+        for event in events:
+            await bus.publish(event)
+        await done.wait()
+        await bus.stop()
+
+    return lambda: asyncio.run(scenario())
+
+
+@benchmark("events.publish_drain_inline", items=EVENTS)
+def events_publish_drain_inline():
+    """inline 핸들러 1개"""
+    return _publish_drain(inline=True, handlers=1)
+
+
+@benchmark("events.publish_drain_tasks", items=EVENTS)
+def events_publish_drain_tasks():
+    """일반 핸들러 2개 (이벤트당 태스크 동시 실행)"""
+    return _publish_drain(inline=False, handlers=2)
+
+
+@benchmark("events.sparse_latency", items=SPARSE_EVENTS)
+def events_sparse_latency():
+    """유휴 워커 상태에서 한 건씩 발행 → 처리 완료 대기 (건당 시간 ≈ 깨움 지연)"""
+    from core.events import EventBus, EventPriority, EventType
+    from core.events.handler import AsyncEventHandler
+
+    async def scenario():
+        handled = asyncio.Event()
+
+        def handle(event):
+            handled.set()
+            return True
+
+        bus = EventBus(max_workers=4)
+        bus.subscribe(EventType.RISK_ALERT, AsyncEventHandler("bench", [EventType.RISK_ALERT], handle), inline=True)
+        await bus.start()
+        for seq in range(SPARSE_EVENTS):
+            event = _price_event(seq, EventType.RISK_ALERT)
+            event.priority = EventPriority.CRITICAL
+            handled.clear()
+            await bus.publish(event)
+            await handled.wait()
+        await bus.stop()
+
+    return lambda: asyncio.run(scenario())
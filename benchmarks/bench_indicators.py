@@ -0,0 +1,93 @@
+"""
+hantu_common 지표 벤치마크
+
+최적화 스윕처럼 파라미터 조합마다 전 종목 지표를 계산하는 부하를 측정합니다.
+(날짜 × 종목) 패널 한 번 계산과 기존 종목별 Indicator 호출을 비교하고,
+VolumeProfile은 bincount 집계와 기존 구간 루프를 비교합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.harness import benchmark
+from benchmarks.synthetic import make_universe
+
+SYMBOLS = 200
+DAYS = 250
+MA_PERIODS = (5, 10, 20, 60)
+RSI_PERIODS = (9, 14, 21)
+PROFILE_SYMBOLS = 20
+
+
+def _sweep(data):
+    from hantu_common.indicators import ATR, RSI, BollingerBands, MovingAverage
+
+    for period in MA_PERIODS:
+        MovingAverage(data).calculate(period, "sma")
+        MovingAverage(data).calculate(period, "wma")
+        BollingerBands(data).calculate(period)
+    for period in RSI_PERIODS:
+        RSI(data).calculate(period)
+        ATR(data).calculate(period)
+
+
+@benchmark("indicators.sweep_panel", items=SYMBOLS)
+def indicators_sweep_panel():
+    """패널 경로: 파라미터 조합마다 전 종목 한 번에 계산"""
+    from hantu_common.indicators import make_panel
+
+    panel = make_panel(make_universe(SYMBOLS, DAYS))
+    return lambda: _sweep(panel)
+
+
+@benchmark("indicators.sweep_per_symbol", items=SYMBOLS, repeat=3)
+def indicators_sweep_per_symbol():
+    """기존 경로: 파라미터 조합 × 종목마다 Indicator 생성/계산"""
+    frames = list(make_universe(SYMBOLS, DAYS).values())
+
+    def run():
+        for df in frames:
+            _sweep(df)
+
+    return run
+
+
+@benchmark("indicators.volume_profile", items=PROFILE_SYMBOLS)
+def indicators_volume_profile():
+    """VolumeProfile bincount 집계 (종목별)"""
+    from hantu_common.indicators import VolumeProfile
+
+    frames = list(make_universe(PROFILE_SYMBOLS, DAYS).values())
+
+    def run():
+        for df in frames:
+            VolumeProfile(df).calculate()
+
+    return run
+
+
+def _legacy_volume_by_price(data: pd.DataFrame, price_levels: int = 50) -> pd.Series:
+    """기존 구간 루프 (봉 × 가격 단위 Python 반복)"""
+    price_min = data['low'].min()
+    price_max = data['high'].max()
+    price_step = (price_max - price_min) / price_levels
+    volume_by_price = pd.Series(0.0, index=np.arange(price_min, price_max, price_step))
+    for i in range(len(data)):
+        price_range = np.arange(data['low'].iloc[i], data['high'].iloc[i], price_step)
+        if len(price_range) > 0:
+            volume_per_level = data['volume'].iloc[i] / len(price_range)
+            for price in price_range:
+                if price in volume_by_price.index:
+                    volume_by_price[price] += volume_per_level
+    return volume_by_price
+
+
+@benchmark("indicators.volume_profile_legacy", items=PROFILE_SYMBOLS, repeat=3)
+def indicators_volume_profile_legacy():
+    frames = list(make_universe(PROFILE_SYMBOLS, DAYS).values())
+
+    def run():
+        for df in frames:
+            _legacy_volume_by_price(df)
+
+    return run
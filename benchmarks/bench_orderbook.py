@@ -0,0 +1,72 @@
+"""
+다종목 호가 분석 벤치마크
+
+합성 10단계 호가로 틱 1회분(전 종목 갱신 + 분석)을 측정합니다.
+배열 호가창(OrderBookArrays) 일괄 분석과 기존 종목별 analyze 호출을 비교합니다.
+"""
+
+from benchmarks.harness import benchmark
+from benchmarks.synthetic import make_orderbooks
+
+SYMBOLS = 500
+
+
+def _orderbook_batch(books):
+    """합성 호가를 디코딩된 H0STASP0 프레임(FrameBatch) 형태로 변환"""
+    from core.api.ws_frame_decoder import TR_ORDERBOOK, FrameBatch
+
+    return FrameBatch(TR_ORDERBOOK, len(books), {
+        "stock_code": tuple(code for code, _, _ in books),
+        "bid_prices": tuple(tuple(p for p, _ in bids) for _, bids, _ in books),
+        "bid_volumes": tuple(tuple(v for _, v in bids) for _, bids, _ in books),
+        "ask_prices": tuple(tuple(p for p, _ in asks) for _, _, asks in books),
+        "ask_volumes": tuple(tuple(v for _, v in asks) for _, _, asks in books),
+    })
+
+
+@benchmark("orderbook.analyze_book", items=SYMBOLS)
+def orderbook_analyze_book():
+    """배열 경로: 프레임 배치 제자리 갱신 + 전 종목 일괄 분석"""
+    from core.indicators.orderbook_analyzer import OrderBookAnalyzer
+    from core.indicators.orderbook_book import OrderBookArrays
+
+    batch = _orderbook_batch(make_orderbooks(SYMBOLS))
+    analyzer = OrderBookAnalyzer()
+    book = OrderBookArrays(capacity=SYMBOLS)
+
+    def run():
+        book.update_batch(batch)
+        analyzer.analyze_book(book)
+
+    return run
+
+
+@benchmark("orderbook.metrics_vectorized", items=SYMBOLS)
+def orderbook_metrics_vectorized():
+    """지표 계산만 (갱신/결과 객체 생성 제외): 불균형, 가중 중간가, 깊이 기울기, 호가벽"""
+    from core.indicators.orderbook_book import OrderBookArrays, compute_metrics, detect_walls
+
+    book = OrderBookArrays(capacity=SYMBOLS)
+    for code, bids, asks in make_orderbooks(SYMBOLS):
+        book.update_levels(code, bids, asks)
+
+    def run():
+        compute_metrics(book)
+        detect_walls(book)
+
+    return run
+
+
+@benchmark("orderbook.analyze_per_symbol", items=SYMBOLS)
+def orderbook_analyze_per_symbol():
+    """기존 경로: 종목마다 리스트 기반 analyze"""
+    from core.indicators.orderbook_analyzer import OrderBookAnalyzer
+
+    books = make_orderbooks(SYMBOLS)
+    analyzer = OrderBookAnalyzer()
+
+    def run():
+        for code, bids, asks in books:
+            analyzer.analyze(code, bids, asks)
+
+    return run
@@ -0,0 +1,48 @@
+"""
+실시간 지표 계산 벤치마크
+"""
+
+from benchmarks.harness import benchmark
+from benchmarks.synthetic import make_ticks
+
+TICKS = 2000
+STOCKS = 5
+
+
+@benchmark("realtime.indicator_update", items=TICKS * STOCKS)
+def indicator_update():
+    from core.realtime.indicators import RealtimeIndicatorCalculator
+
+    ticks = make_ticks(TICKS)
+    codes = [f"{i:06d}" for i in range(STOCKS)]
+
+    def run():
+        calculator = RealtimeIndicatorCalculator()
+        for tick in ticks:
+            for code in codes:
+                calculator.update(code, tick)
+
+    return run
+
+
+@benchmark("realtime.minute_bar_aggregate", items=TICKS * STOCKS)
+def minute_bar_aggregate():
+    """체결 틱 → 1/3/5/15분봉 집계 (틱 3초 간격)"""
+    from datetime import datetime, timedelta
+
+    from core.realtime.bars import MinuteBarAggregator
+
+    start = datetime(2024, 1, 2, 9, 0)
+    ticks = [
+        (start + timedelta(seconds=3 * i), float(tick["close"]), int(tick["volume"]))
+        for i, tick in enumerate(make_ticks(TICKS))
+    ]
+    codes = [f"{i:06d}" for i in range(STOCKS)]
+
+    def run():
+        aggregator = MinuteBarAggregator()
+        for ts, price, volume in ticks:
+            for code in codes:
+                aggregator.on_tick(code, price, volume, ts)
+
+    return run
@@ -0,0 +1,39 @@
+"""
+스크리닝 / 가격 분석 벤치마크
+"""
+
+from datetime import datetime
+
+from benchmarks.harness import benchmark
+from benchmarks.synthetic import StubRestClient, make_price_analysis_input, make_stock_list
+
+SCREENING_STOCKS = 100
+ANALYSIS_STOCKS = 200
+
+
+@benchmark("screening.comprehensive", items=SCREENING_STOCKS, repeat=3)
+def comprehensive_screening():
+    from core.watchlist.stock_screener import StockScreener
+
+    screener = StockScreener()
+    screener._rest_client = StubRestClient()
+    screener._stock_list_cache = make_stock_list(SCREENING_STOCKS)
+    screener._stock_list_cache_time = datetime.now()
+    screener._cache_ttl_seconds = 10 ** 9
+
+    codes = [stock["ticker"] for stock in screener._stock_list_cache]
+    return lambda: screener.comprehensive_screening(codes)
+
+
+@benchmark("selection.price_analysis", items=ANALYSIS_STOCKS, repeat=3)
+def price_analysis():
+    from core.daily_selection.price_analyzer import PriceAnalyzer
+
+    analyzer = PriceAnalyzer()
+    api = StubRestClient()
+    analyzer._get_kis_api = lambda: api
+    stocks = make_price_analysis_input(ANALYSIS_STOCKS)
+    # 섹터 모멘텀은 외부 시세 조회이므로 중립값으로 고정
+    for stock in stocks:
+        analyzer._sector_momentum_cache[stock["sector"]] = 50.0
+    return lambda: analyzer.analyze_multiple_stocks([dict(stock) for stock in stocks])
@@ -0,0 +1,94 @@
+"""
+캐시 직렬화 / DB 대량 기록 벤치마크
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from benchmarks.harness import benchmark
+from benchmarks.synthetic import make_ohlcv, make_price_analysis_input
+
+DB_ROWS = 5000
+CACHE_ITEMS = 200
+
+
+@benchmark("cache.serialize_dataframe", items=1, repeat=10)
+def cache_serialize_dataframe():
+    from core.api.redis_client import _json_serialize
+
+    df = make_ohlcv(1000)
+    return lambda: _json_serialize(df)
+
+
+@benchmark("cache.roundtrip_dicts", items=CACHE_ITEMS, repeat=10)
+def cache_roundtrip_dicts():
+    from core.api.redis_client import _json_deserialize, _json_serialize
+
+    payload = make_price_analysis_input(CACHE_ITEMS)
+    return lambda: _json_deserialize(_json_serialize(payload))
+
+
+def _memory_session():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from core.database.models import Base, Stock
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    stock = Stock(code="000001", name="합성종목", market="KOSPI")
+    session.add(stock)
+    session.commit()
+    return session, stock.id
+
+
+def _price_rows(stock_id):
+    start = date(2000, 1, 3)
+    return [
+        {
+            "stock_id": stock_id, "date": start + timedelta(days=i),
+            "open_price": Decimal("100.00"), "high_price": Decimal("101.00"),
+            "low_price": Decimal("99.00"), "close_price": Decimal("100.50"),
+            "volume": 1000 + i,
+        }
+        for i in range(DB_ROWS)
+    ]
+
+
+@benchmark("db.price_save_loop", items=DB_ROWS, repeat=3)
+def db_price_save_loop():
+    from core.database.models import Price
+    from core.database.repository import StockRepository
+
+    session, stock_id = _memory_session()
+    repository = StockRepository(session)
+    rows = _price_rows(stock_id)
+
+    def run():
+        for row in rows:
+            repository.save_price(
+                row["stock_id"], row["date"], row["open_price"], row["high_price"],
+                row["low_price"], row["close_price"], row["volume"],
+            )
+        session.commit()
+        session.query(Price).delete()
+        session.commit()
+
+    return run
+
+
+@benchmark("db.price_bulk_insert", items=DB_ROWS, repeat=3)
+def db_price_bulk_insert():
+    from core.database.models import Price
+
+    session, stock_id = _memory_session()
+    rows = _price_rows(stock_id)
+
+    def run():
+        session.bulk_insert_mappings(Price, rows)
+        session.commit()
+        session.query(Price).delete()
+        session.commit()
+
+    return run
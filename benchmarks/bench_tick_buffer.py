@@ -0,0 +1,130 @@
+"""
+실시간 틱 버퍼 벤치마크 (합성 하루치 리플레이)
+
+RealtimeProcessor의 컬럼형 링 버퍼와 기존 방식(종목별 deque에 틱 dict 적재)을 비교합니다.
+1분마다 전 종목 최근 창으로 평균/표준편차를 계산하는 지표 조회 부하를 함께 재생합니다.
+
+메모리는 harness가 측정하지 않으므로 직접 실행하여 확인합니다.
+    python -m benchmarks.bench_tick_buffer
+"""
+
+import tracemalloc
+from collections import deque
+
+import numpy as np
+
+from benchmarks.harness import benchmark
+from benchmarks.synthetic import make_trading_day_ticks
+
+SYMBOLS = 50
+TICK_INTERVAL = 6          # 초
+BUFFER = 1000
+WINDOW = 60
+TICKS = SYMBOLS * 390 * 60 // TICK_INTERVAL
+
+
+class LegacyTickBuffer:
+    """기존 방식: 종목별 deque(maxlen)에 틱 dict, 계산마다 리스트 재구성"""
+
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self.price_buffers = {}
+
+    def process(self, data):
+        buffer = self.price_buffers.get(data["stock_code"])
+        if buffer is None:
+            buffer = self.price_buffers[data["stock_code"]] = deque(maxlen=self.maxlen)
+        buffer.append({
+            "price": data["current_price"],
+            "timestamp": data.get("timestamp"),
+            "volume": data.get("volume", 0),
+        })
+
+    def window_stats(self, stock_code, n):
+        prices = [item["price"] for item in list(self.price_buffers[stock_code])[-n:]]
+        return np.mean(prices), np.std(prices)
+
+
+def _replay_columnar(ticks):
+    from core.realtime.processor import RealtimeProcessor
+
+    processor = RealtimeProcessor(buffer_maxlen=BUFFER)
+    for i, tick in enumerate(ticks):
+        processor.process_realtime_price(tick)
+        if i % (SYMBOLS * 60 // TICK_INTERVAL) == 0:
+            for code in processor.price_buffers:
+                window = processor.get_price_window(code, WINDOW)
+                window.price.mean(), window.price.std()
+    return processor
+
+
+def _replay_legacy(ticks):
+    buffers = LegacyTickBuffer(BUFFER)
+    for i, tick in enumerate(ticks):
+        buffers.process(tick)
+        if i % (SYMBOLS * 60 // TICK_INTERVAL) == 0:
+            for code in buffers.price_buffers:
+                buffers.window_stats(code, WINDOW)
+    return buffers
+
+
+@benchmark("realtime.tick_buffer_day_columnar", items=TICKS, repeat=3)
+def tick_buffer_day_columnar():
+    ticks = make_trading_day_ticks(SYMBOLS, TICK_INTERVAL)
+    return lambda: _replay_columnar(ticks)
+
+
+@benchmark("realtime.tick_buffer_day_legacy", items=TICKS, repeat=3)
+def tick_buffer_day_legacy():
+    ticks = make_trading_day_ticks(SYMBOLS, TICK_INTERVAL)
+    return lambda: _replay_legacy(ticks)
+
+
+def measure_memory():
+    """하루치 리플레이 후 버퍼 보유 메모리와 최대 메모리 (바이트)"""
+    import core.realtime.processor  # noqa: F401  모듈 로딩 메모리 제외
+
+    ticks = make_trading_day_ticks(SYMBOLS, TICK_INTERVAL)
+    results = {}
+    for name, replay in (("columnar", _replay_columnar), ("legacy", _replay_legacy)):
+        tracemalloc.start()
+        holder = replay(ticks)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = {"retained": current, "peak": peak}
+        del holder
+    return results
+
+
+if __name__ == "__main__":
+    for name, stats in measure_memory().items():
+        print(f"{name:10s} retained {stats['retained'] / 1e6:8.2f}MB  peak {stats['peak'] / 1e6:8.2f}MB")
+
+
+@benchmark("realtime.tick_window_stats_columnar", items=SYMBOLS * 100)
+def tick_window_stats_columnar():
+    """가득 찬 버퍼에서 종목별 최근 창 통계 (view, 복사 없음)"""
+    processor = _replay_columnar(make_trading_day_ticks(SYMBOLS, 60))
+    codes = list(processor.price_buffers)
+
+    def run():
+        for _ in range(100):
+            for code in codes:
+                prices = processor.get_price_window(code, WINDOW).price
+                prices.mean(), prices.std()
+
+    return run
+
+
+@benchmark("realtime.tick_window_stats_legacy", items=SYMBOLS * 100)
+def tick_window_stats_legacy():
+    """기존 방식: deque → list → 가격 리스트 재구성 후 통계"""
+    buffers = _replay_legacy(make_trading_day_ticks(SYMBOLS, 60))
+    codes = list(buffers.price_buffers)
+
+    def run():
+        for _ in range(100):
+            for code in codes:
+                buffers.window_stats(code, WINDOW)
+
+    return run
@@ -0,0 +1,88 @@
+"""
+WebSocket 실시간 프레임 디코딩 벤치마크
+
+합성 프레임을 녹화 파일로 기록한 뒤 재생하여 측정합니다 (실시간 연결 없음).
+실제 녹화 파일(KISWebSocketClient(record_path=...))은
+core.api.ws_frame_decoder.measure_replay로 같은 방식으로 측정할 수 있습니다.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from benchmarks.harness import benchmark
+from benchmarks.synthetic import make_ws_frames
+
+FRAMES = 2000
+RECORDS_PER_FRAME = 4
+# PINGPONG(JSON) 프레임 제외한 레코드 수
+RECORDS = (FRAMES - FRAMES // 50) * RECORDS_PER_FRAME
+
+
+def _replayed_frames():
+    from core.api.ws_frame_decoder import FrameRecorder, load_recorded_frames
+
+    path = Path(tempfile.mkdtemp(prefix="ws_replay_")) / "frames.txt"
+    with FrameRecorder(path) as recorder:
+        for message in make_ws_frames(FRAMES, RECORDS_PER_FRAME):
+            recorder.write(message)
+    return load_recorded_frames(path)
+
+
+@benchmark("realtime.ws_decode_batch", items=RECORDS)
+def ws_decode_batch():
+    from core.api.ws_frame_decoder import FrameDecoder, is_data_frame
+
+    frames = _replayed_frames()
+
+    def run():
+        decoder = FrameDecoder()
+        for message in frames:
+            if is_data_frame(message):
+                decoder.decode(message)
+
+    return run
+
+
+@benchmark("realtime.ws_decode_records", items=RECORDS)
+def ws_decode_records():
+    """배치 디코딩 후 레코드별 dict 변환 (기존 콜백 호환 경로)"""
+    from core.api.ws_frame_decoder import FrameDecoder, is_data_frame
+
+    frames = _replayed_frames()
+
+    def run():
+        decoder = FrameDecoder()
+        for message in frames:
+            if is_data_frame(message):
+                batch = decoder.decode(message)
+                if batch is not None:
+                    for _ in batch.records():
+                        pass
+
+    return run
+
+
+@benchmark("realtime.ws_normalize_legacy", items=RECORDS)
+def ws_normalize_legacy():
+    """기존 경로: JSON 시도 후 레코드마다 분할/정규화"""
+    from core.api.websocket_client import KISWebSocketClient
+
+    client = KISWebSocketClient(approval_key="bench")
+    frames = _replayed_frames()
+
+    def run():
+        for message in frames:
+            try:
+                json.loads(message)
+                continue
+            except json.JSONDecodeError:
+                pass
+            _, tr_id, count, data = message.split("|", 3)
+            fields = data.split("^")
+            width = len(fields) // int(count)
+            for i in range(int(count)):
+                body = "|".join(fields[i * width:(i + 1) * width])
+                client._normalize_kis_message(tr_id, body)
+
+    return run
@@ -0,0 +1,169 @@
+"""
+벤치마크 실행/기록/비교 도구
+
+- @benchmark 로 등록한 준비(setup) 함수는 측정할 무인자 함수를 반환
+- 준비 비용은 측정에서 제외하고, 워밍업 후 repeat회 실행 시간을 기록
+- 결과는 JSON으로 저장하고, 저장된 기준(baseline)과 중앙값을 비교하여 회귀 판정
+"""
+
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# 준비 함수: 측정 대상(무인자 함수)을 반환
+SetupFn = Callable[[], Callable[[], Any]]
+
+
+@dataclass
+class BenchmarkSpec:
+    """벤치마크 정의"""
+    name: str
+    setup: SetupFn
+    items: int = 1      # 1회 실행당 처리 항목 수 (처리량 계산용)
+    repeat: int = 5
+    warmup: int = 1
+
+
+_REGISTRY: Dict[str, BenchmarkSpec] = {}
+
+
+def benchmark(name: str, items: int = 1, repeat: int = 5, warmup: int = 1):
+    """벤치마크 등록 데코레이터
+
+    Args:
+        name: 벤치마크 이름 (예: "screening.comprehensive_100")
+        items: 1회 실행당 처리 항목 수
+        repeat: 측정 반복 횟수
+        warmup: 측정 전 워밍업 횟수
+    """
+    def decorator(setup: SetupFn) -> SetupFn:
+        if name in _REGISTRY:
+            raise ValueError(f"중복 벤치마크 이름: {name}")
+        _REGISTRY[name] = BenchmarkSpec(name, setup, items, repeat, warmup)
+        return setup
+    return decorator
+
+
+def get_benchmarks(pattern: Optional[str] = None) -> List[BenchmarkSpec]:
+    """등록된 벤치마크 목록 (이름 glob 패턴 필터)"""
+    specs = sorted(_REGISTRY.values(), key=lambda spec: spec.name)
+    if pattern:
+        specs = [spec for spec in specs if fnmatch.fnmatch(spec.name, pattern)]
+    return specs
+
+
+def run_benchmark(spec: BenchmarkSpec, repeat: Optional[int] = None) -> Dict[str, Any]:
+    """단일 벤치마크 실행
+
+    Returns:
+        Dict: 실행 시간 통계 (초) 및 처리량
+    """
+    target = spec.setup()
+    for _ in range(spec.warmup):
+        target()
+
+    timings = []
+    for _ in range(max(1, repeat or spec.repeat)):
+        started = time.perf_counter()
+        target()
+        timings.append(time.perf_counter() - started)
+
+    median = statistics.median(timings)
+    return {
+        'median': median,
+        'min': min(timings),
+        'mean': statistics.fmean(timings),
+        'stdev': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'repeat': len(timings),
+        'items': spec.items,
+        'items_per_sec': spec.items / median if median > 0 else 0.0,
+    }
+
+
+def run_all(pattern: Optional[str] = None, repeat: Optional[int] = None,
+            progress: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """등록된 벤치마크 일괄 실행
+
+    Args:
+        pattern: 이름 glob 패턴
+        repeat: 반복 횟수 (None이면 벤치마크별 기본값)
+        progress: 벤치마크 완료마다 (이름, 결과) 콜백
+
+    Returns:
+        Dict: {"meta": 실행 환경, "results": {이름: 통계}}
+    """
+    results = {}
+    for spec in get_benchmarks(pattern):
+        try:
+            results[spec.name] = run_benchmark(spec, repeat)
+        except Exception as e:
+            results[spec.name] = {'error': f"{type(e).__name__}: {e}"}
+        if progress:
+            progress(spec.name, results[spec.name])
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+        },
+        'results': results,
+    }
+
+
+def save_results(path: str, payload: Dict[str, Any]):
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path: str) -> Optional[Dict[str, Any]]:
+    target = Path(path)
+    if not target.exists():
+        return None
+    with open(target, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = 0.2) -> List[Dict[str, Any]]:
+    """기준 대비 중앙값 비교
+
+    Args:
+        current: run_all 결과
+        baseline: 기준 결과
+        threshold: 회귀 판정 비율 (0.2 = 중앙값 20% 이상 느려지면 회귀)
+
+    Returns:
+        List[Dict]: 벤치마크별 비교 (status: regression/improved/ok/new/error)
+    """
+    base_results = baseline.get('results', {})
+    rows = []
+    for name, stats in current.get('results', {}).items():
+        base = base_results.get(name)
+        row = {'name': name, 'current': stats.get('median'), 'baseline': None, 'ratio': None}
+
+        if 'error' in stats:
+            row['status'] = 'error'
+        elif not base or 'median' not in base or base['median'] <= 0:
+            row['status'] = 'new'
+        else:
+            ratio = stats['median'] / base['median']
+            row.update(baseline=base['median'], ratio=ratio)
+            if ratio > 1 + threshold:
+                row['status'] = 'regression'
+            elif ratio < 1 - threshold:
+                row['status'] = 'improved'
+            else:
+                row['status'] = 'ok'
+        rows.append(row)
+    return rows
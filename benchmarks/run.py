@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+벤치마크 실행 CLI
+
+사용 예:
+    python -m benchmarks.run                          # 전체 실행 후 결과 저장, 기준과 비교
+    python -m benchmarks.run --filter "db.*"          # 이름 패턴으로 선택
+    python -m benchmarks.run --save-baseline          # 현재 결과를 기준으로 저장
+
+기준 대비 중앙값이 threshold 이상 느려진 항목이 있으면 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import importlib
+import logging
+import sys
+from pathlib import Path
+
+from benchmarks.harness import compare_results, load_results, run_all, save_results
+
+BENCHMARK_MODULES = [
+    "benchmarks.bench_selection",
+    "benchmarks.bench_backtest",
+    "benchmarks.bench_realtime",
+    "benchmarks.bench_websocket",
+    "benchmarks.bench_orderbook",
+    "benchmarks.bench_events",
+    "benchmarks.bench_tick_buffer",
+    "benchmarks.bench_indicators",
+    "benchmarks.bench_storage",
+]
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "latest.json"
+DEFAULT_BASELINE = BENCHMARK_DIR / "results" / "baseline.json"
+
+
+def _format_seconds(value) -> str:
+    if value is None:
+        return "-"
+    if value < 1e-3:
+        return f"{value * 1e6:.1f}us"
+    if value < 1:
+        return f"{value * 1e3:.2f}ms"
+    return f"{value:.3f}s"
+
+
+def print_progress(name, stats):
+    if 'error' in stats:
+        print(f"  {name:<34} ERROR {stats['error']}")
+    else:
+        print(f"  {name:<34} {_format_seconds(stats['median']):>10}  "
+              f"{stats['items_per_sec']:>12,.0f} items/s")
+
+
+def print_comparison(rows, threshold):
+    print(f"\n기준 대비 비교 (회귀 기준: +{threshold:.0%})")
+    for row in rows:
+        ratio = f"{row['ratio']:.2f}x" if row['ratio'] is not None else "-"
+        print(f"  {row['name']:<34} {_format_seconds(row['baseline']):>10} → "
+              f"{_format_seconds(row['current']):>10}  {ratio:>6}  {row['status']}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="성능 벤치마크 실행")
+    parser.add_argument("--filter", default=None, help="벤치마크 이름 glob 패턴")
+    parser.add_argument("--repeat", type=int, default=None, help="반복 횟수 (기본: 벤치마크별 설정)")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="결과 JSON 경로")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="기준 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀 판정 비율 (기본 0.2)")
+    parser.add_argument("--save-baseline", action="store_true", help="현재 결과를 기준으로 저장")
+    parser.add_argument("--list", action="store_true", help="등록된 벤치마크 목록만 출력")
+    args = parser.parse_args(argv)
+
+    # 측정 대상 모듈의 로그 출력이 시간에 섞이지 않도록 억제
+    logging.disable(logging.CRITICAL)
+
+    for module in BENCHMARK_MODULES:
+        importlib.import_module(module)
+
+    if args.list:
+        from benchmarks.harness import get_benchmarks
+        for spec in get_benchmarks(args.filter):
+            print(f"{spec.name}  (items={spec.items}, repeat={spec.repeat})")
+        return 0
+
+    print("벤치마크 실행")
+    payload = run_all(args.filter, args.repeat, progress=print_progress)
+    save_results(args.output, payload)
+    print(f"\n결과 저장: {args.output}")
+
+    if args.save_baseline:
+        save_results(args.baseline, payload)
+        print(f"기준 저장: {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        print(f"기준 파일 없음: {args.baseline} (--save-baseline 으로 생성)")
+        return 0
+
+    rows = compare_results(payload, baseline, args.threshold)
+    print_comparison(rows, args.threshold)
+    regressions = [row['name'] for row in rows if row['status'] in ('regression', 'error')]
+    if regressions:
+        print(f"\n회귀 {len(regressions)}건: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+벤치마크용 합성 데이터 생성기
+
+lstm_predictor.create_sample_data / backtest.example.generate_sample_data 와 같은
+랜덤 워크 OHLCV를 시드 고정으로 생성하여 실행마다 같은 입력을 사용합니다.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def make_ohlcv(days: int = 250, seed: int = 42, start_price: float = 50000,
+               end: Optional[datetime] = None) -> pd.DataFrame:
+    """랜덤 워크 일봉 OHLCV (영업일 인덱스)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(end=end or datetime(2025, 1, 31), periods=days, freq='B')
+
+    close = start_price * np.cumprod(1 + rng.standard_normal(days) * 0.02)
+    return pd.DataFrame({
+        'open': close * (1 + rng.standard_normal(days) * 0.005),
+        'high': close * (1 + np.abs(rng.standard_normal(days)) * 0.01),
+        'low': close * (1 - np.abs(rng.standard_normal(days)) * 0.01),
+        'close': close,
+        'volume': rng.integers(100_000, 10_000_000, days),
+    }, index=dates)
+
+
+def make_universe(n: int, days: int = 250, seed: int = 42) -> Dict[str, pd.DataFrame]:
+    """종목 코드별 OHLCV 딕셔너리"""
+    return {
+        f"{i:06d}": make_ohlcv(days, seed=seed + i, start_price=5000 + (i % 50) * 2000)
+        for i in range(n)
+    }
+
+
+def make_stock_list(n: int) -> List[Dict]:
+    """StockScreener 종목 리스트 캐시 형식"""
+    markets = ["KOSPI", "코스닥"]
+    return [
+        {"ticker": f"{i:06d}", "name": f"합성종목{i}", "market": markets[i % 2]}
+        for i in range(n)
+    ]
+
+
+def make_price_analysis_input(n: int, seed: int = 7) -> List[Dict]:
+    """PriceAnalyzer.analyze_multiple_stocks 입력 (네트워크 보충 조회가 없도록 분봉 포함)"""
+    sectors = ["반도체", "자동차", "은행", "바이오", "화학"]
+    stocks = []
+    for i in range(n):
+        df = make_ohlcv(60, seed=seed + i)
+        closes = df['close'].tolist()
+        volumes = df['volume'].astype(float).tolist()
+        stocks.append({
+            "stock_code": f"{i:06d}",
+            "stock_name": f"합성종목{i}",
+            "sector": sectors[i % len(sectors)],
+            "current_price": closes[-1],
+            "volume": volumes[-1],
+            "recent_close_prices": closes,
+            "recent_volumes": volumes,
+            "minute_bars": {"close": closes[-30:], "volume": volumes[-30:]},
+        })
+    return stocks
+
+
+def make_ticks(n: int, seed: int = 3) -> List[Dict]:
+    """실시간 체결 틱 (OHLCV 딕셔너리)"""
+    df = make_ohlcv(n, seed=seed)
+    return df.to_dict('records')
+
+
+def make_ws_frames(n: int, records_per_frame: int = 4, seed: int = 5) -> List[str]:
+    """KIS 실시간 프레임 (한 프레임에 여러 건)
+
+    필드 위치는 _normalize_kis_message 매핑을 따르며, 레코드 폭은 체결 46필드,
+    호가 60필드(기존 정규화의 최소 필드 수)입니다. 체결 3 : 호가 1 비율로 섞고,
+    PINGPONG JSON 프레임을 간간이 포함합니다.
+    """
+    rng = np.random.default_rng(seed)
+    frames = []
+    for i in range(n):
+        if i % 50 == 49:
+            frames.append('{"header":{"tr_id":"PINGPONG","datetime":"20240102090000"}}')
+            continue
+        records = []
+        for _ in range(records_per_frame):
+            code = f"{int(rng.integers(0, 200)):06d}"
+            price = int(rng.integers(10000, 100000))
+            if i % 4 == 3:
+                asks = [price + 100 * k for k in range(1, 11)]
+                bids = [price - 100 * k for k in range(10)]
+                sizes = rng.integers(1, 5000, 20).tolist()
+                fields = [code, "090000", "0", *asks, *bids, *sizes, sum(sizes[:10]), sum(sizes[10:])]
+                fields += ["0"] * (60 - len(fields))
+            else:
+                fields = [code, "090000", price, "2", 100, "0.52"] + ["0"] * 40
+                fields[9] = int(rng.integers(1, 1000))
+                fields[12] = int(rng.integers(1000, 10 ** 7))
+                fields[16:19] = [price - 300, price + 500, price - 800]
+            records.append("^".join(map(str, fields)))
+        tr_id = "H0STASP0" if i % 4 == 3 else "H0STCNT0"
+        frames.append(f"0|{tr_id}|{records_per_frame:03d}|" + "^".join(records))
+    return frames
+
+
+def make_orderbooks(n_symbols: int, levels: int = 10, seed: int = 9):
+    """종목별 합성 호가 [(code, bids, asks), ...] (bids/asks는 [(가격, 수량), ...])"""
+    rng = np.random.default_rng(seed)
+    books = []
+    for i in range(n_symbols):
+        price = int(rng.integers(100, 1000)) * 100
+        bid_sizes = rng.integers(1, 5000, levels)
+        ask_sizes = rng.integers(1, 5000, levels)
+        bids = [(price - 100 * k, int(bid_sizes[k])) for k in range(levels)]
+        asks = [(price + 100 * (k + 1), int(ask_sizes[k])) for k in range(levels)]
+        books.append((f"{i:06d}", bids, asks))
+    return books
+
+
+def make_trading_day_ticks(n_symbols: int, interval_seconds: int = 6, seed: int = 13) -> List[Dict]:
+    """하루치(09:00~15:30) 체결 틱 (_normalize_kis_message 형식, 시각순으로 종목 교차)"""
+    rng = np.random.default_rng(seed)
+    steps = 390 * 60 // interval_seconds
+    prices = rng.integers(100, 1000, n_symbols) * 100 + np.cumsum(
+        rng.integers(-1, 2, (steps, n_symbols)) * 50, axis=0
+    )
+    volumes = rng.integers(1, 1000, (steps, n_symbols))
+    codes = [f"{i:06d}" for i in range(n_symbols)]
+    ticks = []
+    for step in range(steps):
+        seconds = 9 * 3600 + step * interval_seconds
+        hhmmss = f"{seconds // 3600:02d}{seconds % 3600 // 60:02d}{seconds % 60:02d}"
+        for i, code in enumerate(codes):
+            ticks.append({
+                "stock_code": code,
+                "timestamp": hhmmss,
+                "current_price": int(prices[step, i]),
+                "volume": int(volumes[step, i]),
+            })
+    return ticks
+
+
+class StubRestClient:
+    """RestClient / KISAPI 대체 (합성 시세, 네트워크 없음)"""
+
+    def __init__(self, days: int = 120, seed: int = 11):
+        self._days = days
+        self._seed = seed
+        self._charts: Dict[str, pd.DataFrame] = {}
+
+    def _chart(self, stock_code: str) -> pd.DataFrame:
+        if stock_code not in self._charts:
+            self._charts[stock_code] = make_ohlcv(
+                self._days, seed=self._seed + int(stock_code or 0)
+            )
+        return self._charts[stock_code]
+
+    def get_current_price(self, stock_code: str) -> Dict:
+        last = self._chart(stock_code).iloc[-1]
+        return {"current_price": float(last['close']), "volume": int(last['volume'])}
+
+    def get_stock_info(self, stock_code: str) -> Dict:
+        code = int(stock_code or 0)
+        return {
+            "market_cap": 1e11 + code * 1e9,
+            "per": 5 + code % 30,
+            "pbr": 0.5 + (code % 20) / 10,
+        }
+
+    def get_daily_chart(self, stock_code: str, period_days: int = 120) -> pd.DataFrame:
+        return self._chart(stock_code).tail(period_days)
+
+    def get_stock_history(self, stock_code: str, period: str = "D", count: int = 30) -> pd.DataFrame:
+        return self._chart(stock_code).tail(count).reset_index(names='date')
@@ -0,0 +1,125 @@
+"""
+Profile command - Hot-path latency statistics and on-demand batch profiling.
+
+Usage:
+    hantu profile [SUBCOMMAND]
+
+Subcommands:
+    enable      Profile the next matching batch with cProfile
+    disable     Cancel a pending profiling request
+    status      Show pending request and saved profiles
+    show        Print top functions from a saved profile
+    latency     Show per-stage latency histograms
+"""
+
+import sys
+import click
+
+
+@click.group(invoke_without_command=True)
+@click.pass_context
+def profile(ctx: click.Context) -> None:
+    """Hot-path profiling and latency statistics.
+
+    \b
+    Examples:
+        hantu profile enable                     Profile the next batch
+        hantu profile enable -t phase2.* -n 2    Profile the next 2 Phase 2 batches
+        hantu profile show                       Show the latest profile
+        hantu profile latency                    Show per-stage latency
+    """
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+
+
+@profile.command('enable')
+@click.option('--target', '-t', default='*',
+              help='Batch name pattern (phase1.screening, phase2.daily_update, ...).')
+@click.option('--batches', '-n', type=int, default=1, help='Number of batches to profile.')
+def profile_enable(target: str, batches: int) -> None:
+    """Profile the next matching batch run(s) with cProfile."""
+    from core.utils.profiling import DEFAULT_PROFILE_DIR, request_profile
+
+    request = request_profile(target, batches)
+    click.echo(f"Profiling requested: target={request['target']}, batches={request['remaining']}")
+    click.echo(f"Results will be written to {DEFAULT_PROFILE_DIR}")
+
+
+@profile.command('disable')
+def profile_disable() -> None:
+    """Cancel a pending profiling request."""
+    from core.utils.profiling import cancel_profile
+
+    if cancel_profile():
+        click.echo("Profiling request cancelled.")
+    else:
+        click.echo("No pending profiling request.")
+
+
+@profile.command('status')
+@click.option('--limit', '-n', type=int, default=10, help='Number of saved profiles to list.')
+def profile_status(limit: int) -> None:
+    """Show pending request and saved profiles."""
+    from core.utils.profiling import get_profile_request, list_profiles
+
+    request = get_profile_request()
+    if request:
+        click.echo(f"Pending: target={request.get('target')}, "
+                   f"remaining={request.get('remaining')}, requested_at={request.get('requested_at')}")
+    else:
+        click.echo("Pending: none")
+
+    profiles = list_profiles()[:limit]
+    click.echo()
+    click.echo(f"Saved profiles ({len(profiles)}):")
+    for path in profiles:
+        click.echo(f"  {path.name}")
+
+
+@profile.command('show')
+@click.argument('path', required=False)
+@click.option('--limit', '-n', type=int, default=30, help='Number of functions to show.')
+@click.option('--sort', '-s', 'sort_by', type=click.Choice(['cumulative', 'tottime', 'calls']),
+              default='cumulative', help='Sort order.')
+def profile_show(path: str, limit: int, sort_by: str) -> None:
+    """Print top functions from a saved profile (latest if PATH omitted)."""
+    from core.utils.profiling import format_profile, list_profiles
+
+    if not path:
+        profiles = list_profiles()
+        if not profiles:
+            click.echo("No saved profiles.", err=True)
+            sys.exit(1)
+        path = str(profiles[0])
+
+    click.echo(f"Profile: {path}")
+    click.echo(format_profile(path, limit, sort_by))
+
+
+@profile.command('latency')
+@click.option('--service', '-s', default=None, help='Show a single service (scheduler, trading).')
+def profile_latency(service: str) -> None:
+    """Show per-stage latency histograms from periodic snapshots."""
+    from core.utils.latency_metrics import LatencyConfig, load_snapshots, merge_snapshots
+
+    # 수집 측과 같은 설정(HANTU_LATENCY_SNAPSHOT_DIR)으로 스냅샷 위치 결정
+    snapshot_dir = LatencyConfig.from_env().snapshot_dir
+    snapshots = load_snapshots(snapshot_dir)
+    if service:
+        snapshots = [s for s in snapshots if s.get('service') == service]
+    if not snapshots:
+        click.echo(f"No latency snapshots found in {snapshot_dir}", err=True)
+        sys.exit(1)
+
+    for snapshot in snapshots:
+        click.echo(f"- {snapshot.get('service')} (pid {snapshot.get('pid')}, {snapshot.get('timestamp')})")
+
+    click.echo()
+    header = f"{'Stage':<60} {'Count':>8} {'p50':>10} {'p90':>10} {'p99':>10} {'Max':>10}"
+    click.echo(header)
+    click.echo("-" * len(header))
+    for name, stats in merge_snapshots(snapshots).items():
+        click.echo(
+            f"{name:<60} {stats['count']:>8} {stats['p50_ms']:>8.1f}ms "
+            f"{stats['p90_ms']:>8.1f}ms {stats['p99_ms']:>8.1f}ms {stats['max_ms']:>8.1f}ms"
+        )
@@ -16,6 +16,7 @@ Commands:
     config      Configuration management
     health      System health check
     logs        View logs
+    profile     Latency statistics and batch profiling
 """
 
 import sys
@@ -97,6 +98,7 @@ from cli.commands.select import select  # noqa: E402
 from cli.commands.config import config  # noqa: E402
 from cli.commands.health import health  # noqa: E402
 from cli.commands.logs import logs  # noqa: E402
+from cli.commands.profile import profile  # noqa: E402
 
 cli.add_command(start)
 cli.add_command(stop)
@@ -108,6 +110,7 @@ cli.add_command(select)
 cli.add_command(config)
 cli.add_command(health)
 cli.add_command(logs)
+cli.add_command(profile)
 
 
 def main() -> None:
@@ -30,9 +30,14 @@ except ImportError:
 from core.config.api_config import APIConfig, KISErrorCode
 from core.api.redis_client import cache
 from core.utils.log_utils import get_logger
+from core.utils.latency_metrics import (
+    latency_timer, record_latency, STAGE_API_CALL, STAGE_RATE_LIMIT_WAIT,
+)
 
 logger = get_logger(__name__)
 
+PRICE_PATH = "/uapi/domestic-stock/v1/quotations/inquire-price"
+
 
 @dataclass
 class PriceData:
@@ -160,10 +165,10 @@ class AsyncKISClient:
         if self.session:
             await self.session.close()
 
-    def _get_headers(self) -> Dict[str, str]:
+    async def _get_headers(self) -> Dict[str, str]:
         """요청 헤더 생성"""
-        # 토큰 유효성 확인
-        self.config.ensure_valid_token()
+        # 토큰 유효성 확인 (갱신이 필요하면 스레드에서 수행하여 이벤트 루프를 막지 않음)
+        await self.config.ensure_valid_token_async()
 
         # 시세 조회 API (inquire-price)는 모의/실전 동일한 tr_id 사용
         # 참고: 거래 API (order, balance)만 모의/실전 tr_id가 다름 (TTTC.../VTTC...)
@@ -185,6 +190,11 @@ class AsyncKISClient:
         2. 1분 윈도우: 최대 100건
         3. 1시간 윈도우: 최대 1500건
         """
+        with latency_timer(STAGE_RATE_LIMIT_WAIT):
+            await self._wait_rate_limit()
+
+    async def _wait_rate_limit(self):
+        """윈도우별 한도와 최소 간격까지 대기 (락 획득 대기 포함)"""
         async with self._rate_limit_lock:
             now = time.time()
 
@@ -268,15 +278,18 @@ class AsyncKISClient:
                     # Rate Limit 대기
                     await self._rate_limit_wait()
 
-                    url = f"{self.config.base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
-                    headers = self._get_headers()
+                    url = f"{self.config.base_url}{PRICE_PATH}"
+                    headers = await self._get_headers()
                     params = {
                         "FID_COND_MRKT_DIV_CODE": "J",
                         "FID_INPUT_ISCD": stock_code
                     }
 
+                    # 엔드포인트별 지연 시간 집계 (Rate Limit 백오프 대기는 제외)
+                    started = time.perf_counter()
                     async with self.session.get(url, headers=headers, params=params) as response:
                         data = await response.json()
+                        record_latency(STAGE_API_CALL, time.perf_counter() - started, PRICE_PATH)
 
                         # Rate Limit 에러 처리 (EGW00201)
                         if self._is_rate_limit_error(data):
@@ -21,6 +21,7 @@ class KISAPI(KISRestClient):
         self.config = APIConfig()  # 싱글톤 인스턴스
         super().__init__()
         self.ws_client = None
+        self._bar_clock_task: Optional[asyncio.Task] = None
         
     def place_order(self, stock_code: str, order_type: str, quantity: int,
                    price: int = 0, order_division: str = "00") -> dict:
@@ -135,10 +136,35 @@ class KISAPI(KISRestClient):
                 return False
                 
             self.ws_client = KISWebSocketClient(self.config.access_token)
-            return await self.ws_client.connect()
+            # 체결 스트림으로 장중 분봉 집계 (REST 분봉 폴링 대체)
+            from core.realtime import get_bar_aggregator, get_realtime_processor
+            aggregator = get_bar_aggregator()
+            aggregator.attach(self.ws_client)
+            # 체결가는 공용 처리기가 소비 (완성 분봉은 집계기 리스너로 수신)
+            self.ws_client.add_callback("H0STCNT0", get_realtime_processor().process_realtime_price)
+            if not await self.ws_client.connect():
+                return False
+            self._start_bar_clock(aggregator)
+            return True
         except Exception as e:
             logger.error(f"[connect_websocket] WebSocket 연결 중 오류 발생: {str(e)}", exc_info=True)
             return False
+
+    def _start_bar_clock(self, aggregator):
+        """분봉 시각 경계 마감 루프 시작 (틱이 끊긴 종목도 정시에 마감)"""
+        self._stop_bar_clock(aggregator)
+        self._bar_clock_task = asyncio.create_task(aggregator.run_clock())
+
+    def _stop_bar_clock(self, aggregator=None):
+        """분봉 시각 경계 마감 루프 종료"""
+        if self._bar_clock_task is None:
+            return
+        if aggregator is None:
+            from core.realtime import get_bar_aggregator
+            aggregator = get_bar_aggregator()
+        aggregator.stop_clock()
+        self._bar_clock_task.cancel()
+        self._bar_clock_task = None
         
     def add_callback(self, tr_id: str, callback: Callable):
         """실시간 데이터 수신 콜백 등록"""
@@ -202,6 +228,7 @@ class KISAPI(KISRestClient):
         except Exception as e:
             logger.error(f"[start_real_time] 실시간 데이터 수신 중 오류 발생: {str(e)}", exc_info=True)
             # 연결이 남아있다면 정리
+            self._stop_bar_clock()
             if self.ws_client:
                 try:
                     await self.ws_client.close()
@@ -212,6 +239,7 @@ class KISAPI(KISRestClient):
             
     async def close(self):
         """연결 종료"""
+        self._stop_bar_clock()
         if self.ws_client:
             await self.ws_client.close()
             self.ws_client = None
@@ -484,11 +484,14 @@ class KRXClient:
             )
             return None
 
-    def save_market_fundamentals_to_db(self, date: Optional[str] = None) -> int:
-        """전체 종목 재무 데이터를 DB에 저장
+    def save_market_fundamentals_to_db(
+        self, date: Optional[str] = None, df: Optional[pd.DataFrame] = None
+    ) -> int:
+        """전체 종목 재무 데이터를 DB에 저장 (거래일 단위 일괄 upsert)
 
         Args:
             date: 조회 일자 (YYYYMMDD 형식, 기본값: 오늘)
+            df: 이미 조회한 재무 데이터 (None이면 조회)
 
         Returns:
             int: 저장된 종목 수
@@ -497,116 +500,20 @@ class KRXClient:
             if date is None:
                 date = datetime.now().strftime("%Y%m%d")
 
-            df = self.get_market_fundamentals(date=date)
+            if df is None:
+                df = self.get_market_fundamentals(date=date)
 
             if df.empty:
                 logger.warning("[save_market_fundamentals_to_db] 저장할 데이터 없음")
                 return 0
 
-            # DB 저장
-            from core.database.unified_db import get_session
-            from core.database.models import StockFundamental
-
-            saved_count = 0
-            data_date = datetime.strptime(date, "%Y%m%d").date()
-
-            with get_session() as session:
-                for _, row in df.iterrows():
-                    stock_code = str(row.get("ticker", ""))
-                    if not stock_code:
-                        continue
-
-                    # 기존 데이터 확인 (upsert)
-                    existing = (
-                        session.query(StockFundamental)
-                        .filter_by(stock_code=stock_code, date=data_date)
-                        .first()
-                    )
-
-                    if existing:
-                        # 업데이트
-                        existing.per = (
-                            float(row.get("PER", 0))
-                            if pd.notna(row.get("PER"))
-                            else None
-                        )
-                        existing.pbr = (
-                            float(row.get("PBR", 0))
-                            if pd.notna(row.get("PBR"))
-                            else None
-                        )
-                        existing.eps = (
-                            float(row.get("EPS", 0))
-                            if pd.notna(row.get("EPS"))
-                            else None
-                        )
-                        existing.bps = (
-                            float(row.get("BPS", 0))
-                            if pd.notna(row.get("BPS"))
-                            else None
-                        )
-                        existing.div = (
-                            float(row.get("DIV", 0))
-                            if pd.notna(row.get("DIV"))
-                            else None
-                        )
-                        existing.dps = (
-                            float(row.get("DPS", 0))
-                            if pd.notna(row.get("DPS"))
-                            else None
-                        )
-                        existing.roe = (
-                            float(row.get("ROE", 0))
-                            if pd.notna(row.get("ROE"))
-                            else None
-                        )
-                        existing.updated_at = datetime.now()
-                    else:
-                        # 신규 생성
-                        fundamental = StockFundamental(
-                            stock_code=stock_code,
-                            date=data_date,
-                            per=(
-                                float(row.get("PER", 0))
-                                if pd.notna(row.get("PER"))
-                                else None
-                            ),
-                            pbr=(
-                                float(row.get("PBR", 0))
-                                if pd.notna(row.get("PBR"))
-                                else None
-                            ),
-                            eps=(
-                                float(row.get("EPS", 0))
-                                if pd.notna(row.get("EPS"))
-                                else None
-                            ),
-                            bps=(
-                                float(row.get("BPS", 0))
-                                if pd.notna(row.get("BPS"))
-                                else None
-                            ),
-                            div=(
-                                float(row.get("DIV", 0))
-                                if pd.notna(row.get("DIV"))
-                                else None
-                            ),
-                            dps=(
-                                float(row.get("DPS", 0))
-                                if pd.notna(row.get("DPS"))
-                                else None
-                            ),
-                            roe=(
-                                float(row.get("ROE", 0))
-                                if pd.notna(row.get("ROE"))
-                                else None
-                            ),
-                        )
-                        session.add(fundamental)
-
-                    saved_count += 1
+            from core.database.fundamentals_snapshot import (
+                get_fundamentals_snapshot_cache,
+                upsert_fundamentals,
+            )
 
-                session.commit()
+            saved_count = upsert_fundamentals(df, date)
+            get_fundamentals_snapshot_cache().invalidate(date)
 
             logger.info(
                 f"[save_market_fundamentals_to_db] DB 저장 완료 - {saved_count}개 종목"
@@ -710,7 +617,7 @@ class KRXClient:
                 return 0
 
             # 1. DB 저장 (주요)
-            db_count = self.save_market_fundamentals_to_db(date=date)
+            db_count = self.save_market_fundamentals_to_db(date=date, df=df)
 
             # 2. 파일 백업 (보조)
             file_path = self.stock_dir / f"krx_fundamentals_{date}.json"
@@ -9,6 +9,7 @@ import requests
 import fcntl
 import tempfile
 from typing import Dict, List, Optional
+from urllib.parse import urlparse
 import pandas as pd
 from datetime import datetime, timedelta
 
@@ -25,7 +26,11 @@ from core.config import settings
 from core.config.api_config import APIConfig, KISErrorCode, KISEndpoint
 from core.api.redis_client import cache_with_ttl, invalidate_function_cache
 from core.utils.log_utils import get_logger
+from core.utils.latency_metrics import latency_timer, STAGE_API_CALL, STAGE_RATE_LIMIT_WAIT
 from core.models.validators import StockCode, PeriodDays, CountRange
+from core.database.ohlcv_store import (
+    CALENDAR_BUFFER, get_ohlcv_store, ohlcv_store_enabled, sync_daily_history
+)
 from pydantic import ValidationError, BaseModel, Field
 
 logger = get_logger(__name__)
@@ -193,15 +198,16 @@ class KISRestClient:
             if not self.config.ensure_valid_token():
                 raise NonRetryableAPIError("API 토큰이 유효하지 않습니다")
 
-            # 재시도 로직이 적용된 내부 요청 실행
-            return self._request_with_retry(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                data=data,
-                timeout=timeout or settings.REQUEST_TIMEOUT
-            )
+            # 재시도 로직이 적용된 내부 요청 실행 (엔드포인트별 지연 시간 집계)
+            with latency_timer(STAGE_API_CALL, urlparse(url).path):
+                return self._request_with_retry(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    params=params,
+                    data=data,
+                    timeout=timeout or settings.REQUEST_TIMEOUT
+                )
 
         except NonRetryableAPIError as e:
             logger.error(
@@ -505,6 +511,11 @@ class KISRestClient:
         backoff_multiplier = _get_backoff_multiplier()
         min_interval = base_interval * backoff_multiplier
 
+        with latency_timer(STAGE_RATE_LIMIT_WAIT):
+            self._wait_rate_limit(min_interval, backoff_multiplier)
+
+    def _wait_rate_limit(self, min_interval: float, backoff_multiplier: float):
+        """최소 요청 간격까지 대기 (락 획득 대기 포함)"""
         try:
             # 파일 락을 사용한 글로벌 rate limiting
             with open(_RATE_LIMIT_LOCK_FILE, 'w') as lock_file:
@@ -692,6 +703,7 @@ class KISRestClient:
             캐시 TTL: 600초 (10분)
             KIS 표준 API (inquire-daily-itemchartprice) 사용
             휴장일 고려하여 요청 기간을 1.3배로 확장
+            일봉 이력 저장소 사용 시 마지막 저장일 이후 봉만 조회
         """
         try:
             # 입력 검증
@@ -702,57 +714,82 @@ class KISRestClient:
                 logger.error(f"입력 검증 실패: {e}", exc_info=True)
                 return None
 
+            if ohlcv_store_enabled():
+                df = sync_daily_history(
+                    get_ohlcv_store(), stock_code, period_validated.days,
+                    self._fetch_daily_chart_range
+                )
+                if df is None or df.empty:
+                    logger.error(f"일봉 데이터 조회 실패: {stock_code}", exc_info=True)
+                    return None
+                logger.info(f"일봉 데이터 조회 완료: {stock_code}, {len(df)}일 (이력 저장소)")
+                return df
+
             # 날짜 범위 계산 (YYYYMMDD 형식)
             # 휴장일(주말, 공휴일)을 고려하여 요청 기간을 1.3배로 확장
             end_date = datetime.now()
-            buffer_days = int(period_validated.days * 1.3)
+            buffer_days = int(period_validated.days * CALENDAR_BUFFER)
             start_date = end_date - timedelta(days=buffer_days)
 
-            params = {
-                "FID_COND_MRKT_DIV_CODE": "J",  # 시장 구분 코드 (J: 주식, ETF, ETN)
-                "FID_INPUT_ISCD": stock_code,
-                "FID_INPUT_DATE_1": start_date.strftime("%Y%m%d"),  # 시작일자
-                "FID_INPUT_DATE_2": end_date.strftime("%Y%m%d"),     # 종료일자
-                "FID_PERIOD_DIV_CODE": "D",  # D:일봉, W:주봉, M:월봉, Y:년봉
-                "FID_ORG_ADJ_PRC": "0"  # 0:수정주가(권리락 반영), 1:원주가
-            }
-
-            # SSOT 원칙: KISEndpoint 레지스트리 활용
-            response = self.request_endpoint(
-                KISEndpoint.INQUIRE_DAILY_ITEMCHARTPRICE,
-                params=params
-            )
-
-            # 표준 API는 output2에 차트 데이터 반환
-            if "output2" in response and response["output2"]:
-                data = []
-                for item in response["output2"]:
-                    data.append({
-                        "date": datetime.strptime(item["stck_bsop_date"], "%Y%m%d"),
-                        "open": float(item["stck_oprc"]),
-                        "high": float(item["stck_hgpr"]),
-                        "low": float(item["stck_lwpr"]),
-                        "close": float(item["stck_clpr"]),
-                        "volume": int(item["acml_vol"])
-                    })
-
-                df = pd.DataFrame(data)
-                df = df.sort_values("date").reset_index(drop=True)
-                df.set_index("date", inplace=True)
-
-                # 요청한 기간만큼 데이터 제한
-                if len(df) > period_validated.days:
-                    df = df.tail(period_validated.days)
-
-                logger.info(f"일봉 데이터 조회 완료: {stock_code}, {len(df)}일 (표준 API)")
-                return df
-            else:
+            df = self._fetch_daily_chart_range(stock_code, start_date, end_date)
+            if df is None or df.empty:
                 logger.error(f"일봉 데이터 조회 실패: {stock_code}", exc_info=True)
                 return None
 
+            # 요청한 기간만큼 데이터 제한
+            if len(df) > period_validated.days:
+                df = df.tail(period_validated.days)
+
+            logger.info(f"일봉 데이터 조회 완료: {stock_code}, {len(df)}일 (표준 API)")
+            return df
+
         except Exception as e:
             logger.error(f"일봉 데이터 조회 오류: {e}", exc_info=True)
             return None
+
+    def _fetch_daily_chart_range(
+        self,
+        stock_code: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[pd.DataFrame]:
+        """기간 지정 일봉 조회 (date 인덱스 오름차순, 응답 실패 시 None)"""
+        params = {
+            "FID_COND_MRKT_DIV_CODE": "J",  # 시장 구분 코드 (J: 주식, ETF, ETN)
+            "FID_INPUT_ISCD": stock_code,
+            "FID_INPUT_DATE_1": start_date.strftime("%Y%m%d"),  # 시작일자
+            "FID_INPUT_DATE_2": end_date.strftime("%Y%m%d"),     # 종료일자
+            "FID_PERIOD_DIV_CODE": "D",  # D:일봉, W:주봉, M:월봉, Y:년봉
+            "FID_ORG_ADJ_PRC": "0"  # 0:수정주가(권리락 반영), 1:원주가
+        }
+
+        # SSOT 원칙: KISEndpoint 레지스트리 활용
+        response = self.request_endpoint(
+            KISEndpoint.INQUIRE_DAILY_ITEMCHARTPRICE,
+            params=params
+        )
+
+        # 표준 API는 output2에 차트 데이터 반환
+        if "output2" not in response:
+            return None
+
+        data = []
+        for item in response["output2"] or []:
+            if not item.get("stck_bsop_date"):
+                continue
+            data.append({
+                "date": datetime.strptime(item["stck_bsop_date"], "%Y%m%d"),
+                "open": float(item["stck_oprc"]),
+                "high": float(item["stck_hgpr"]),
+                "low": float(item["stck_lwpr"]),
+                "close": float(item["stck_clpr"]),
+                "volume": int(item["acml_vol"])
+            })
+
+        df = pd.DataFrame(data, columns=["date", "open", "high", "low", "close", "volume"])
+        df = df.sort_values("date").reset_index(drop=True)
+        df.set_index("date", inplace=True)
+        return df
     
     @cache_with_ttl(ttl=600, key_prefix="stock_info")
     def get_stock_info(self, stock_code: str) -> Optional[Dict]:
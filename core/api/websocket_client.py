@@ -8,11 +8,13 @@
 import json
 import asyncio
 import websockets
-from typing import Dict, Optional, Callable, List
+from pathlib import Path
+from typing import Dict, Optional, Callable, List, Union
 from core.config.settings import (
     SERVER, SOCKET_VIRTUAL_URL, SOCKET_PROD_URL
 )
 from core.config.api_config import APIConfig
+from core.api.ws_frame_decoder import FrameBatch, FrameDecoder, FrameRecorder, is_data_frame
 from core.utils.log_utils import get_logger
 
 logger = get_logger(__name__)
@@ -25,11 +27,12 @@ class KISWebSocketClient:
     REST API access_token 대신 별도의 approval_key 사용
     """
 
-    def __init__(self, approval_key: Optional[str] = None):
+    def __init__(self, approval_key: Optional[str] = None, record_path: Optional[Union[str, Path]] = None):
         """초기화
 
         Args:
             approval_key: WebSocket 접속키 (None이면 자동 발급)
+            record_path: 수신 프레임 녹화 파일 (재생 벤치마크용, None이면 녹화 안 함)
         """
         self.config = APIConfig()
 
@@ -43,6 +46,9 @@ class KISWebSocketClient:
         self.ws_url = SOCKET_PROD_URL if SERVER == 'prod' else SOCKET_VIRTUAL_URL
         self.subscribed_codes: Dict[str, List[str]] = {}  # {종목코드: [TR_ID 리스트]}
         self.callbacks: Dict[str, Callable] = {}  # {TR_ID: callback 함수}
+        self.batch_callbacks: Dict[str, Callable] = {}  # {TR_ID: FrameBatch callback 함수}
+        self.decoder = FrameDecoder()
+        self.recorder = FrameRecorder(record_path) if record_path else None
         self.websocket = None
         self.running = False
 
@@ -69,13 +75,20 @@ class KISWebSocketClient:
         instance.ws_url = SOCKET_PROD_URL if SERVER == 'prod' else SOCKET_VIRTUAL_URL
         instance.subscribed_codes = {}
         instance.callbacks = {}
+        instance.batch_callbacks = {}
+        instance.decoder = FrameDecoder()
+        instance.recorder = None
         instance.websocket = None
         instance.running = False
         return instance
         
     def add_callback(self, tr_id: str, callback: Callable):
-        """실시간 데이터 수신 시 호출할 콜백 함수 등록"""
+        """실시간 데이터 수신 시 호출할 콜백 함수 등록 (레코드별 dict)"""
         self.callbacks[tr_id] = callback
+
+    def add_batch_callback(self, tr_id: str, callback: Callable[[FrameBatch], None]):
+        """실시간 프레임 단위 콜백 등록 (한 프레임의 N건을 FrameBatch로 전달)"""
+        self.batch_callbacks[tr_id] = callback
         
     async def connect(self):
         """WebSocket 연결"""
@@ -222,6 +235,14 @@ class KISWebSocketClient:
         Args:
             message: WebSocket으로부터 수신된 원본 메시지
         """
+        if self.recorder:
+            self.recorder.write(message)
+
+        # 실시간 데이터 프레임은 JSON 시도 없이 배치 디코딩
+        if is_data_frame(message):
+            await self._handle_data_frame(message)
+            return
+
         try:
             # JSON 파싱
             data = json.loads(message)
@@ -261,6 +282,35 @@ class KISWebSocketClient:
         except Exception as e:
             logger.error(f"메시지 처리 중 오류 발생: {e}", exc_info=True)
 
+    async def _handle_data_frame(self, message: str):
+        """파이프 구분 실시간 프레임 처리 (N건 배치 디코딩 후 콜백)"""
+        try:
+            batch = self.decoder.decode(message)
+            if batch is None:
+                return
+
+            batch_callback = self.batch_callbacks.get(batch.tr_id)
+            if batch_callback:
+                if asyncio.iscoroutinefunction(batch_callback):
+                    await batch_callback(batch)
+                else:
+                    batch_callback(batch)
+
+            callback = self.callbacks.get(batch.tr_id)
+            if callback:
+                is_async = asyncio.iscoroutinefunction(callback)
+                for record in batch.records():
+                    if is_async:
+                        await callback(record)
+                    else:
+                        callback(record)
+
+            if not batch_callback and not callback:
+                logger.debug(f"등록되지 않은 TR_ID: {batch.tr_id}")
+
+        except Exception as e:
+            logger.error(f"실시간 프레임 처리 중 오류 발생: {e}", exc_info=True)
+
     def _normalize_kis_message(self, tr_id: str, body: str) -> Optional[Dict]:
         """KIS WebSocket 메시지 정규화
 
@@ -379,6 +429,8 @@ class KISWebSocketClient:
     async def close(self):
         """WebSocket 연결 종료"""
         self.running = False
+        if self.recorder:
+            self.recorder.close()
         if self.websocket:
             # 모든 구독 해지
             for stock_code in list(self.subscribed_codes.keys()):
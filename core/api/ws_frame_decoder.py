@@ -0,0 +1,274 @@
+"""
+KIS WebSocket 실시간 프레임 배치 디코더
+
+KIS 실시간 데이터 프레임은 JSON이 아닌 파이프(|) 구분 문자열입니다.
+
+    {암호화 여부}|{TR_ID}|{건수}|{필드^필드^...}
+
+한 프레임에 여러 건(건수 필드)이 이어 붙어 오므로, 데이터부를 한 번 분할한 뒤
+레코드 폭 간격 슬라이스로 컬럼별 타입 튜플을 한 번에 만듭니다 (레코드별 dict 생성 없음).
+JSON 프레임(구독 응답, PINGPONG)은 첫 글자로 구분하여 디코더를 거치지 않습니다.
+
+녹화/재생:
+    FrameRecorder로 수신 프레임을 한 줄씩 기록하고, measure_replay로
+    실시간 연결 없이 디코딩 처리량(메시지/초)을 측정합니다.
+"""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+TR_TRADE = "H0STCNT0"      # 실시간 체결가
+TR_ORDERBOOK = "H0STASP0"  # 실시간 호가
+
+# 컬럼 정의: (이름, 필드 위치 또는 [시작, 끝) 구간, 타입)
+# 위치는 KISWebSocketClient._normalize_kis_message 매핑과 동일
+ColumnSpec = Tuple[str, Union[int, Tuple[int, int]], str]
+
+FIELD_SPECS: Dict[str, List[ColumnSpec]] = {
+    TR_TRADE: [
+        ("stock_code", 0, "str"),
+        ("timestamp", 1, "str"),
+        ("current_price", 2, "int"),
+        ("change", 3, "str"),
+        ("change_price", 4, "int"),
+        ("change_rate", 5, "float"),
+        ("volume", 9, "int"),
+        ("accumulated_volume", 12, "int"),
+        ("open_price", 16, "int"),
+        ("high_price", 17, "int"),
+        ("low_price", 18, "int"),
+    ],
+    TR_ORDERBOOK: [
+        ("stock_code", 0, "str"),
+        ("timestamp", 1, "str"),
+        ("ask_prices", (3, 13), "int"),
+        ("bid_prices", (13, 23), "int"),
+        ("ask_volumes", (23, 33), "int"),
+        ("bid_volumes", (33, 43), "int"),
+        ("total_ask_volume", 43, "int"),
+        ("total_bid_volume", 44, "int"),
+    ],
+}
+
+def _to_ints(values: List[str]) -> tuple:
+    try:
+        return tuple(map(int, values))
+    except ValueError:
+        # 빈 필드는 0으로 처리
+        return tuple(int(v) if v else 0 for v in values)
+
+
+def _to_floats(values: List[str]) -> tuple:
+    try:
+        return tuple(map(float, values))
+    except ValueError:
+        return tuple(float(v) if v else 0.0 for v in values)
+
+
+_CONVERTERS = {"str": tuple, "int": _to_ints, "float": _to_floats}
+
+
+def _min_width(specs: List[ColumnSpec]) -> int:
+    return max((pos[1] if isinstance(pos, tuple) else pos + 1) for _, pos, _ in specs)
+
+
+def is_data_frame(message: Union[str, bytes]) -> bool:
+    """실시간 데이터 프레임 여부 (JSON 시도 없이 첫 두 글자로 판별)"""
+    if isinstance(message, bytes):
+        return len(message) > 2 and message[:1] in (b"0", b"1") and message[1:2] == b"|"
+    return len(message) > 2 and message[0] in "01" and message[1] == "|"
+
+
+@dataclass
+class FrameBatch:
+    """한 프레임의 디코딩 결과 (컬럼별 타입 튜플)
+
+    Attributes:
+        tr_id: 거래 ID
+        count: 레코드 수
+        columns: 컬럼명 → 레코드 수 길이의 튜플 (int/float/str, 호가 10단계는 레코드별 10개 튜플)
+    """
+    tr_id: str
+    count: int
+    columns: Dict[str, tuple] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, name: str) -> tuple:
+        return self.columns[name]
+
+    def array(self, name: str) -> np.ndarray:
+        """컬럼의 numpy 배열 (호가 10단계는 (count, 10))"""
+        return np.asarray(self.columns[name])
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """레코드별 딕셔너리 (_normalize_kis_message와 같은 형식, 기존 콜백 호환용)"""
+        names = list(self.columns)
+        listed = {name for name in names if self.columns[name] and isinstance(self.columns[name][0], tuple)}
+        for values in zip(*(self.columns[name] for name in names)):
+            record = dict(zip(names, values))
+            for name in listed:
+                record[name] = list(record[name])
+            yield record
+
+
+class FrameDecoder:
+    """KIS 실시간 프레임 배치 디코더
+
+    Args:
+        specs: TR_ID별 컬럼 정의 (기본: FIELD_SPECS)
+    """
+
+    def __init__(self, specs: Optional[Dict[str, List[ColumnSpec]]] = None):
+        self.specs = specs or FIELD_SPECS
+        self._min_width = {tr_id: _min_width(s) for tr_id, s in self.specs.items()}
+        # (이름, 시작, 끝(단일 필드면 None), 변환 함수)로 미리 풀어둠
+        self._plans = {
+            tr_id: [
+                (name, pos[0], pos[1], _CONVERTERS[kind]) if isinstance(pos, tuple)
+                else (name, pos, None, _CONVERTERS[kind])
+                for name, pos, kind in s
+            ]
+            for tr_id, s in self.specs.items()
+        }
+        self.frames = 0
+        self.records = 0
+        self.errors = 0
+
+    def decode(self, message: Union[str, bytes]) -> Optional[FrameBatch]:
+        """데이터 프레임 디코딩
+
+        Returns:
+            Optional[FrameBatch]: 디코딩 결과 (암호화/미지원 TR_ID/형식 오류 시 None)
+        """
+        if isinstance(message, bytes):
+            message = message.decode("utf-8")
+
+        parts = message.split("|", 3)
+        if len(parts) != 4:
+            self.errors += 1
+            logger.warning(f"실시간 프레임 형식 오류: {message[:100]}")
+            return None
+
+        encrypted, tr_id, count_text, data = parts
+        if encrypted == "1":
+            logger.debug(f"암호화 프레임은 배치 디코딩 미지원: {tr_id}")
+            return None
+
+        plan = self._plans.get(tr_id)
+        if plan is None:
+            return None
+
+        try:
+            count = int(count_text)
+        except ValueError:
+            self.errors += 1
+            logger.warning(f"실시간 프레임 건수 오류 ({tr_id}): {count_text}")
+            return None
+
+        fields = data.split("^")
+        if count <= 0 or len(fields) % count:
+            self.errors += 1
+            logger.warning(f"실시간 프레임 필드 수 불일치 ({tr_id}): {len(fields)}개 / {count}건")
+            return None
+
+        width = len(fields) // count
+        if width < self._min_width[tr_id]:
+            self.errors += 1
+            logger.warning(f"실시간 프레임 필드 부족 ({tr_id}): {width}개")
+            return None
+
+        try:
+            batch = FrameBatch(tr_id, count, self._columns(fields, count, width, plan))
+        except ValueError as e:
+            self.errors += 1
+            logger.error(f"실시간 프레임 파싱 오류 ({tr_id}): {e}, 본문: {data[:100]}", exc_info=True)
+            return None
+
+        self.frames += 1
+        self.records += count
+        return batch
+
+    @staticmethod
+    def _columns(fields: List[str], count: int, width: int, plan: list) -> Dict[str, tuple]:
+        columns = {}
+        stop = count * width
+        for name, start, end, convert in plan:
+            if end is None:
+                columns[name] = convert(fields[start:stop:width])
+            elif count == 1:
+                columns[name] = (convert(fields[start:end]),)
+            else:
+                columns[name] = tuple(
+                    convert(fields[base + start:base + end]) for base in range(0, stop, width)
+                )
+        return columns
+
+
+class FrameRecorder:
+    """수신 프레임 녹화 (한 줄에 한 프레임, 닫힌 뒤 기록하면 이어서 추가)"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = None
+
+    def write(self, message: Union[str, bytes]):
+        if isinstance(message, bytes):
+            message = message.decode("utf-8")
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(message.replace("\n", " ") + "\n")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "FrameRecorder":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_recorded_frames(path: Union[str, Path]) -> List[str]:
+    """녹화 파일의 프레임 목록"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.rstrip("\n") for line in f if line.strip()]
+
+
+def measure_replay(path: Union[str, Path], repeat: int = 3) -> Dict[str, float]:
+    """녹화 프레임 디코딩 처리량 측정 (실시간 연결 없음)
+
+    Returns:
+        Dict: frames, records, data_frames, frames_per_sec, records_per_sec (최고 회차 기준)
+    """
+    frames = load_recorded_frames(path)
+    best = float("inf")
+    decoder = FrameDecoder()
+    for _ in range(max(1, repeat)):
+        decoder = FrameDecoder()
+        started = time.perf_counter()
+        for message in frames:
+            if is_data_frame(message):
+                decoder.decode(message)
+        best = min(best, time.perf_counter() - started)
+
+    best = max(best, 1e-9)
+    return {
+        "frames": len(frames),
+        "data_frames": decoder.frames,
+        "records": decoder.records,
+        "frames_per_sec": len(frames) / best,
+        "records_per_sec": decoder.records / best,
+    }
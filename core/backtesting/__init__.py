@@ -13,6 +13,12 @@ from .walk_forward import (
     WalkForwardResult,
     WindowResult
 )
+from .worker_pool import (
+    BacktestWorkerPool,
+    WorkerPoolConfig,
+    BacktestTimeoutError,
+    BacktestWorkerError
+)
 
 __all__ = [
     'BaseBacktester',
@@ -23,5 +29,9 @@ __all__ = [
     'WalkForwardAnalyzer',
     'WalkForwardConfig',
     'WalkForwardResult',
-    'WindowResult'
+    'WindowResult',
+    'BacktestWorkerPool',
+    'WorkerPoolConfig',
+    'BacktestTimeoutError',
+    'BacktestWorkerError'
 ]
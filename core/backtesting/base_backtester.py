@@ -9,13 +9,14 @@ import numpy as np
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 from dataclasses import asdict, replace
 
 from core.utils.log_utils import get_logger
 from core.api.kis_api import KISAPI
 from core.backtesting.trading_costs import TradingCosts
 from core.backtesting.models import BacktestResult, Trade
+from core.backtesting.data_cache import BacktestDataCache
 from core.config.constants import RISK_FREE_RATE
 
 logger = get_logger(__name__)
@@ -30,10 +31,15 @@ class BaseBacktester(ABC):
     - _get_strategy_name(): 추상 메서드 (전략명 반환)
     """
 
-    def __init__(self, initial_capital: float = 100000000):
+    def __init__(
+        self,
+        initial_capital: float = 100000000,
+        data_cache: Optional[BacktestDataCache] = None
+    ):
         """
         Args:
             initial_capital: 초기 자본금 (기본: 1억원)
+            data_cache: 여러 백테스트 실행이 공유할 데이터 캐시 (None이면 매번 로드)
         """
         self.logger = logger
         self.initial_capital = initial_capital
@@ -41,6 +47,7 @@ class BaseBacktester(ABC):
         self.trading_costs = TradingCosts()
         # TODO: 캐시 TTL 설정 고려 (백테스트 기간이 길 경우 메모리 부담)
         self.price_data_cache: Dict = {}  # 가격 데이터 캐시
+        self.data_cache = data_cache
 
     def backtest(
         self,
@@ -137,18 +144,15 @@ class BaseBacktester(ABC):
 
             while current_date <= end:
                 date_str = current_date.strftime("%Y%m%d")
-                file_path = Path(f"data/daily_selection/daily_selection_{date_str}.json")
-
-                if file_path.exists():
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            stocks = data.get('data', {}).get('selected_stocks', [])
-                            for stock in stocks:
-                                stock['selection_date'] = current_date.strftime("%Y-%m-%d")
-                            selections.extend(stocks)
-                    except Exception as e:
-                        self.logger.error(f"데이터 로드 실패 {date_str}: {e}", exc_info=True)
+
+                if self.data_cache is not None:
+                    stocks = self.data_cache.get_selections(
+                        date_str,
+                        lambda day=current_date: self._load_day_selections(day)
+                    )
+                else:
+                    stocks = self._load_day_selections(current_date)
+                selections.extend(stocks)
 
                 current_date += timedelta(days=1)
 
@@ -159,6 +163,48 @@ class BaseBacktester(ABC):
             self.logger.error(f"선정 데이터 로드 실패: {e}", exc_info=True)
             return []
 
+    def _load_day_selections(self, day: datetime) -> List[Dict]:
+        """하루치 선정 데이터 로드
+
+        Args:
+            day: 선정 날짜
+
+        Returns:
+            List[Dict]: 선정 종목 목록 (파일 없으면 빈 리스트)
+        """
+        date_str = day.strftime("%Y%m%d")
+        file_path = Path(f"data/daily_selection/daily_selection_{date_str}.json")
+
+        if not file_path.exists():
+            return []
+
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            stocks = data.get('data', {}).get('selected_stocks', [])
+            for stock in stocks:
+                stock['selection_date'] = day.strftime("%Y-%m-%d")
+            return stocks
+        except Exception as e:
+            self.logger.error(f"데이터 로드 실패 {date_str}: {e}", exc_info=True)
+            return []
+
+    def _fetch_price_history(self, stock_code: str):
+        """종목 가격 이력 조회 (데이터 캐시가 있으면 재사용)
+
+        Args:
+            stock_code: 종목 코드
+
+        Returns:
+            DataFrame 또는 None
+        """
+        if self.data_cache is not None:
+            return self.data_cache.get_prices(
+                stock_code,
+                lambda: self.api.get_daily_prices(stock_code, period=100)
+            )
+        return self.api.get_daily_prices(stock_code, period=100)
+
     def _load_price_data_for_backtest(
         self,
         selections: List[Dict],
@@ -194,7 +240,7 @@ class BaseBacktester(ABC):
             for code in stock_codes:
                 try:
                     # API를 통해 과거 데이터 조회 (충분한 기간)
-                    price_df = self.api.get_daily_prices(code, period=100)
+                    price_df = self._fetch_price_history(code)
 
                     if price_df is None or price_df.empty:
                         self.logger.warning(f"가격 데이터 없음: {code}")
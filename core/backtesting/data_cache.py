@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+백테스트 데이터 캐시
+겹치는 기간을 반복 실행할 때(Walk-Forward 등) 일별 선정 데이터와 가격 이력을 재사용
+"""
+
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class BacktestDataCache:
+    """일별 선정 데이터 / 종목별 가격 이력 캐시
+
+    캐시는 원본 데이터만 보관하며, 기간 필터링과 가공은 호출 측에서 수행합니다.
+    같은 프로세스 안에서 여러 백테스트 실행이 하나의 캐시를 공유할 수 있습니다.
+    """
+
+    def __init__(self):
+        self._selections: Dict[str, List[Dict]] = {}
+        self._prices: Dict[str, pd.DataFrame] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_selections(self, date_str: str, loader: Callable[[], List[Dict]]) -> List[Dict]:
+        """일별 선정 데이터 조회 (없으면 loader로 로드 후 저장)
+
+        Args:
+            date_str: 날짜 (YYYYMMDD)
+            loader: 선정 데이터 로드 함수
+
+        Returns:
+            List[Dict]: 선정 종목 목록 (호출 측 수정이 캐시에 반영되지 않도록 복사본)
+        """
+        if date_str in self._selections:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._selections[date_str] = loader()
+        return [dict(stock) for stock in self._selections[date_str]]
+
+    def get_prices(
+        self,
+        stock_code: str,
+        loader: Callable[[], Optional[pd.DataFrame]]
+    ) -> Optional[pd.DataFrame]:
+        """종목 가격 이력 조회 (없으면 loader로 로드 후 저장)
+
+        조회 실패(None)는 저장하지 않으므로 다음 호출에서 다시 로드합니다.
+
+        Args:
+            stock_code: 종목 코드
+            loader: 가격 이력 로드 함수
+
+        Returns:
+            DataFrame 또는 None (조회 실패 시)
+        """
+        if stock_code in self._prices:
+            self.hits += 1
+            return self._prices[stock_code]
+
+        self.misses += 1
+        prices = loader()
+        if prices is not None:
+            self._prices[stock_code] = prices
+        return prices
+
+    def clear(self):
+        """캐시 비우기"""
+        self._selections.clear()
+        self._prices.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self) -> Dict:
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            'selection_days': len(self._selections),
+            'price_series': len(self._prices),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
@@ -4,12 +4,14 @@ Walk-Forward Analysis 모듈
 Rolling window 방식으로 전략을 Out-of-Sample 검증
 """
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 import statistics
 
 from core.utils.log_utils import get_logger
+from core.backtesting.data_cache import BacktestDataCache
 from core.backtesting.strategy_backtester import StrategyBacktester, BacktestResult
 
 logger = get_logger(__name__)
@@ -30,12 +32,15 @@ class WalkForwardConfig:
             통계적 유의성을 위해 최소 15건 이상 권장.
         purge_days: 학습/테스트 구간 사이 데이터 격리 기간 (일). 기본 5일.
             Look-ahead bias 방지용. 보유 기간과 동일하게 설정 권장.
+        max_workers: 윈도우 병렬 실행 프로세스 수. 기본 1(순차 실행).
+            여러 해를 분석할 때는 CPU 코어 수에 맞춰 설정.
     """
     train_window_days: int = 180  # 6개월
     test_window_days: int = 30    # 1개월
     step_days: int = 30           # 1개월씩 이동
     min_train_trades: int = 20    # 최소 학습 거래수
     purge_days: int = 5           # 데이터 격리 기간
+    max_workers: int = 1          # 윈도우 병렬 실행 프로세스 수
 
 
 @dataclass
@@ -66,6 +71,39 @@ class WalkForwardResult:
     valid_windows: int                # windows with sufficient trades
 
 
+# 윈도우 완료 콜백: (완료 윈도우 결과 또는 None, 윈도우 번호, 전체 윈도우 수)
+WindowCallback = Callable[[Optional[WindowResult], int, int], None]
+
+# 워커 프로세스별 분석기 (프로세스 안에서 데이터 캐시를 윈도우 간 공유)
+_worker_analyzer: Optional['WalkForwardAnalyzer'] = None
+
+
+def _init_window_worker(config: 'WalkForwardConfig'):
+    """워커 프로세스 초기화"""
+    global _worker_analyzer
+    _worker_analyzer = WalkForwardAnalyzer(config)
+
+
+def _run_window_in_worker(
+    window_index: int,
+    window_dates: Tuple[str, str, str, str],
+    selection_criteria: Dict,
+    trading_config: Dict
+) -> Tuple[int, Optional[WindowResult]]:
+    """워커 프로세스에서 단일 윈도우 실행"""
+    train_start, train_end, test_start, test_end = window_dates
+    result = _worker_analyzer._backtest_window(
+        window_index=window_index,
+        train_start=train_start,
+        train_end=train_end,
+        test_start=test_start,
+        test_end=test_end,
+        selection_criteria=selection_criteria,
+        trading_config=trading_config
+    )
+    return window_index, result
+
+
 class WalkForwardAnalyzer:
     """Walk-Forward Analysis 수행 엔진"""
 
@@ -75,7 +113,9 @@ class WalkForwardAnalyzer:
             config: Walk-Forward 설정 (기본값 사용 시 None)
         """
         self.config = config or WalkForwardConfig()
-        self.backtester = StrategyBacktester()
+        # 겹치는 Train 구간이 같은 일별 선정/가격 데이터를 다시 로드하지 않도록 캐시 공유
+        self.data_cache = BacktestDataCache()
+        self.backtester = StrategyBacktester(data_cache=self.data_cache)
 
         # 입력 검증
         if self.config.train_window_days <= 0:
@@ -84,13 +124,16 @@ class WalkForwardAnalyzer:
             raise ValueError(f"test_window_days must be > 0, got {self.config.test_window_days}")
         if self.config.step_days <= 0:
             raise ValueError(f"step_days must be > 0, got {self.config.step_days}")
+        if self.config.max_workers <= 0:
+            raise ValueError(f"max_workers must be > 0, got {self.config.max_workers}")
 
         logger.info(
             f"WalkForwardAnalyzer 초기화: "
             f"train={self.config.train_window_days}일, "
             f"test={self.config.test_window_days}일, "
             f"step={self.config.step_days}일, "
-            f"min_trades={self.config.min_train_trades}"
+            f"min_trades={self.config.min_train_trades}, "
+            f"workers={self.config.max_workers}"
         )
 
     def run(
@@ -99,7 +142,8 @@ class WalkForwardAnalyzer:
         end_date: str,
         selection_criteria: Dict,
         trading_config: Dict,
-        strategy_name: str = "walk_forward"
+        strategy_name: str = "walk_forward",
+        on_window_complete: Optional[WindowCallback] = None
     ) -> WalkForwardResult:
         """Walk-Forward Analysis 실행
 
@@ -109,6 +153,7 @@ class WalkForwardAnalyzer:
             selection_criteria: 종목 선정 기준
             trading_config: 매매 설정
             strategy_name: 전략명
+            on_window_complete: 윈도우 완료 시 호출 (병렬 실행 시 완료 순서대로 호출)
 
         Returns:
             WalkForwardResult: 종합 결과
@@ -122,29 +167,23 @@ class WalkForwardAnalyzer:
         windows_dates = self._generate_windows(start_date, end_date)
         logger.info(f"총 {len(windows_dates)}개 윈도우 생성")
 
-        # 2. 각 윈도우별 백테스트 실행
-        window_results = []
-        for i, (train_start, train_end, test_start, test_end) in enumerate(windows_dates, start=1):
-            logger.info(
-                f"[{i}/{len(windows_dates)}] 윈도우 실행: "
-                f"Train {train_start}~{train_end}, "
-                f"Test {test_start}~{test_end}"
+        # 2. 각 윈도우별 백테스트 실행 (결과는 윈도우 번호 순으로 병합)
+        if self.config.max_workers > 1 and len(windows_dates) > 1:
+            results_by_index = self._run_windows_parallel(
+                windows_dates, selection_criteria, trading_config, on_window_complete
             )
-
-            result = self._backtest_window(
-                window_index=i,
-                train_start=train_start,
-                train_end=train_end,
-                test_start=test_start,
-                test_end=test_end,
-                selection_criteria=selection_criteria,
-                trading_config=trading_config
+        else:
+            results_by_index = self._run_windows_sequential(
+                windows_dates, selection_criteria, trading_config, on_window_complete
             )
 
+        window_results = []
+        for i in sorted(results_by_index):
+            result = results_by_index[i]
             if result:
                 window_results.append(result)
                 logger.info(
-                    f"  Train Sharpe: {result.train_result.sharpe_ratio:.3f}, "
+                    f"  [W{i}] Train Sharpe: {result.train_result.sharpe_ratio:.3f}, "
                     f"Test Sharpe: {result.test_result.sharpe_ratio:.3f}, "
                     f"OF Ratio: {result.overfitting_ratio:.3f}"
                 )
@@ -169,6 +208,102 @@ class WalkForwardAnalyzer:
 
         return final_result
 
+    def _run_windows_sequential(
+        self,
+        windows_dates: List[Tuple[str, str, str, str]],
+        selection_criteria: Dict,
+        trading_config: Dict,
+        on_window_complete: Optional[WindowCallback] = None
+    ) -> Dict[int, Optional[WindowResult]]:
+        """윈도우 순차 실행
+
+        Returns:
+            Dict[윈도우 번호, 결과 또는 None]
+        """
+        total = len(windows_dates)
+        results: Dict[int, Optional[WindowResult]] = {}
+
+        for i, (train_start, train_end, test_start, test_end) in enumerate(windows_dates, start=1):
+            logger.info(
+                f"[{i}/{total}] 윈도우 실행: "
+                f"Train {train_start}~{train_end}, "
+                f"Test {test_start}~{test_end}"
+            )
+
+            results[i] = self._backtest_window(
+                window_index=i,
+                train_start=train_start,
+                train_end=train_end,
+                test_start=test_start,
+                test_end=test_end,
+                selection_criteria=selection_criteria,
+                trading_config=trading_config
+            )
+            self._notify_window_complete(on_window_complete, results[i], i, total)
+
+        return results
+
+    def _run_windows_parallel(
+        self,
+        windows_dates: List[Tuple[str, str, str, str]],
+        selection_criteria: Dict,
+        trading_config: Dict,
+        on_window_complete: Optional[WindowCallback] = None
+    ) -> Dict[int, Optional[WindowResult]]:
+        """윈도우 병렬 실행 (프로세스 풀)
+
+        윈도우는 시간 순서대로 제출되므로 각 워커는 인접한(겹치는) 윈도우를 이어서 처리하게 되고,
+        워커별 데이터 캐시가 겹치는 구간의 선정/가격 데이터를 재사용합니다.
+
+        Returns:
+            Dict[윈도우 번호, 결과 또는 None]
+        """
+        total = len(windows_dates)
+        workers = min(self.config.max_workers, total)
+        results: Dict[int, Optional[WindowResult]] = {}
+
+        logger.info(f"윈도우 병렬 실행: {total}개 윈도우, {workers}개 프로세스")
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_window_worker,
+            initargs=(self.config,)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _run_window_in_worker, i, dates, selection_criteria, trading_config
+                ): i
+                for i, dates in enumerate(windows_dates, start=1)
+            }
+
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    _, result = future.result()
+                except Exception as e:
+                    logger.error(f"윈도우 {i} 워커 실행 실패: {e}", exc_info=True)
+                    result = None
+
+                results[i] = result
+                self._notify_window_complete(on_window_complete, result, i, total)
+
+        return results
+
+    @staticmethod
+    def _notify_window_complete(
+        callback: Optional[WindowCallback],
+        result: Optional[WindowResult],
+        window_index: int,
+        total: int
+    ):
+        """윈도우 완료 콜백 호출 (콜백 오류는 분석에 영향 없음)"""
+        if callback is None:
+            return
+        try:
+            callback(result, window_index, total)
+        except Exception as e:
+            logger.warning(f"윈도우 완료 콜백 오류: {e}")
+
     def _generate_windows(
         self,
         start_date: str,
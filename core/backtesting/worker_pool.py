@@ -0,0 +1,541 @@
+#!/usr/bin/env python3
+"""
+상주 백테스트 워커 풀
+백테스트마다 인터프리터를 새로 띄우지 않고, 미리 띄운 워커 프로세스가 파라미터 세트를 받아 실행
+
+- 워커는 시작 시 전략 클래스를 import하고, 기간별 가격 데이터를 프로세스 안에 캐시
+- 작업별 타임아웃: 초과 시 해당 워커를 종료하고 새 워커로 교체
+- 취소: 대기 중인 작업은 큐에서 제거, 실행 중인 작업은 워커 종료 후 교체
+- 결과는 구조화된 지표 딕셔너리로 반환 (stdout 파싱 없음)
+- 워커 초기화가 연속으로 실패하면 재생성을 멈추고 대기/신규 작업을 초기화 오류로 실패 처리
+"""
+
+import inspect
+import itertools
+import multiprocessing as mp
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass, field
+from multiprocessing.connection import wait as wait_connections
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class BacktestTimeoutError(TimeoutError):
+    """워커 풀 작업 타임아웃"""
+
+
+class BacktestWorkerError(RuntimeError):
+    """워커 프로세스 내 백테스트 실패 또는 비정상 종료"""
+
+
+@dataclass
+class WorkerPoolConfig:
+    """워커 풀 설정"""
+    num_workers: int = 2                 # 상주 워커 프로세스 수
+    default_timeout_seconds: float = 300.0  # 작업 기본 타임아웃
+    poll_interval_seconds: float = 0.1   # 디스패처 폴링 간격
+    max_init_failures: int = 3           # 연속 초기화 실패 허용 횟수 (초과 시 워커 재생성 중단)
+
+
+@dataclass
+class _Task:
+    task_id: str
+    strategy_name: str
+    parameters: Dict[str, Any]
+    config: Dict[str, Any]
+    timeout: float
+    future: Future = field(default_factory=Future)
+    submitted_at: float = field(default_factory=time.time)
+
+
+class HantuBacktestRunner:
+    """hantu_backtest 엔진 실행기 (워커 프로세스 안에서 생성)
+
+    전략 클래스는 생성 시 한 번만 import하고, 같은 기간의 가격 데이터는
+    첫 실행에서 로드한 것을 재사용합니다. 같은 데이터로 파라미터만 바꿔 평가하므로
+    평가 간 비교도 일관됩니다.
+    """
+
+    def __init__(self):
+        from hantu_backtest.core.backtest import Backtest
+        from hantu_backtest.strategies.momentum import MomentumStrategy
+
+        self._backtest_cls = Backtest
+        self._strategies: Dict[str, type] = {"momentum": MomentumStrategy}
+        self._default_strategy = MomentumStrategy
+        self._data_cache: Dict[Tuple[str, str], Any] = {}
+
+    def _resolve_strategy(self, strategy_name: str) -> type:
+        for key, strategy_cls in self._strategies.items():
+            if key in strategy_name.lower():
+                return strategy_cls
+        return self._default_strategy
+
+    def run(self, strategy_name: str, parameters: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+        """백테스트 실행
+
+        Args:
+            strategy_name: 전략명
+            parameters: 전략 파라미터 (전략 생성자 인자와 일치하는 항목만 사용)
+            config: 백테스트 설정 (start_date, end_date, initial_capital, commission)
+
+        Returns:
+            Dict: 성과 지표 (수익률은 비율 단위)
+        """
+        strategy_cls = self._resolve_strategy(strategy_name)
+        accepted = inspect.signature(strategy_cls.__init__).parameters
+        strategy = strategy_cls(**{k: v for k, v in parameters.items() if k in accepted})
+
+        start_date = config.get("start_date", "2023-01-01")
+        end_date = config.get("end_date", "2024-01-01")
+        key = (start_date, end_date)
+        if key not in self._data_cache:
+            self._data_cache[key] = strategy.load_data(start_date, end_date)
+        cached = self._data_cache[key]
+        strategy.load_data = lambda *_: cached.copy()
+
+        backtest = self._backtest_cls(
+            strategy=strategy,
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=config.get("initial_capital", 100_000_000),
+            commission=config.get("commission", 0.00015),
+        )
+        output = backtest.run()
+
+        returns = output.get("returns", {})
+        trades = output.get("trades", [])
+        return {
+            "total_return": returns.get("total_return", 0.0) / 100,
+            "annual_return": returns.get("annual_return", 0.0) / 100,
+            "sharpe_ratio": returns.get("sharpe_ratio", 0.0),
+            "total_trades": len(trades),
+        }
+
+
+def _worker_main(conn, runner_factory: Callable[[], Any]):
+    """워커 프로세스 진입점
+
+    메시지 형식:
+        부모 → 워커: (task_id, strategy_name, parameters, config) 또는 None(종료)
+        워커 → 부모: ("ready", None, None) / (task_id, "ok", 지표) / (task_id, "error", 메시지)
+    """
+    try:
+        runner = runner_factory()
+    except Exception as e:
+        conn.send(("init_error", "error", f"워커 초기화 실패: {e}"))
+        return
+
+    conn.send(("ready", None, None))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+
+        task_id, strategy_name, parameters, config = message
+        try:
+            metrics = runner.run(strategy_name, parameters, config)
+            conn.send((task_id, "ok", metrics))
+        except Exception as e:
+            conn.send((task_id, "error", f"{type(e).__name__}: {e}"))
+
+
+class _WorkerHandle:
+    """부모 측 워커 상태"""
+
+    def __init__(self, worker_id: int, process, conn):
+        self.worker_id = worker_id
+        self.process = process
+        self.conn = conn
+        self.ready = False
+        self.task: Optional[_Task] = None
+        self.started_at: float = 0.0
+
+
+class BacktestWorkerPool:
+    """상주 백테스트 워커 풀
+
+    Usage:
+        pool = BacktestWorkerPool(WorkerPoolConfig(num_workers=4))
+        pool.start()
+        future = pool.submit("momentum", {"rsi_period": 10}, {"start_date": "2023-01-01"})
+        metrics = future.result()
+        pool.stop()
+    """
+
+    def __init__(
+        self,
+        config: Optional[WorkerPoolConfig] = None,
+        runner_factory: Callable[[], Any] = HantuBacktestRunner,
+    ):
+        """
+        Args:
+            config: 워커 풀 설정
+            runner_factory: 워커 프로세스에서 실행기를 생성하는 함수 (pickle 가능해야 함)
+        """
+        self.config = config or WorkerPoolConfig()
+        self._runner_factory = runner_factory
+        self._context = mp.get_context()
+
+        self._lock = threading.Lock()
+        self._pending: Deque[_Task] = deque()
+        self._tasks: Dict[str, _Task] = {}
+        self._workers: Dict[int, _WorkerHandle] = {}
+        self._worker_ids = itertools.count()
+        self._task_ids = itertools.count(1)
+
+        self._dispatcher: Optional[threading.Thread] = None
+        self._running = False
+        self._init_failures = 0
+        self._init_error: Optional[BacktestWorkerError] = None
+
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "cancelled": 0,
+            "workers_restarted": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+    def start(self):
+        """워커 프로세스 및 디스패처 시작"""
+        if self._running:
+            return
+
+        self._running = True
+        self._init_failures = 0
+        self._init_error = None
+        for _ in range(max(1, self.config.num_workers)):
+            self._spawn_worker()
+
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, name="BacktestWorkerPool", daemon=True
+        )
+        self._dispatcher.start()
+        logger.info(f"백테스트 워커 풀 시작: {len(self._workers)}개 워커")
+
+    def stop(self, timeout: float = 5.0):
+        """풀 종료 (남은 작업은 취소)"""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._dispatcher:
+            self._dispatcher.join(timeout=timeout)
+
+        with self._lock:
+            for task in list(self._tasks.values()):
+                task.future.cancel()
+            self._pending.clear()
+            self._tasks.clear()
+            workers = list(self._workers.values())
+            self._workers.clear()
+
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except (OSError, BrokenPipeError):
+                pass
+        for worker in workers:
+            worker.process.join(timeout=timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join(timeout=1)
+            worker.conn.close()
+
+        logger.info(f"백테스트 워커 풀 종료: {self.get_stats()}")
+
+    def __enter__(self) -> 'BacktestWorkerPool':
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    # ------------------------------------------------------------------
+    # 작업 제출 / 취소
+    # ------------------------------------------------------------------
+    def submit(
+        self,
+        strategy_name: str,
+        parameters: Dict[str, Any],
+        config: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        task_id: Optional[str] = None,
+    ) -> Future:
+        """백테스트 작업 제출
+
+        Args:
+            strategy_name: 전략명
+            parameters: 전략 파라미터
+            config: 백테스트 설정 딕셔너리
+            timeout: 실행 타임아웃 (초, None이면 기본값)
+            task_id: 작업 ID (None이면 자동 생성, 취소 시 사용)
+
+        Returns:
+            Future: 결과는 지표 딕셔너리. 실패 시 BacktestWorkerError,
+            타임아웃 시 BacktestTimeoutError, 취소 시 CancelledError.
+            워커 초기화 실패로 풀을 사용할 수 없으면 초기화 오류로 즉시 실패
+        """
+        if not self._running:
+            raise RuntimeError("워커 풀이 시작되지 않았습니다")
+
+        task = _Task(
+            task_id=task_id or f"task_{next(self._task_ids)}",
+            strategy_name=strategy_name,
+            parameters=dict(parameters),
+            config=dict(config or {}),
+            timeout=timeout if timeout is not None else self.config.default_timeout_seconds,
+        )
+        task.future.task_id = task.task_id
+
+        with self._lock:
+            if task.task_id in self._tasks:
+                raise ValueError(f"중복 작업 ID: {task.task_id}")
+            self._stats["submitted"] += 1
+            if self._init_error is not None and not self._workers:
+                self._stats["failed"] += 1
+                task.future.set_exception(self._init_error)
+                return task.future
+            self._tasks[task.task_id] = task
+            self._pending.append(task)
+
+        return task.future
+
+    def cancel(self, task_id: str) -> bool:
+        """작업 취소
+
+        대기 중인 작업은 큐에서 제거하고, 실행 중인 작업은 워커를 종료 후 교체합니다.
+
+        Returns:
+            bool: 취소 여부 (이미 완료된 작업이면 False)
+        """
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None or task.future.done():
+                return False
+
+            if task in self._pending:
+                self._pending.remove(task)
+            else:
+                worker = self._find_worker(task_id)
+                if worker is not None:
+                    self._replace_worker(worker)
+
+            self._tasks.pop(task_id, None)
+            task.future.cancel()
+            self._stats["cancelled"] += 1
+
+        logger.info(f"백테스트 작업 취소: {task_id}")
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 통계"""
+        with self._lock:
+            return {
+                **self._stats,
+                "pending": len(self._pending),
+                "running": sum(1 for w in self._workers.values() if w.task),
+                "workers": len(self._workers),
+            }
+
+    # ------------------------------------------------------------------
+    # 내부: 워커 관리
+    # ------------------------------------------------------------------
+    def _spawn_worker(self) -> _WorkerHandle:
+        parent_conn, child_conn = self._context.Pipe()
+        worker_id = next(self._worker_ids)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self._runner_factory),
+            name=f"BacktestWorker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+
+        handle = _WorkerHandle(worker_id, process, parent_conn)
+        self._workers[worker_id] = handle
+        return handle
+
+    def _discard_worker(self, worker: _WorkerHandle):
+        """워커 종료 및 핸들 제거 (lock 보유 상태에서 호출)"""
+        self._workers.pop(worker.worker_id, None)
+        if worker.process.is_alive():
+            worker.process.terminate()
+        worker.process.join(timeout=1)
+        worker.conn.close()
+
+    def _replace_worker(self, worker: _WorkerHandle):
+        """워커 종료 후 새 워커로 교체 (lock 보유 상태에서 호출)"""
+        self._discard_worker(worker)
+
+        if self._running and self._init_error is None:
+            self._spawn_worker()
+            self._stats["workers_restarted"] += 1
+
+    def _handle_init_error(self, worker: _WorkerHandle, message: str):
+        """워커 초기화 실패 처리 (lock 보유 상태에서 호출)
+
+        연속 실패가 max_init_failures에 도달하면 재생성을 멈추고, 대기 작업과
+        이후 제출되는 작업을 초기화 오류로 실패 처리합니다.
+        """
+        logger.error(f"{worker.process.name}: {message}")
+        self._init_failures += 1
+        if self._init_failures >= max(1, self.config.max_init_failures):
+            self._init_error = BacktestWorkerError(message)
+            logger.error(
+                f"워커 초기화 {self._init_failures}회 연속 실패 - 워커 재생성 중단"
+            )
+        self._replace_worker(worker)
+
+        if self._init_error is not None and not self._workers:
+            self._fail_all_pending(self._init_error)
+
+    def _find_worker(self, task_id: str) -> Optional[_WorkerHandle]:
+        for worker in self._workers.values():
+            if worker.task and worker.task.task_id == task_id:
+                return worker
+        return None
+
+    # ------------------------------------------------------------------
+    # 내부: 디스패치 루프
+    # ------------------------------------------------------------------
+    def _dispatch_loop(self):
+        while self._running:
+            try:
+                self._assign_pending()
+                self._collect_results()
+                self._check_timeouts()
+            except Exception as e:
+                logger.error(f"워커 풀 디스패치 오류: {e}", exc_info=True)
+                time.sleep(self.config.poll_interval_seconds)
+
+    def _assign_pending(self):
+        with self._lock:
+            for worker in list(self._workers.values()):
+                if not self._pending:
+                    return
+                if not worker.ready or worker.task is not None:
+                    continue
+
+                task = self._pending.popleft()
+                try:
+                    worker.conn.send(
+                        (task.task_id, task.strategy_name, task.parameters, task.config)
+                    )
+                except (OSError, BrokenPipeError):
+                    self._pending.appendleft(task)
+                    self._replace_worker(worker)
+                    continue
+                worker.task = task
+                worker.started_at = time.time()
+
+    def _collect_results(self):
+        with self._lock:
+            conns = {w.conn: w for w in self._workers.values()}
+
+        if not conns:
+            time.sleep(self.config.poll_interval_seconds)
+            return
+
+        try:
+            ready = wait_connections(list(conns), timeout=self.config.poll_interval_seconds)
+        except (OSError, ValueError):
+            # 대기 중 취소/타임아웃으로 연결이 닫힌 경우 다음 주기에 다시 확인
+            return
+
+        for conn in ready:
+            worker = conns[conn]
+            if worker.worker_id not in self._workers:
+                continue
+            try:
+                task_id, status, payload = conn.recv()
+            except (EOFError, OSError):
+                self._handle_worker_exit(worker)
+                continue
+
+            with self._lock:
+                if task_id == "ready":
+                    worker.ready = True
+                    self._init_failures = 0
+                    continue
+                if task_id == "init_error":
+                    self._handle_init_error(worker, payload)
+                    continue
+
+                task = worker.task
+                worker.task = None
+                if task is None or task.task_id != task_id:
+                    continue
+                self._tasks.pop(task_id, None)
+
+                if task.future.done():  # 이미 취소됨
+                    continue
+                if status == "ok":
+                    self._stats["completed"] += 1
+                    task.future.set_result(payload)
+                else:
+                    self._stats["failed"] += 1
+                    task.future.set_exception(BacktestWorkerError(payload))
+
+    def _handle_worker_exit(self, worker: _WorkerHandle):
+        """워커 비정상 종료 처리"""
+        with self._lock:
+            if worker.worker_id not in self._workers:
+                return
+            task = worker.task
+            logger.warning(f"{worker.process.name} 비정상 종료 - 교체")
+            self._replace_worker(worker)
+
+            if task is not None:
+                self._tasks.pop(task.task_id, None)
+                if not task.future.done():
+                    self._stats["failed"] += 1
+                    task.future.set_exception(
+                        BacktestWorkerError(f"워커 비정상 종료 (작업 {task.task_id})")
+                    )
+
+    def _fail_all_pending(self, error: Exception):
+        """워커 초기화 실패 시 대기 작업 실패 처리 (lock 보유 상태에서 호출)"""
+        while self._pending:
+            task = self._pending.popleft()
+            self._tasks.pop(task.task_id, None)
+            if not task.future.done():
+                self._stats["failed"] += 1
+                task.future.set_exception(error)
+
+    def _check_timeouts(self):
+        now = time.time()
+        with self._lock:
+            for worker in list(self._workers.values()):
+                task = worker.task
+                if task is None or now - worker.started_at < task.timeout:
+                    continue
+
+                logger.warning(f"백테스트 타임아웃: {task.task_id} ({task.timeout}초)")
+                self._replace_worker(worker)
+                self._tasks.pop(task.task_id, None)
+                if not task.future.done():
+                    self._stats["timed_out"] += 1
+                    task.future.set_exception(
+                        BacktestTimeoutError(f"백테스트 타임아웃 ({task.timeout}초)")
+                    )
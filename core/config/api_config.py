@@ -19,10 +19,15 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.ssl_ import create_urllib3_context
 
 from . import settings
+from .token_manager import TokenManager
 from core.utils.log_utils import get_logger
 
 # 글로벌 토큰 갱신 락 파일 (멀티프로세스 대응)
 _TOKEN_REFRESH_LOCK_FILE = os.path.join(tempfile.gettempdir(), "hantu_token_refresh.lock")
+_WS_APPROVAL_LOCK_FILE = os.path.join(tempfile.gettempdir(), "hantu_ws_approval.lock")
+
+# 만료 10분 전부터는 갱신 필요
+TOKEN_REFRESH_MARGIN = timedelta(minutes=10)
 
 
 class TLSAdapter(HTTPAdapter):
@@ -264,6 +269,9 @@ class APIConfig:
         self._session = requests.Session()
         self._session.mount('https://', TLSAdapter())
 
+        # 토큰 단일 비행/선제 갱신 관리자
+        self.token_manager = TokenManager(self)
+
         # 초기화 완료
         self._initialized = True
 
@@ -385,7 +393,7 @@ class APIConfig:
         self.request_times.append(current_time)
         self.last_request_time = current_time
         
-    def refresh_token(self, force: bool = False) -> bool:
+    def refresh_token(self, force: bool = False, min_validity: Optional[timedelta] = None) -> bool:
         """토큰 갱신 (전역 락으로 동시 갱신 방지)
 
         한국투자증권 공식 규정:
@@ -394,6 +402,7 @@ class APIConfig:
 
         Args:
             force: 강제 갱신 여부 (True일 때 1분 제한 무시)
+            min_validity: 이보다 잔여 시간이 짧으면 갱신 (기본 10분, 선제 갱신 시 더 길게)
 
         Returns:
             bool: 갱신 성공 여부
@@ -409,7 +418,7 @@ class APIConfig:
                     self._load_token()
 
                     # 토큰이 유효한지 먼저 확인 (force=True일 때도 확인)
-                    if self.validate_token():
+                    if self.validate_token(min_validity):
                         if force:
                             logger.info("[refresh_token] 토큰이 이미 유효함 (다른 프로세스가 갱신, force=True 무시)")
                         else:
@@ -421,7 +430,7 @@ class APIConfig:
                         logger.debug("[refresh_token] 토큰 갱신 필요: access_token 없음")
                     elif not self.token_expired_at:
                         logger.debug("[refresh_token] 토큰 갱신 필요: token_expired_at 없음")
-                    elif datetime.now() + timedelta(minutes=10) >= self.token_expired_at:
+                    elif datetime.now() + (min_validity or TOKEN_REFRESH_MARGIN) >= self.token_expired_at:
                         remaining = (self.token_expired_at - datetime.now()).total_seconds() / 60
                         logger.debug(f"[refresh_token] 토큰 갱신 필요: 만료 임박 (남은 시간: {remaining:.1f}분)")
 
@@ -514,9 +523,12 @@ class APIConfig:
             logger.error(f"[refresh_token] 토큰 갱신 중 오류 발생: {str(e)}", exc_info=True)
             return False
             
-    def validate_token(self) -> bool:
+    def validate_token(self, min_validity: Optional[timedelta] = None) -> bool:
         """토큰 유효성 검사
         
+        Args:
+            min_validity: 필요한 최소 잔여 시간 (기본 10분)
+
         Returns:
             bool: 토큰 유효 여부
         """
@@ -524,20 +536,24 @@ class APIConfig:
             return False
             
         # 만료 10분 전부터는 갱신 필요
-        if datetime.now() + timedelta(minutes=10) >= self.token_expired_at:
+        if datetime.now() + (min_validity or TOKEN_REFRESH_MARGIN) >= self.token_expired_at:
             return False
             
         return True
         
     def ensure_valid_token(self) -> bool:
         """토큰 유효성 보장
+
+        동시에 여러 스레드가 갱신이 필요해도 한 번만 발급하고 결과를 공유합니다 (TokenManager).
         
         Returns:
             bool: 토큰 유효 여부
         """
-        if not self.validate_token():
-            return self.refresh_token()
-        return True
+        return self.token_manager.ensure_valid()
+
+    async def ensure_valid_token_async(self) -> bool:
+        """토큰 유효성 보장 (비동기, 갱신은 스레드에서 수행)"""
+        return await self.token_manager.ensure_valid_async()
 
     # 간단한 접근자 제공 (호환성용)
     def get_access_token(self) -> Optional[str]:
@@ -571,60 +587,84 @@ class APIConfig:
         Returns:
             str: WebSocket 접속키 (실패 시 None)
         """
-        try:
-            # 캐시된 접속키 확인
-            if not force and self.ws_approval_key:
-                return self.ws_approval_key
-
-            # 저장된 접속키 로드 시도
-            if not force:
-                self._load_ws_approval_key()
-                if self.ws_approval_key:
-                    return self.ws_approval_key
+        # 캐시된 접속키 확인
+        if not force and self.ws_approval_key:
+            return self.ws_approval_key
+        return self.token_manager.get_ws_approval_key(force=force)
+
+    def issue_ws_approval_key(
+        self,
+        force: bool = False,
+        requested_at: Optional[datetime] = None
+    ) -> Optional[str]:
+        """WebSocket 접속키 발급 (전역 락으로 프로세스 간 중복 발급 방지)
 
-            # 새 접속키 발급
-            url = f"{self.base_url}/oauth2/Approval"
-
-            data = {
-                "grant_type": "client_credentials",
-                "appkey": self.app_key,
-                "secretkey": self.app_secret
-            }
+        Args:
+            force: 강제 재발급 여부
+            requested_at: 요청 시각 (이후에 다른 프로세스가 발급한 키는 재사용)
 
-            # 로깅 시 민감 정보 마스킹
-            safe_data = data.copy()
-            safe_data["appkey"] = "***MASKED***"
-            safe_data["secretkey"] = "***MASKED***"
-            logger.debug(f"[get_ws_approval_key] 접속키 요청: {safe_data}")
-
-            headers = {"content-type": "application/json; charset=utf-8"}
-            # TLS 1.2+ 세션 사용
-            response = self._session.post(url, json=data, headers=headers, timeout=settings.REQUEST_TIMEOUT)
-
-            if response.status_code == 200:
-                result = response.json()
-                self.ws_approval_key = result.get('approval_key')
-                self._save_ws_approval_key()
-                logger.info("[get_ws_approval_key] WebSocket 접속키 발급 성공")
-                return self.ws_approval_key
-            else:
-                logger.error(f"[get_ws_approval_key] 접속키 발급 실패: {response.status_code}", exc_info=True)
-                # 응답 본문에 민감 정보가 포함될 수 있으므로 마스킹
+        Returns:
+            str: WebSocket 접속키 (실패 시 None)
+        """
+        try:
+            with open(_WS_APPROVAL_LOCK_FILE, 'w') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
                 try:
-                    error_data = response.json()
-                    safe_error_data = {
-                        k: "***MASKED***" if k in ("approval_key", "appkey", "secretkey") else v
-                        for k, v in error_data.items()
-                    }
-                    logger.error(f"[get_ws_approval_key] 응답 데이터: {safe_error_data}")
-                except Exception:
-                    logger.error(f"[get_ws_approval_key] 응답 본문 길이: {len(response.text)} bytes")
-                return None
+                    # 락 획득 후 저장된 접속키 재로드 (다른 프로세스가 발급했을 수 있음)
+                    issued_at = self._load_ws_approval_key()
+                    if self.ws_approval_key and (
+                        not force or (requested_at and issued_at and issued_at >= requested_at)
+                    ):
+                        return self.ws_approval_key
+
+                    return self._request_ws_approval_key()
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
         except Exception as e:
             logger.error(f"[get_ws_approval_key] 오류: {e}", exc_info=True)
             return None
 
+    def _request_ws_approval_key(self) -> Optional[str]:
+        """새 WebSocket 접속키 발급 요청"""
+        url = f"{self.base_url}/oauth2/Approval"
+
+        data = {
+            "grant_type": "client_credentials",
+            "appkey": self.app_key,
+            "secretkey": self.app_secret
+        }
+
+        # 로깅 시 민감 정보 마스킹
+        safe_data = data.copy()
+        safe_data["appkey"] = "***MASKED***"
+        safe_data["secretkey"] = "***MASKED***"
+        logger.debug(f"[get_ws_approval_key] 접속키 요청: {safe_data}")
+
+        headers = {"content-type": "application/json; charset=utf-8"}
+        # TLS 1.2+ 세션 사용
+        response = self._session.post(url, json=data, headers=headers, timeout=settings.REQUEST_TIMEOUT)
+
+        if response.status_code == 200:
+            result = response.json()
+            self.ws_approval_key = result.get('approval_key')
+            self._save_ws_approval_key()
+            logger.info("[get_ws_approval_key] WebSocket 접속키 발급 성공")
+            return self.ws_approval_key
+
+        logger.error(f"[get_ws_approval_key] 접속키 발급 실패: {response.status_code}", exc_info=True)
+        # 응답 본문에 민감 정보가 포함될 수 있으므로 마스킹
+        try:
+            error_data = response.json()
+            safe_error_data = {
+                k: "***MASKED***" if k in ("approval_key", "appkey", "secretkey") else v
+                for k, v in error_data.items()
+            }
+            logger.error(f"[get_ws_approval_key] 응답 데이터: {safe_error_data}")
+        except Exception:
+            logger.error(f"[get_ws_approval_key] 응답 본문 길이: {len(response.text)} bytes")
+        return None
+
     def _save_ws_approval_key(self) -> None:
         """WebSocket 접속키 저장"""
         try:
@@ -642,16 +682,23 @@ class APIConfig:
         except Exception as e:
             logger.error(f"[_save_ws_approval_key] 저장 실패: {e}", exc_info=True)
 
-    def _load_ws_approval_key(self) -> None:
-        """WebSocket 접속키 로드"""
+    def _load_ws_approval_key(self) -> Optional[datetime]:
+        """WebSocket 접속키 로드
+
+        Returns:
+            Optional[datetime]: 저장된 접속키 발급 시각
+        """
         try:
             if not self._ws_approval_key_file.exists():
-                return
+                return None
             with open(self._ws_approval_key_file, 'r') as f:
                 data = json.load(f)
             self.ws_approval_key = data.get('approval_key')
+            issued_at = data.get('issued_at')
+            return datetime.fromisoformat(issued_at) if issued_at else None
         except Exception as e:
             logger.error(f"[_load_ws_approval_key] 로드 실패: {e}", exc_info=True)
+            return None
 
     # ========== 에러 처리 유틸리티 ==========
 
@@ -0,0 +1,238 @@
+"""
+접근 토큰 / WebSocket 접속키 관리
+
+APIConfig의 토큰 발급을 감싸 요청 경로에서 토큰 갱신 대기를 제거합니다.
+
+- 메모리의 토큰/만료 시각으로 빠른 유효성 확인
+- 단일 비행(single-flight): 동시에 갱신이 필요해도 한 호출만 발급하고 나머지는 그 결과를 공유
+  (프로세스 간에는 APIConfig의 파일 락 + 재로드로 보장)
+- 만료 전 백그라운드 선제 갱신
+- 만료 임박(유효 시간 잔여)이지만 아직 사용 가능한 토큰은 갱신을 기다리지 않고 사용
+"""
+
+import asyncio
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+# 선제 갱신 시점 (만료 30분 전)
+PROACTIVE_REFRESH_MARGIN = timedelta(minutes=30)
+
+# 만료 임박 토큰을 계속 사용할 수 있는 최소 잔여 시간
+MIN_USABLE_VALIDITY = timedelta(minutes=1)
+
+# 백그라운드 갱신 스레드 최대 대기 간격 (초)
+BACKGROUND_CHECK_INTERVAL = 300.0
+
+
+def background_refresh_enabled() -> bool:
+    return os.getenv('HANTU_TOKEN_BACKGROUND_REFRESH', 'true').lower() in ('1', 'true', 'yes')
+
+
+class SingleFlight:
+    """같은 키의 동시 호출을 한 번의 실행으로 합침
+
+    먼저 들어온 호출이 실행하고, 실행 중에 들어온 호출은 그 결과(또는 예외)를 공유합니다.
+    """
+
+    class _Call:
+        __slots__ = ('event', 'result', 'error')
+
+        def __init__(self):
+            self.event = threading.Event()
+            self.result: Any = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "SingleFlight._Call"] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """fn 실행 또는 진행 중인 실행 결과 대기
+
+        Returns:
+            (결과, 공유 여부): 다른 호출의 결과를 받았으면 공유 여부 True
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return call.result, False
+
+    def in_flight(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._calls
+
+
+class TokenManager:
+    """접근 토큰 / WebSocket 접속키 관리자
+
+    Args:
+        config: APIConfig (validate_token, refresh_token, issue_ws_approval_key 제공)
+        proactive_margin: 만료 전 선제 갱신 시점
+        background: 백그라운드 선제 갱신 사용 여부 (기본: HANTU_TOKEN_BACKGROUND_REFRESH)
+    """
+
+    TOKEN_KEY = 'access_token'
+    WS_APPROVAL_KEY = 'ws_approval_key'
+
+    def __init__(
+        self,
+        config,
+        proactive_margin: timedelta = PROACTIVE_REFRESH_MARGIN,
+        background: Optional[bool] = None
+    ):
+        self._config = config
+        self.proactive_margin = proactive_margin
+        self._background = background
+        self._flight = SingleFlight()
+        self._refresher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread_lock = threading.Lock()
+
+    @property
+    def background(self) -> bool:
+        return background_refresh_enabled() if self._background is None else self._background
+
+    # ------------------------------------------------------------------
+    # 접근 토큰
+    # ------------------------------------------------------------------
+
+    def ensure_valid(self) -> bool:
+        """요청 경로용 토큰 확보
+
+        유효하면 즉시 반환, 만료 임박이지만 사용 가능하면 백그라운드 갱신을 걸고 반환,
+        사용 불가하면 (다른 호출과 합쳐진) 갱신 결과를 기다립니다.
+        """
+        if self._config.validate_token():
+            self._ensure_refresher()
+            return True
+
+        if self._usable() and self.background:
+            self._wakeup.set()
+            self._ensure_refresher()
+            return True
+
+        ok = self.refresh()
+        if ok:
+            self._ensure_refresher()
+        return ok
+
+    async def ensure_valid_async(self) -> bool:
+        """비동기 요청 경로용 토큰 확보 (갱신은 스레드에서 수행)"""
+        if self._config.validate_token():
+            self._ensure_refresher()
+            return True
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.ensure_valid)
+
+    def refresh(self, force: bool = False, min_validity: Optional[timedelta] = None) -> bool:
+        """토큰 갱신 (프로세스 내 단일 비행)"""
+        result, shared = self._flight.do(
+            (self.TOKEN_KEY, force, min_validity),
+            lambda: self._config.refresh_token(force=force, min_validity=min_validity)
+        )
+        if shared:
+            logger.debug("[TokenManager] 진행 중인 토큰 갱신 결과 공유")
+        return bool(result)
+
+    def _usable(self) -> bool:
+        """만료 전이라 아직 요청에 쓸 수 있는 토큰인지"""
+        expired_at = getattr(self._config, 'token_expired_at', None)
+        if not getattr(self._config, 'access_token', None) or not expired_at:
+            return False
+        return datetime.now() + MIN_USABLE_VALIDITY < expired_at
+
+    def seconds_until_refresh(self) -> Optional[float]:
+        """선제 갱신 시점까지 남은 시간 (토큰 없으면 None)"""
+        expired_at = getattr(self._config, 'token_expired_at', None)
+        if not getattr(self._config, 'access_token', None) or not expired_at:
+            return None
+        return (expired_at - self.proactive_margin - datetime.now()).total_seconds()
+
+    # ------------------------------------------------------------------
+    # 백그라운드 선제 갱신
+    # ------------------------------------------------------------------
+
+    def _ensure_refresher(self):
+        if self.background and (self._refresher is None or not self._refresher.is_alive()):
+            self.start_background_refresh()
+
+    def start_background_refresh(self):
+        """만료 proactive_margin 전에 토큰을 갱신하는 데몬 스레드 시작"""
+        with self._thread_lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._stop.clear()
+            self._refresher = threading.Thread(
+                target=self._refresh_loop, name="token-refresher", daemon=True
+            )
+            self._refresher.start()
+        logger.debug("[TokenManager] 백그라운드 토큰 갱신 시작")
+
+    def stop_background_refresh(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wakeup.set()
+        thread = self._refresher
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+        self._refresher = None
+
+    def _refresh_loop(self):
+        while not self._stop.is_set():
+            remaining = self.seconds_until_refresh()
+            if remaining is not None and remaining <= 0:
+                try:
+                    ok = self.refresh(min_validity=self.proactive_margin)
+                except Exception as e:
+                    logger.error(f"[TokenManager] 선제 토큰 갱신 실패: {e}", exc_info=True)
+                    ok = False
+                # 발급 제한 등으로 실패 시 1분 후 재시도
+                remaining = self.seconds_until_refresh() if ok else 60.0
+
+            wait = BACKGROUND_CHECK_INTERVAL if remaining is None else min(
+                max(remaining, 1.0), BACKGROUND_CHECK_INTERVAL
+            )
+            self._wakeup.wait(wait)
+            self._wakeup.clear()
+
+    # ------------------------------------------------------------------
+    # WebSocket 접속키
+    # ------------------------------------------------------------------
+
+    def get_ws_approval_key(self, force: bool = False) -> Optional[str]:
+        """WebSocket 접속키 (프로세스 내 단일 비행, 프로세스 간 파일 락)"""
+        if not force and self._config.ws_approval_key:
+            return self._config.ws_approval_key
+
+        requested_at = datetime.now()
+        key, shared = self._flight.do(
+            (self.WS_APPROVAL_KEY, force),
+            lambda: self._config.issue_ws_approval_key(force=force, requested_at=requested_at)
+        )
+        if shared:
+            logger.debug("[TokenManager] 진행 중인 접속키 발급 결과 공유")
+        return key
@@ -25,7 +25,16 @@ sys.path.insert(
 
 from core.watchlist.watchlist_manager import WatchlistManager
 from core.daily_selection.price_analyzer import PriceAnalyzer, PriceAttractivenessLegacy
+from core.daily_selection.phase2_work_queue import (
+    CheckpointStatus,
+    Phase2Checkpoint,
+    Phase2WorkQueue,
+    WorkQueueProgress,
+    resolve_worker_count,
+)
+from core.daily_selection.selection_merger import StreamingSelectionMerger
 from core.utils.log_utils import get_logger
+from core.utils.profiling import profile_batch, BATCH_PHASE2_UPDATE
 from core.utils.telegram_notifier import get_telegram_notifier
 from core.interfaces.trading import IDailyUpdater, PriceAttractiveness, DailySelection
 
@@ -283,6 +292,11 @@ class DailyUpdater(IDailyUpdater):
         self._scheduler_running = False
         self._scheduler_thread = None
 
+        # 분산 배치 스트리밍 병합 상태 (배치 완료 시마다 누적)
+        self._batch_merger: Optional[StreamingSelectionMerger] = None
+        self._batch_merger_date: Optional[str] = None
+        self._merged_batches: set = set()
+
         # 출력 디렉토리 생성
         os.makedirs(self._output_dir, exist_ok=True)
 
@@ -436,6 +450,7 @@ class DailyUpdater(IDailyUpdater):
 
         raise last_exception
 
+    @profile_batch(BATCH_PHASE2_UPDATE)
     def run_daily_update(
         self,
         p_force_run: bool = False,
@@ -2007,7 +2022,8 @@ class DailyUpdater(IDailyUpdater):
         stock: Dict,
         async_api,
         semaphore: asyncio.Semaphore,
-        batch_index: int
+        batch_index: int,
+        raise_errors: bool = False
     ) -> Optional[Dict]:
         """단일 종목 처리 (병렬 처리용 헬퍼)
 
@@ -2016,9 +2032,11 @@ class DailyUpdater(IDailyUpdater):
             async_api: AsyncKISClient 인스턴스
             semaphore: 동시성 제어 세마포어
             batch_index: 배치 번호
+            raise_errors: True이면 조회/분석 실패를 예외로 전달 (작업 큐 재시도/실패 기록용)
 
         Returns:
-            Optional[Dict]: 선정된 종목 데이터 또는 None
+            Optional[Dict]: 선정된 종목 데이터 또는 None (필터 탈락,
+                raise_errors=False이면 처리 실패 포함)
         """
         async with semaphore:
             try:
@@ -2033,6 +2051,8 @@ class DailyUpdater(IDailyUpdater):
                 )
 
                 if not price_result:
+                    if raise_errors:
+                        raise RuntimeError(f"현재가 조회 실패 ({stock_code})")
                     return None
 
                 current_price = price_result.current_price
@@ -2107,6 +2127,8 @@ class DailyUpdater(IDailyUpdater):
                 }
 
             except Exception as e:
+                if raise_errors:
+                    raise
                 self._logger.warning(
                     f"종목 처리 실패 ({stock.get('stock_code')}): {e}",
                     exc_info=True
@@ -2277,6 +2299,9 @@ class DailyUpdater(IDailyUpdater):
                 len(selected_stocks)
             )
 
+            # 배치 결과를 스트리밍 병합기에 누적 (최종 병합 시 파일 재독 방지)
+            self._merge_batch_into_memory(batch_index, selected_stocks)
+
             # 6. 부분 결과 저장
             batch_file = Path(self._output_dir) / f"batch_{batch_index}.json"
             batch_file.parent.mkdir(parents=True, exist_ok=True)
@@ -2291,7 +2316,7 @@ class DailyUpdater(IDailyUpdater):
             }
 
             with open(batch_file, "w", encoding="utf-8") as f:
-                json.dump(batch_data, f, ensure_ascii=False, indent=2)
+                json.dump(batch_data, f, ensure_ascii=False, separators=(',', ':'))
 
             self._logger.info(f"배치 {batch_index} 부분 결과 저장: {batch_file}")
 
@@ -2379,7 +2404,7 @@ class DailyUpdater(IDailyUpdater):
                     }
 
                     with open(metrics_file, 'w', encoding='utf-8') as f:
-                        json.dump(metric_data, f, ensure_ascii=False, indent=2)
+                        json.dump(metric_data, f, ensure_ascii=False, separators=(',', ':'))
 
                     self._logger.info(
                         f"배치 #{batch_index} 메트릭 JSON 저장 완료: {metrics_file} "
@@ -2419,11 +2444,15 @@ class DailyUpdater(IDailyUpdater):
         try:
             self._logger.info(f"배치 결과 병합 시작: {total_batches}개 배치")
 
-            all_selected_stocks = []
+            merger = self._get_batch_merger()
             batch_dir = Path(self._output_dir)
 
-            # 모든 배치 파일 읽기
-            for i in range(total_batches):
+            # 메모리에 누적되지 않은 배치만 파일에서 읽기 (재시작 등)
+            missing = [i for i in range(total_batches) if i not in self._merged_batches]
+            if missing:
+                self._logger.info(f"메모리 미병합 배치 파일 로드: {missing}")
+
+            for i in missing:
                 batch_file = batch_dir / f"batch_{i}.json"
                 if not batch_file.exists():
                     self._logger.warning(f"배치 {i} 파일 없음: {batch_file}", exc_info=True)
@@ -2432,68 +2461,29 @@ class DailyUpdater(IDailyUpdater):
                 try:
                     with open(batch_file, "r", encoding="utf-8") as f:
                         batch_data = json.load(f)
-                        selected = batch_data.get("selected_stocks", [])
-                        all_selected_stocks.extend(selected)
-                        self._logger.info(f"배치 {i}: {len(selected)}개 종목 병합")
+                    selected = batch_data.get("selected_stocks", [])
+                    self._merge_batch_into_memory(i, selected)
+                    self._logger.info(f"배치 {i}: {len(selected)}개 종목 병합")
                 except Exception as e:
                     self._logger.error(f"배치 {i} 파일 읽기 실패: {e}", exc_info=True)
                     continue
 
-            # 중복 제거 (stock_code 기준)
-            unique_stocks = {}
-            for stock in all_selected_stocks:
-                code = stock.get("stock_code")
-                if code and code not in unique_stocks:
-                    unique_stocks[code] = stock
-
-            candidate_stocks = list(unique_stocks.values())
-
-            self._logger.info(f"중복 제거 후 후보 종목: {len(candidate_stocks)}개")
-
-            # Phase A 개선: 시장 적응형 상위 N개 선정
-            final_stocks = self._select_top_n_adaptive(
-                candidate_stocks,
-                market_condition
-            )
+            # 병합기가 종목 코드 중복 제거 및 섹터별 상위 후보 유지
+            candidate_stocks = merger.candidates()
 
             self._logger.info(
-                f"최종 선정 완료: {len(final_stocks)}개 종목 "
-                f"(후보 {len(candidate_stocks)}개 중)"
+                f"중복 제거 후 후보 종목: {len(candidate_stocks)}개 "
+                f"(병합 통계: {merger.get_stats()})"
             )
 
-            # 최종 결과 저장
-            date_str = datetime.now().strftime("%Y%m%d")
-            final_file = batch_dir / f"daily_selection_{date_str}.json"
-
-            final_data = {
-                "timestamp": datetime.now().isoformat(),
-                "version": "1.0.0",
-                "market_date": datetime.now().strftime("%Y-%m-%d"),
-                "market_condition": market_condition,
-                "data": {
-                    "selected_stocks": final_stocks
-                },
-                "stocks": final_stocks,
-                "metadata": {
-                    "total_selected": len(final_stocks),
+            final_stocks = self._finalize_selection(
+                candidate_stocks,
+                market_condition,
+                metadata={
                     "batch_count": total_batches,
                     "source": "distributed_batches"
                 }
-            }
-
-            # === DB에 저장 (우선) ===
-            selection_date = datetime.now().date()
-            db_saved = self._save_selection_to_db(final_data, selection_date)
-            if db_saved:
-                self._logger.info(f"최종 결과 DB 저장 완료: {len(final_stocks)}건")
-            else:
-                self._logger.warning("최종 결과 DB 저장 실패 - JSON 폴백 저장", exc_info=True)
-
-            # === JSON 폴백 저장 (DB 실패 시) ===
-            if not db_saved:
-                with open(final_file, "w", encoding="utf-8") as f:
-                    json.dump(final_data, f, ensure_ascii=False, indent=2)
-                self._logger.info(f"최종 결과 JSON 폴백 저장: {final_file}")
+            )
 
             # 배치 파일 정리 (선택적)
             # for i in range(total_batches):
@@ -2513,12 +2503,320 @@ class DailyUpdater(IDailyUpdater):
                 )
                 notifier.send_message(message)
 
+            self._reset_batch_merger()
             return True
 
         except Exception as e:
             self._logger.error(f"배치 결과 병합 실패: {e}", exc_info=True)
             return False
 
+    def _create_selection_merger(self) -> StreamingSelectionMerger:
+        """선정 규칙(섹터 제한, 최대 목표 수)에 맞춘 스트리밍 병합기 생성
+
+        Returns:
+            StreamingSelectionMerger: 빈 병합기
+        """
+        max_per_sector = self._config["diversification"]["max_stocks_per_sector"]
+        max_target = max(self._config["adaptive_selection"].values())
+        return StreamingSelectionMerger(
+            score_fn=self._calculate_composite_score,
+            max_per_sector=max_per_sector,
+            overflow_capacity=max_target,
+        )
+
+    def _get_batch_merger(self) -> StreamingSelectionMerger:
+        """오늘 날짜의 분산 배치 병합기 반환 (날짜가 바뀌면 초기화)"""
+        today = datetime.now().strftime("%Y%m%d")
+        if self._batch_merger is None or self._batch_merger_date != today:
+            self._batch_merger = self._create_selection_merger()
+            self._batch_merger_date = today
+            self._merged_batches = set()
+        return self._batch_merger
+
+    def _merge_batch_into_memory(self, batch_index: int, selected_stocks: List[Dict]) -> None:
+        """배치 결과를 분산 배치 병합기에 누적
+
+        Args:
+            batch_index: 배치 번호
+            selected_stocks: 배치에서 안전 필터를 통과한 종목
+        """
+        merger = self._get_batch_merger()
+        if batch_index in self._merged_batches:
+            return
+        merger.extend(selected_stocks)
+        self._merged_batches.add(batch_index)
+
+    def _reset_batch_merger(self) -> None:
+        """분산 배치 병합 상태 초기화"""
+        self._batch_merger = None
+        self._batch_merger_date = None
+        self._merged_batches = set()
+
+
+    def _finalize_selection(
+        self,
+        candidate_stocks: List[Dict],
+        market_condition: str,
+        metadata: Optional[Dict] = None
+    ) -> List[Dict]:
+        """후보 종목에서 최종 선정 후 저장 (DB 우선, 실패 시 JSON 폴백)
+
+        Args:
+            candidate_stocks: 안전 필터 통과 후보 종목
+            market_condition: 시장 상황
+            metadata: 결과 메타데이터 (source 등)
+
+        Returns:
+            List[Dict]: 최종 선정 종목
+        """
+        # Phase A 개선: 시장 적응형 상위 N개 선정
+        final_stocks = self._select_top_n_adaptive(
+            candidate_stocks,
+            market_condition
+        )
+
+        self._logger.info(
+            f"최종 선정 완료: {len(final_stocks)}개 종목 "
+            f"(후보 {len(candidate_stocks)}개 중)"
+        )
+
+        # 최종 결과 저장
+        date_str = datetime.now().strftime("%Y%m%d")
+        final_file = Path(self._output_dir) / f"daily_selection_{date_str}.json"
+
+        final_data = {
+            "timestamp": datetime.now().isoformat(),
+            "version": "1.0.0",
+            "market_date": datetime.now().strftime("%Y-%m-%d"),
+            "market_condition": market_condition,
+            "data": {
+                "selected_stocks": final_stocks
+            },
+            "stocks": final_stocks,
+            "metadata": {
+                "total_selected": len(final_stocks),
+                **(metadata or {})
+            }
+        }
+
+        # === DB에 저장 (우선) ===
+        selection_date = datetime.now().date()
+        db_saved = self._save_selection_to_db(final_data, selection_date)
+        if db_saved:
+            self._logger.info(f"최종 결과 DB 저장 완료: {len(final_stocks)}건")
+        else:
+            self._logger.warning("최종 결과 DB 저장 실패 - JSON 폴백 저장", exc_info=True)
+
+        # === JSON 폴백 저장 (DB 실패 시) ===
+        if not db_saved:
+            with open(final_file, "w", encoding="utf-8") as f:
+                json.dump(final_data, f, ensure_ascii=False, indent=2)
+            self._logger.info(f"최종 결과 JSON 폴백 저장: {final_file}")
+
+        return final_stocks
+
+    def get_phase2_checkpoint(self, target_date: Optional[datetime] = None) -> Phase2Checkpoint:
+        """Phase 2 종목 단위 체크포인트 반환
+
+        Args:
+            target_date: 대상 날짜 (기본값: 오늘)
+
+        Returns:
+            Phase2Checkpoint: 체크포인트
+        """
+        return Phase2Checkpoint.for_date(self._output_dir, target_date)
+
+    def get_phase2_merge_snapshot_path(self, target_date: Optional[datetime] = None) -> str:
+        """Phase 2 병합 스냅샷 경로 (data/daily_selection/phase2_merge_YYYYMMDD.json)"""
+        date_str = (target_date or datetime.now()).strftime("%Y%m%d")
+        return os.path.join(self._output_dir, f"phase2_merge_{date_str}.json")
+
+    def _restore_phase2_merger(
+        self,
+        checkpoint: Phase2Checkpoint,
+        snapshot_path: str
+    ) -> StreamingSelectionMerger:
+        """스냅샷 + 체크포인트 꼬리로 병합기 복원
+
+        스냅샷 이후에 기록된 체크포인트 레코드만 다시 읽어 병합합니다.
+
+        Args:
+            checkpoint: 종목 단위 체크포인트
+            snapshot_path: 병합 스냅샷 경로
+
+        Returns:
+            StreamingSelectionMerger: 복원된 병합기
+        """
+        merger, extra = StreamingSelectionMerger.load_checkpoint(
+            snapshot_path, self._calculate_composite_score
+        )
+        offset = extra.get("checkpoint_offset", 0)
+        if merger is None:
+            merger, offset = self._create_selection_merger(), 0
+
+        replayed = 0
+        for record, _ in checkpoint.iter_records(offset):
+            if record.get("status") == CheckpointStatus.DONE and record.get("result"):
+                merger.add(record["result"])
+                replayed += 1
+
+        if offset or replayed:
+            self._logger.info(
+                f"Phase 2 병합 상태 복원: 스냅샷 {offset}바이트 이후 {replayed}건 재병합"
+            )
+        return merger
+
+    @profile_batch(BATCH_PHASE2_UPDATE)
+    def run_work_queue_update(self, wait_phase1: bool = True) -> bool:
+        """Phase 2 작업 큐 실행 (고정 배치 슬롯 대체)
+
+        감시 리스트 전체를 우선순위 작업 큐로 처리하며, 워커 수는 API Rate Limit
+        예산에 맞춰 결정됩니다. 종목 단위 체크포인트가 있으면 완료된 종목은 건너뛰고
+        중단된 지점부터 재개합니다.
+
+        Args:
+            wait_phase1: Phase 1 완료 대기 여부
+
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            self._logger.info("=" * 60)
+            self._logger.info("Phase 2 작업 큐 실행 시작")
+
+            checkpoint = self.get_phase2_checkpoint()
+
+            # 재개가 아닌 첫 실행일 때만 Phase 1 완료 대기
+            if wait_phase1 and not checkpoint.exists():
+                if not self.wait_for_phase1():
+                    self._logger.error("Phase 1 완료 대기 실패", exc_info=True)
+                    return False
+
+            market_condition = self.analyze_market_condition()
+
+            watchlist_stocks = self._watchlist_manager.list_stocks(p_status="active")
+            self._logger.info(f"감시 리스트 종목 수: {len(watchlist_stocks)}개")
+
+            if not watchlist_stocks:
+                self._logger.warning("감시 리스트 비어있음", exc_info=True)
+                return False
+
+            stocks_dict = [
+                vars(s) if hasattr(s, '__dict__') else s
+                for s in watchlist_stocks
+            ]
+
+            # 재개 이전 결과는 스냅샷과 체크포인트 꼬리에서 복원하고, 이후 결과는 도착 즉시 병합
+            snapshot_path = self.get_phase2_merge_snapshot_path()
+            merger = self._restore_phase2_merger(checkpoint, snapshot_path)
+
+            progress = asyncio.run(
+                self._run_work_queue(stocks_dict, checkpoint, merger, snapshot_path)
+            )
+
+            candidate_stocks = merger.candidates()
+            self._logger.info(
+                f"안전 필터 통과 후보 종목: {merger.seen_count}개 "
+                f"(선정 후보 {len(candidate_stocks)}개 유지)"
+            )
+
+            final_stocks = self._finalize_selection(
+                candidate_stocks,
+                market_condition,
+                metadata={
+                    "source": "work_queue",
+                    "progress": progress.to_dict()
+                }
+            )
+
+            notifier = get_telegram_notifier()
+            if notifier.is_enabled():
+                elapsed_minutes = progress.elapsed_seconds / 60
+                message = (
+                    f"✅ Phase 2 완료\n"
+                    f"- 처리 종목: {progress.processed}개"
+                    f" (재개 {progress.skipped}개, 실패 {progress.failed}개)\n"
+                    f"- 총 선정 종목: {len(final_stocks)}개\n"
+                    f"- 소요 시간: {elapsed_minutes:.1f}분 (워커 {progress.worker_count}개)"
+                )
+                notifier.send_message(message)
+
+            return True
+
+        except Exception as e:
+            self._logger.error(f"Phase 2 작업 큐 실행 실패: {e}", exc_info=True)
+            return False
+
+    async def _run_work_queue(
+        self,
+        stocks: List[Dict],
+        checkpoint: Phase2Checkpoint,
+        merger: Optional[StreamingSelectionMerger] = None,
+        snapshot_path: Optional[str] = None,
+        snapshot_interval: int = 50
+    ) -> WorkQueueProgress:
+        """AsyncKISClient 세션 안에서 작업 큐 실행
+
+        Args:
+            stocks: 감시 리스트 종목
+            checkpoint: 종목 단위 체크포인트
+            merger: 결과 도착 시 누적할 스트리밍 병합기
+            snapshot_path: 병합 스냅샷 경로 (None이면 저장 안 함)
+            snapshot_interval: 스냅샷 저장 간격 (처리 종목 수)
+
+        Returns:
+            WorkQueueProgress: 진행 상황
+        """
+        from core.api.async_client import AsyncKISClient
+        from core.config import settings
+
+        concurrency = self._config.get("concurrency", {})
+        max_concurrent = concurrency.get("max_concurrent_requests", 5)
+        # 워커 수는 실제 적용되는 초당 요청 한도(설정값) 기준
+        rate_limit = concurrency.get("rate_limit_per_sec") or settings.RATE_LIMIT_PER_SEC
+        worker_count = resolve_worker_count(rate_limit, max_concurrent)
+
+        async with AsyncKISClient(
+            max_concurrent=worker_count,
+            rate_limit_per_sec=rate_limit
+        ) as async_api:
+            # 워커 수가 동시성을 제한하므로 종목 처리용 세마포어는 같은 크기로 둠
+            semaphore = asyncio.Semaphore(worker_count)
+
+            async def process(stock: Dict) -> Optional[Dict]:
+                # 실패는 예외로 올려 작업 큐가 재시도 후 FAILED로 기록 (None은 필터 탈락)
+                return await self._process_single_stock(
+                    stock, async_api, semaphore, -1, raise_errors=True
+                )
+
+            def report(progress: WorkQueueProgress) -> None:
+                self._logger.info(f"Phase 2 진행: {progress.to_dict()}")
+
+            state = {"count": 0, "offset": 0}
+
+            def on_result(result: Optional[Dict], offset: int) -> None:
+                state["offset"] = offset
+                if merger is None:
+                    return
+                merger.add(result)
+                state["count"] += 1
+                if snapshot_path and state["count"] % snapshot_interval == 0:
+                    merger.save_checkpoint(snapshot_path, {"checkpoint_offset": offset})
+
+            queue = Phase2WorkQueue(
+                process_fn=process,
+                checkpoint=checkpoint,
+                worker_count=worker_count,
+                priority_fn=self.calculate_composite_priority,
+                progress_callback=report,
+                result_callback=on_result,
+            )
+            progress = await queue.run(stocks)
+
+            if merger is not None and snapshot_path and state["offset"]:
+                merger.save_checkpoint(snapshot_path, {"checkpoint_offset": state["offset"]})
+            return progress
+
 
 if __name__ == "__main__":
     # 테스트 실행
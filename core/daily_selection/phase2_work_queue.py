@@ -0,0 +1,351 @@
+"""
+Phase 2 작업 큐 모듈
+
+고정된 18개 배치 슬롯 대신 감시 리스트 전체를 하나의 우선순위 작업 큐로 처리합니다.
+
+- 워커 수는 API Rate Limit 예산(초당 요청 수)과 동시성 설정에 맞춰 결정
+- 복합 우선순위(calculate_composite_priority) 높은 종목부터 처리
+- 종목 단위 체크포인트(JSONL)로 재시작 시 중단 지점부터 정확히 재개
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+# 종목 처리 함수: stock -> 선정 데이터(통과) 또는 None(탈락), 처리 실패는 예외
+StockProcessor = Callable[[Dict], Awaitable[Optional[Dict]]]
+
+# 종목 결과 콜백: (선정 데이터 또는 None, 기록 후 체크포인트 오프셋)
+ResultCallback = Callable[[Optional[Dict], int], None]
+
+
+class CheckpointStatus:
+    """체크포인트 상태 값"""
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class WorkQueueProgress:
+    """작업 큐 진행 상황"""
+    total: int = 0
+    skipped: int = 0  # 체크포인트로 건너뛴 종목 수
+    processed: int = 0
+    selected: int = 0
+    failed: int = 0
+    worker_count: int = 0
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.total - self.skipped - self.processed - self.failed)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        end = self.finished_at or time.time()
+        return end - self.started_at
+
+    @property
+    def throughput_per_min(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.processed / elapsed * 60 if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'total': self.total,
+            'skipped': self.skipped,
+            'processed': self.processed,
+            'selected': self.selected,
+            'failed': self.failed,
+            'remaining': self.remaining,
+            'worker_count': self.worker_count,
+            'elapsed_seconds': round(self.elapsed_seconds, 2),
+            'throughput_per_min': round(self.throughput_per_min, 2),
+        }
+
+
+class Phase2Checkpoint:
+    """
+    종목 단위 진행 체크포인트
+
+    JSONL 파일에 종목별 처리 결과를 한 줄씩 추가합니다.
+    같은 종목이 여러 번 기록되면 마지막 기록이 우선합니다.
+    """
+
+    def __init__(self, path: str):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @classmethod
+    def for_date(cls, output_dir: str, target_date: Optional[datetime] = None) -> 'Phase2Checkpoint':
+        """날짜별 체크포인트 (data/daily_selection/phase2_progress_YYYYMMDD.jsonl)"""
+        date_str = (target_date or datetime.now()).strftime("%Y%m%d")
+        return cls(os.path.join(output_dir, f"phase2_progress_{date_str}.jsonl"))
+
+    def iter_records(self, start_offset: int = 0) -> Iterator[Tuple[Dict, int]]:
+        """
+        체크포인트 레코드 순회
+
+        Args:
+            start_offset: 읽기 시작 바이트 오프셋 (병합 스냅샷 이후 꼬리만 읽을 때 사용)
+
+        Yields:
+            (레코드, 해당 레코드 다음 바이트 오프셋)
+        """
+        if not self._path.exists():
+            return
+
+        with self._lock:
+            with open(self._path, 'rb') as f:
+                f.seek(start_offset)
+                lines = f.readlines()
+
+        offset = start_offset
+        for raw in lines:
+            offset += len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # 중단 시 잘린 마지막 줄은 무시 (해당 종목은 재처리)
+                continue
+            if record.get('stock_code'):
+                yield record, offset
+
+    def load(self) -> Dict[str, Dict]:
+        """종목 코드 → 마지막 체크포인트 레코드"""
+        return {record['stock_code']: record for record, _ in self.iter_records()}
+
+    def completed_codes(self) -> set:
+        """처리 완료(done) 종목 코드"""
+        return {
+            code for code, record in self.load().items()
+            if record.get('status') == CheckpointStatus.DONE
+        }
+
+    def selected_results(self) -> List[Dict]:
+        """안전 필터를 통과한 종목 결과"""
+        return [
+            record['result'] for record in self.load().values()
+            if record.get('status') == CheckpointStatus.DONE and record.get('result')
+        ]
+
+    def record(self, stock_code: str, status: str, result: Optional[Dict] = None, error: str = "") -> int:
+        """
+        종목 처리 결과 기록
+
+        Returns:
+            int: 기록 후 파일 끝 바이트 오프셋
+        """
+        entry = {
+            'stock_code': stock_code,
+            'status': status,
+            'result': result,
+            'timestamp': datetime.now().isoformat(),
+        }
+        if error:
+            entry['error'] = error
+
+        line = json.dumps(entry, ensure_ascii=False, default=str, separators=(',', ':'))
+        with self._lock:
+            with open(self._path, 'ab') as f:
+                f.write((line + '\n').encode('utf-8'))
+                f.flush()
+                return f.tell()
+
+    def exists(self) -> bool:
+        return self._path.exists() and self._path.stat().st_size > 0
+
+
+class Phase2WorkQueue:
+    """
+    Phase 2 우선순위 작업 큐
+
+    Usage:
+        queue = Phase2WorkQueue(process_fn, checkpoint, worker_count=5,
+                                priority_fn=updater.calculate_composite_priority)
+        progress = await queue.run(watchlist_stocks)
+    """
+
+    def __init__(
+        self,
+        process_fn: StockProcessor,
+        checkpoint: Phase2Checkpoint,
+        worker_count: int,
+        priority_fn: Optional[Callable[[Dict], float]] = None,
+        max_attempts: int = 2,
+        progress_callback: Optional[Callable[[WorkQueueProgress], None]] = None,
+        progress_interval: int = 50,
+        result_callback: Optional[ResultCallback] = None,
+    ):
+        """
+        Args:
+            process_fn: 종목 처리 코루틴 함수
+            checkpoint: 종목 단위 체크포인트
+            worker_count: 동시 워커 수
+            priority_fn: 우선순위 함수 (높을수록 먼저 처리)
+            max_attempts: 예외 발생 시 종목당 최대 시도 횟수
+            progress_callback: 진행 상황 콜백 (progress_interval 종목마다 호출)
+            progress_interval: 진행 상황 보고 간격 (종목 수)
+            result_callback: 종목 처리 완료 시 호출 (스트리밍 병합용)
+        """
+        self._process_fn = process_fn
+        self._checkpoint = checkpoint
+        self._worker_count = max(1, worker_count)
+        self._priority_fn = priority_fn
+        self._max_attempts = max(1, max_attempts)
+        self._progress_callback = progress_callback
+        self._progress_interval = max(1, progress_interval)
+        self._result_callback = result_callback
+        self._progress = WorkQueueProgress()
+
+    @property
+    def progress(self) -> WorkQueueProgress:
+        return self._progress
+
+    def _priority(self, stock: Dict) -> float:
+        if self._priority_fn is None:
+            return 0.0
+        try:
+            return float(self._priority_fn(stock))
+        except Exception:
+            return 0.0
+
+    async def run(self, stocks: List[Dict]) -> WorkQueueProgress:
+        """
+        작업 큐 실행 (모든 종목 처리 완료 시 반환)
+
+        Args:
+            stocks: 감시 리스트 종목 (stock_code 필수)
+
+        Returns:
+            WorkQueueProgress: 최종 진행 상황
+        """
+        completed = self._checkpoint.completed_codes()
+
+        progress = WorkQueueProgress(total=len(stocks), worker_count=self._worker_count)
+        self._progress = progress
+
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        seen = set()
+        for seq, stock in enumerate(stocks):
+            code = stock.get("stock_code")
+            if not code or code in seen:
+                progress.total -= 1
+                continue
+            seen.add(code)
+            if code in completed:
+                progress.skipped += 1
+                continue
+            # 우선순위 내림차순, 동순위는 입력 순서
+            queue.put_nowait((-self._priority(stock), seq, 1, stock))
+
+        if progress.skipped:
+            logger.info(f"체크포인트에서 {progress.skipped}개 종목 완료 확인 - 나머지부터 재개")
+
+        pending = queue.qsize()
+        logger.info(
+            f"Phase 2 작업 큐 시작: {pending}개 종목, 워커 {self._worker_count}개"
+        )
+
+        workers = [
+            asyncio.create_task(self._worker(queue))
+            for _ in range(min(self._worker_count, max(1, pending)))
+        ]
+        await queue.join()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        progress.finished_at = time.time()
+        logger.info(f"Phase 2 작업 큐 완료: {progress.to_dict()}")
+        return progress
+
+    async def _worker(self, queue: asyncio.PriorityQueue) -> None:
+        while True:
+            neg_priority, seq, attempt, stock = await queue.get()
+            try:
+                await self._handle(queue, neg_priority, seq, attempt, stock)
+            except Exception as e:
+                # 체크포인트 기록 실패 등으로 워커가 죽으면 queue.join()이 끝나지 않음
+                logger.error(f"종목 처리 중 오류 ({stock.get('stock_code')}): {e}", exc_info=True)
+            finally:
+                queue.task_done()
+
+    async def _handle(
+        self,
+        queue: asyncio.PriorityQueue,
+        neg_priority: float,
+        seq: int,
+        attempt: int,
+        stock: Dict,
+    ) -> None:
+        code = stock["stock_code"]
+        progress = self._progress
+
+        try:
+            result = await self._process_fn(stock)
+        except Exception as e:
+            if attempt < self._max_attempts:
+                # 재시도는 같은 우선순위로 큐 뒤쪽에 배치
+                queue.put_nowait((neg_priority, seq + progress.total, attempt + 1, stock))
+                return
+            progress.failed += 1
+            self._checkpoint.record(code, CheckpointStatus.FAILED, error=str(e))
+            logger.warning(f"종목 처리 최종 실패 ({code}): {e}")
+            return
+
+        progress.processed += 1
+        if result:
+            progress.selected += 1
+        offset = self._checkpoint.record(code, CheckpointStatus.DONE, result=result)
+
+        if self._result_callback:
+            try:
+                self._result_callback(result, offset)
+            except Exception as e:
+                logger.warning(f"결과 콜백 오류 ({code}): {e}")
+
+        if self._progress_callback and progress.processed % self._progress_interval == 0:
+            try:
+                self._progress_callback(progress)
+            except Exception as e:
+                logger.warning(f"진행 상황 콜백 오류: {e}")
+
+
+def resolve_worker_count(rate_limit_per_sec: int, max_concurrent: int, calls_per_stock: int = 2) -> int:
+    """
+    Rate Limit 예산에 맞춘 워커 수 계산
+
+    종목당 API 호출 수를 고려하여, 초당 요청 예산을 넘지 않는 범위에서
+    최대한 많은 워커를 사용합니다 (응답 지연 동안 다른 워커가 예산을 사용).
+
+    Args:
+        rate_limit_per_sec: 초당 허용 요청 수
+        max_concurrent: 설정상 최대 동시 요청 수
+        calls_per_stock: 종목당 API 호출 수
+
+    Returns:
+        int: 워커 수 (최소 1)
+    """
+    budget_workers = max(1, rate_limit_per_sec * 2 // max(1, calls_per_stock))
+    return max(1, min(max_concurrent, budget_workers))
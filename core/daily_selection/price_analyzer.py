@@ -20,6 +20,7 @@ sys.path.insert(
 
 from core.config.api_config import APIConfig
 from core.utils.log_utils import get_logger
+from core.utils.latency_metrics import latency_timer, timed, STAGE_INDICATOR, STAGE_SCORING
 from core.interfaces.trading import IPriceAnalyzer, PriceAttractiveness, TechnicalSignal
 from hantu_common.indicators.trend import SlopeIndicator
 from core.config import trading_config as TCONF
@@ -829,6 +830,7 @@ class PriceAnalyzer(IPriceAnalyzer):
             self._logger.error(f"패턴 감지 오류: {e}", exc_info=True)
             return 0.0
 
+    @timed(STAGE_SCORING)
     def _analyze_price_attractiveness_legacy(
         self, p_stock_data: Dict
     ) -> PriceAttractivenessLegacy:
@@ -855,16 +857,17 @@ class PriceAnalyzer(IPriceAnalyzer):
                 _v_current_price = 50000.0  # 기본값
 
             # 각 분석 영역별 점수 계산
-            _v_technical_score, _v_technical_signals = (
-                self._analyze_technical_indicators(p_stock_data)
-            )
-            _v_volume_score = self._analyze_volume(p_stock_data)
-            _v_pattern_score = self._analyze_patterns(p_stock_data)
+            with latency_timer(STAGE_INDICATOR):
+                _v_technical_score, _v_technical_signals = (
+                    self._analyze_technical_indicators(p_stock_data)
+                )
+                _v_volume_score = self._analyze_volume(p_stock_data)
+                _v_pattern_score = self._analyze_patterns(p_stock_data)
 
-            # 기울기 지표 분석 추가
-            _v_slope_score, _v_slope_signals = self._analyze_slope_indicators(
-                p_stock_data
-            )
+                # 기울기 지표 분석 추가
+                _v_slope_score, _v_slope_signals = self._analyze_slope_indicators(
+                    p_stock_data
+                )
             _v_technical_signals.extend(_v_slope_signals)
 
             # 종합 점수 계산 (가중 평균)
@@ -1175,17 +1178,29 @@ class PriceAnalyzer(IPriceAnalyzer):
             if (recent_bars is None) or (
                 isinstance(recent_bars, list) and len(recent_bars) == 0
             ):
-                # 필요 시 API로 보충
+                # 체결 스트림 집계 분봉 우선, 없으면 API로 보충
+                df_mb = None
                 try:
-                    from core.api.kis_api import KISAPI
+                    from core.realtime.bars import get_bar_aggregator
 
-                    api = KISAPI()
-                    df_mb = api.get_minute_bars(
-                        p_stock_data.get("stock_code", ""), time_unit=1, count=30
+                    df_mb = get_bar_aggregator().to_frame(
+                        p_stock_data.get("stock_code", ""), interval=1, limit=30
                     )
+                    if df_mb.empty:
+                        df_mb = None
                 except Exception as e:
-                    self._logger.warning(f"{stock_code}: 분봉 데이터 조회 실패, VWAP 계산 생략: {e}")
-                    df_mb = None
+                    self._logger.debug(f"{stock_code}: 실시간 분봉 조회 실패: {e}")
+                if df_mb is None:
+                    try:
+                        from core.api.kis_api import KISAPI
+
+                        api = KISAPI()
+                        df_mb = api.get_minute_bars(
+                            p_stock_data.get("stock_code", ""), time_unit=1, count=30
+                        )
+                    except Exception as e:
+                        self._logger.warning(f"{stock_code}: 분봉 데이터 조회 실패, VWAP 계산 생략: {e}")
+                        df_mb = None
             else:
                 df_mb = recent_bars
             if df_mb is not None:
@@ -0,0 +1,207 @@
+"""
+Phase 2 선정 결과 스트리밍 병합 모듈
+
+종목 분석 결과가 도착할 때마다 섹터별 상위 K개만 힙으로 유지하여,
+중간 파일을 다시 읽거나 전체 후보를 재정렬하지 않고 최종 선정을 만들 수 있게 합니다.
+
+_select_top_n_adaptive의 선정 규칙과 결과가 동일하도록 보관 범위를 정합니다.
+- 분류된 섹터: 섹터당 최대 선정 수(max_per_sector)를 넘는 종목은 절대 선정되지 않으므로
+  섹터별 상위 max_per_sector개만 보관
+- 미분류("", "기타"): 섹터 제한이 없으므로 최대 목표 선정 수(overflow_capacity)만큼 보관
+"""
+
+import heapq
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+# 섹터 제한이 적용되지 않는 섹터 값
+UNCLASSIFIED_SECTORS = ("", "기타")
+
+# 힙 항목: (점수, -도착순서, 도착순서, 종목) - 최소 힙에서 점수가 낮고 늦게 도착한 종목이 먼저 제거됨
+_HeapEntry = Tuple[float, int, int, Dict]
+
+
+class StreamingSelectionMerger:
+    """
+    섹터별 상위 K 스트리밍 병합기
+
+    Usage:
+        merger = StreamingSelectionMerger(score_fn, max_per_sector=3, overflow_capacity=12)
+        for stock in results:
+            merger.add(stock)
+        candidates = merger.candidates()
+    """
+
+    def __init__(
+        self,
+        score_fn: Callable[[Dict], float],
+        max_per_sector: int,
+        overflow_capacity: int,
+    ):
+        """
+        Args:
+            score_fn: 종합 점수 함수 (높을수록 우선)
+            max_per_sector: 분류된 섹터당 보관 수
+            overflow_capacity: 미분류 종목 보관 수 (최대 목표 선정 수)
+        """
+        self._score_fn = score_fn
+        self._max_per_sector = max(1, max_per_sector)
+        self._overflow_capacity = max(1, overflow_capacity)
+
+        self._heaps: Dict[str, List[_HeapEntry]] = {}
+        self._seen_codes: Set[str] = set()
+        self._seq: int = 0
+        self._evicted_count: int = 0
+
+    @staticmethod
+    def _group_key(stock: Dict) -> str:
+        sector = stock.get("sector", "") or ""
+        return "" if sector in UNCLASSIFIED_SECTORS else sector
+
+    def _capacity(self, group: str) -> int:
+        return self._overflow_capacity if group == "" else self._max_per_sector
+
+    def add(self, stock: Optional[Dict]) -> bool:
+        """
+        종목 결과 추가
+
+        같은 종목 코드는 처음 도착한 결과만 사용합니다 (기존 배치 병합과 동일).
+
+        Args:
+            stock: 안전 필터 통과 종목 (None이면 무시)
+
+        Returns:
+            bool: 후보로 보관되었는지 여부
+        """
+        if not stock:
+            return False
+
+        code = stock.get("stock_code")
+        if not code or code in self._seen_codes:
+            return False
+        self._seen_codes.add(code)
+
+        score = float(self._score_fn(stock))
+        stock["composite_score"] = score
+
+        group = self._group_key(stock)
+        heap = self._heaps.setdefault(group, [])
+        seq = self._seq
+        self._seq += 1
+        entry = (score, -seq, seq, stock)
+
+        if len(heap) < self._capacity(group):
+            heapq.heappush(heap, entry)
+            return True
+
+        # 현재 최저 종목보다 우선순위가 높을 때만 교체
+        if entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+            self._evicted_count += 1
+            return True
+
+        self._evicted_count += 1
+        return False
+
+    def extend(self, stocks: Iterable[Optional[Dict]]) -> int:
+        """여러 종목 추가 후 보관된 수 반환"""
+        return sum(1 for stock in stocks if self.add(stock))
+
+    def candidates(self) -> List[Dict]:
+        """보관 중인 후보 종목 (점수 내림차순, 동점은 도착순)"""
+        entries = [entry for heap in self._heaps.values() for entry in heap]
+        entries.sort(key=lambda e: (-e[0], e[2]))
+        return [entry[3] for entry in entries]
+
+    @property
+    def seen_count(self) -> int:
+        return len(self._seen_codes)
+
+    def __len__(self) -> int:
+        return sum(len(heap) for heap in self._heaps.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'seen': self.seen_count,
+            'retained': len(self),
+            'evicted': self._evicted_count,
+            'groups': len(self._heaps),
+        }
+
+    def to_state(self) -> Dict[str, Any]:
+        """체크포인트용 상태 (보관 후보만 포함하는 압축 형태)"""
+        return {
+            'max_per_sector': self._max_per_sector,
+            'overflow_capacity': self._overflow_capacity,
+            'seq': self._seq,
+            'seen_codes': sorted(self._seen_codes),
+            'entries': [
+                [entry[2], entry[3]]
+                for heap in self._heaps.values()
+                for entry in heap
+            ],
+        }
+
+    @classmethod
+    def from_state(
+        cls,
+        state: Dict[str, Any],
+        score_fn: Callable[[Dict], float],
+    ) -> 'StreamingSelectionMerger':
+        """체크포인트 상태에서 복원"""
+        merger = cls(score_fn, state['max_per_sector'], state['overflow_capacity'])
+        merger._seq = state.get('seq', 0)
+        merger._seen_codes = set(state.get('seen_codes', []))
+
+        for seq, stock in state.get('entries', []):
+            score = float(stock.get("composite_score", score_fn(stock)))
+            group = merger._group_key(stock)
+            heapq.heappush(merger._heaps.setdefault(group, []), (score, -seq, seq, stock))
+        return merger
+
+    def save_checkpoint(self, path: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """
+        압축 체크포인트 저장 (원자적 교체)
+
+        Args:
+            path: 저장 경로
+            extra: 함께 저장할 부가 정보 (예: 진행 체크포인트 오프셋)
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_suffix(target.suffix + '.tmp')
+
+        payload = {'merger': self.to_state(), 'extra': extra or {}}
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(',', ':'), default=str)
+        os.replace(tmp_path, target)
+
+    @classmethod
+    def load_checkpoint(
+        cls,
+        path: str,
+        score_fn: Callable[[Dict], float],
+    ) -> Tuple[Optional['StreamingSelectionMerger'], Dict[str, Any]]:
+        """
+        압축 체크포인트 로드
+
+        Returns:
+            (병합기 또는 None, 부가 정보)
+        """
+        target = Path(path)
+        if not target.exists():
+            return None, {}
+
+        try:
+            with open(target, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            return cls.from_state(payload['merger'], score_fn), payload.get('extra', {})
+        except Exception as e:
+            logger.warning(f"병합 체크포인트 로드 실패, 새로 시작: {e}")
+            return None, {}
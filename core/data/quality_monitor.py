@@ -15,7 +15,7 @@ import time
 from enum import Enum
 import json
 
-from ..utils.logging import get_logger
+from ..utils.log_utils import get_logger
 
 logger = get_logger(__name__)
 
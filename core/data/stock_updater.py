@@ -6,16 +6,19 @@
 
 import sqlite3
 import pandas as pd
+import heapq
 import json
+import queue
 import threading
 import time
 import schedule
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
 
-from ..utils.logging import get_logger
+from ..utils.log_utils import get_logger
 
 logger = get_logger(__name__)
 
@@ -64,6 +67,114 @@ class UpdateResult:
         """딕셔너리로 변환"""
         return asdict(self)
 
+@dataclass
+class UpdateProgress:
+    """병렬 업데이트 진행 상황"""
+    total: int = 0
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retried: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리 종목 수"""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'total': self.total,
+            'completed': self.completed,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'retried': self.retried,
+            'elapsed': round(self.elapsed, 3),
+            'throughput': round(self.throughput, 2),
+        }
+
+
+class RateBudget:
+    """스레드 간 공유하는 최소 호출 간격 제한"""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self):
+        """다음 호출 가능 시점까지 대기 (슬롯은 호출 순서대로 예약)"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+
+    __call__ = acquire
+
+
+class _RetryQueue:
+    """재시도 지연을 갖는 작업 큐
+
+    (준비 시각, 순번, 종목, 시도 횟수) 힙으로 관리하며,
+    모든 종목이 최종 처리되면 대기 중인 워커를 깨워 종료시킵니다.
+    """
+
+    def __init__(self, stock_codes: List[str]):
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._seq = 0
+        self._outstanding = len(stock_codes)
+        self._cancelled = False
+        for code in stock_codes:
+            self._push(code, 0, 0.0)
+
+    def _push(self, stock_code: str, attempt: int, ready_at: float):
+        heapq.heappush(self._heap, (ready_at, self._seq, stock_code, attempt))
+        self._seq += 1
+
+    def retry(self, stock_code: str, attempt: int, delay: float):
+        with self._cond:
+            self._push(stock_code, attempt, time.monotonic() + delay)
+            self._cond.notify()
+
+    def done(self):
+        """종목 하나의 최종 처리 (성공 또는 재시도 소진)"""
+        with self._cond:
+            self._outstanding -= 1
+            if self._outstanding <= 0:
+                self._cond.notify_all()
+
+    def cancel(self):
+        with self._cond:
+            self._cancelled = True
+            self._cond.notify_all()
+
+    def get(self) -> Optional[Tuple[str, int]]:
+        """준비된 작업 반환 (더 이상 작업이 없으면 None)"""
+        with self._cond:
+            while True:
+                if self._cancelled or self._outstanding <= 0:
+                    return None
+                if self._heap:
+                    wait = self._heap[0][0] - time.monotonic()
+                    if wait <= 0:
+                        _, _, stock_code, attempt = heapq.heappop(self._heap)
+                        return stock_code, attempt
+                    self._cond.wait(wait)
+                else:
+                    # 다른 워커가 처리 중인 종목의 재시도 등록 대기
+                    self._cond.wait()
+
+
 class StockUpdater:
     """종목 정보 업데이트 자동화 시스템"""
     
@@ -85,10 +196,22 @@ class StockUpdater:
             'monthly_cleanup': 1,             # 매월 1일 정리 작업
             'api_delay': 0.1,                 # API 호출 간격 (초)
             'batch_size': 100,                # 배치 크기
+            'max_workers': 1,                 # 상세 정보 조회 워커 수 (1: 순차)
+            'max_retries': 3,                 # 종목별 재시도 횟수
+            'retry_backoff': 1.0,             # 재시도 대기 기본값 (초, 지수 증가)
+            'retry_backoff_max': 30.0,        # 재시도 대기 상한 (초)
+            'progress_log_interval': 100,     # 진행 상황 로그 간격 (종목 수)
         }
         
         # 외부 API 클라이언트 (실제 구현에서 설정)
         self._api_client = None
+
+        # 워커 공유 호출 제한 (API 클라이언트 설정 시 해당 클라이언트의 제한 사용)
+        self._rate_limiter: Callable[[], None] = RateBudget(self._update_settings['api_delay'])
+
+        # 병렬 업데이트 진행 상황
+        self._progress_lock = threading.Lock()
+        self._progress: Optional[UpdateProgress] = None
         
         # 캐시된 데이터
         self._cached_stocks: Dict[str, StockInfo] = {}
@@ -103,9 +226,27 @@ class StockUpdater:
         self._logger.info("StockUpdater 초기화 완료")
     
     def set_api_client(self, api_client):
-        """API 클라이언트 설정"""
+        """API 클라이언트 설정
+
+        KISRestClient처럼 _rate_limit을 가진 클라이언트는 병렬 업데이트에서도
+        같은 (프로세스 간 공유) 호출 제한을 사용합니다.
+        """
         self._api_client = api_client
+        rate_limit = getattr(api_client, '_rate_limit', None)
+        if callable(rate_limit):
+            self._rate_limiter = rate_limit
         self._logger.info("API 클라이언트 설정 완료")
+
+    def set_rate_limiter(self, rate_limiter: Callable[[], None]):
+        """워커 공유 호출 제한 설정 (호출 시 다음 슬롯까지 대기하는 함수)"""
+        self._rate_limiter = rate_limiter
+
+    def configure(self, **settings):
+        """업데이트 설정 변경 (max_workers, max_retries 등)"""
+        unknown = set(settings) - set(self._update_settings)
+        if unknown:
+            raise ValueError(f"알 수 없는 설정: {sorted(unknown)}")
+        self._update_settings.update(settings)
     
     def _init_database(self):
         """데이터베이스 초기화"""
@@ -183,8 +324,8 @@ class StockUpdater:
         # 매주 일요일 오전 7시에 전체 업데이트
         schedule.every().sunday.at("07:00").do(self._run_weekly_update)
         
-        # 매월 1일 오전 8시에 정리 작업
-        schedule.every().month.do(self._run_monthly_cleanup)
+        # 매월 1일 오전 8시에 정리 작업 (schedule은 월 단위 주기를 지원하지 않아 매일 확인)
+        schedule.every().day.at("08:00").do(self._run_monthly_cleanup_if_due)
     
     def _fetch_stock_list_from_api(self) -> List[Dict[str, Any]]:
         """API에서 종목 리스트 조회"""
@@ -216,8 +357,13 @@ class StockUpdater:
             self._logger.error(f"API 종목 리스트 조회 중 오류: {e}")
             return []
     
-    def _fetch_detailed_stock_info(self, stock_code: str) -> Optional[StockInfo]:
-        """특정 종목의 상세 정보 조회"""
+    def _fetch_detailed_stock_info(self, stock_code: str, throttle: bool = True) -> Optional[StockInfo]:
+        """특정 종목의 상세 정보 조회
+
+        Args:
+            stock_code: 종목 코드
+            throttle: 조회 후 api_delay만큼 대기 (병렬 업데이트는 공유 호출 제한 사용)
+        """
         if not self._api_client:
             return None
         
@@ -243,7 +389,8 @@ class StockUpdater:
             )
             
             # API 호출 제한 대응
-            time.sleep(self._update_settings['api_delay'])
+            if throttle:
+                time.sleep(self._update_settings['api_delay'])
             
             return stock_info
             
@@ -398,6 +545,10 @@ class StockUpdater:
             with sqlite3.connect(self._db_path) as conn:
                 cursor = conn.execute('SELECT stock_code FROM stock_info WHERE is_active = 1')
                 active_stocks = [row[0] for row in cursor.fetchall()]
+
+            if self._update_settings['max_workers'] > 1:
+                self.update_stocks_concurrently(active_stocks, update_type='weekly')
+                return
             
             updated_count = 0
             errors = []
@@ -414,7 +565,143 @@ class StockUpdater:
             
         except Exception as e:
             self._logger.error(f"주간 업데이트 중 오류: {e}")
+
+    def update_stocks_concurrently(
+        self,
+        stock_codes: List[str],
+        fetch: Optional[Callable[[str], Optional[StockInfo]]] = None,
+        max_workers: Optional[int] = None,
+        update_type: str = 'manual',
+        progress_callback: Optional[Callable[[UpdateProgress], None]] = None
+    ) -> UpdateResult:
+        """종목 상세 정보 병렬 업데이트
+
+        워커들이 공유 호출 제한(_rate_limiter) 안에서 조회하고, 실패한 종목은
+        지수 백오프 후 재시도 큐로 돌려보냅니다. DB 쓰기는 호출 스레드에서 순차로 수행합니다.
+
+        Args:
+            stock_codes: 업데이트할 종목 코드
+            fetch: 종목 상세 조회 함수 (기본: _fetch_detailed_stock_info, 실패 시 None 또는 예외)
+            max_workers: 워커 수 (기본: max_workers 설정)
+            update_type: 업데이트 이력에 기록할 유형
+            progress_callback: 종목 하나가 최종 처리될 때마다 호출
+
+        Returns:
+            UpdateResult: 업데이트 결과
+        """
+        codes = list(dict.fromkeys(stock_codes))
+        fetch = fetch or (lambda code: self._fetch_detailed_stock_info(code, throttle=False))
+        workers = max(1, min(max_workers or self._update_settings['max_workers'], len(codes) or 1))
+        max_attempts = self._update_settings['max_retries'] + 1
+        log_interval = max(1, self._update_settings['progress_log_interval'])
+
+        progress = UpdateProgress(total=len(codes))
+        with self._progress_lock:
+            self._progress = progress
+
+        work = _RetryQueue(codes)
+        results: "queue.Queue[Tuple[str, Optional[StockInfo], Optional[str]]]" = queue.Queue()
+
+        def worker():
+            while True:
+                item = work.get()
+                if item is None:
+                    return
+                stock_code, attempt = item
+                error = None
+                try:
+                    self._rate_limiter()
+                    info = fetch(stock_code)
+                    if info is None:
+                        error = "조회 결과 없음"
+                except Exception as e:
+                    info, error = None, str(e)
+
+                if error is None:
+                    results.put((stock_code, info, None))
+                    work.done()
+                elif attempt + 1 < max_attempts:
+                    with self._progress_lock:
+                        progress.retried += 1
+                    work.retry(stock_code, attempt + 1, self._retry_delay(attempt))
+                else:
+                    results.put((stock_code, None, f"종목 {stock_code}: {error} ({attempt + 1}회 시도)"))
+                    work.done()
+
+        self._logger.info(f"병렬 종목 업데이트 시작: {len(codes)}개 종목, 워커 {workers}개")
+
+        new_stocks = 0
+        errors: List[str] = []
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stock_updater")
+        try:
+            for _ in range(workers):
+                executor.submit(worker)
+
+            for _ in range(len(codes)):
+                stock_code, info, error = results.get()
+                succeeded = False
+                if info is not None:
+                    is_new = not self._stock_exists(stock_code)
+                    succeeded = self._update_stock_info(info)
+                    if succeeded and is_new:
+                        new_stocks += 1
+                    if not succeeded:
+                        error = f"종목 {stock_code}: DB 저장 실패"
+                if error:
+                    errors.append(error)
+
+                with self._progress_lock:
+                    progress.completed += 1
+                    if succeeded:
+                        progress.succeeded += 1
+                    else:
+                        progress.failed += 1
+
+                if progress_callback:
+                    progress_callback(progress)
+                if progress.completed % log_interval == 0:
+                    self._logger.info(
+                        f"병렬 종목 업데이트 진행: {progress.completed}/{progress.total} "
+                        f"({progress.throughput:.1f}종목/초, 재시도 {progress.retried})"
+                    )
+        finally:
+            work.cancel()
+            executor.shutdown(wait=True)
+            progress.finished_at = time.monotonic()
+
+        result = UpdateResult(
+            update_date=datetime.now().strftime('%Y-%m-%d'),
+            total_stocks=progress.total,
+            updated_stocks=progress.succeeded,
+            new_stocks=new_stocks,
+            delisted_stocks=0,
+            errors=errors,
+            elapsed_time=progress.elapsed
+        )
+        self._save_update_result(result, update_type)
+
+        self._logger.info(
+            f"병렬 종목 업데이트 완료: {progress.succeeded}/{progress.total} 종목 "
+            f"(실패 {progress.failed}, 재시도 {progress.retried}, "
+            f"{progress.throughput:.1f}종목/초, 소요시간 {progress.elapsed:.1f}초)"
+        )
+        return result
+
+    def _retry_delay(self, attempt: int) -> float:
+        """재시도 대기 시간 (지수 백오프)"""
+        base = self._update_settings['retry_backoff']
+        return min(base * (2 ** attempt), self._update_settings['retry_backoff_max'])
+
+    def get_update_progress(self) -> Optional[Dict[str, Any]]:
+        """진행 중이거나 마지막 병렬 업데이트의 진행 상황"""
+        with self._progress_lock:
+            return self._progress.to_dict() if self._progress else None
     
+    def _run_monthly_cleanup_if_due(self):
+        """정리 작업일(monthly_cleanup)에만 월간 정리 실행"""
+        if datetime.now().day == self._update_settings['monthly_cleanup']:
+            self._run_monthly_cleanup()
+
     def _run_monthly_cleanup(self):
         """월간 정리 작업 실행"""
         try:
@@ -0,0 +1,331 @@
+"""
+재무 데이터 스냅샷 모듈
+
+- 거래일 단위 일괄 upsert: 종목별 조회/저장 대신 한 번의 집합 연산으로 저장
+- 프로세스 내 스냅샷 캐시: 거래일별로 한 번만 로드하고 종목 코드로 조회,
+  Phase 1 스크리닝 워커들이 공유
+"""
+
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+FUNDAMENTAL_FIELDS = ('per', 'pbr', 'eps', 'bps', 'div', 'dps', 'roe')
+
+DEFAULT_STOCK_DIR = Path(__file__).parent.parent.parent / "data" / "stock"
+FILE_PATTERN = "krx_fundamentals_*.json"
+
+
+def fundamentals_file_path(date: str, stock_dir: Optional[Path] = None) -> Path:
+    return Path(stock_dir or DEFAULT_STOCK_DIR) / f"krx_fundamentals_{date}.json"
+
+
+def normalize_fundamentals(df: pd.DataFrame) -> pd.DataFrame:
+    """KRX/KIS 재무 DataFrame → ticker + 소문자 지표 컬럼
+
+    대문자(PER, PBR ...) / 소문자 컬럼 모두 허용하며, 중복 종목은 마지막 값을 사용합니다.
+    결측 지표는 NaN으로 유지합니다.
+    """
+    if df is None or df.empty:
+        return pd.DataFrame(columns=['ticker', *FUNDAMENTAL_FIELDS])
+
+    ticker_column = 'ticker' if 'ticker' in df.columns else 'stock_code'
+    normalized = pd.DataFrame({'ticker': df[ticker_column].astype(str).str.strip()})
+
+    for name in FUNDAMENTAL_FIELDS:
+        source = name.upper() if name.upper() in df.columns else name
+        if source in df.columns:
+            normalized[name] = pd.to_numeric(df[source], errors='coerce')
+        else:
+            normalized[name] = np.nan
+
+    normalized = normalized[normalized['ticker'].ne('') & normalized['ticker'].ne('nan')]
+    return normalized.drop_duplicates('ticker', keep='last').reset_index(drop=True)
+
+
+def _to_records(frame: pd.DataFrame) -> List[Dict]:
+    """NaN → None 변환된 레코드 목록"""
+    values = frame[list(FUNDAMENTAL_FIELDS)].astype(object)
+    values = values.where(pd.notna(values), None)
+    records = values.to_dict('records')
+    for ticker, record in zip(frame['ticker'].tolist(), records):
+        record['stock_code'] = ticker
+    return records
+
+
+def upsert_fundamentals(df: pd.DataFrame, date: str, session=None) -> int:
+    """거래일 재무 데이터 일괄 upsert
+
+    SQLite/PostgreSQL은 INSERT ... ON CONFLICT (stock_code, date) DO UPDATE 한 문장으로,
+    그 외 DB는 기존 종목 일괄 조회 후 bulk insert/update로 처리합니다.
+
+    Args:
+        df: 재무 데이터 (ticker + PER/PBR/... 컬럼)
+        date: 거래일 (YYYYMMDD)
+        session: SQLAlchemy 세션 (None이면 통합 DB 세션 사용)
+
+    Returns:
+        int: 저장된 종목 수
+    """
+    frame = normalize_fundamentals(df)
+    if frame.empty:
+        return 0
+
+    data_date = datetime.strptime(date, "%Y%m%d").date()
+    now = datetime.now()
+    records = _to_records(frame)
+    for record in records:
+        record['date'] = data_date
+        record['updated_at'] = now
+
+    if session is None:
+        from core.database.unified_db import get_session
+        with get_session() as db_session:
+            _upsert_records(db_session, records, data_date, now)
+            db_session.commit()
+    else:
+        _upsert_records(session, records, data_date, now)
+        session.commit()
+
+    return len(records)
+
+
+def _upsert_records(session, records: List[Dict], data_date, now: datetime):
+    from core.database.models import StockFundamental
+
+    dialect = session.get_bind().dialect.name
+    if dialect in ('sqlite', 'postgresql'):
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+
+        statement = insert(StockFundamental)
+        statement = statement.on_conflict_do_update(
+            index_elements=['stock_code', 'date'],
+            set_={
+                **{name: getattr(statement.excluded, name) for name in FUNDAMENTAL_FIELDS},
+                'updated_at': statement.excluded.updated_at,
+            },
+        )
+        for record in records:
+            record.setdefault('created_at', now)
+        session.execute(statement, records)
+        return
+
+    # 범용 경로: 기존 행 ID를 한 번에 조회
+    existing = dict(
+        session.query(StockFundamental.stock_code, StockFundamental.id)
+        .filter(StockFundamental.date == data_date)
+        .all()
+    )
+    updates, inserts = [], []
+    for record in records:
+        row_id = existing.get(record['stock_code'])
+        if row_id is None:
+            inserts.append({**record, 'created_at': now})
+        else:
+            updates.append({**record, 'id': row_id})
+
+    if inserts:
+        session.bulk_insert_mappings(StockFundamental, inserts)
+    if updates:
+        session.bulk_update_mappings(StockFundamental, updates)
+
+
+@dataclass
+class FundamentalsSnapshot:
+    """거래일 재무 데이터 스냅샷 (종목 코드 인덱스)"""
+    date: Optional[str] = None                       # YYYYMMDD
+    source: str = "empty"                            # db / file / empty
+    records: Dict[str, Dict[str, Optional[float]]] = field(default_factory=dict)
+    loaded_at: datetime = field(default_factory=datetime.now)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self.records
+
+    def get(self, ticker: str) -> Optional[Dict[str, Optional[float]]]:
+        return self.records.get(ticker)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, date: Optional[str], source: str) -> "FundamentalsSnapshot":
+        frame = normalize_fundamentals(df)
+        records = {}
+        for record in _to_records(frame):
+            ticker = record.pop('stock_code')
+            records[ticker] = record
+        return cls(date=date, source=source, records=records)
+
+
+class FundamentalsSnapshotCache:
+    """거래일별 재무 스냅샷 캐시
+
+    DB에서 거래일 전체를 한 번의 쿼리로 로드하고, DB에 없으면 해당 일자(또는 최신)
+    JSON 파일을 한 번만 파싱합니다. 스레드 간 공유되며 로드는 일자별 1회로 제한됩니다.
+    """
+
+    def __init__(self, stock_dir: Optional[Path] = None, use_db: bool = True):
+        self.stock_dir = Path(stock_dir or DEFAULT_STOCK_DIR)
+        self.use_db = use_db
+        self._snapshots: Dict[str, FundamentalsSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def get_snapshot(self, date: Optional[str] = None, refresh: bool = False) -> FundamentalsSnapshot:
+        """스냅샷 조회 (없으면 로드)
+
+        Args:
+            date: 거래일 (YYYYMMDD, None이면 최신)
+            refresh: True면 다시 로드
+        """
+        key = date or "latest"
+        if refresh:
+            self.invalidate(date)
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                snapshot = self._load(date)
+                self._snapshots[key] = snapshot
+                # DB 최신 스냅샷은 종목별 최신 행이라 기준일 이전 행이 섞일 수 있음
+                if snapshot.date and not (date is None and snapshot.source == "db"):
+                    self._snapshots[snapshot.date] = snapshot
+                logger.info(
+                    f"재무 스냅샷 로드 - 기준일: {snapshot.date}, 출처: {snapshot.source}, "
+                    f"종목 수: {len(snapshot)}"
+                )
+            return snapshot
+
+    def get(self, ticker: str, date: Optional[str] = None) -> Optional[Dict[str, Optional[float]]]:
+        """종목 재무 데이터
+
+        DB 스냅샷에 없는 종목은 파일 스냅샷에서 찾습니다 (없으면 None).
+        """
+        snapshot = self.get_snapshot(date)
+        record = snapshot.get(ticker)
+        if record is None and snapshot.source == "db":
+            record = self._get_file_snapshot(date).get(ticker)
+        return record
+
+    def _get_file_snapshot(self, date: Optional[str]) -> FundamentalsSnapshot:
+        key = f"file:{date or 'latest'}"
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshots.get(key)
+                if snapshot is None:
+                    snapshot = self._load_from_file(date) or FundamentalsSnapshot(date=date)
+                    self._snapshots[key] = snapshot
+        return snapshot
+
+    def preload(self, date: Optional[str] = None) -> FundamentalsSnapshot:
+        """실행 시작 시 최신 데이터로 다시 로드"""
+        return self.get_snapshot(date, refresh=True)
+
+    def invalidate(self, date: Optional[str] = None):
+        """캐시 무효화 (date 지정 시 해당 일자와 최신 스냅샷)"""
+        with self._lock:
+            if date is None:
+                self._snapshots.clear()
+            else:
+                for key in (date, "latest", f"file:{date}", "file:latest"):
+                    self._snapshots.pop(key, None)
+
+    def _load(self, date: Optional[str]) -> FundamentalsSnapshot:
+        if self.use_db:
+            try:
+                snapshot = self._load_from_db(date)
+                if snapshot is not None:
+                    return snapshot
+            except Exception as e:
+                logger.warning(f"재무 스냅샷 DB 로드 실패, 파일로 폴백: {e}")
+
+        snapshot = self._load_from_file(date)
+        return snapshot if snapshot is not None else FundamentalsSnapshot(date=date)
+
+    def _load_from_db(self, date: Optional[str]) -> Optional[FundamentalsSnapshot]:
+        from core.database.unified_db import get_session
+        from core.database.models import StockFundamental
+        from sqlalchemy import func
+
+        columns = [StockFundamental.stock_code] + [
+            getattr(StockFundamental, name) for name in FUNDAMENTAL_FIELDS
+        ]
+        with get_session() as session:
+            if date:
+                data_date = datetime.strptime(date, "%Y%m%d").date()
+                rows = session.query(*columns).filter(StockFundamental.date == data_date).all()
+            else:
+                # 종목별 최신 행 (최근 거래일에 누락된 종목도 직전 데이터로 포함)
+                latest = (
+                    session.query(
+                        StockFundamental.stock_code,
+                        func.max(StockFundamental.date).label('date'),
+                    )
+                    .group_by(StockFundamental.stock_code)
+                    .subquery()
+                )
+                rows = (
+                    session.query(*columns, StockFundamental.date)
+                    .join(latest, (StockFundamental.stock_code == latest.c.stock_code)
+                          & (StockFundamental.date == latest.c.date))
+                    .all()
+                )
+                data_date = max((row[-1] for row in rows), default=None)
+                rows = [row[:-1] for row in rows]
+
+        if not rows:
+            return None
+
+        records = {
+            row[0]: dict(zip(FUNDAMENTAL_FIELDS, row[1:]))
+            for row in rows
+        }
+        return FundamentalsSnapshot(
+            date=data_date.strftime("%Y%m%d"), source="db", records=records
+        )
+
+    def _load_from_file(self, date: Optional[str]) -> Optional[FundamentalsSnapshot]:
+        if date:
+            path = fundamentals_file_path(date, self.stock_dir)
+            if not path.exists():
+                return None
+        else:
+            files = list(self.stock_dir.glob(FILE_PATTERN))
+            if not files:
+                return None
+            path = max(files, key=lambda x: x.name)
+            date = path.stem.rsplit("_", 1)[-1]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return FundamentalsSnapshot.from_frame(pd.DataFrame(data), date, "file")
+
+
+_snapshot_cache: Optional[FundamentalsSnapshotCache] = None
+_snapshot_cache_lock = threading.Lock()
+
+
+def get_fundamentals_snapshot_cache() -> FundamentalsSnapshotCache:
+    """재무 스냅샷 캐시 싱글톤"""
+    global _snapshot_cache
+    if _snapshot_cache is None:
+        with _snapshot_cache_lock:
+            if _snapshot_cache is None:
+                _snapshot_cache = FundamentalsSnapshotCache()
+    return _snapshot_cache
@@ -0,0 +1,341 @@
+"""
+일봉 OHLCV 이력 저장소
+
+(stock_code, date) 키의 로컬 SQLite 파일에 일봉을 누적 저장하여,
+매 실행마다 전체 기간(~120일)을 다시 받는 대신 마지막 저장일 이후 봉만 조회합니다.
+
+- 마지막 저장일 봉을 함께 재조회하여 장중 부분 봉을 갱신
+- 겹치는 봉의 시가가 달라지면 (수정주가 반영) 해당 종목 구간 전체 재조회
+- 스레드별 연결 + WAL 모드로 병렬 스크리닝 워커에서 동시 사용
+
+환경변수:
+    HANTU_OHLCV_STORE_ENABLED: 사용 여부 (기본 true)
+    HANTU_OHLCV_STORE_PATH: 저장 파일 경로 (기본 data/historical/daily_ohlcv.db)
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Union
+
+import pandas as pd
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_STORE_PATH = Path(__file__).parent.parent.parent / "data" / "historical" / "daily_ohlcv.db"
+
+# 휴장일 고려 요청 기간 확장 배율 (get_daily_chart와 동일)
+CALENDAR_BUFFER = 1.3
+
+# 수정주가 반영 여부 판단 허용 오차 (겹치는 봉 시가 기준)
+ADJUSTMENT_TOLERANCE = 1e-6
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# 거래대금 (pykrx 조회분만 제공, 없으면 NULL)
+AMOUNT_COLUMN = 'amount'
+
+DateLike = Union[date, datetime, str, pd.Timestamp]
+
+# fetch_range(stock_code, start, end) -> OHLCV DataFrame (date 인덱스) 또는 None
+FetchRange = Callable[[str, datetime, datetime], Optional[pd.DataFrame]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_ohlcv (
+    stock_code TEXT NOT NULL,
+    date TEXT NOT NULL,
+    open REAL, high REAL, low REAL, close REAL, volume INTEGER, amount REAL,
+    PRIMARY KEY (stock_code, date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    stock_code TEXT PRIMARY KEY,
+    covered_from TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+
+def ohlcv_store_enabled() -> bool:
+    return os.getenv('HANTU_OHLCV_STORE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+
+
+def _to_day(value: DateLike) -> str:
+    if isinstance(value, str):
+        value = datetime.strptime(value.replace('-', ''), "%Y%m%d")
+    return pd.Timestamp(value).strftime("%Y-%m-%d")
+
+
+class OHLCVHistoryStore:
+    """종목별 일봉 이력 저장소 (SQLite)"""
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        self.db_path = Path(db_path or os.getenv('HANTU_OHLCV_STORE_PATH') or DEFAULT_STORE_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+            self._migrate(conn)
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        """거래대금 컬럼이 없는 기존 저장 파일에 컬럼 추가"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(daily_ohlcv)")}
+        if AMOUNT_COLUMN not in columns:
+            conn.execute(f"ALTER TABLE daily_ohlcv ADD COLUMN {AMOUNT_COLUMN} REAL")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def last_date(self, stock_code: str) -> Optional[date]:
+        row = self._connect().execute(
+            "SELECT MAX(date) FROM daily_ohlcv WHERE stock_code = ?", (stock_code,)
+        ).fetchone()
+        return date.fromisoformat(row[0]) if row and row[0] else None
+
+    def last_dates(self, stock_codes: Optional[Iterable[str]] = None) -> Dict[str, date]:
+        """종목별 마지막 저장일 (한 번의 쿼리)"""
+        rows = self._connect().execute(
+            "SELECT stock_code, MAX(date) FROM daily_ohlcv GROUP BY stock_code"
+        ).fetchall()
+        wanted = set(stock_codes) if stock_codes is not None else None
+        return {
+            code: date.fromisoformat(last)
+            for code, last in rows
+            if wanted is None or code in wanted
+        }
+
+    def covered_from(self, stock_code: str) -> Optional[date]:
+        """연속 저장이 보장되는 시작일"""
+        row = self._connect().execute(
+            "SELECT covered_from FROM coverage WHERE stock_code = ?", (stock_code,)
+        ).fetchone()
+        return date.fromisoformat(row[0]) if row else None
+
+    def count(self, stock_code: str) -> int:
+        row = self._connect().execute(
+            "SELECT COUNT(*) FROM daily_ohlcv WHERE stock_code = ?", (stock_code,)
+        ).fetchone()
+        return int(row[0])
+
+    def get_bar(self, stock_code: str, day: DateLike) -> Optional[Dict[str, float]]:
+        row = self._connect().execute(
+            "SELECT open, high, low, close, volume FROM daily_ohlcv "
+            "WHERE stock_code = ? AND date = ?",
+            (stock_code, _to_day(day)),
+        ).fetchone()
+        return dict(zip(OHLCV_COLUMNS, row)) if row else None
+
+    def load(
+        self,
+        stock_code: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        limit: Optional[int] = None,
+        with_amount: bool = False
+    ) -> pd.DataFrame:
+        """저장된 일봉 (get_daily_chart와 같은 형식: date 인덱스, 오름차순)
+
+        Args:
+            start/end: 기간 (포함)
+            limit: 최근 N개만
+            with_amount: 거래대금(amount) 컬럼 포함 (저장되지 않은 봉은 NaN)
+        """
+        columns = [*OHLCV_COLUMNS, AMOUNT_COLUMN] if with_amount else list(OHLCV_COLUMNS)
+        query = f"SELECT date, {', '.join(columns)} FROM daily_ohlcv WHERE stock_code = ?"
+        params = [stock_code]
+        if start is not None:
+            query += " AND date >= ?"
+            params.append(_to_day(start))
+        if end is not None:
+            query += " AND date <= ?"
+            params.append(_to_day(end))
+        query += " ORDER BY date DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(int(limit))
+
+        rows = self._connect().execute(query, params).fetchall()
+        df = pd.DataFrame(rows[::-1], columns=['date', *columns])
+        df['date'] = pd.to_datetime(df['date'])
+        df['volume'] = df['volume'].astype('int64')
+        if with_amount:
+            df[AMOUNT_COLUMN] = df[AMOUNT_COLUMN].astype(float)
+        return df.set_index('date')
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+
+    def append(self, stock_code: str, df: pd.DataFrame, covered_from: Optional[DateLike] = None) -> int:
+        """일봉 저장 (같은 날짜는 덮어씀)
+
+        Args:
+            df: OHLCV DataFrame (date 인덱스 또는 date 컬럼).
+                amount 컬럼이 없거나 NaN이면 기존 저장된 거래대금을 유지
+            covered_from: 이 날짜부터 연속 저장됨을 기록 (전체 구간 조회 시).
+                기존 저장 구간보다 이르면 구간 시작을 앞당기므로, df가 기존
+                covered_from까지 이어져 있어야 합니다
+
+        Returns:
+            int: 저장된 봉 수
+        """
+        if df is None or df.empty:
+            return 0
+
+        frame = df.reset_index() if 'date' not in df.columns else df
+        days = pd.to_datetime(frame['date']).dt.strftime("%Y-%m-%d")
+        if AMOUNT_COLUMN in frame.columns:
+            amounts = frame[AMOUNT_COLUMN].astype(float)
+            amounts = amounts.astype(object).where(amounts.notna(), None).tolist()
+        else:
+            amounts = [None] * len(frame)
+        rows = list(zip(
+            [stock_code] * len(frame),
+            days.tolist(),
+            frame['open'].astype(float).tolist(),
+            frame['high'].astype(float).tolist(),
+            frame['low'].astype(float).tolist(),
+            frame['close'].astype(float).tolist(),
+            frame['volume'].astype('int64').tolist(),
+            amounts,
+        ))
+
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT INTO daily_ohlcv "
+                "(stock_code, date, open, high, low, close, volume, amount) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(stock_code, date) DO UPDATE SET "
+                "open = excluded.open, high = excluded.high, low = excluded.low, "
+                "close = excluded.close, volume = excluded.volume, "
+                "amount = COALESCE(excluded.amount, daily_ohlcv.amount)",
+                rows,
+            )
+            if covered_from is not None:
+                self._set_coverage(conn, stock_code, _to_day(covered_from))
+        return len(rows)
+
+    def replace(self, stock_code: str, df: pd.DataFrame, covered_from: DateLike) -> int:
+        """종목 이력 교체 (수정주가 반영 시)"""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM daily_ohlcv WHERE stock_code = ?", (stock_code,))
+            conn.execute("DELETE FROM coverage WHERE stock_code = ?", (stock_code,))
+        return self.append(stock_code, df, covered_from=covered_from)
+
+    @staticmethod
+    def _set_coverage(conn: sqlite3.Connection, stock_code: str, covered_from: str):
+        conn.execute(
+            "INSERT INTO coverage (stock_code, covered_from, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(stock_code) DO UPDATE SET "
+            "covered_from = MIN(covered_from, excluded.covered_from), "
+            "updated_at = excluded.updated_at",
+            (stock_code, covered_from, datetime.now().isoformat()),
+        )
+
+
+def sync_daily_history(
+    store: OHLCVHistoryStore,
+    stock_code: str,
+    period_days: int,
+    fetch_range: FetchRange,
+    today: Optional[date] = None
+) -> Optional[pd.DataFrame]:
+    """저장소를 최신으로 갱신하고 최근 period_days개 일봉 반환
+
+    - 저장 이력이 요청 구간을 덮지 못하면 구간 전체 조회
+    - 그 외에는 마지막 저장일부터 오늘까지만 조회 (보통 1~2봉)
+    - 증분 조회 실패 시 저장된 데이터로 응답
+
+    Args:
+        store: 이력 저장소
+        stock_code: 종목 코드
+        period_days: 필요한 봉 수
+        fetch_range: (종목, 시작일, 종료일) → OHLCV DataFrame 조회 함수
+        today: 기준일 (테스트용)
+
+    Returns:
+        Optional[pd.DataFrame]: 최근 period_days개 일봉 (조회 실패 시 None)
+    """
+    today = today or date.today()
+    end = datetime.combine(today, datetime.min.time())
+    window_start = end - timedelta(days=int(period_days * CALENDAR_BUFFER))
+
+    last = store.last_date(stock_code)
+    covered = store.covered_from(stock_code)
+    if last is None or covered is None or covered > window_start.date() or last < window_start.date():
+        fetched = fetch_range(stock_code, window_start, end)
+        if fetched is None or fetched.empty:
+            return None
+        store.replace(stock_code, fetched, covered_from=window_start)
+        logger.debug(f"일봉 이력 전체 조회: {stock_code}, {len(fetched)}봉")
+        return store.load(stock_code, limit=period_days)
+
+    last_start = datetime.combine(last, datetime.min.time())
+    fetched = fetch_range(stock_code, last_start, end)
+    if fetched is None:
+        logger.warning(f"일봉 증분 조회 실패, 저장 데이터 사용: {stock_code} (마지막 {last})")
+        return store.load(stock_code, limit=period_days)
+
+    if _adjusted_since(store, stock_code, last, fetched):
+        logger.info(f"수정주가 변경 감지, 일봉 이력 재조회: {stock_code}")
+        full = fetch_range(stock_code, window_start, end)
+        if full is None or full.empty:
+            return None
+        store.replace(stock_code, full, covered_from=window_start)
+    else:
+        store.append(stock_code, fetched)
+        logger.debug(f"일봉 증분 조회: {stock_code}, {len(fetched)}봉")
+
+    return store.load(stock_code, limit=period_days)
+
+
+def _adjusted_since(store: OHLCVHistoryStore, stock_code: str, last: date, fetched: pd.DataFrame) -> bool:
+    """겹치는 봉(마지막 저장일)의 시가가 달라졌는지 확인"""
+    stored = store.get_bar(stock_code, last)
+    if stored is None or fetched.empty:
+        return False
+
+    index = pd.to_datetime(fetched.index if 'date' not in fetched.columns else fetched['date'])
+    matches = fetched[(index.normalize() == pd.Timestamp(last))]
+    if matches.empty:
+        return False
+
+    new_open = float(matches['open'].iloc[0])
+    old_open = float(stored['open'])
+    return abs(new_open - old_open) > ADJUSTMENT_TOLERANCE * max(abs(old_open), 1.0)
+
+
+_stores: Dict[Path, OHLCVHistoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_ohlcv_store(db_path: Optional[Union[str, Path]] = None) -> OHLCVHistoryStore:
+    """경로별 일봉 이력 저장소 싱글톤"""
+    path = Path(db_path or os.getenv('HANTU_OHLCV_STORE_PATH') or DEFAULT_STORE_PATH)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = OHLCVHistoryStore(path)
+        return store
@@ -13,6 +13,7 @@ from pathlib import Path
 
 from core.config import settings
 from core.utils import get_logger
+from core.utils.latency_metrics import latency_timer, STAGE_DB_COMMIT
 from .models import Base
 
 logger = get_logger(__name__)
@@ -94,7 +95,8 @@ class DatabaseSession:
         session = self._create_session()
         try:
             yield session
-            session.commit()
+            with latency_timer(STAGE_DB_COMMIT):
+                session.commit()
         except Exception as e:
             logger.error(f"DB 세션 에러: {e}", exc_info=True)
             session.rollback()
@@ -2,16 +2,24 @@
 이벤트 버스 구현
 
 이 모듈은 이벤트 시스템의 핵심인 이벤트 버스를 구현합니다.
+
+디스패치:
+- 워커는 발행 시 Condition 통지로 깨어납니다 (빈 큐 폴링 없음)
+- 우선순위(critical/high/normal) 안에서는 이벤트 타입별 가중 공정 큐잉
+- 처리 순서는 (타입, 종목) 단위로 보장 (다른 종목의 같은 타입 이벤트는 병렬 처리)
+- inline 구독 핸들러는 태스크 생성 없이 워커에서 바로 호출
+- 배치 구독은 플러시 주기마다 모인 이벤트 목록을 한 번에 전달
 """
 
 import asyncio
 import logging
 import uuid
-from typing import Dict, List, Optional, Set, Any
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from collections import defaultdict, deque
 import threading
 
 from ..interfaces.events import IEventBus, IEventHandler, IEvent, EventType
+from .dispatch import BatchSubscription, FairQueue, LatencyStats
 from .types import is_high_priority, is_critical_priority
 
 logger = logging.getLogger(__name__)
@@ -23,48 +31,127 @@ class EventBus(IEventBus):
     def __init__(self, 
                  max_queue_size: int = 1000,
                  max_workers: int = 10,
-                 enable_persistence: bool = False):
+                 enable_persistence: bool = False,
+                 type_weights: Optional[Dict[EventType, int]] = None,
+                 preserve_type_order: bool = True,
+                 order_key: Optional[Callable[[IEvent], Any]] = None,
+                 stats_window: int = 1000):
         """
         이벤트 버스 초기화
         
         Args:
-            max_queue_size: 최대 큐 크기
+            max_queue_size: 최대 큐 크기 (우선순위별)
             max_workers: 최대 워커 수
             enable_persistence: 이벤트 영속성 활성화 여부
+            type_weights: 같은 우선순위 안에서 이벤트 타입별 가중치 (기본 1, 라운드 로빈)
+            preserve_type_order: 같은 타입·같은 순서 키(기본: 종목 코드) 이벤트를 발행 순서대로
+                하나씩 처리할지 여부 (다른 종목의 같은 타입 이벤트는 동시에 처리)
+            order_key: 순서 보장 단위 키 함수 (기본: 이벤트의 stock_code, 없으면 타입 전체)
+            stats_window: 지연 통계 링 버퍼 크기
         """
         self._v_subscribers: Dict[EventType, Set[IEventHandler]] = defaultdict(set)
-        self._v_event_queue: deque = deque(maxlen=max_queue_size)
-        self._v_high_priority_queue: deque = deque(maxlen=max_queue_size)
-        self._v_critical_priority_queue: deque = deque(maxlen=max_queue_size)
+        self._v_inline_handlers: Set[IEventHandler] = set()
+        self._v_batch_subscriptions: Dict[str, BatchSubscription] = {}
+        self._v_event_queue = FairQueue(max_queue_size, type_weights, preserve_type_order, order_key)
+        self._v_high_priority_queue = FairQueue(max_queue_size, type_weights, preserve_type_order, order_key)
+        self._v_critical_priority_queue = FairQueue(max_queue_size, type_weights, preserve_type_order, order_key)
+        # 꺼내는 순서 (중요 → 높음 → 일반)
+        self._v_queues = (
+            self._v_critical_priority_queue,
+            self._v_high_priority_queue,
+            self._v_event_queue,
+        )
         
         self._v_max_workers = max_workers
         self._v_enable_persistence = enable_persistence
         self._v_is_running = False
         self._v_worker_tasks: List[asyncio.Task] = []
+        self._v_flush_tasks: Dict[str, asyncio.Task] = {}
         self._v_lock = threading.RLock()
+        # 실행 중인 루프에서 처음 사용할 때 생성 (생성 시점 루프에 묶이지 않도록)
+        self._v_condition: Optional[asyncio.Condition] = None
         
         # 통계
         self._v_published_count = 0
         self._v_processed_count = 0
         self._v_failed_count = 0
         self._v_dropped_count = 0
-        self._v_processing_times: List[float] = []
+        self._v_processing_times = LatencyStats(stats_window)
+        self._v_queue_latencies = LatencyStats(stats_window)
         
         # 이벤트 저장소 (간단한 메모리 저장소)
         self._v_event_store: Dict[str, IEvent] = {}
         self._v_event_history: deque = deque(maxlen=10000)
     
-    def subscribe(self, event_type: EventType, handler: IEventHandler) -> bool:
-        """이벤트 구독"""
+    def subscribe(self, event_type: EventType, handler: IEventHandler, inline: bool = False) -> bool:
+        """이벤트 구독
+        
+        Args:
+            event_type: 이벤트 타입
+            handler: 이벤트 핸들러
+            inline: 빠른 동기성 핸들러 여부 (True면 태스크 생성 없이 워커에서 순서대로 호출)
+        """
         with self._v_lock:
             if event_type not in handler.get_supported_events():
                 logger.warning(f"Handler '{handler.get_handler_name()}' does not support event type '{event_type}'")
                 return False
             
             self._v_subscribers[event_type].add(handler)
+            if inline:
+                self._v_inline_handlers.add(handler)
             logger.info(f"Handler '{handler.get_handler_name()}' subscribed to event type '{event_type}'")
             return True
     
+    def subscribe_batch(self,
+                        event_type: EventType,
+                        callback: Callable[[List[IEvent]], Any],
+                        flush_interval: float = 0.1,
+                        max_batch: Optional[int] = None,
+                        coalesce_key: Optional[Callable[[IEvent], Any]] = None) -> str:
+        """배치 구독 (플러시 주기마다 모인 이벤트 목록을 한 번에 전달)
+        
+        Args:
+            event_type: 이벤트 타입
+            callback: 이벤트 목록을 받는 함수 (동기/코루틴)
+            flush_interval: 플러시 주기 (초)
+            max_batch: 이 개수에 도달하면 즉시 플러시
+            coalesce_key: 지정 시 주기 안에서 같은 키는 최신 이벤트만 전달 (예: lambda e: e.stock_code)
+            
+        Returns:
+            str: 구독 ID (unsubscribe_batch에 사용)
+        """
+        _v_subscription = BatchSubscription(
+            subscription_id=str(uuid.uuid4()),
+            event_type=event_type,
+            callback=callback,
+            flush_interval=flush_interval,
+            max_batch=max_batch,
+            coalesce_key=coalesce_key,
+        )
+        with self._v_lock:
+            self._v_batch_subscriptions[_v_subscription.subscription_id] = _v_subscription
+        
+        if self._v_is_running:
+            self._start_flush_task(_v_subscription)
+        
+        logger.info(f"Batch subscription '{_v_subscription.subscription_id}' added for event type '{event_type}' "
+                    f"(flush {flush_interval}s)")
+        return _v_subscription.subscription_id
+    
+    async def unsubscribe_batch(self, subscription_id: str) -> bool:
+        """배치 구독 해제 (남은 이벤트는 전달 후 해제)"""
+        with self._v_lock:
+            _v_subscription = self._v_batch_subscriptions.pop(subscription_id, None)
+        if _v_subscription is None:
+            return False
+        
+        _v_task = self._v_flush_tasks.pop(subscription_id, None)
+        if _v_task:
+            _v_task.cancel()
+            await asyncio.gather(_v_task, return_exceptions=True)
+        await self._flush_batch(_v_subscription)
+        return True
+    
     def unsubscribe(self, event_type: EventType, handler: IEventHandler) -> bool:
         """이벤트 구독 해제"""
         with self._v_lock:
@@ -97,26 +184,24 @@ class EventBus(IEventBus):
         
         # 우선순위별 큐에 추가
         if is_critical_priority(event.priority):
-            if len(self._v_critical_priority_queue) >= self._v_critical_priority_queue.maxlen:
-                self._v_dropped_count += 1
-                logger.warning(f"Critical priority queue is full. Dropping event: {event.event_id}")
-                return False
-            self._v_critical_priority_queue.append(event)
+            _v_queue, _v_queue_name = self._v_critical_priority_queue, "Critical priority queue"
         elif is_high_priority(event.priority):
-            if len(self._v_high_priority_queue) >= self._v_high_priority_queue.maxlen:
-                self._v_dropped_count += 1
-                logger.warning(f"High priority queue is full. Dropping event: {event.event_id}")
-                return False
-            self._v_high_priority_queue.append(event)
+            _v_queue, _v_queue_name = self._v_high_priority_queue, "High priority queue"
         else:
-            if len(self._v_event_queue) >= self._v_event_queue.maxlen:
-                self._v_dropped_count += 1
-                logger.warning(f"Event queue is full. Dropping event: {event.event_id}")
-                return False
-            self._v_event_queue.append(event)
+            _v_queue, _v_queue_name = self._v_event_queue, "Event queue"
+        
+        if not _v_queue.put(event, asyncio.get_running_loop().time()):
+            self._v_dropped_count += 1
+            logger.warning(f"{_v_queue_name} is full. Dropping event: {event.event_id}")
+            return False
         
         self._v_published_count += 1
         logger.debug(f"Event published: {event.event_id} (type: {event.event_type.value})")
+        
+        # 대기 중인 워커 하나를 깨움
+        _v_condition = self._get_condition()
+        async with _v_condition:
+            _v_condition.notify()
         return True
     
     def get_subscribers(self, event_type: EventType) -> List[IEventHandler]:
@@ -145,6 +230,10 @@ class EventBus(IEventBus):
             _v_worker_task = asyncio.create_task(self._worker_loop(f"worker-{i}"))
             self._v_worker_tasks.append(_v_worker_task)
         
+        # 배치 구독 플러시 태스크 시작
+        for subscription in list(self._v_batch_subscriptions.values()):
+            self._start_flush_task(subscription)
+        
         logger.info(f"EventBus started with {self._v_max_workers} workers")
         return True
     
@@ -156,15 +245,22 @@ class EventBus(IEventBus):
         
         self._v_is_running = False
         
-        # 워커 태스크 중지
-        for task in self._v_worker_tasks:
+        # 워커/플러시 태스크 중지
+        _v_tasks = self._v_worker_tasks + list(self._v_flush_tasks.values())
+        for task in _v_tasks:
             task.cancel()
         
         # 남은 태스크 정리
-        if self._v_worker_tasks:
-            await asyncio.gather(*self._v_worker_tasks, return_exceptions=True)
+        if _v_tasks:
+            await asyncio.gather(*_v_tasks, return_exceptions=True)
         
         self._v_worker_tasks.clear()
+        self._v_flush_tasks.clear()
+        self._v_condition = None
+        
+        # 배치 구독에 남은 이벤트 전달
+        for subscription in list(self._v_batch_subscriptions.values()):
+            await self._flush_batch(subscription)
         
         logger.info("EventBus stopped")
         return True
@@ -173,20 +269,41 @@ class EventBus(IEventBus):
         """이벤트 버스 실행 상태 확인"""
         return self._v_is_running
     
+    def _get_condition(self) -> asyncio.Condition:
+        """워커 깨우기용 Condition (실행 중인 루프에서 생성)"""
+        if self._v_condition is None:
+            self._v_condition = asyncio.Condition()
+        return self._v_condition
+    
     async def _worker_loop(self, worker_name: str):
         """워커 루프"""
         logger.info(f"EventBus worker '{worker_name}' started")
+        _v_condition = self._get_condition()
+        _v_loop = asyncio.get_running_loop()
         
         while self._v_is_running:
             try:
-                # 이벤트 가져오기 (우선순위 순서)
-                _v_event = await self._get_next_event()
+                # 꺼낼 이벤트가 생길 때까지 대기 (발행/타입 처리 완료 시 통지)
+                async with _v_condition:
+                    _v_item = self._pop_next_event()
+                    while _v_item is None and self._v_is_running:
+                        await _v_condition.wait()
+                        _v_item = self._pop_next_event()
                 
-                if _v_event:
+                if _v_item is None:
+                    break
+                
+                _v_queue, _v_enqueued_at, _v_event = _v_item
+                self._v_queue_latencies.record(_v_loop.time() - _v_enqueued_at)
+                try:
                     await self._process_event(_v_event)
-                else:
-                    # 이벤트가 없으면 잠시 대기
-                    await asyncio.sleep(0.1)
+                finally:
+                    if _v_queue.preserve_order:
+                        _v_queue.done(_v_event)
+                        # 같은 타입의 다음 이벤트를 다른 워커가 가져갈 수 있게 통지
+                        if _v_queue.has_ready():
+                            async with _v_condition:
+                                _v_condition.notify()
                     
             except asyncio.CancelledError:
                 logger.info(f"EventBus worker '{worker_name}' cancelled")
@@ -197,27 +314,23 @@ class EventBus(IEventBus):
         
         logger.info(f"EventBus worker '{worker_name}' stopped")
     
-    async def _get_next_event(self) -> Optional[IEvent]:
-        """다음 이벤트 가져오기 (우선순위 순서)"""
-        # 중요 우선순위 큐에서 먼저 가져오기
-        if self._v_critical_priority_queue:
-            return self._v_critical_priority_queue.popleft()
-        
-        # 높은 우선순위 큐에서 가져오기
-        if self._v_high_priority_queue:
-            return self._v_high_priority_queue.popleft()
-        
-        # 일반 우선순위 큐에서 가져오기
-        if self._v_event_queue:
-            return self._v_event_queue.popleft()
-        
+    def _pop_next_event(self) -> Optional[Tuple[FairQueue, float, IEvent]]:
+        """다음 이벤트 가져오기 (우선순위 순서, 우선순위 안에서는 타입별 공정 순서)"""
+        for queue in self._v_queues:
+            _v_item = queue.pop()
+            if _v_item is not None:
+                return (queue,) + _v_item
         return None
     
     async def _process_event(self, event: IEvent):
         """이벤트 처리"""
-        _v_start_time = asyncio.get_event_loop().time()
+        _v_start_time = asyncio.get_running_loop().time()
         
         try:
+            # 배치 구독 적재
+            if self._v_batch_subscriptions:
+                await self._collect_batches(event)
+            
             # 구독자 찾기
             _v_handlers = self.get_subscribers(event.event_type)
             
@@ -225,17 +338,26 @@ class EventBus(IEventBus):
                 logger.debug(f"No handlers for event type: {event.event_type.value}")
                 return
             
-            # 모든 핸들러에 이벤트 전달
-            _v_tasks = []
+            # inline 핸들러는 순서대로 바로 호출, 나머지는 2개 이상일 때만 태스크로 동시 실행
+            _v_results = []
+            _v_concurrent = []
             for handler in _v_handlers:
-                if handler.is_enabled():
-                    _v_task = asyncio.create_task(handler.process_event(event))
-                    _v_tasks.append(_v_task)
+                if not handler.is_enabled():
+                    continue
+                if handler in self._v_inline_handlers:
+                    _v_results.append(await self._call_handler(handler, event))
+                else:
+                    _v_concurrent.append(handler)
             
-            # 모든 핸들러 처리 완료 대기
-            if _v_tasks:
-                _v_results = await asyncio.gather(*_v_tasks, return_exceptions=True)
-                
+            if len(_v_concurrent) == 1:
+                _v_results.append(await self._call_handler(_v_concurrent[0], event))
+            elif _v_concurrent:
+                _v_results.extend(await asyncio.gather(
+                    *(handler.process_event(event) for handler in _v_concurrent),
+                    return_exceptions=True
+                ))
+            
+            if _v_results:
                 # 결과 처리
                 _v_success_count = 0
                 for result in _v_results:
@@ -248,27 +370,63 @@ class EventBus(IEventBus):
                 if _v_success_count > 0:
                     self._v_processed_count += 1
                 
-                logger.debug(f"Event processed: {event.event_id} ({_v_success_count}/{len(_v_tasks)} handlers succeeded)")
+                logger.debug(f"Event processed: {event.event_id} ({_v_success_count}/{len(_v_results)} handlers succeeded)")
             
         except Exception as e:
             logger.error(f"Failed to process event {event.event_id}: {str(e)}", exc_info=True)
             self._v_failed_count += 1
         
         finally:
-            # 처리 시간 기록
-            _v_processing_time = asyncio.get_event_loop().time() - _v_start_time
-            self._v_processing_times.append(_v_processing_time)
-            
-            # 최근 1000개의 처리 시간만 유지
-            if len(self._v_processing_times) > 1000:
-                self._v_processing_times.pop(0)
+            # 처리 시간 기록 (최근 stats_window개 링 버퍼)
+            self._v_processing_times.record(asyncio.get_running_loop().time() - _v_start_time)
+    
+    @staticmethod
+    async def _call_handler(handler: IEventHandler, event: IEvent):
+        """핸들러 직접 호출 (gather와 같이 예외는 결과로 반환)"""
+        try:
+            return await handler.process_event(event)
+        except Exception as e:
+            return e
+    
+    async def _collect_batches(self, event: IEvent):
+        """이벤트를 해당 타입 배치 구독에 적재 (max_batch 도달 시 즉시 플러시)"""
+        for subscription in list(self._v_batch_subscriptions.values()):
+            if subscription.event_type == event.event_type and subscription.add(event):
+                await self._flush_batch(subscription)
+    
+    async def _flush_batch(self, subscription: BatchSubscription):
+        """배치 구독에 모인 이벤트 전달"""
+        _v_batch = subscription.drain()
+        if not _v_batch:
+            return
+        
+        subscription.delivered_batches += 1
+        subscription.delivered_events += len(_v_batch)
+        try:
+            _v_result = subscription.callback(_v_batch)
+            if asyncio.iscoroutine(_v_result):
+                await _v_result
+        except Exception as e:
+            self._v_failed_count += 1
+            logger.error(f"Batch subscription '{subscription.subscription_id}' callback failed: {str(e)}", exc_info=True)
+    
+    def _start_flush_task(self, subscription: BatchSubscription):
+        """배치 구독 주기 플러시 태스크 시작"""
+        if subscription.subscription_id in self._v_flush_tasks:
+            return
+        self._v_flush_tasks[subscription.subscription_id] = asyncio.create_task(self._flush_loop(subscription))
+    
+    async def _flush_loop(self, subscription: BatchSubscription):
+        """플러시 주기마다 배치 전달"""
+        while self._v_is_running:
+            try:
+                await asyncio.sleep(subscription.flush_interval)
+                await self._flush_batch(subscription)
+            except asyncio.CancelledError:
+                break
     
     def get_event_stats(self) -> Dict[str, Any]:
         """이벤트 통계 조회"""
-        _v_avg_processing_time = 0
-        if self._v_processing_times:
-            _v_avg_processing_time = sum(self._v_processing_times) / len(self._v_processing_times)
-        
         return {
             'is_running': self._v_is_running,
             'published_count': self._v_published_count,
@@ -276,13 +434,24 @@ class EventBus(IEventBus):
             'failed_count': self._v_failed_count,
             'dropped_count': self._v_dropped_count,
             'success_rate': (self._v_processed_count / max(1, self._v_published_count)) * 100,
-            'avg_processing_time': _v_avg_processing_time,
+            'avg_processing_time': self._v_processing_times.mean(),
+            'processing_time': self._v_processing_times.summary(),
+            'queue_latency': self._v_queue_latencies.summary(),
             'queue_sizes': {
                 'normal': len(self._v_event_queue),
                 'high': len(self._v_high_priority_queue),
                 'critical': len(self._v_critical_priority_queue)
             },
             'total_subscribers': sum(len(handlers) for handlers in self._v_subscribers.values()),
+            'batch_subscriptions': {
+                subscription_id: {
+                    'event_type': subscription.event_type.value,
+                    'pending': subscription.pending(),
+                    'delivered_batches': subscription.delivered_batches,
+                    'delivered_events': subscription.delivered_events,
+                }
+                for subscription_id, subscription in self._v_batch_subscriptions.items()
+            },
             'active_workers': len(self._v_worker_tasks)
         }
     
@@ -306,6 +475,7 @@ class EventBus(IEventBus):
         self._v_failed_count = 0
         self._v_dropped_count = 0
         self._v_processing_times.clear()
+        self._v_queue_latencies.clear()
     
     def subscribe_multiple(self, event_types: List[EventType], handler: IEventHandler) -> Dict[EventType, bool]:
         """여러 이벤트 타입에 구독"""
@@ -323,6 +493,7 @@ class EventBus(IEventBus):
                 if handler in handlers:
                     handlers.discard(handler)
                     _v_unsubscribed_count += 1
+            self._v_inline_handlers.discard(handler)
         
         logger.info(f"Handler '{handler.get_handler_name()}' unsubscribed from {_v_unsubscribed_count} event types")
         return _v_unsubscribed_count
@@ -333,17 +504,20 @@ class EventBus(IEventBus):
             'normal_queue': {
                 'size': len(self._v_event_queue),
                 'max_size': self._v_event_queue.maxlen,
-                'utilization': len(self._v_event_queue) / self._v_event_queue.maxlen * 100
+                'utilization': len(self._v_event_queue) / self._v_event_queue.maxlen * 100,
+                'by_type': self._v_event_queue.sizes()
             },
             'high_priority_queue': {
                 'size': len(self._v_high_priority_queue),
                 'max_size': self._v_high_priority_queue.maxlen,
-                'utilization': len(self._v_high_priority_queue) / self._v_high_priority_queue.maxlen * 100
+                'utilization': len(self._v_high_priority_queue) / self._v_high_priority_queue.maxlen * 100,
+                'by_type': self._v_high_priority_queue.sizes()
             },
             'critical_priority_queue': {
                 'size': len(self._v_critical_priority_queue),
                 'max_size': self._v_critical_priority_queue.maxlen,
-                'utilization': len(self._v_critical_priority_queue) / self._v_critical_priority_queue.maxlen * 100
+                'utilization': len(self._v_critical_priority_queue) / self._v_critical_priority_queue.maxlen * 100,
+                'by_type': self._v_critical_priority_queue.sizes()
             }
         }
     
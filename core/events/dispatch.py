@@ -0,0 +1,267 @@
+"""
+이벤트 디스패치 구성 요소
+
+EventBus가 사용하는 큐/통계/배치 구독 구현입니다.
+
+- FairQueue: 한 우선순위 안에서 이벤트 타입별 가중 공정 큐잉 (대량 틱이 주문/리스크 이벤트를 굶기지 않도록),
+  순서 보장은 (타입, 종목) 단위
+- LatencyStats: 고정 크기 링 버퍼 지연 통계
+- BatchSubscription: 플러시 주기마다 이벤트 목록을 모아 전달하는 배치 구독
+"""
+
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from ..interfaces.events import EventType, IEvent
+
+logger = logging.getLogger(__name__)
+
+
+def default_order_key(event: IEvent) -> Any:
+    """순서 보장 단위 키 (종목 이벤트는 종목 코드, 그 외는 타입 전체)"""
+    return getattr(event, 'stock_code', None) or None
+
+
+class FairQueue:
+    """이벤트 타입별 가중 라운드 로빈 큐
+
+    타입마다 순서 키(기본: 종목 코드)별 FIFO 큐를 두고, 준비된 타입을 순환하며
+    타입당 weight개씩 꺼냅니다. 한 타입 안에서는 준비된 키를 순환합니다.
+    preserve_order가 True이면 같은 (타입, 키)는 동시에 하나만 처리되도록 꺼낸 뒤
+    done()이 호출될 때까지 순환에서 빠집니다 (워커가 여러 개여도 종목 내 순서 보장,
+    다른 종목의 같은 타입 이벤트는 동시에 처리).
+    """
+
+    def __init__(self,
+                 maxlen: int,
+                 weights: Optional[Dict[EventType, int]] = None,
+                 preserve_order: bool = True,
+                 order_key: Optional[Callable[[IEvent], Any]] = None):
+        """
+        Args:
+            maxlen: 전체 최대 이벤트 수
+            weights: 이벤트 타입별 가중치 (기본 1, 한 번에 연속으로 꺼낼 개수)
+            preserve_order: (타입, 순서 키) 내 처리 순서 보장 여부
+            order_key: 순서 보장 단위 키 함수 (기본 default_order_key, preserve_order일 때만 사용)
+        """
+        self.maxlen = maxlen
+        self.preserve_order = preserve_order
+        self._v_order_key = order_key or default_order_key
+        self._v_weights = dict(weights or {})
+        # 타입 → 순서 키 → (enqueued_at, event) FIFO
+        self._v_queues: Dict[EventType, Dict[Any, Deque[Tuple[float, IEvent]]]] = {}
+        # 타입별 꺼낼 수 있는 키 순환 (처리 중인 키 제외)
+        self._v_ready_keys: Dict[EventType, Deque[Any]] = {}
+        self._v_ready: Deque[EventType] = deque()
+        self._v_credits: Dict[EventType, int] = {}
+        self._v_busy: Set[Tuple[EventType, Any]] = set()
+        self._v_size = 0
+
+    def __len__(self) -> int:
+        return self._v_size
+
+    def weight(self, event_type: EventType) -> int:
+        return max(1, self._v_weights.get(event_type, 1))
+
+    def set_weight(self, event_type: EventType, weight: int):
+        self._v_weights[event_type] = weight
+
+    def is_full(self) -> bool:
+        return self._v_size >= self.maxlen
+
+    def has_ready(self) -> bool:
+        """지금 꺼낼 수 있는 이벤트가 있는지 (처리 중인 키 제외)"""
+        return bool(self._v_ready)
+
+    def key_of(self, event: IEvent) -> Any:
+        """이벤트의 순서 키 (순서 보장을 끄면 타입 전체가 하나의 FIFO)"""
+        return self._v_order_key(event) if self.preserve_order else None
+
+    def put(self, event: IEvent, enqueued_at: float) -> bool:
+        """이벤트 추가 (가득 찼으면 False)"""
+        if self._v_size >= self.maxlen:
+            return False
+
+        event_type = event.event_type
+        key = self.key_of(event)
+        keys = self._v_queues.setdefault(event_type, {})
+        queue = keys.get(key)
+        if queue is None:
+            queue = keys[key] = deque()
+        if not queue and (event_type, key) not in self._v_busy:
+            self._make_ready(event_type, key)
+        queue.append((enqueued_at, event))
+        self._v_size += 1
+        return True
+
+    def _make_ready(self, event_type: EventType, key: Any, resume: bool = False):
+        """키를 타입 순환에 넣고, 타입이 순환 밖이면 타입도 넣음"""
+        ready_keys = self._v_ready_keys.setdefault(event_type, deque())
+        was_ready = bool(ready_keys)
+        ready_keys.append(key)
+        if was_ready:
+            return
+        if resume and self._v_credits.get(event_type, 0) > 0:
+            # 가중치가 남았으면 앞에서 이어서 처리
+            self._v_ready.appendleft(event_type)
+        else:
+            self._v_credits[event_type] = self.weight(event_type)
+            self._v_ready.append(event_type)
+
+    def pop(self) -> Optional[Tuple[float, IEvent]]:
+        """다음 (enqueued_at, event) 꺼내기 (꺼낼 것이 없으면 None)"""
+        if not self._v_ready:
+            return None
+
+        event_type = self._v_ready[0]
+        ready_keys = self._v_ready_keys[event_type]
+        key = ready_keys.popleft()
+        queue = self._v_queues[event_type][key]
+        item = queue.popleft()
+        self._v_size -= 1
+        self._v_credits[event_type] -= 1
+
+        if self.preserve_order:
+            # done()에서 키를 다시 순환에 넣음
+            self._v_busy.add((event_type, key))
+        elif queue:
+            ready_keys.appendleft(key)
+        if not queue and (event_type, key) not in self._v_busy:
+            del self._v_queues[event_type][key]
+
+        if not ready_keys:
+            self._v_ready.popleft()
+        elif self._v_credits[event_type] <= 0:
+            self._v_ready.rotate(-1)
+            self._v_credits[event_type] = self.weight(event_type)
+        return item
+
+    def done(self, event: IEvent):
+        """이벤트 처리 완료 (preserve_order일 때 해당 키를 다시 순환에 넣음)"""
+        event_type = event.event_type
+        key = self.key_of(event)
+        if (event_type, key) not in self._v_busy:
+            return
+        self._v_busy.discard((event_type, key))
+        keys = self._v_queues.get(event_type, {})
+        if keys.get(key):
+            self._make_ready(event_type, key, resume=True)
+        else:
+            keys.pop(key, None)
+
+    def sizes(self) -> Dict[str, int]:
+        """타입별 대기 이벤트 수"""
+        sizes = {}
+        for event_type, keys in self._v_queues.items():
+            size = sum(len(queue) for queue in keys.values())
+            if size:
+                sizes[event_type.value] = size
+        return sizes
+
+    def clear(self):
+        self._v_queues.clear()
+        self._v_ready_keys.clear()
+        self._v_ready.clear()
+        self._v_credits.clear()
+        self._v_busy.clear()
+        self._v_size = 0
+
+
+class LatencyStats:
+    """고정 크기 링 버퍼 지연 통계 (초 단위)"""
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._v_values: List[float] = [0.0] * capacity
+        self._v_index = 0
+        self._v_count = 0
+
+    def __len__(self) -> int:
+        return self._v_count
+
+    def record(self, value: float):
+        self._v_values[self._v_index] = value
+        self._v_index = (self._v_index + 1) % self.capacity
+        if self._v_count < self.capacity:
+            self._v_count += 1
+
+    def values(self) -> List[float]:
+        """기록 순서대로의 최근 값"""
+        if self._v_count < self.capacity:
+            return self._v_values[:self._v_count]
+        return self._v_values[self._v_index:] + self._v_values[:self._v_index]
+
+    def mean(self) -> float:
+        if not self._v_count:
+            return 0.0
+        return sum(self._v_values[:self._v_count]) / self._v_count
+
+    def percentile(self, pct: float) -> float:
+        if not self._v_count:
+            return 0.0
+        ordered = sorted(self._v_values[:self._v_count])
+        index = min(self._v_count - 1, int(round(pct / 100 * (self._v_count - 1))))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'count': self._v_count,
+            'mean': self.mean(),
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+            'max': max(self._v_values[:self._v_count]) if self._v_count else 0.0,
+        }
+
+    def clear(self):
+        self._v_index = 0
+        self._v_count = 0
+
+
+@dataclass
+class BatchSubscription:
+    """배치 구독
+
+    Attributes:
+        event_type: 구독 이벤트 타입
+        callback: 이벤트 목록을 받는 함수 (동기/코루틴)
+        flush_interval: 플러시 주기 (초)
+        max_batch: 이 개수에 도달하면 주기를 기다리지 않고 플러시 (None이면 주기만)
+        coalesce_key: 지정 시 같은 키의 이벤트는 최신 것만 유지 (예: 종목 코드)
+    """
+    subscription_id: str
+    event_type: EventType
+    callback: Callable[[List[IEvent]], Any]
+    flush_interval: float = 0.1
+    max_batch: Optional[int] = None
+    coalesce_key: Optional[Callable[[IEvent], Any]] = None
+    _v_pending: List[IEvent] = field(default_factory=list)
+    _v_latest: Dict[Any, IEvent] = field(default_factory=dict)
+    delivered_batches: int = 0
+    delivered_events: int = 0
+
+    def add(self, event: IEvent) -> bool:
+        """이벤트 적재 (max_batch 도달 시 True)"""
+        if self.coalesce_key is not None:
+            key = self.coalesce_key(event)
+            # 키 순서는 처음 들어온 순서 유지, 값만 최신으로 교체
+            self._v_latest[key] = event
+            size = len(self._v_latest)
+        else:
+            self._v_pending.append(event)
+            size = len(self._v_pending)
+        return self.max_batch is not None and size >= self.max_batch
+
+    def drain(self) -> List[IEvent]:
+        """적재된 이벤트 꺼내기"""
+        if self.coalesce_key is not None:
+            batch = list(self._v_latest.values())
+            self._v_latest.clear()
+        else:
+            batch = self._v_pending
+            self._v_pending = []
+        return batch
+
+    def pending(self) -> int:
+        return len(self._v_latest) if self.coalesce_key is not None else len(self._v_pending)
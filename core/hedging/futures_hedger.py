@@ -31,6 +31,8 @@ from enum import Enum
 import numpy as np
 import pandas as pd
 
+from core.risk.correlation.rolling_moments import RollingMoments
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +41,10 @@ KOSPI200_FUTURES_MULTIPLIER = 250000  # 1포인트당 25만원
 KOSPI200_TICK_SIZE = 0.05  # 틱 크기
 MARGIN_RATE = 0.15  # 증거금율 (15%)
 
+# 롤링 모멘트 엔진 내 시장 지수 수익률 키
+MARKET_RETURNS_KEY = "__market__"
+MIN_BETA_OBSERVATIONS = 20
+
 
 class MarketCondition(Enum):
     """시장 상황"""
@@ -196,15 +202,19 @@ class FuturesHedger:
         self,
         config: Optional[HedgeConfig] = None,
         kis_api: Optional[Any] = None,
+        moments: Optional[RollingMoments] = None,
     ):
         """초기화
 
         Args:
             config: 헤지 설정
             kis_api: KIS API 클라이언트 (선물 주문용)
+            moments: 롤링 모멘트 엔진 (기본: 인스턴스 전용 lookback_days 윈도우 엔진)
         """
         self.config = config or HedgeConfig()
         self.kis_api = kis_api
+        self.moments = moments
+        self._own_moments: Dict[int, RollingMoments] = {}
         self.current_position: Optional[HedgePosition] = None
         self.trade_history: List[Dict] = []
 
@@ -229,13 +239,13 @@ class FuturesHedger:
         stock_r = stock_returns.loc[common_idx]
         market_r = market_returns.loc[common_idx]
 
-        if len(common_idx) < 20:
+        if len(common_idx) < MIN_BETA_OBSERVATIONS:
             logger.warning("데이터가 부족합니다 (최소 20일 필요)")
             return 1.0, 0.0
 
-        # 베타 = Cov(stock, market) / Var(market)
+        # 베타 = Cov(stock, market) / Var(market) (둘 다 표본 기준, ddof=1)
         covariance = np.cov(stock_r, market_r)[0, 1]
-        market_variance = np.var(market_r)
+        market_variance = np.var(market_r, ddof=1)
 
         if market_variance == 0:
             return 1.0, 0.0
@@ -266,8 +276,18 @@ class FuturesHedger:
         Returns:
             PortfolioBeta
         """
-        # 시장 수익률
-        market_returns = market_data['close'].pct_change().dropna().tail(lookback_days)
+        # 보유 종목 + 시장 수익률을 롤링 모멘트 엔진에 반영 (새 봉만 증분 갱신)
+        moments = self.moments
+        if moments is None or moments.window != lookback_days:
+            moments = self._own_moments.get(lookback_days)
+            if moments is None:
+                moments = self._own_moments[lookback_days] = RollingMoments(lookback_days)
+
+        codes = [code for code in portfolio if code in stock_data]
+        moments.sync_prices(
+            {**{code: stock_data[code] for code in codes}, MARKET_RETURNS_KEY: market_data},
+            codes + [MARKET_RETURNS_KEY],
+        )
 
         stock_betas = {}
         weighted_beta = 0.0
@@ -282,10 +302,13 @@ class FuturesHedger:
                 weighted_beta += weight * 1.0
                 continue
 
-            stock_df = stock_data[stock_code]
-            stock_returns = stock_df['close'].pct_change().dropna().tail(lookback_days)
+            beta, r_sq = moments.beta(
+                stock_code, MARKET_RETURNS_KEY, min_periods=MIN_BETA_OBSERVATIONS
+            )
+            if np.isnan(beta):
+                logger.warning(f"베타 계산 데이터 부족: {stock_code} (최소 20일 필요)")
+                beta, r_sq = 1.0, 0.0
 
-            beta, r_sq = self.calculate_stock_beta(stock_returns, market_returns)
             stock_betas[stock_code] = beta
             weighted_beta += weight * beta
             total_r_squared += weight * r_sq
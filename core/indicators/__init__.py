@@ -7,6 +7,7 @@ Technical indicators and market analysis tools.
 Includes:
 - OrderBookAnalyzer: Order book imbalance analyzer
 - OrderBookMonitor: Real-time WebSocket monitoring
+- OrderBookArrays: Array-backed multi-symbol order book (vectorized metrics)
 - InvestorFlowAnalyzer: Investor flow analysis (foreign/institution)
 """
 
@@ -19,6 +20,13 @@ from .orderbook_analyzer import (
     analyze_orderbook,
 )
 
+from .orderbook_book import (
+    OrderBookArrays,
+    compute_metrics,
+    depth_slope,
+    detect_walls,
+)
+
 from .investor_flow import (
     InvestorFlowAnalyzer,
     InvestorFlowResult,
@@ -36,6 +44,10 @@ __all__ = [
     'OrderBookImbalance',
     'OrderBookLevel',
     'analyze_orderbook',
+    'OrderBookArrays',
+    'compute_metrics',
+    'depth_slope',
+    'detect_walls',
     # Investor Flow
     'InvestorFlowAnalyzer',
     'InvestorFlowResult',
@@ -14,7 +14,10 @@ from typing import List, Tuple, Dict, Optional, Callable
 from datetime import datetime
 from enum import Enum
 
+import numpy as np
+
 from ..utils.log_utils import get_logger
+from .orderbook_book import OrderBookArrays, compute_metrics
 
 logger = get_logger(__name__)
 
@@ -204,6 +207,67 @@ class OrderBookAnalyzer:
         bids, asks = self._parse_kis_orderbook(raw_data)
         return self.analyze(stock_code, bids, asks)
 
+    def analyze_book(
+        self,
+        book: OrderBookArrays,
+        stock_codes: Optional[List[str]] = None,
+        levels: Optional[int] = None
+    ) -> List[OrderBookImbalance]:
+        """배열 호가창 전 종목(또는 지정 종목) 일괄 분석
+
+        지표와 신호를 종목 축으로 한 번에 계산하며, 결과/캐시/콜백은 analyze와 같습니다.
+
+        Args:
+            book: OrderBookArrays 호가창
+            stock_codes: 분석할 종목 코드 리스트 (None이면 전체)
+            levels: 분석할 호가 레벨 수 (None이면 기본값)
+
+        Returns:
+            List[OrderBookImbalance]: 종목 순서대로의 분석 결과
+        """
+        rows = book.rows(stock_codes)
+        if len(rows) == 0:
+            return []
+
+        metrics = compute_metrics(book, rows, levels or self.levels)
+        signals, confidences = self._calculate_signals(metrics['imbalance_ratio'])
+
+        columns = zip(
+            rows.tolist(),
+            metrics['bid_volume'].tolist(),
+            metrics['ask_volume'].tolist(),
+            metrics['total_volume'].tolist(),
+            metrics['imbalance_ratio'].tolist(),
+            signals,
+            confidences.tolist(),
+            metrics['bid_price_weighted'].tolist(),
+            metrics['ask_price_weighted'].tolist(),
+            metrics['spread'].tolist(),
+        )
+        timestamp = datetime.now().isoformat()
+
+        results = []
+        for row, bid_volume, ask_volume, total_volume, ratio, signal, confidence, bid_w, ask_w, spread in columns:
+            result = OrderBookImbalance(
+                stock_code=book.codes[row],
+                bid_volume=bid_volume,
+                ask_volume=ask_volume,
+                total_volume=total_volume,
+                imbalance_ratio=ratio,
+                signal=signal,
+                confidence=round(confidence, 3),
+                bid_price_weighted=bid_w,
+                ask_price_weighted=ask_w,
+                spread=spread,
+                timestamp=timestamp,
+            )
+            self._cache[result.stock_code] = result
+            self._notify_callbacks(result)
+            results.append(result)
+
+        logger.debug(f"호가 일괄 분석 - {len(results)}개 종목")
+        return results
+
     def _parse_kis_orderbook(
         self,
         raw_data: Dict
@@ -283,6 +347,39 @@ class OrderBookAnalyzer:
 
         return signal, round(confidence, 3)
 
+    def _calculate_signals(
+        self,
+        imbalance_ratios: np.ndarray
+    ) -> Tuple[List[OrderBookSignal], np.ndarray]:
+        """신호 및 신뢰도 벡터 계산 (_calculate_signal과 같은 구간, 반올림 전 신뢰도)"""
+        ratios = np.asarray(imbalance_ratios, dtype=np.float64)
+        abs_ratios = np.abs(ratios)
+        conditions = [
+            ratios > self.strong_threshold,
+            ratios > self.weak_threshold,
+            ratios < self.strong_threshold * -1,
+            ratios < self.weak_threshold * -1,
+        ]
+        choices = [
+            OrderBookSignal.STRONG_BUY,
+            OrderBookSignal.BUY,
+            OrderBookSignal.STRONG_SELL,
+            OrderBookSignal.SELL,
+        ]
+        index = np.select(conditions, np.arange(len(choices)), default=len(choices))
+        confidences = np.select(
+            conditions,
+            [
+                np.minimum(abs_ratios / 0.5, 1.0),
+                abs_ratios / self.strong_threshold,
+                np.minimum(abs_ratios / 0.5, 1.0),
+                abs_ratios / self.strong_threshold,
+            ],
+            default=1 - (abs_ratios / self.weak_threshold),
+        )
+        lookup = choices + [OrderBookSignal.NEUTRAL]
+        return [lookup[i] for i in index], confidences
+
     def _calculate_weighted_price(
         self,
         orders: List[Tuple[int, int]]
@@ -402,6 +499,7 @@ class OrderBookMonitor:
         """
         self.analyzer = analyzer or OrderBookAnalyzer()
         self.ws_client = ws_client
+        self.book = OrderBookArrays(levels=self.analyzer.levels)
         self._monitoring_stocks: List[str] = []
         self._running = False
 
@@ -431,8 +529,11 @@ class OrderBookMonitor:
                 await self.ws_client.subscribe(code, [self.TR_ORDERBOOK])
                 self._monitoring_stocks.append(code)
 
-            # 호가 데이터 수신 콜백 등록
-            self.ws_client.add_callback(self.TR_ORDERBOOK, self._on_orderbook_data)
+            # 호가 데이터 수신 콜백 등록 (프레임 단위 배치 지원 시 배열 호가창 경로)
+            if hasattr(self.ws_client, 'add_batch_callback'):
+                self.ws_client.add_batch_callback(self.TR_ORDERBOOK, self._on_orderbook_batch)
+            else:
+                self.ws_client.add_callback(self.TR_ORDERBOOK, self._on_orderbook_data)
 
             self._running = True
             logger.info(f"호가 모니터링 시작: {len(stock_codes)}개 종목")
@@ -472,6 +573,28 @@ class OrderBookMonitor:
         except Exception as e:
             logger.error(f"호가 데이터 처리 오류: {e}", exc_info=True)
 
+    def _on_orderbook_batch(self, batch):
+        """호가 프레임 배치 수신 콜백
+
+        프레임의 N건을 배열 호가창에 제자리 반영한 뒤 갱신된 종목만 일괄 분석합니다.
+
+        Args:
+            batch: FrameBatch (H0STASP0)
+        """
+        try:
+            rows = self.book.update_batch(batch)
+            codes = [self.book.codes[row] for row in dict.fromkeys(rows.tolist())]
+
+            for result in self.analyzer.analyze_book(self.book, codes):
+                if result.signal in [OrderBookSignal.STRONG_BUY, OrderBookSignal.STRONG_SELL]:
+                    logger.info(
+                        f"🔔 강한 호가 신호 - {result.stock_code}: {result.signal.value} "
+                        f"(불균형 {result.imbalance_ratio:.2%}, 신뢰도 {result.confidence:.1%})"
+                    )
+
+        except Exception as e:
+            logger.error(f"호가 배치 처리 오류: {e}", exc_info=True)
+
     @property
     def is_running(self) -> bool:
         """모니터링 중인지 확인"""
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+배열 기반 다종목 호가창
+
+종목별 10단계 호가를 (종목 수 × 레벨) 고정 NumPy 배열에 보관하고,
+H0STASP0 수신 시 해당 종목 행만 제자리 갱신합니다.
+불균형/가중 중간가/깊이 기울기/호가벽 지표를 전 종목에 대해 한 번에 계산하여
+한 분석기로 수백 종목을 틱 주기마다 처리할 수 있게 합니다.
+
+지표 정의는 OrderBookAnalyzer.analyze와 같습니다 (가격 0인 레벨은 잔량 0으로 취급).
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_LEVELS = 10
+
+
+class OrderBookArrays:
+    """종목별 호가 배열 저장소
+
+    Attributes:
+        bid_prices / bid_volumes / ask_prices / ask_volumes: (capacity, levels) int64 배열
+        codes: 행 순서의 종목 코드
+    """
+
+    def __init__(self, levels: int = DEFAULT_LEVELS, capacity: int = 256):
+        self.levels = levels
+        self.codes: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.bid_prices = np.zeros((capacity, levels), dtype=np.int64)
+        self.bid_volumes = np.zeros((capacity, levels), dtype=np.int64)
+        self.ask_prices = np.zeros((capacity, levels), dtype=np.int64)
+        self.ask_volumes = np.zeros((capacity, levels), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return stock_code in self._index
+
+    def row(self, stock_code: str) -> int:
+        """종목 행 번호 (없으면 할당, 용량 부족 시 두 배로 확장)"""
+        idx = self._index.get(stock_code)
+        if idx is not None:
+            return idx
+
+        idx = len(self.codes)
+        if idx >= self.bid_prices.shape[0]:
+            self._grow(max(1, idx * 2))
+        self._index[stock_code] = idx
+        self.codes.append(stock_code)
+        return idx
+
+    def _grow(self, capacity: int):
+        for name in ('bid_prices', 'bid_volumes', 'ask_prices', 'ask_volumes'):
+            old = getattr(self, name)
+            new = np.zeros((capacity, self.levels), dtype=old.dtype)
+            new[:old.shape[0]] = old
+            setattr(self, name, new)
+
+    def rows(self, stock_codes: Optional[Iterable[str]] = None) -> np.ndarray:
+        """종목 행 번호 배열 (None이면 전체)"""
+        if stock_codes is None:
+            return np.arange(len(self.codes))
+        return np.fromiter((self._index[code] for code in stock_codes), dtype=np.intp)
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def update(
+        self,
+        stock_code: str,
+        bid_prices: Sequence[int],
+        bid_volumes: Sequence[int],
+        ask_prices: Sequence[int],
+        ask_volumes: Sequence[int],
+    ) -> int:
+        """한 종목 호가 제자리 갱신 (부족한 레벨은 0)"""
+        idx = self.row(stock_code)
+        for target, values in (
+            (self.bid_prices, bid_prices), (self.bid_volumes, bid_volumes),
+            (self.ask_prices, ask_prices), (self.ask_volumes, ask_volumes),
+        ):
+            n = min(len(values), self.levels)
+            target[idx, :n] = values[:n]
+            target[idx, n:] = 0
+        return idx
+
+    def update_levels(
+        self,
+        stock_code: str,
+        bids: Sequence[Tuple[int, int]],
+        asks: Sequence[Tuple[int, int]],
+    ) -> int:
+        """[(가격, 수량), ...] 형식 갱신 (OrderBookAnalyzer.analyze 입력과 동일)"""
+        return self.update(
+            stock_code,
+            [p for p, _ in bids], [v for _, v in bids],
+            [p for p, _ in asks], [v for _, v in asks],
+        )
+
+    def update_record(self, record: Dict) -> Optional[int]:
+        """KISWebSocketClient 정규화 호가 레코드로 갱신"""
+        stock_code = record.get('stock_code')
+        if not stock_code:
+            return None
+        return self.update(
+            stock_code,
+            record.get('bid_prices', ()), record.get('bid_volumes', ()),
+            record.get('ask_prices', ()), record.get('ask_volumes', ()),
+        )
+
+    def update_batch(self, batch) -> np.ndarray:
+        """디코딩된 H0STASP0 프레임(FrameBatch) 일괄 갱신
+
+        Returns:
+            np.ndarray: 갱신된 행 번호 (같은 종목이 여러 번이면 마지막 값 유지)
+        """
+        idx = np.fromiter((self.row(code) for code in batch['stock_code']), dtype=np.intp)
+        n = self.levels
+        self.bid_prices[idx] = np.asarray(batch['bid_prices'])[:, :n]
+        self.bid_volumes[idx] = np.asarray(batch['bid_volumes'])[:, :n]
+        self.ask_prices[idx] = np.asarray(batch['ask_prices'])[:, :n]
+        self.ask_volumes[idx] = np.asarray(batch['ask_volumes'])[:, :n]
+        return idx
+
+    def levels_of(self, stock_code: str) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """종목 호가를 [(가격, 수량), ...]로 반환 (가격 0 레벨 제외)"""
+        idx = self._index[stock_code]
+        bids = [(int(p), int(v)) for p, v in zip(self.bid_prices[idx], self.bid_volumes[idx]) if p > 0]
+        asks = [(int(p), int(v)) for p, v in zip(self.ask_prices[idx], self.ask_volumes[idx]) if p > 0]
+        return bids, asks
+
+
+# ----------------------------------------------------------------------
+# 벡터화 지표 (rows 행 × levels 레벨)
+# ----------------------------------------------------------------------
+
+
+def _effective_volumes(prices: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+    """가격이 없는 레벨의 잔량은 제외"""
+    return np.where(prices > 0, volumes, 0)
+
+
+def _best_price(prices: np.ndarray) -> np.ndarray:
+    """레벨 순서상 첫 유효 호가 (없으면 0)"""
+    valid = prices > 0
+    first = valid.argmax(axis=1)
+    best = prices[np.arange(prices.shape[0]), first]
+    return np.where(valid.any(axis=1), best, 0)
+
+
+def compute_metrics(
+    book: OrderBookArrays,
+    rows: Optional[np.ndarray] = None,
+    levels: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """전 종목(또는 rows) 호가 지표를 한 번에 계산
+
+    Returns:
+        Dict[str, np.ndarray]: bid_volume, ask_volume, total_volume, imbalance_ratio,
+            bid_price_weighted, ask_price_weighted, spread(%), weighted_mid, bid_slope, ask_slope
+    """
+    rows = np.arange(len(book)) if rows is None else rows
+    n = min(levels or book.levels, book.levels)
+
+    bid_px = book.bid_prices[rows, :n]
+    ask_px = book.ask_prices[rows, :n]
+    bid_qty = _effective_volumes(bid_px, book.bid_volumes[rows, :n])
+    ask_qty = _effective_volumes(ask_px, book.ask_volumes[rows, :n])
+
+    bid_volume = bid_qty.sum(axis=1)
+    ask_volume = ask_qty.sum(axis=1)
+    total_volume = bid_volume + ask_volume
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        imbalance = np.where(total_volume > 0, (bid_volume - ask_volume) / total_volume, 0.0)
+        bid_weighted = np.where(bid_volume > 0, (bid_px * bid_qty).sum(axis=1) / bid_volume, 0.0)
+        ask_weighted = np.where(ask_volume > 0, (ask_px * ask_qty).sum(axis=1) / ask_volume, 0.0)
+
+        best_bid = _best_price(bid_px)
+        best_ask = _best_price(ask_px)
+        has_both = (best_bid > 0) & (best_ask > 0)
+        spread = np.where(has_both, (best_ask - best_bid) / np.where(best_bid > 0, best_bid, 1) * 100, 0.0)
+
+        # 가중 중간가 (micro-price): 반대편 1호가 잔량으로 가중
+        bid_top = bid_qty[:, 0].astype(np.float64)
+        ask_top = ask_qty[:, 0].astype(np.float64)
+        top = bid_top + ask_top
+        weighted_mid = np.where(
+            has_both & (top > 0),
+            (best_bid * ask_top + best_ask * bid_top) / np.where(top > 0, top, 1),
+            np.where(has_both, (best_bid + best_ask) / 2.0, 0.0),
+        )
+
+    return {
+        'bid_volume': bid_volume,
+        'ask_volume': ask_volume,
+        'total_volume': total_volume,
+        'imbalance_ratio': imbalance,
+        'bid_price_weighted': bid_weighted,
+        'ask_price_weighted': ask_weighted,
+        'spread': spread,
+        'weighted_mid': weighted_mid,
+        'bid_slope': depth_slope(bid_px, bid_qty, weighted_mid),
+        'ask_slope': depth_slope(ask_px, ask_qty, weighted_mid),
+    }
+
+
+def depth_slope(prices: np.ndarray, volumes: np.ndarray, mid: np.ndarray) -> np.ndarray:
+    """깊이 기울기: 중간가 대비 거리(%)에 대한 누적 잔량의 최소제곱 기울기
+
+    값이 클수록 가격이 멀어질 때 잔량이 빠르게 쌓이는 (두꺼운) 호가입니다.
+    유효 레벨이 2개 미만이면 0.
+    """
+    valid = prices > 0
+    safe_mid = np.where(mid > 0, mid, 1.0)[:, None]
+    x = np.where(valid, np.abs(prices - safe_mid) / safe_mid * 100, 0.0)
+    y = np.where(valid, np.cumsum(volumes, axis=1), 0.0)
+
+    count = valid.sum(axis=1)
+    safe_count = np.maximum(count, 1)
+    x_mean = x.sum(axis=1) / safe_count
+    y_mean = y.sum(axis=1) / safe_count
+    dx = np.where(valid, x - x_mean[:, None], 0.0)
+    dy = np.where(valid, y - y_mean[:, None], 0.0)
+    var = (dx * dx).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where((count >= 2) & (var > 0), (dx * dy).sum(axis=1) / np.where(var > 0, var, 1), 0.0)
+    return slope
+
+
+def detect_walls(
+    book: OrderBookArrays,
+    rows: Optional[np.ndarray] = None,
+    multiple: float = 3.0,
+    min_volume: int = 0
+) -> List[Dict]:
+    """호가벽 탐지: 같은 쪽 유효 레벨 잔량 중앙값의 multiple배 이상인 레벨
+
+    Returns:
+        List[Dict]: [{stock_code, side, level, price, volume, ratio}, ...]
+    """
+    rows = np.arange(len(book)) if rows is None else rows
+    walls = []
+    for side, prices, volumes in (
+        ('bid', book.bid_prices[rows], book.bid_volumes[rows]),
+        ('ask', book.ask_prices[rows], book.ask_volumes[rows]),
+    ):
+        valid = prices > 0
+        qty = np.where(valid, volumes, np.nan).astype(np.float64)
+        with np.errstate(all='ignore'):
+            median = np.nanmedian(np.where(valid.any(axis=1)[:, None], qty, 0.0), axis=1)
+        threshold = np.maximum(median * multiple, min_volume)[:, None]
+        mask = valid & (median[:, None] > 0) & (volumes >= threshold)
+        for r, level in zip(*np.nonzero(mask)):
+            walls.append({
+                'stock_code': book.codes[rows[r]],
+                'side': side,
+                'level': int(level) + 1,
+                'price': int(prices[r, level]),
+                'volume': int(volumes[r, level]),
+                'ratio': float(volumes[r, level] / median[r]),
+            })
+    return walls
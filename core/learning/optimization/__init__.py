@@ -5,18 +5,18 @@ Phase 4: AI 학습 시스템 - 파라미터 최적화 모듈
 """
 
 from .parameter_manager import ParameterManager, ParameterSet, OptimizationResult
+from .evaluation_engine import EvaluationEngine, EvaluationConfig
 from .genetic_optimizer import GeneticOptimizer, GeneticConfig
 from .bayesian_optimizer import BayesianOptimizer, BayesianConfig
-from .grid_optimizer import GridOptimizer, GridConfig
 
 __all__ = [
     'ParameterManager',
     'ParameterSet',
     'OptimizationResult',
+    'EvaluationEngine',
+    'EvaluationConfig',
     'GeneticOptimizer',
     'GeneticConfig',
     'BayesianOptimizer', 
-    'BayesianConfig',
-    'GridOptimizer',
-    'GridConfig'
+    'BayesianConfig'
 ] 
\ No newline at end of file
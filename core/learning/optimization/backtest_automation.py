@@ -4,17 +4,20 @@
 전략 변경 시 자동으로 백테스트를 실행하고 검증하는 시스템
 """
 
+import itertools
 import json
 import os
 import threading
 import time
+from concurrent.futures import CancelledError
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 import subprocess
 
-from ...utils.logging import get_logger
+from ...utils.log_utils import get_logger
+from ...backtesting.worker_pool import BacktestWorkerPool, WorkerPoolConfig
 from .parameter_manager import ParameterManager, ParameterSet
 
 logger = get_logger(__name__)
@@ -106,17 +109,21 @@ class BacktestEngine:
     """백테스트 엔진"""
     
     def __init__(self, backtest_script_path: str = "hantu_backtest/main.py",
-                 data_dir: str = "data/backtest_automation"):
+                 data_dir: str = "data/backtest_automation",
+                 worker_pool: Optional[BacktestWorkerPool] = None):
         """
         초기화
         
         Args:
             backtest_script_path: 백테스트 스크립트 경로
             data_dir: 백테스트 데이터 저장 디렉토리
+            worker_pool: 상주 워커 풀 (지정 시 서브프로세스 대신 풀에서 실행)
         """
         self._logger = logger
         self._backtest_script_path = backtest_script_path
         self._data_dir = data_dir
+        self._worker_pool = worker_pool
+        self._id_seq = itertools.count(1)
         
         # 디렉토리 생성
         os.makedirs(data_dir, exist_ok=True)
@@ -127,6 +134,29 @@ class BacktestEngine:
         
         self._logger.info("백테스트 엔진 초기화 완료")
     
+    def enable_worker_pool(self, num_workers: int = 2) -> BacktestWorkerPool:
+        """상주 워커 풀 활성화
+        
+        워커는 전략 클래스와 가격 데이터를 미리 로드해 두고 파라미터 세트만 받아 실행하므로,
+        백테스트마다 인터프리터를 띄우는 비용 없이 반복 평가할 수 있습니다.
+        """
+        if self._worker_pool is None:
+            self._worker_pool = BacktestWorkerPool(WorkerPoolConfig(num_workers=num_workers))
+        if not self._worker_pool.is_running:
+            self._worker_pool.start()
+        return self._worker_pool
+    
+    def shutdown_worker_pool(self):
+        """상주 워커 풀 종료"""
+        if self._worker_pool is not None:
+            self._worker_pool.stop()
+            self._worker_pool = None
+    
+    def _new_backtest_id(self, strategy_name: str) -> str:
+        # 같은 초에 여러 백테스트를 제출해도 ID가 겹치지 않도록 순번 부여
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return f"{strategy_name}_{timestamp}_{next(self._id_seq):04d}"
+    
     def run_backtest(self, strategy_name: str, parameters: Dict[str, Any],
                     config: BacktestConfig = None) -> BacktestResult:
         """
@@ -143,8 +173,11 @@ class BacktestEngine:
         if config is None:
             config = BacktestConfig()
         
+        if self._worker_pool is not None and self._worker_pool.is_running:
+            return self.run_backtests(strategy_name, [parameters], config)[0]
+        
         # 백테스트 ID 생성
-        backtest_id = f"{strategy_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        backtest_id = self._new_backtest_id(strategy_name)
         
         # 백테스트 결과 객체 생성
         result = BacktestResult(
@@ -203,6 +236,65 @@ class BacktestEngine:
         
         return result
     
+    def run_backtests(self, strategy_name: str, parameter_list: List[Dict[str, Any]],
+                      config: BacktestConfig = None) -> List[BacktestResult]:
+        """
+        여러 파라미터 세트 백테스트 실행
+        
+        워커 풀이 활성화되어 있으면 모든 세트를 한 번에 제출하여 병렬로 실행하고,
+        없으면 순차 실행합니다.
+        
+        Args:
+            strategy_name: 전략명
+            parameter_list: 전략 파라미터 목록
+            config: 백테스트 설정
+        
+        Returns:
+            List[BacktestResult]: 입력 순서와 같은 백테스트 결과 목록
+        """
+        if config is None:
+            config = BacktestConfig()
+        
+        if self._worker_pool is None or not self._worker_pool.is_running:
+            return [self.run_backtest(strategy_name, params, config) for params in parameter_list]
+        
+        submitted = []
+        for parameters in parameter_list:
+            result = BacktestResult(
+                backtest_id=self._new_backtest_id(strategy_name),
+                strategy_name=strategy_name,
+                parameters=parameters,
+                status=BacktestStatus.RUNNING,
+                start_time=datetime.now()
+            )
+            self._running_backtests[result.backtest_id] = result
+            future = self._worker_pool.submit(
+                strategy_name, parameters, asdict(config),
+                timeout=config.timeout_seconds, task_id=result.backtest_id
+            )
+            submitted.append((result, future))
+        
+        results = []
+        for result, future in submitted:
+            try:
+                self._apply_metrics(result, future.result())
+                result.status = BacktestStatus.COMPLETED
+            except CancelledError:
+                result.status = BacktestStatus.CANCELLED
+            except Exception as e:
+                result.status = BacktestStatus.FAILED
+                result.error_message = str(e)
+                self._logger.error(f"백테스트 실패: {result.backtest_id} - {e}")
+            finally:
+                result.end_time = datetime.now()
+                result.execution_time = (result.end_time - result.start_time).total_seconds()
+                self._running_backtests.pop(result.backtest_id, None)
+                self._backtest_history.append(result)
+                self._save_backtest_result(result)
+            results.append(result)
+        
+        return results
+    
     def _create_parameter_file(self, backtest_id: str, parameters: Dict[str, Any],
                               config: BacktestConfig) -> str:
         """파라미터 파일 생성"""
@@ -284,23 +376,7 @@ class BacktestEngine:
                 with open(result_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 
-                # 성과 지표 추출
-                result.total_return = data.get('total_return', 0.0)
-                result.annual_return = data.get('annual_return', 0.0)
-                result.sharpe_ratio = data.get('sharpe_ratio', 0.0)
-                result.max_drawdown = data.get('max_drawdown', 0.0)
-                result.win_rate = data.get('win_rate', 0.0)
-                result.profit_factor = data.get('profit_factor', 1.0)
-                result.total_trades = data.get('total_trades', 0)
-                result.winning_trades = data.get('winning_trades', 0)
-                result.losing_trades = data.get('losing_trades', 0)
-                result.average_win = data.get('average_win', 0.0)
-                result.average_loss = data.get('average_loss', 0.0)
-                result.largest_win = data.get('largest_win', 0.0)
-                result.largest_loss = data.get('largest_loss', 0.0)
-                result.consecutive_wins = data.get('consecutive_wins', 0)
-                result.consecutive_losses = data.get('consecutive_losses', 0)
-                
+                self._apply_metrics(result, data)
                 result.result_file = result_file
                 
             else:
@@ -314,6 +390,24 @@ class BacktestEngine:
             result.annual_return = 0.0
             result.sharpe_ratio = 0.0
     
+    def _apply_metrics(self, result: BacktestResult, data: Dict[str, Any]):
+        """성과 지표 딕셔너리를 결과 객체에 반영"""
+        result.total_return = data.get('total_return', 0.0)
+        result.annual_return = data.get('annual_return', 0.0)
+        result.sharpe_ratio = data.get('sharpe_ratio', 0.0)
+        result.max_drawdown = data.get('max_drawdown', 0.0)
+        result.win_rate = data.get('win_rate', 0.0)
+        result.profit_factor = data.get('profit_factor', 1.0)
+        result.total_trades = data.get('total_trades', 0)
+        result.winning_trades = data.get('winning_trades', 0)
+        result.losing_trades = data.get('losing_trades', 0)
+        result.average_win = data.get('average_win', 0.0)
+        result.average_loss = data.get('average_loss', 0.0)
+        result.largest_win = data.get('largest_win', 0.0)
+        result.largest_loss = data.get('largest_loss', 0.0)
+        result.consecutive_wins = data.get('consecutive_wins', 0)
+        result.consecutive_losses = data.get('consecutive_losses', 0)
+    
     def _parse_output_text(self, result: BacktestResult, output: str):
         """텍스트 출력에서 결과 파싱"""
         lines = output.split('\n')
@@ -361,7 +455,9 @@ class BacktestEngine:
         """백테스트 취소"""
         if backtest_id in self._running_backtests:
             self._running_backtests[backtest_id].status = BacktestStatus.CANCELLED
-            # 실제 프로세스 종료는 구현 복잡성으로 인해 생략
+            # 워커 풀에서 실행 중이면 해당 워커를 종료하고 교체
+            if self._worker_pool is not None:
+                self._worker_pool.cancel(backtest_id)
             self._logger.info(f"백테스트 취소 요청: {backtest_id}")
             return True
         
@@ -630,6 +726,30 @@ class AutomationManager:
                 'automation_time': datetime.now()
             }
     
+    def run_automated_backtests(self, strategy_name: str,
+                                parameter_sets: List[ParameterSet],
+                                config: BacktestConfig = None) -> List[Dict[str, Any]]:
+        """여러 파라미터 세트 자동 백테스트 일괄 실행 (워커 풀 활성화 시 병렬)"""
+        backtest_results = self._backtest_engine.run_backtests(
+            strategy_name, [parameter_set.parameters for parameter_set in parameter_sets], config
+        )
+        
+        automation_results = []
+        for parameter_set, backtest_result in zip(parameter_sets, backtest_results):
+            validation_result = self._validation_system.validate_backtest(backtest_result)
+            automation_results.append({
+                'strategy_name': strategy_name,
+                'parameter_set_id': id(parameter_set),
+                'backtest_result': backtest_result,
+                'validation_result': validation_result,
+                'automation_time': datetime.now(),
+                'auto_approved': validation_result.status == ValidationStatus.PASSED
+            })
+        
+        approved = sum(1 for r in automation_results if r['auto_approved'])
+        self._logger.info(f"일괄 자동 백테스트 완료: {strategy_name} - {approved}/{len(automation_results)} 검증 통과")
+        return automation_results
+    
     def get_automation_summary(self) -> Dict[str, Any]:
         """자동화 요약 정보"""
         return {
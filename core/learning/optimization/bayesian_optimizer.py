@@ -8,22 +8,20 @@ import numpy as np
 import json
 import os
 from datetime import datetime
+from functools import partial
 from typing import Dict, List, Tuple, Optional, Any, Callable
 from dataclasses import dataclass, asdict
 import warnings
 
-from ...utils.logging import get_logger
-from .parameter_manager import (
-    ParameterManager,
-    ParameterSet,
-    ParameterSpace,
-    ParameterType,
-)
+from core.utils.log_utils import get_logger
+from .parameter_manager import ParameterManager, ParameterSet
+from .evaluation_engine import EvaluationConfig, EvaluationEngine
 
 logger = get_logger(__name__)
 
 # sklearn 사용 (없으면 간단한 대안 구현)
 try:
+    from sklearn.base import clone
     from sklearn.gaussian_process import GaussianProcessRegressor
     from sklearn.gaussian_process.kernels import Matern
 
@@ -34,6 +32,14 @@ except ImportError:
         "scikit-learn이나 scipy가 설치되지 않음. 간단한 베이지안 최적화 구현을 사용합니다."
     )
 
+# 준난수(Sobol) 후보 생성 (없으면 numpy 라틴 하이퍼큐브 사용)
+try:
+    from scipy.stats import qmc
+
+    QMC_AVAILABLE = True
+except ImportError:
+    QMC_AVAILABLE = False
+
 
 @dataclass
 class BayesianConfig:
@@ -47,6 +53,12 @@ class BayesianConfig:
     n_restarts_optimizer: int = 5  # 획득 함수 최적화 재시작 수
     convergence_threshold: float = 1e-6  # 수렴 임계값
     early_stopping_iterations: int = 10  # 조기 종료 반복 수
+    batch_size: int = 1  # 한 번에 제안/동시 평가할 샘플 수 (q-batch)
+    max_workers: int = 1  # 동시 평가 워커 수
+    n_candidates: int = 1000  # 획득 함수 후보 수
+    candidate_sampler: str = "sobol"  # 후보 생성 방식 ("sobol", "lhs", "random")
+    liar_strategy: str = "max"  # constant liar 가상 관측값 ("max", "mean", "min")
+    hyperparameter_refit_interval: int = 5  # 커널 하이퍼파라미터 재최적화 주기 (배치 단위)
 
 
 @dataclass
@@ -108,6 +120,8 @@ class BayesianOptimizer:
         self._best_parameters = None
         self._best_fitness = float("-inf")
         self._current_iteration = 0
+        self._rng = np.random.default_rng()
+        self._engine: Optional[EvaluationEngine] = None
 
         self._logger.info("베이지안 최적화기 초기화 완료")
 
@@ -118,7 +132,7 @@ class BayesianOptimizer:
         파라미터 최적화 수행
 
         Args:
-            strategy_name: 최적화할 전략명
+            strategy_name: 최적화할 컴포넌트명 (ParameterManager 파라미터 공간 이름)
             target_fitness: 목표 적합도 (달성시 조기 종료)
 
         Returns:
@@ -128,7 +142,7 @@ class BayesianOptimizer:
         self._logger.info(f"베이지안 최적화 시작: {strategy_name}")
 
         # 파라미터 공간 가져오기
-        param_spaces = self._parameter_manager.get_all_parameter_spaces(strategy_name)
+        param_spaces = self._parameter_manager.get_parameter_space(strategy_name)
         if not param_spaces:
             raise ValueError(
                 f"전략 '{strategy_name}'의 파라미터 공간을 찾을 수 없습니다"
@@ -145,95 +159,120 @@ class BayesianOptimizer:
         # 파라미터 공간을 수치형으로 변환
         param_bounds, param_info = self._prepare_parameter_space(param_spaces)
 
-        # 초기 샘플링
-        self._initial_sampling(strategy_name, param_bounds, param_info)
-
-        convergence_counter = 0
-        convergence_achieved = False
-
-        # 베이지안 최적화 반복
-        for iteration in range(
-            self._config.initial_samples, self._config.max_iterations
-        ):
-            self._current_iteration = iteration
-
-            # 가우시안 프로세스 모델 학습
-            if not self._train_gp_model():
-                self._logger.warning(
-                    "가우시안 프로세스 모델 학습 실패, 랜덤 샘플링으로 대체"
-                )
-                next_params = self._random_sampling(
-                    strategy_name, param_bounds, param_info
-                )
-            else:
-                # 획득 함수로 다음 샘플 찾기
-                next_params = self._acquire_next_sample(param_bounds, param_info)
+        # 평가 엔진 (배치 동시 평가 + 중복 파라미터 캐시)
+        self._engine = EvaluationEngine(
+            partial(self._evaluate_parameters, strategy_name),
+            EvaluationConfig(
+                max_workers=self._config.max_workers,
+                failure_score=0.0,
+            ),
+        )
 
-            if next_params is None:
-                self._logger.warning("다음 샘플 획득 실패, 랜덤 샘플링으로 대체")
-                next_params = self._random_sampling(
-                    strategy_name, param_bounds, param_info
+        try:
+            # 초기 샘플링
+            self._initial_sampling(strategy_name, param_bounds, param_info)
+
+            convergence_counter = 0
+            convergence_achieved = False
+            batch_count = 0
+            iteration = self._config.initial_samples
+
+            # 베이지안 최적화 반복 (배치 단위로 제안 후 동시 평가)
+            while iteration < self._config.max_iterations and not convergence_achieved:
+                batch_size = min(
+                    max(1, self._config.batch_size),
+                    self._config.max_iterations - iteration,
                 )
 
-            # 파라미터 세트 생성 및 평가
-            param_set = self._parameter_manager.create_parameter_set(
-                strategy_name, next_params
-            )
-            if param_set is None:
-                self._logger.warning("파라미터 세트 생성 실패, 건너뜀")
-                continue
-
-            try:
-                fitness_score = self._fitness_function(param_set)
-                param_set.fitness_score = fitness_score
-            except Exception as e:
-                self._logger.error(f"적합도 평가 실패: {e}", exc_info=True)
-                fitness_score = 0.0
-                param_set.fitness_score = fitness_score
-
-            # 샘플 추가
-            param_vector = self._params_to_vector(next_params, param_info)
-            self._X_samples.append(param_vector)
-            self._y_samples.append(fitness_score)
+                # 가우시안 프로세스 모델 학습 (하이퍼파라미터는 주기적으로만 재최적화)
+                refit = batch_count % max(1, self._config.hyperparameter_refit_interval) == 0
+                batch_count += 1
+                if not self._train_gp_model(optimize_hyperparameters=refit):
+                    self._logger.warning(
+                        "가우시안 프로세스 모델 학습 실패, 랜덤 샘플링으로 대체"
+                    )
+                    proposals = []
+                else:
+                    # 획득 함수로 다음 샘플 배치 찾기
+                    proposals = self._acquire_batch(batch_size, param_bounds, param_info)
+
+                if len(proposals) < batch_size:
+                    self._logger.debug("획득 샘플 부족분은 랜덤 샘플링으로 대체")
+                    proposals.extend(
+                        (
+                            self._random_sampling(strategy_name, param_bounds, param_info),
+                            0.0,
+                        )
+                        for _ in range(batch_size - len(proposals))
+                    )
 
-            # 최고 성능 업데이트
-            if fitness_score > self._best_fitness:
-                self._best_fitness = fitness_score
-                self._best_parameters = param_set
-                self._parameter_manager.add_parameter_set(param_set)
-                convergence_counter = 0
-            else:
-                convergence_counter += 1
-
-            # 기록 저장
-            history_entry = OptimizationHistory(
-                iteration=iteration,
-                parameters=next_params,
-                fitness_score=fitness_score,
-                acquisition_value=0.0,  # 실제로는 획득 함수 값
-                timestamp=datetime.now(),
-            )
-            self._optimization_history.append(history_entry)
+                # 파라미터 세트 생성
+                batch = [
+                    (
+                        next_params,
+                        acquisition_value,
+                        self._create_parameter_set(strategy_name, next_params),
+                    )
+                    for next_params, acquisition_value in proposals
+                ]
 
-            self._logger.info(
-                f"반복 {iteration}: 적합도={fitness_score:.6f}, 최고={self._best_fitness:.6f}"
-            )
+                # 배치 동시 평가
+                scores = self._engine.evaluate_batch([params for params, _, _ in batch])
 
-            # 목표 적합도 달성 체크
-            if target_fitness and fitness_score >= target_fitness:
-                self._logger.info(
-                    f"목표 적합도 달성: {fitness_score:.6f} >= {target_fitness:.6f}"
-                )
-                convergence_achieved = True
-                break
+                for (next_params, acquisition_value, param_set), fitness_score in zip(
+                    batch, scores
+                ):
+                    self._current_iteration = iteration
+                    param_set.performance_score = fitness_score
+
+                    # 샘플 추가
+                    param_vector = self._params_to_vector(next_params, param_info)
+                    self._X_samples.append(param_vector)
+                    self._y_samples.append(fitness_score)
+
+                    # 최고 성능 업데이트
+                    if fitness_score > self._best_fitness:
+                        self._best_fitness = fitness_score
+                        self._best_parameters = param_set
+                        convergence_counter = 0
+                    else:
+                        convergence_counter += 1
+
+                    # 기록 저장
+                    history_entry = OptimizationHistory(
+                        iteration=iteration,
+                        parameters=next_params,
+                        fitness_score=fitness_score,
+                        acquisition_value=float(acquisition_value),
+                        timestamp=datetime.now(),
+                    )
+                    self._optimization_history.append(history_entry)
 
-            # 조기 수렴 체크
-            if convergence_counter >= self._config.early_stopping_iterations:
-                self._logger.info(
-                    f"조기 수렴 감지: {convergence_counter}회 반복 동안 개선 없음"
-                )
-                convergence_achieved = True
-                break
+                    self._logger.info(
+                        f"반복 {iteration}: 적합도={fitness_score:.6f}, 최고={self._best_fitness:.6f}"
+                    )
+                    iteration += 1
+
+                    # 목표 적합도 달성 체크
+                    if target_fitness and fitness_score >= target_fitness:
+                        self._logger.info(
+                            f"목표 적합도 달성: {fitness_score:.6f} >= {target_fitness:.6f}"
+                        )
+                        convergence_achieved = True
+                        break
+
+                    # 조기 수렴 체크
+                    if convergence_counter >= self._config.early_stopping_iterations:
+                        self._logger.info(
+                            f"조기 수렴 감지: {convergence_counter}회 반복 동안 개선 없음"
+                        )
+                        convergence_achieved = True
+                        break
+        finally:
+            self._engine.shutdown()
+
+        if self._best_parameters is not None:
+            self._best_parameters.is_best = True
 
         # 최적화 완료
         end_time = datetime.now()
@@ -262,103 +301,90 @@ class BayesianOptimizer:
         return result
 
     def _prepare_parameter_space(
-        self, param_spaces: Dict[str, ParameterSpace]
+        self, param_spaces: Dict[str, Dict]
     ) -> Tuple[List[Tuple[float, float]], Dict]:
-        """파라미터 공간을 수치형으로 변환"""
+        """파라미터 공간을 수치형으로 변환
+
+        Args:
+            param_spaces: ParameterManager 파라미터 공간
+                ({'type': 'int'|'float', 'range': [low, high]} 또는
+                {'type': 'choice', 'choices': [...]})
+        """
         param_bounds = []
         param_info = {"names": [], "types": [], "categories": {}, "original_bounds": {}}
 
-        for param_name, param_space in param_spaces.items():
-            param_info["names"].append(param_name)
-            param_info["types"].append(param_space.param_type)
+        for param_name, param_config in param_spaces.items():
+            param_type = param_config.get("type")
+            if param_type in ("int", "float"):
+                low, high = param_config["range"]
+                param_bounds.append((float(low), float(high)))
+                param_info["original_bounds"][param_name] = (low, high)
+            elif param_type == "choice":
+                categories = list(param_config.get("choices") or [])
+                if not categories:
+                    continue
+                param_bounds.append((0.0, float(len(categories) - 1)))
+                param_info["categories"][param_name] = categories
+            else:
+                self._logger.warning(f"지원하지 않는 파라미터 유형: {param_name} ({param_type})")
+                continue
 
-            if param_space.param_type == ParameterType.INTEGER:
-                param_bounds.append(
-                    (
-                        float(param_space.min_value or 0),
-                        float(param_space.max_value or 100),
-                    )
-                )
-                param_info["original_bounds"][param_name] = (
-                    param_space.min_value,
-                    param_space.max_value,
-                )
-            elif param_space.param_type == ParameterType.FLOAT:
-                param_bounds.append(
-                    (
-                        float(param_space.min_value or 0.0),
-                        float(param_space.max_value or 1.0),
-                    )
-                )
-                param_info["original_bounds"][param_name] = (
-                    param_space.min_value,
-                    param_space.max_value,
-                )
-            elif param_space.param_type == ParameterType.BOOLEAN:
-                param_bounds.append((0.0, 1.0))
-            elif param_space.param_type == ParameterType.CATEGORICAL:
-                param_bounds.append((0.0, float(len(param_space.categories or []) - 1)))
-                param_info["categories"][param_name] = param_space.categories or []
+            param_info["names"].append(param_name)
+            param_info["types"].append(param_type)
 
         return param_bounds, param_info
 
+    def _create_parameter_set(
+        self, strategy_name: str, params: Dict[str, Any]
+    ) -> ParameterSet:
+        """평가할 파라미터 세트 생성"""
+        return ParameterSet(
+            name=strategy_name,
+            parameters=params,
+            optimization_method="bayesian_optimization",
+            created_at=datetime.now().isoformat(),
+        )
+
     def _initial_sampling(
         self,
         strategy_name: str,
         param_bounds: List[Tuple[float, float]],
         param_info: Dict,
     ):
-        """초기 샘플링"""
+        """초기 샘플링 (공간 충전 샘플을 한 번에 생성하여 동시 평가)"""
         self._logger.info(f"초기 샘플링 시작: {self._config.initial_samples}개 샘플")
 
-        for i in range(self._config.initial_samples):
-            # 기존 좋은 파라미터가 있다면 일부 포함
-            if i == 0:
-                best_params = self._parameter_manager.get_best_parameters()
-                if best_params:
-                    param_vector = self._params_to_vector(
-                        best_params.parameters, param_info
-                    )
-                    fitness_score = best_params.fitness_score or 0.0
-                else:
-                    # 랜덤 샘플링
-                    params = self._random_sampling(
-                        strategy_name, param_bounds, param_info
-                    )
-                    param_set = self._parameter_manager.create_parameter_set(
-                        strategy_name, params
-                    )
-                    if param_set:
-                        try:
-                            fitness_score = self._fitness_function(param_set)
-                            param_set.fitness_score = fitness_score
-                        except Exception as e:
-                            self._logger.error(
-                                f"초기 샘플 평가 실패: {e}", exc_info=True
-                            )
-                            fitness_score = 0.0
-                        param_vector = self._params_to_vector(params, param_info)
-                    else:
-                        continue
-            else:
-                # 랜덤 샘플링
-                params = self._random_sampling(strategy_name, param_bounds, param_info)
-                param_set = self._parameter_manager.create_parameter_set(
-                    strategy_name, params
-                )
-                if param_set:
-                    try:
-                        fitness_score = self._fitness_function(param_set)
-                        param_set.fitness_score = fitness_score
-                    except Exception as e:
-                        self._logger.error(f"초기 샘플 평가 실패: {e}", exc_info=True)
-                        fitness_score = 0.0
-                    param_vector = self._params_to_vector(params, param_info)
-                else:
-                    continue
+        n_samples = self._config.initial_samples
+
+        # 기존 좋은 파라미터가 있다면 평가 없이 포함
+        best_params = self._parameter_manager.get_best_parameters(strategy_name)
+        if best_params and best_params.performance_score is not None and n_samples > 0:
+            self._X_samples.append(
+                self._params_to_vector(best_params.parameters, param_info)
+            )
+            fitness_score = best_params.performance_score
+            self._y_samples.append(fitness_score)
+            if fitness_score > self._best_fitness:
+                self._best_fitness = fitness_score
+                self._best_parameters = best_params
+            n_samples -= 1
+
+        if n_samples <= 0:
+            return
+
+        vectors = self._generate_candidates(n_samples, param_bounds)
+        batch = []
+        for vector in vectors:
+            params = self._vector_to_params(vector, param_info)
+            batch.append((params, self._create_parameter_set(strategy_name, params)))
+
+        scores = self._engine.evaluate_batch([params for params, _ in batch])
+
+        for i, ((params, param_set), fitness_score) in enumerate(zip(batch, scores)):
+            param_set.performance_score = fitness_score
 
             # 샘플 추가
-            self._X_samples.append(param_vector)
+            self._X_samples.append(self._params_to_vector(params, param_info))
             self._y_samples.append(fitness_score)
 
             # 최고 성능 업데이트
@@ -368,6 +394,16 @@ class BayesianOptimizer:
 
             self._logger.debug(f"초기 샘플 {i+1}: 적합도={fitness_score:.6f}")
 
+    def _evaluate_parameters(
+        self, strategy_name: str, params: Dict[str, Any]
+    ) -> Optional[float]:
+        """파라미터 딕셔너리 적합도 평가 (평가 엔진 워커에서 호출)"""
+        try:
+            return self._fitness_function(self._create_parameter_set(strategy_name, params))
+        except Exception as e:
+            self._logger.error(f"적합도 평가 실패: {e}", exc_info=True)
+            return None
+
     def _random_sampling(
         self,
         strategy_name: str,
@@ -381,21 +417,25 @@ class BayesianOptimizer:
             param_type = param_info["types"][i]
             min_val, max_val = param_bounds[i]
 
-            if param_type == ParameterType.INTEGER:
+            if param_type == "int":
                 original_min, original_max = param_info["original_bounds"][param_name]
-                params[param_name] = np.random.randint(original_min, original_max + 1)
-            elif param_type == ParameterType.FLOAT:
-                params[param_name] = np.random.uniform(min_val, max_val)
-            elif param_type == ParameterType.BOOLEAN:
-                params[param_name] = np.random.choice([True, False])
-            elif param_type == ParameterType.CATEGORICAL:
+                params[param_name] = int(self._rng.integers(original_min, original_max + 1))
+            elif param_type == "float":
+                params[param_name] = float(self._rng.uniform(min_val, max_val))
+            elif param_type == "choice":
+                # 튜플/None 선택지도 그대로 유지하도록 인덱스로 선택
                 categories = param_info["categories"][param_name]
-                params[param_name] = np.random.choice(categories)
+                params[param_name] = categories[int(self._rng.integers(len(categories)))]
 
         return params
 
-    def _train_gp_model(self) -> bool:
-        """가우시안 프로세스 모델 학습"""
+    def _train_gp_model(self, optimize_hyperparameters: bool = True) -> bool:
+        """가우시안 프로세스 모델 학습
+
+        Args:
+            optimize_hyperparameters: False이면 직전에 학습된 커널을 고정한 채
+                새 샘플만 반영 (커널 최적화 재시작 생략)
+        """
         if not SKLEARN_AVAILABLE or len(self._X_samples) < 2:
             return False
 
@@ -403,8 +443,16 @@ class BayesianOptimizer:
             X = np.array(self._X_samples)
             y = np.array(self._y_samples)
 
+            if not optimize_hyperparameters and hasattr(self._gp_model, "kernel_"):
+                self._gp_model = self._fixed_kernel_model(self._gp_model)
+
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
+                if optimize_hyperparameters:
+                    self._gp_model.set_params(
+                        optimizer="fmin_l_bfgs_b",
+                        n_restarts_optimizer=self._config.n_restarts_optimizer,
+                    )
                 self._gp_model.fit(X, y)
 
             return True
@@ -412,55 +460,115 @@ class BayesianOptimizer:
             self._logger.error(f"가우시안 프로세스 모델 학습 실패: {e}", exc_info=True)
             return False
 
-    def _acquire_next_sample(
-        self, param_bounds: List[Tuple[float, float]], param_info: Dict
-    ) -> Optional[Dict[str, Any]]:
-        """획득 함수로 다음 샘플 찾기"""
-        if not SKLEARN_AVAILABLE or self._gp_model is None:
-            return None
+    def _fixed_kernel_model(self, model):
+        """학습된 커널 하이퍼파라미터를 고정한 GP 복제본 (재학습 시 커널 최적화 생략)"""
+        return clone(model).set_params(kernel=model.kernel_, optimizer=None)
 
-        try:
-            # 간단한 그리드 서치로 획득 함수 최적화
-            best_acq_value = float("-inf")
-            best_params = None
+    def _generate_candidates(
+        self, n: int, param_bounds: List[Tuple[float, float]]
+    ) -> np.ndarray:
+        """후보 벡터 생성 (n x 차원, 벡터화)
 
-            # 각 차원마다 몇 개 후보 생성
-            n_candidates = 1000
-            candidates = []
+        sobol/lhs는 공간을 고르게 덮어 같은 후보 수에서도 랜덤보다 빈 영역이 적습니다.
+        """
+        dim = len(param_bounds)
+        if n <= 0 or dim == 0:
+            return np.empty((0, dim))
 
-            for _ in range(n_candidates):
-                candidate = []
-                for min_val, max_val in param_bounds:
-                    candidate.append(np.random.uniform(min_val, max_val))
-                candidates.append(candidate)
+        sampler = self._config.candidate_sampler
+        if sampler == "sobol" and QMC_AVAILABLE:
+            with warnings.catch_warnings():
+                # 2의 거듭제곱이 아닌 샘플 수 경고 무시
+                warnings.simplefilter("ignore")
+                unit = qmc.Sobol(d=dim, scramble=True, seed=self._rng).random(n)
+        elif sampler in ("sobol", "lhs"):
+            # 라틴 하이퍼큐브: 차원별로 n개 구간에 하나씩 배치
+            strata = self._rng.permuted(np.tile(np.arange(n), (dim, 1)), axis=1).T
+            unit = (strata + self._rng.random((n, dim))) / n
+        else:
+            unit = self._rng.random((n, dim))
+
+        bounds = np.asarray(param_bounds, dtype=float)
+        return bounds[:, 0] + unit * (bounds[:, 1] - bounds[:, 0])
+
+    def _acquisition_values(self, candidates: np.ndarray, model=None) -> np.ndarray:
+        """설정된 획득 함수 값 계산"""
+        if self._config.acquisition_function == "ei":
+            return self._expected_improvement(candidates, model)
+        elif self._config.acquisition_function == "ucb":
+            return self._upper_confidence_bound(candidates, model)
+        return self._probability_of_improvement(candidates, model)  # "pi"
 
-            candidates = np.array(candidates)
+    def _acquire_batch(
+        self, batch_size: int, param_bounds: List[Tuple[float, float]], param_info: Dict
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """획득 함수로 동시 평가할 샘플 배치 찾기 (constant liar)
 
-            # 획득 함수 계산
-            if self._config.acquisition_function == "ei":
-                acquisition_values = self._expected_improvement(candidates)
-            elif self._config.acquisition_function == "ucb":
-                acquisition_values = self._upper_confidence_bound(candidates)
-            else:  # "pi"
-                acquisition_values = self._probability_of_improvement(candidates)
+        한 점을 고를 때마다 그 점에 가상 관측값(liar)을 넣어 GP를 갱신하므로,
+        같은 배치의 다음 점은 불확실성이 줄어든 주변을 피해 다른 영역에서 선택됩니다.
+        가상 관측 갱신은 학습된 커널을 고정하여 커널 최적화 없이 수행합니다.
+
+        Returns:
+            List[(파라미터, 획득 함수 값)]
+        """
+        if not SKLEARN_AVAILABLE or self._gp_model is None:
+            return []
 
-            # 최고 획득 함수 값을 가진 후보 선택
-            best_idx = np.argmax(acquisition_values)
-            best_candidate = candidates[best_idx]
+        try:
+            candidates = self._generate_candidates(
+                self._config.n_candidates, param_bounds
+            )
+            if len(candidates) == 0:
+                return []
+
+            y_observed = np.asarray(self._y_samples, dtype=float)
+            lie = {
+                "max": np.max(y_observed),
+                "min": np.min(y_observed),
+            }.get(self._config.liar_strategy, np.mean(y_observed))
+
+            X_fantasy = np.array(self._X_samples, dtype=float)
+            y_fantasy = y_observed
+            model = self._gp_model
+            available = np.ones(len(candidates), dtype=bool)
+            batch = []
+            seen_keys = set()
+            acquisition_values = None
+
+            while len(batch) < batch_size and available.any():
+                # 획득 함수 값은 모델이 갱신될 때만 다시 계산 (중복 후보 건너뛸 때는 재사용)
+                if acquisition_values is None:
+                    acquisition_values = self._acquisition_values(candidates, model)
+                best_idx = int(np.argmax(np.where(available, acquisition_values, -np.inf)))
+                available[best_idx] = False
+
+                # 정수/범주형 반올림 후 같은 파라미터가 되는 후보는 건너뜀
+                params = self._vector_to_params(candidates[best_idx], param_info)
+                key = tuple(sorted((k, str(v)) for k, v in params.items()))
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+                batch.append((params, acquisition_values[best_idx]))
 
-            # 벡터를 파라미터로 변환
-            best_params = self._vector_to_params(best_candidate, param_info)
+                if len(batch) < batch_size:
+                    X_fantasy = np.vstack([X_fantasy, candidates[best_idx]])
+                    y_fantasy = np.append(y_fantasy, lie)
+                    model = self._fixed_kernel_model(self._gp_model)
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore")
+                        model.fit(X_fantasy, y_fantasy)
+                    acquisition_values = None
 
-            return best_params
+            return batch
 
         except Exception as e:
             self._logger.error(f"획득 함수 최적화 실패: {e}", exc_info=True)
-            return None
+            return []
 
-    def _expected_improvement(self, X: np.ndarray) -> np.ndarray:
+    def _expected_improvement(self, X: np.ndarray, model=None) -> np.ndarray:
         """기대 개선 (Expected Improvement) 계산"""
         try:
-            mu, std = self._gp_model.predict(X, return_std=True)
+            mu, std = (model or self._gp_model).predict(X, return_std=True)
 
             # 현재 최고값
             f_best = np.max(self._y_samples)
@@ -480,10 +588,10 @@ class BayesianOptimizer:
             self._logger.error(f"기대 개선 계산 실패: {e}", exc_info=True)
             return np.zeros(len(X))
 
-    def _upper_confidence_bound(self, X: np.ndarray) -> np.ndarray:
+    def _upper_confidence_bound(self, X: np.ndarray, model=None) -> np.ndarray:
         """상한 신뢰 구간 (Upper Confidence Bound) 계산"""
         try:
-            mu, std = self._gp_model.predict(X, return_std=True)
+            mu, std = (model or self._gp_model).predict(X, return_std=True)
 
             # UCB = 평균 + kappa * 표준편차
             kappa = 2.0  # 탐험-활용 균형 파라미터
@@ -495,10 +603,10 @@ class BayesianOptimizer:
             self._logger.error(f"상한 신뢰 구간 계산 실패: {e}", exc_info=True)
             return np.zeros(len(X))
 
-    def _probability_of_improvement(self, X: np.ndarray) -> np.ndarray:
+    def _probability_of_improvement(self, X: np.ndarray, model=None) -> np.ndarray:
         """개선 확률 (Probability of Improvement) 계산"""
         try:
-            mu, std = self._gp_model.predict(X, return_std=True)
+            mu, std = (model or self._gp_model).predict(X, return_std=True)
 
             # 현재 최고값
             f_best = np.max(self._y_samples)
@@ -534,13 +642,9 @@ class BayesianOptimizer:
             param_type = param_info["types"][i]
             value = params.get(param_name, 0)
 
-            if param_type == ParameterType.INTEGER:
-                vector.append(float(value))
-            elif param_type == ParameterType.FLOAT:
+            if param_type in ("int", "float"):
                 vector.append(float(value))
-            elif param_type == ParameterType.BOOLEAN:
-                vector.append(1.0 if value else 0.0)
-            elif param_type == ParameterType.CATEGORICAL:
+            elif param_type == "choice":
                 categories = param_info["categories"][param_name]
                 try:
                     idx = categories.index(value)
@@ -558,16 +662,14 @@ class BayesianOptimizer:
             param_type = param_info["types"][i]
             value = vector[i]
 
-            if param_type == ParameterType.INTEGER:
+            if param_type == "int":
                 original_min, original_max = param_info["original_bounds"][param_name]
                 params[param_name] = int(
                     np.clip(np.round(value), original_min, original_max)
                 )
-            elif param_type == ParameterType.FLOAT:
+            elif param_type == "float":
                 params[param_name] = float(value)
-            elif param_type == ParameterType.BOOLEAN:
-                params[param_name] = value >= 0.5
-            elif param_type == ParameterType.CATEGORICAL:
+            elif param_type == "choice":
                 categories = param_info["categories"][param_name]
                 idx = int(np.clip(np.round(value), 0, len(categories) - 1))
                 params[param_name] = categories[idx]
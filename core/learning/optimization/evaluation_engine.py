@@ -0,0 +1,238 @@
+"""
+Phase 4: AI 학습 시스템 - 병렬 적합도 평가 엔진
+
+유전 알고리즘/베이지안 최적화기가 공유하는 평가 엔진
+- 개체(파라미터 세트)를 실행기(프로세스/스레드)로 분산 평가
+- 정규화된 파라미터 벡터를 키로 하는 적합도 캐시 (엘리트/중복 개체 재평가 방지)
+- 배치 단위 진행 상황 콜백
+"""
+
+import math
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+# 평가 함수: 파라미터 딕셔너리 → 적합도 (실패 시 None)
+EvaluateFn = Callable[[Dict[str, Any]], Optional[float]]
+
+# 진행 콜백: (완료 수, 배치 크기, 이번 배치 최고 적합도)
+ProgressCallback = Callable[[int, int, float], None]
+
+
+@dataclass
+class EvaluationConfig:
+    """평가 엔진 설정"""
+    max_workers: int = 1            # 1이면 현재 스레드에서 순차 평가
+    executor_type: str = "thread"   # "thread" 또는 "process"
+    cache_enabled: bool = True
+    float_precision: int = 8        # 캐시 키 생성 시 실수 반올림 자릿수
+    failure_score: float = 0.0      # 평가 실패 시 적합도
+
+    def __post_init__(self):
+        if self.max_workers < 1:
+            raise ValueError("max_workers는 1 이상이어야 합니다")
+        if self.executor_type not in ("thread", "process"):
+            raise ValueError(f"지원하지 않는 실행기 유형: {self.executor_type}")
+
+
+def canonical_key(parameters: Dict[str, Any], float_precision: int = 8) -> Tuple:
+    """파라미터 딕셔너리의 정규화된 캐시 키
+
+    키 순서와 numpy 스칼라 타입 차이를 제거하고 실수는 반올림하여,
+    같은 파라미터 벡터가 항상 같은 키를 갖도록 합니다.
+
+    Args:
+        parameters: 파라미터 딕셔너리
+        float_precision: 실수 반올림 자릿수
+
+    Returns:
+        Tuple: (이름, 값) 쌍의 정렬된 튜플
+    """
+    items = []
+    for name in sorted(parameters):
+        value = parameters[name]
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, float):
+            value = round(value, float_precision) if math.isfinite(value) else repr(value)
+        elif not isinstance(value, Hashable):
+            value = repr(value)
+        items.append((name, value))
+    return tuple(items)
+
+
+class EvaluationEngine:
+    """병렬 + 메모이즈 적합도 평가 엔진
+
+    Usage:
+        engine = EvaluationEngine(evaluate_fn, EvaluationConfig(max_workers=8))
+        scores = engine.evaluate_batch(population)
+        engine.shutdown()
+    """
+
+    def __init__(self, evaluate_fn: EvaluateFn, config: Optional[EvaluationConfig] = None):
+        """
+        Args:
+            evaluate_fn: 평가 함수 (프로세스 실행기 사용 시 pickle 가능해야 함)
+            config: 평가 엔진 설정
+        """
+        self._evaluate_fn = evaluate_fn
+        self._config = config or EvaluationConfig()
+        self._executor: Optional[Executor] = None
+
+        self._cache: Dict[Tuple, float] = {}
+        self._stats = {
+            'requested': 0,
+            'evaluated': 0,
+            'cache_hits': 0,
+            'failures': 0,
+            'evaluation_time': 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # 실행기 관리
+    # ------------------------------------------------------------------
+    def _get_executor(self) -> Optional[Executor]:
+        if self._config.max_workers <= 1:
+            return None
+        if self._executor is None:
+            if self._config.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self._config.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._config.max_workers,
+                    thread_name_prefix="fitness-eval",
+                )
+        return self._executor
+
+    def shutdown(self):
+        """실행기 종료 (캐시는 유지)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> 'EvaluationEngine':
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    # ------------------------------------------------------------------
+    # 평가
+    # ------------------------------------------------------------------
+    def key_for(self, parameters: Dict[str, Any]) -> Tuple:
+        return canonical_key(parameters, self._config.float_precision)
+
+    def evaluate_batch(
+        self,
+        population: List[Dict[str, Any]],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[float]:
+        """개체 집단 평가
+
+        캐시에 있는 개체와 배치 내 중복 개체는 한 번만 평가하고,
+        나머지는 실행기로 동시에 평가합니다.
+
+        Args:
+            population: 파라미터 딕셔너리 목록
+            progress_callback: 개체 평가 완료마다 호출되는 콜백
+
+        Returns:
+            List[float]: 입력 순서와 같은 적합도 목록
+        """
+        started = time.time()
+        self._stats['requested'] += len(population)
+
+        keys = [self.key_for(individual) for individual in population]
+        scores: Dict[Tuple, float] = {}
+        todo: Dict[Tuple, Dict[str, Any]] = {}
+
+        for key, individual in zip(keys, population):
+            if self._config.cache_enabled and key in self._cache:
+                scores[key] = self._cache[key]
+            elif key not in todo:
+                todo[key] = individual
+
+        self._stats['cache_hits'] += len(population) - len(todo)
+
+        total = len(todo)
+        best = max(scores.values(), default=-np.inf)
+        done = 0
+        for key, score in self._run(todo):
+            if score is None:
+                # 실패는 일시적일 수 있으므로 캐시하지 않음
+                score = self._config.failure_score
+            elif self._config.cache_enabled:
+                self._cache[key] = score
+            scores[key] = score
+            done += 1
+            best = max(best, score)
+            if progress_callback:
+                progress_callback(done, total, best)
+
+        self._stats['evaluated'] += total
+        self._stats['evaluation_time'] += time.time() - started
+        return [scores[key] for key in keys]
+
+    def evaluate(self, parameters: Dict[str, Any]) -> float:
+        """단일 개체 평가 (캐시 사용)"""
+        return self.evaluate_batch([parameters])[0]
+
+    def _run(self, todo: Dict[Tuple, Dict[str, Any]]):
+        """평가 실행 - 완료 순서대로 (키, 적합도 또는 실패 시 None) 반환"""
+        executor = self._get_executor() if len(todo) > 1 else None
+
+        if executor is None:
+            for key, individual in todo.items():
+                yield key, self._safe_score(lambda: self._evaluate_fn(individual))
+            return
+
+        futures = {
+            executor.submit(self._evaluate_fn, individual): key
+            for key, individual in todo.items()
+        }
+        for future in as_completed(futures):
+            yield futures[future], self._safe_score(future.result)
+
+    def _safe_score(self, call: Callable[[], Optional[float]]) -> Optional[float]:
+        try:
+            score = call()
+        except Exception as e:
+            logger.error(f"적합도 평가 실패: {e}")
+            score = None
+
+        if score is None or not math.isfinite(score):
+            self._stats['failures'] += 1
+            return None
+        return float(score)
+
+    # ------------------------------------------------------------------
+    # 캐시 / 통계
+    # ------------------------------------------------------------------
+    def clear_cache(self):
+        self._cache.clear()
+
+    @property
+    def cache_size(self) -> int:
+        return len(self._cache)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """평가 통계"""
+        requested = self._stats['requested']
+        return {
+            **self._stats,
+            'cache_size': len(self._cache),
+            'cache_hit_rate': self._stats['cache_hits'] / requested if requested else 0.0,
+        }
@@ -5,17 +5,22 @@ Phase 4: AI 학습 시스템 - 유전 알고리즘 최적화기
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from datetime import datetime
+from functools import partial
 import random
 from dataclasses import dataclass
 import time
 
 from core.utils.log_utils import get_logger
 from .parameter_manager import ParameterManager, ParameterSet, OptimizationResult
+from .evaluation_engine import EvaluationConfig, EvaluationEngine
 
 logger = get_logger(__name__)
 
+# 세대 진행 콜백: (세대, 전체 세대 수, 최고 적합도, 평가 통계)
+GenerationCallback = Callable[[int, int, float, Dict[str, Any]], None]
+
 @dataclass
 class GeneticConfig:
     """유전 알고리즘 설정 클래스"""
@@ -27,6 +32,9 @@ class GeneticConfig:
     tournament_size: int = 3
     convergence_patience: int = 20
     early_stopping: bool = True
+    max_workers: int = 1            # 동시 평가 수 (1이면 순차)
+    executor_type: str = "thread"   # "thread" 또는 "process"
+    cache_fitness: bool = True      # 동일 개체 재평가 방지
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -37,7 +45,10 @@ class GeneticConfig:
             'elite_size': self.elite_size,
             'tournament_size': self.tournament_size,
             'convergence_patience': self.convergence_patience,
-            'early_stopping': self.early_stopping
+            'early_stopping': self.early_stopping,
+            'max_workers': self.max_workers,
+            'executor_type': self.executor_type,
+            'cache_fitness': self.cache_fitness
         }
 
 class GeneticOptimizer:
@@ -64,14 +75,19 @@ class GeneticOptimizer:
         self._no_improvement_count = 0
         self._best_fitness = -np.inf
         
+        # 평가 엔진 (optimize 실행 중에만 유지)
+        self._engine: Optional[EvaluationEngine] = None
+        
         self._logger.info("GeneticOptimizer 초기화 완료")
     
-    def optimize(self, component: str, max_evaluations: Optional[int] = None) -> OptimizationResult:
+    def optimize(self, component: str, max_evaluations: Optional[int] = None,
+                 progress_callback: Optional[GenerationCallback] = None) -> OptimizationResult:
         """유전 알고리즘 최적화 실행
         
         Args:
             component: 최적화할 컴포넌트 이름
-            max_evaluations: 최대 평가 횟수
+            max_evaluations: 최대 평가 횟수 (캐시로 재사용된 개체는 제외)
+            progress_callback: 세대 완료마다 호출되는 콜백
             
         Returns:
             OptimizationResult: 최적화 결과
@@ -82,6 +98,7 @@ class GeneticOptimizer:
             
             # 초기화
             self._reset_optimization_state()
+            self._engine = self._create_evaluation_engine(component)
             
             # 초기 집단 생성
             self._initialize_population(component)
@@ -90,7 +107,6 @@ class GeneticOptimizer:
             self._evaluate_population(component)
             
             all_tested_parameters = []
-            total_evaluations = 0
             
             # 세대 진화
             for generation in range(self._config.generations):
@@ -118,7 +134,7 @@ class GeneticOptimizer:
                     )
                     all_tested_parameters.append(param_set)
                 
-                total_evaluations += len(self._population)
+                total_evaluations = self._engine.get_stats()['evaluated']
                 
                 # 개선 확인
                 if best_fitness > self._best_fitness:
@@ -127,6 +143,11 @@ class GeneticOptimizer:
                 else:
                     self._no_improvement_count += 1
                 
+                # 진행 상황 전달
+                if progress_callback:
+                    progress_callback(generation, self._config.generations, best_fitness,
+                                      self._engine.get_stats())
+                
                 # 로그 출력
                 if generation % 10 == 0:
                     self._logger.info(f"세대 {generation}: 최고 적합도 {best_fitness:.4f}")
@@ -154,18 +175,22 @@ class GeneticOptimizer:
             )
             
             optimization_time = time.time() - start_time
+            engine_stats = self._engine.get_stats()
             
             # 결과 구성
             result = OptimizationResult(
                 method="genetic_algorithm",
                 best_parameters=best_parameters,
                 all_tested_parameters=all_tested_parameters,
-                total_evaluations=total_evaluations,
+                total_evaluations=engine_stats['evaluated'],
                 optimization_time=optimization_time,
                 convergence_iteration=self._current_generation
             )
             
-            self._logger.info(f"유전 알고리즘 최적화 완료: 최고 점수 {best_parameters.performance_score:.4f}")
+            self._logger.info(
+                f"유전 알고리즘 최적화 완료: 최고 점수 {best_parameters.performance_score:.4f}, "
+                f"평가 {engine_stats['evaluated']}회 (캐시 적중률 {engine_stats['cache_hit_rate']:.1%})"
+            )
             return result
             
         except Exception as e:
@@ -178,6 +203,22 @@ class GeneticOptimizer:
                 total_evaluations=0,
                 optimization_time=0.0
             )
+        
+        finally:
+            if self._engine is not None:
+                self._engine.shutdown()
+                self._engine = None
+    
+    def _create_evaluation_engine(self, component: str) -> EvaluationEngine:
+        """평가 엔진 생성 (컴포넌트별 평가 함수 + 적합도 캐시)"""
+        return EvaluationEngine(
+            partial(self._param_manager.evaluate_parameters, component),
+            EvaluationConfig(
+                max_workers=self._config.max_workers,
+                executor_type=self._config.executor_type,
+                cache_enabled=self._config.cache_fitness,
+            )
+        )
     
     def _reset_optimization_state(self):
         """최적화 상태 리셋"""
@@ -215,16 +256,18 @@ class GeneticOptimizer:
             self._logger.error(f"초기 집단 생성 오류: {e}", exc_info=True)
     
     def _evaluate_population(self, component: str):
-        """집단 평가"""
+        """집단 평가
+        
+        엘리트 보존 개체와 중복 개체는 캐시된 적합도를 재사용하고,
+        새 개체만 평가 엔진에서 동시에 평가합니다. 실패한 경우 최저 점수(0.0)
+        optimize() 밖에서 호출되면 이번 평가용 엔진을 만들고 바로 종료합니다.
+        """
         try:
-            self._fitness_scores = []
-            
-            for individual in self._population:
-                score = self._param_manager.evaluate_parameters(component, individual)
-                if score is not None:
-                    self._fitness_scores.append(score)
-                else:
-                    self._fitness_scores.append(0.0)  # 실패한 경우 최저 점수
+            if self._engine is not None:
+                self._fitness_scores = self._engine.evaluate_batch(self._population)
+            else:
+                with self._create_evaluation_engine(component) as engine:
+                    self._fitness_scores = engine.evaluate_batch(self._population)
             
         except Exception as e:
             self._logger.error(f"집단 평가 오류: {e}", exc_info=True)
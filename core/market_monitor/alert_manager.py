@@ -17,7 +17,7 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 from pathlib import Path
 
-from ..utils.logging import get_logger
+from ..utils.log_utils import get_logger
 from ..notification.telegram_bot import (
     TelegramNotifier as StandardTelegramNotifier,
     TelegramConfig as StandardTelegramConfig,
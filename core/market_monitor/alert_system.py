@@ -18,7 +18,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import requests
 
-from ..utils.logging import get_logger
+from ..utils.log_utils import get_logger
 from .anomaly_detector import AnomalyAlert, AnomalySeverity
 
 logger = get_logger(__name__)
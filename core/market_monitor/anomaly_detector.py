@@ -7,13 +7,16 @@
 import numpy as np
 import pandas as pd
 import json
+import math
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
-from ..utils.logging import get_logger
+from ..realtime.ring_buffer import ColumnarRingBuffer
+from ..scoring.ranking import upper_triangle_pairs
+from ..utils.log_utils import get_logger
 from .market_monitor import MarketSnapshot
 
 logger = get_logger(__name__)
@@ -61,6 +64,7 @@ class AnomalyConfig:
     # 감지 기간 설정
     detection_window: int = 60                 # 감지 윈도우 (분)
     historical_days: int = 30                  # 과거 데이터 비교 기간
+    snapshot_interval_seconds: int = 60        # 스냅샷 간격 (종목별 히스토리 용량 산정)
     
     # 필터링 설정
     min_market_cap: float = 100000000          # 최소 시가총액 (1억)
@@ -95,68 +99,97 @@ class AnomalyAlert:
     detection_method: str = ""
     false_positive_risk: float = 0.0
 
+# 종목별 히스토리 컬럼 (timestamp는 epoch 초)
+PRICE_HISTORY_FIELDS = (("timestamp", "float64"), ("price", "float64"), ("change_rate", "float64"))
+VOLUME_HISTORY_FIELDS = (("timestamp", "float64"), ("volume", "float64"), ("volume_ratio", "float64"))
+
+TRADING_SECONDS_PER_DAY = 390 * 60   # 정규장 09:00~15:30
+MAX_HISTORY_CAPACITY = 20000         # 종목별 히스토리 최대 행 수 (메모리 상한)
+
+
 class StatisticalAnalyzer:
     """통계적 분석기"""
     
-    def __init__(self):
+    def __init__(self, history_capacity: Optional[int] = None, retention_days: int = 30,
+                 snapshot_interval_seconds: float = 60):
+        """
+        Args:
+            history_capacity: 종목별 보관 스냅샷 수 (링 버퍼 용량, None이면 보관 기간과 스냅샷
+                간격으로 산정하되 MAX_HISTORY_CAPACITY로 제한)
+            retention_days: 통계에 사용할 기간 (일)
+            snapshot_interval_seconds: 스냅샷 간격 (초)
+
+        용량이 보관 기간을 다 담지 못하면 통계는 최근 용량만큼의 스냅샷만 사용하며, 이때 경고를 남깁니다.
+        """
         self._logger = logger
-        self._price_history = {}
-        self._volume_history = {}
+        # 보관 기간을 모두 거래일로 보고 장중 스냅샷 수를 넉넉히 산정
+        required = max(1, math.ceil(retention_days * TRADING_SECONDS_PER_DAY / snapshot_interval_seconds))
+        if history_capacity is None:
+            history_capacity = min(required, MAX_HISTORY_CAPACITY)
+        if history_capacity < required:
+            covered_days = history_capacity * snapshot_interval_seconds / TRADING_SECONDS_PER_DAY
+            self._logger.warning(
+                f"히스토리 용량 {history_capacity}개로 통계 기간이 약 {covered_days:.1f}거래일로 제한됩니다 "
+                f"(설정 {retention_days}일, 스냅샷 간격 {snapshot_interval_seconds}초)"
+            )
+        self._history_capacity = history_capacity
+        self._retention = timedelta(days=retention_days)
+        self._price_history: Dict[str, ColumnarRingBuffer] = {}
+        self._volume_history: Dict[str, ColumnarRingBuffer] = {}
         self._correlation_matrix = None
     
     def update_historical_data(self, snapshots: List[MarketSnapshot]):
         """과거 데이터 업데이트"""
         try:
             for snapshot in snapshots:
+                timestamp = snapshot.timestamp.timestamp()
                 for stock in snapshot.stock_snapshots:
                     stock_code = stock.stock_code
                     
                     # 가격 히스토리 업데이트
-                    if stock_code not in self._price_history:
-                        self._price_history[stock_code] = []
-                    
-                    self._price_history[stock_code].append({
-                        'timestamp': snapshot.timestamp,
-                        'price': stock.current_price,
-                        'change_rate': stock.price_change_rate
-                    })
+                    price_history = self._price_history.get(stock_code)
+                    if price_history is None:
+                        price_history = self._price_history[stock_code] = ColumnarRingBuffer(
+                            self._history_capacity, PRICE_HISTORY_FIELDS
+                        )
+                    elif timestamp <= price_history.last('timestamp'):
+                        # 이미 반영된 스냅샷 (recent_snapshots 중복 전달) → 시각 오름차순 유지
+                        continue
+                    price_history.append(timestamp, stock.current_price, stock.price_change_rate)
                     
                     # 거래량 히스토리 업데이트
-                    if stock_code not in self._volume_history:
-                        self._volume_history[stock_code] = []
-                    
-                    self._volume_history[stock_code].append({
-                        'timestamp': snapshot.timestamp,
-                        'volume': stock.volume,
-                        'volume_ratio': stock.volume_ratio
-                    })
-            
-            # 오래된 데이터 정리 (30일)
-            cutoff_time = datetime.now() - timedelta(days=30)
+                    volume_history = self._volume_history.get(stock_code)
+                    if volume_history is None:
+                        volume_history = self._volume_history[stock_code] = ColumnarRingBuffer(
+                            self._history_capacity, VOLUME_HISTORY_FIELDS
+                        )
+                    volume_history.append(timestamp, stock.volume, stock.volume_ratio)
+            
+            # 오래된 데이터 정리 (보관 기간 동안 갱신 없는 종목 제거)
+            cutoff_time = datetime.now() - self._retention
             self._cleanup_old_data(cutoff_time)
             
         except Exception as e:
             self._logger.error(f"과거 데이터 업데이트 실패: {e}", exc_info=True)
     
     def _cleanup_old_data(self, cutoff_time: datetime):
-        """오래된 데이터 정리"""
-        for stock_code in list(self._price_history.keys()):
-            self._price_history[stock_code] = [
-                item for item in self._price_history[stock_code]
-                if item['timestamp'] > cutoff_time
-            ]
-            
-            if not self._price_history[stock_code]:
-                del self._price_history[stock_code]
-        
-        for stock_code in list(self._volume_history.keys()):
-            self._volume_history[stock_code] = [
-                item for item in self._volume_history[stock_code]
-                if item['timestamp'] > cutoff_time
-            ]
-            
-            if not self._volume_history[stock_code]:
-                del self._volume_history[stock_code]
+        """오래된 데이터 정리
+
+        링 버퍼는 용량이 고정이라 행을 지우지 않고, 통계 계산 시 보관 기간 창만 사용합니다.
+        마지막 기록이 기준 시각 이전인 종목만 버퍼째 제거합니다.
+        """
+        cutoff = cutoff_time.timestamp()
+        for history in (self._price_history, self._volume_history):
+            for stock_code in [code for code, buffer in history.items() if buffer.last('timestamp') <= cutoff]:
+                del history[stock_code]
+    
+    def _recent_column(self, history: Dict[str, ColumnarRingBuffer], stock_code: str, name: str) -> np.ndarray:
+        """보관 기간 내 컬럼 값 (복사 없는 view, 히스토리는 시각 오름차순으로만 기록됨)"""
+        buffer = history.get(stock_code)
+        if buffer is None:
+            return np.empty(0)
+        cutoff = (datetime.now() - self._retention).timestamp()
+        return buffer.column(name, buffer.since('timestamp', cutoff))
     
     def detect_price_anomalies(self, current_snapshot: MarketSnapshot, config: AnomalyConfig) -> List[Dict]:
         """가격 이상 감지"""
@@ -318,26 +351,22 @@ class StatisticalAnalyzer:
             # 상관계수 매트릭스 계산
             correlation_matrix = stock_returns.corr()
             
-            # 이상 상관관계 감지
-            for i, stock1 in enumerate(correlation_matrix.columns):
-                for j, stock2 in enumerate(correlation_matrix.columns):
-                    if i >= j:  # 중복 제거
-                        continue
-                    
-                    correlation = correlation_matrix.loc[stock1, stock2]
-                    
-                    # 비정상적으로 낮은 상관관계 (보통 양의 상관관계를 가져야 하는 종목들)
-                    if not np.isnan(correlation) and correlation < config.correlation_threshold:
-                        anomaly = {
-                            'type': AnomalyType.CORRELATION_BREAK,
-                            'severity': AnomalySeverity.MEDIUM,
-                            'stock1': stock1,
-                            'stock2': stock2,
-                            'correlation': correlation,
-                            'expected_correlation': 0.7  # 예상 상관계수
-                        }
-                        
-                        anomalies.append(anomaly)
+            # 이상 상관관계 감지: 비정상적으로 낮은 상관관계 (보통 양의 상관관계를 가져야 하는 종목들)
+            rows, cols, values = upper_triangle_pairs(
+                correlation_matrix.values,
+                lambda v: v < config.correlation_threshold
+            )
+            names = correlation_matrix.columns.to_numpy()
+
+            for stock1, stock2, correlation in zip(names[rows], names[cols], values.tolist()):
+                anomalies.append({
+                    'type': AnomalyType.CORRELATION_BREAK,
+                    'severity': AnomalySeverity.MEDIUM,
+                    'stock1': stock1,
+                    'stock2': stock2,
+                    'correlation': correlation,
+                    'expected_correlation': 0.7  # 예상 상관계수
+                })
                         
         except Exception as e:
             self._logger.error(f"상관관계 이상 감지 실패: {e}", exc_info=True)
@@ -346,15 +375,10 @@ class StatisticalAnalyzer:
     
     def _get_price_statistics(self, stock_code: str) -> Dict[str, float]:
         """가격 통계 정보 조회"""
-        if stock_code not in self._price_history:
-            return {}
-        
-        history = self._price_history[stock_code]
-        if not history:
+        changes = self._recent_column(self._price_history, stock_code, 'change_rate')
+        if not len(changes):
             return {}
         
-        changes = [item['change_rate'] for item in history]
-        
         return {
             'mean_change': np.mean(changes),
             'std_change': np.std(changes),
@@ -364,15 +388,10 @@ class StatisticalAnalyzer:
     
     def _get_volume_statistics(self, stock_code: str) -> Dict[str, float]:
         """거래량 통계 정보 조회"""
-        if stock_code not in self._volume_history:
+        ratios = self._recent_column(self._volume_history, stock_code, 'volume_ratio')
+        if not len(ratios):
             return {}
         
-        history = self._volume_history[stock_code]
-        if not history:
-            return {}
-        
-        ratios = [item['volume_ratio'] for item in history]
-        
         return {
             'mean_ratio': np.mean(ratios),
             'std_ratio': np.std(ratios),
@@ -595,7 +614,10 @@ class AnomalyDetector:
         os.makedirs(data_dir, exist_ok=True)
         
         # 분석 컴포넌트
-        self._statistical_analyzer = StatisticalAnalyzer()
+        self._statistical_analyzer = StatisticalAnalyzer(
+            retention_days=self._config.historical_days,
+            snapshot_interval_seconds=self._config.snapshot_interval_seconds,
+        )
         self._pattern_analyzer = PatternAnalyzer()
         
         # 감지 기록
@@ -14,7 +14,7 @@ from enum import Enum
 import threading
 import time
 
-from ..utils.logging import get_logger
+from ..utils.log_utils import get_logger
 from .market_monitor import MarketMonitor, MarketSnapshot, MarketStatus
 from .anomaly_detector import AnomalyDetector, AnomalyAlert, AnomalySeverity
 from .alert_system import AlertSystem
@@ -17,7 +17,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from concurrent.futures import ThreadPoolExecutor
 
-from ..utils.logging import get_logger
+from ..utils.log_utils import get_logger
 from .anomaly_detector import AnomalyAlert, AnomalySeverity
 from .alert_system import AlertChannel
 from ..notification.telegram_bot import (
@@ -14,7 +14,7 @@ from typing import Dict, List, Tuple, Optional, Any, Callable
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
-from ..utils.logging import get_logger
+from ..utils.log_utils import get_logger
 
 logger = get_logger(__name__)
 
@@ -14,7 +14,7 @@ from collections import deque, defaultdict
 import sqlite3
 from pathlib import Path
 
-from ..utils.logging import get_logger
+from ..utils.log_utils import get_logger
 
 logger = get_logger(__name__)
 
@@ -13,7 +13,7 @@ from dataclasses import dataclass, asdict
 from collections import deque
 import json
 
-from ..utils.logging import get_logger
+from ..utils.log_utils import get_logger
 
 logger = get_logger(__name__)
 
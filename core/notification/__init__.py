@@ -8,6 +8,13 @@ from .alert import Alert, AlertType, AlertLevel, AlertFormatter
 from .notifier import BaseNotifier, NotifierConfig, MockNotifier
 from .telegram_bot import TelegramNotifier, TelegramConfig
 from .notification_manager import NotificationManager, RateLimitConfig
+from .delivery_queue import (
+    DeliveryQueue,
+    DeliveryConfig,
+    DeliveryHandle,
+    DeliveryStatus,
+    DeliveryOutbox,
+)
 
 __all__ = [
     # Alert
@@ -25,4 +32,10 @@ __all__ = [
     # Manager
     'NotificationManager',
     'RateLimitConfig',
+    # Delivery
+    'DeliveryQueue',
+    'DeliveryConfig',
+    'DeliveryHandle',
+    'DeliveryStatus',
+    'DeliveryOutbox',
 ]
@@ -0,0 +1,690 @@
+"""
+알림 발송 큐 모듈
+
+호출 스레드를 막지 않는 백그라운드 알림 발송 서브시스템입니다.
+
+- 백그라운드 워커 스레드가 실제 발송과 재시도를 담당
+- JSONL 아웃박스로 미발송 메시지를 재시작 후에도 보존
+- 동일 coalesce_key 메시지를 윈도우 내에서 하나로 병합 (예: 배치 요약)
+- RateLimitConfig 기반 대상(채팅)별 발송 속도 제한
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .notifier import NotificationResult
+
+logger = logging.getLogger(__name__)
+
+
+# 발송 함수: (text, options) -> NotificationResult 또는 bool
+DeliverySender = Callable[[str, Dict[str, Any]], Any]
+
+
+class DeliveryStatus(Enum):
+    """발송 상태"""
+    PENDING = "pending"
+    DELIVERED = "delivered"
+    FAILED = "failed"
+    FILTERED = "filtered"
+
+
+@dataclass
+class DeliveryConfig:
+    """발송 큐 설정"""
+    # 아웃박스 파일 경로 (None이면 메모리 전용)
+    outbox_path: Optional[str] = None
+
+    # 병합 설정
+    coalesce_window_seconds: float = 5.0
+    coalesce_max_items: int = 20
+    coalesce_max_chars: int = 3500  # 텔레그램 메시지 한도(4096) 이하
+    coalesce_separator: str = "\n\n"
+
+    # 재시도 설정
+    max_attempts: int = 5
+    retry_base_delay: float = 2.0  # 초
+    retry_max_delay: float = 300.0  # 초
+
+    # 워커 최대 대기 시간 (초)
+    idle_wait_seconds: float = 1.0
+
+    # ack 누적 개수가 이 값을 넘으면 아웃박스 압축
+    compact_threshold: int = 200
+
+
+@dataclass
+class DeliveryItem:
+    """발송 대기 항목"""
+    item_id: str
+    target: str
+    text: str
+    coalesce_key: Optional[str] = None
+    options: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    created_at: float = field(default_factory=time.time)
+    next_attempt_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'item_id': self.item_id,
+            'target': self.target,
+            'text': self.text,
+            'coalesce_key': self.coalesce_key,
+            'options': self.options,
+            'attempts': self.attempts,
+            'created_at': self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DeliveryItem':
+        return cls(
+            item_id=data['item_id'],
+            target=data['target'],
+            text=data['text'],
+            coalesce_key=data.get('coalesce_key'),
+            options=data.get('options') or {},
+            attempts=data.get('attempts', 0),
+            created_at=data.get('created_at', time.time()),
+        )
+
+
+class DeliveryHandle:
+    """
+    발송 핸들
+
+    submit 직후 반환되며, 필요 시 wait()로 발송 완료를 기다릴 수 있습니다.
+    """
+
+    def __init__(self, delivery_id: str, target: str):
+        self.delivery_id = delivery_id
+        self.target = target
+        self.status = DeliveryStatus.PENDING
+        self.result: Optional[NotificationResult] = None
+        self._event = threading.Event()
+
+    def done(self) -> bool:
+        """완료 여부 (성공/실패 무관)"""
+        return self._event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        발송 완료 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 제한 시간 내 발송 성공 여부
+        """
+        self._event.wait(timeout)
+        return self.status == DeliveryStatus.DELIVERED
+
+    def _resolve(self, status: DeliveryStatus, result: NotificationResult) -> None:
+        self.status = status
+        self.result = result
+        self._event.set()
+
+    @classmethod
+    def resolved(
+        cls,
+        target: str,
+        status: DeliveryStatus,
+        error: str = "",
+    ) -> 'DeliveryHandle':
+        """이미 완료된 핸들 생성 (필터링된 알림 등)"""
+        handle = cls(uuid.uuid4().hex[:12], target)
+        handle._resolve(status, NotificationResult(
+            success=status == DeliveryStatus.DELIVERED,
+            alert_id=handle.delivery_id,
+            error=error,
+        ))
+        return handle
+
+
+class DeliveryOutbox:
+    """
+    JSONL 아웃박스
+
+    put/ack 레코드를 append-only로 기록하고, 로드 시 ack되지 않은 항목만 복원합니다.
+    """
+
+    def __init__(self, path: Optional[str], compact_threshold: int = 200):
+        self._path = Path(path) if path else None
+        self._compact_threshold = compact_threshold
+        self._ack_since_compact = 0
+        self._lock = threading.Lock()
+
+        if self._path:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self._path is not None
+
+    def load(self) -> List[DeliveryItem]:
+        """미발송 항목 복원 후 파일 압축"""
+        if not self._path or not self._path.exists():
+            return []
+
+        pending: Dict[str, DeliveryItem] = {}
+        with self._lock:
+            with open(self._path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 중단된 마지막 줄 등은 무시
+                        logger.warning(f"손상된 아웃박스 레코드 무시: {line[:80]}")
+                        continue
+
+                    if record.get('op') == 'put':
+                        item = DeliveryItem.from_dict(record['item'])
+                        pending[item.item_id] = item
+                    elif record.get('op') == 'ack':
+                        for item_id in record.get('ids', []):
+                            pending.pop(item_id, None)
+
+        items = list(pending.values())
+        self.compact(items)
+        return items
+
+    def append(self, item: DeliveryItem) -> None:
+        """항목 기록"""
+        self._write_lines([{'op': 'put', 'item': item.to_dict()}])
+
+    def ack(self, item_ids: List[str], pending: Optional[List[DeliveryItem]] = None) -> None:
+        """
+        완료 항목 기록
+
+        Args:
+            item_ids: 완료(성공/최종 실패)된 항목 ID
+            pending: 현재 대기 항목 (압축 임계치 도달 시 사용)
+        """
+        if not self._path or not item_ids:
+            return
+
+        self._write_lines([{'op': 'ack', 'ids': item_ids}])
+        self._ack_since_compact += len(item_ids)
+
+        if pending is not None and self._ack_since_compact >= self._compact_threshold:
+            self.compact(pending)
+
+    def compact(self, pending: List[DeliveryItem]) -> None:
+        """대기 항목만 남기도록 파일 재작성 (원자적 교체)"""
+        if not self._path:
+            return
+
+        with self._lock:
+            tmp_path = self._path.with_suffix(self._path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for item in pending:
+                    f.write(json.dumps(
+                        {'op': 'put', 'item': item.to_dict()},
+                        ensure_ascii=False,
+                    ) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._path)
+            self._ack_since_compact = 0
+
+    def _write_lines(self, records: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            with open(self._path, 'a', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+
+
+class TargetRateLimiter:
+    """
+    대상(채팅)별 발송 속도 제한
+
+    RateLimitConfig의 per_chat_max_per_minute, per_chat_min_interval_seconds를 사용합니다.
+    """
+
+    def __init__(self, max_per_minute: int, min_interval_seconds: float):
+        self._max_per_minute = max_per_minute
+        self._min_interval = min_interval_seconds
+        self._sent: Dict[str, Deque[float]] = {}
+
+    def next_allowed_at(self, target: str, now: float) -> float:
+        """다음 발송 가능 시각 (now 이하이면 즉시 가능)"""
+        sent = self._sent.get(target)
+        if not sent:
+            return now
+
+        while sent and sent[0] <= now - 60.0:
+            sent.popleft()
+
+        allowed = now
+        if sent:
+            allowed = max(allowed, sent[-1] + self._min_interval)
+        if self._max_per_minute > 0 and len(sent) >= self._max_per_minute:
+            allowed = max(allowed, sent[0] + 60.0)
+        return allowed
+
+    def record(self, target: str, now: float) -> None:
+        self._sent.setdefault(target, deque()).append(now)
+
+    def defer(self, target: str, until: float) -> None:
+        """서버 Retry-After 등으로 대상 발송을 until까지 보류"""
+        sent = self._sent.setdefault(target, deque())
+        sent.append(until - self._min_interval)
+
+
+class DeliveryQueue:
+    """
+    비동기 알림 발송 큐
+
+    Usage:
+        queue = DeliveryQueue(DeliveryConfig(outbox_path="data/notifications/outbox.jsonl"))
+        queue.register_target("telegram", lambda text, opts: notifier.send_raw(text))
+        handle = queue.submit("telegram", "메시지", coalesce_key="batch_summary")
+    """
+
+    def __init__(
+        self,
+        config: Optional[DeliveryConfig] = None,
+        rate_limit_config: Optional[Any] = None,
+    ):
+        """
+        Args:
+            config: 발송 큐 설정
+            rate_limit_config: RateLimitConfig (대상별 속도 제한)
+        """
+        # 순환 import 방지
+        from .notification_manager import RateLimitConfig
+
+        self.config = config or DeliveryConfig()
+        rate_config = rate_limit_config or RateLimitConfig()
+        self._limiter = TargetRateLimiter(
+            max_per_minute=rate_config.per_chat_max_per_minute,
+            min_interval_seconds=rate_config.per_chat_min_interval_seconds,
+        )
+
+        self._senders: Dict[str, DeliverySender] = {}
+        self._pending: List[DeliveryItem] = []
+        self._handles: Dict[str, DeliveryHandle] = {}
+
+        self._outbox = DeliveryOutbox(
+            self.config.outbox_path,
+            compact_threshold=self.config.compact_threshold,
+        )
+
+        self._cond = threading.Condition()
+        self._worker_thread: Optional[threading.Thread] = None
+        self._running: bool = False
+        self._flushing: bool = False
+        self._in_flight: int = 0
+
+        # 통계
+        self._submitted_count: int = 0
+        self._delivered_count: int = 0
+        self._failed_count: int = 0
+        self._retry_count: int = 0
+        self._coalesced_count: int = 0
+        self._recovered_count: int = 0
+
+        self._recover()
+
+    def _recover(self) -> None:
+        """아웃박스에서 미발송 항목 복원"""
+        try:
+            items = self._outbox.load()
+        except Exception as e:
+            logger.error(f"아웃박스 복원 실패: {e}", exc_info=True)
+            return
+
+        for item in items:
+            self._pending.append(item)
+            self._handles[item.item_id] = DeliveryHandle(item.item_id, item.target)
+
+        if items:
+            self._recovered_count = len(items)
+            logger.info(f"미발송 알림 {len(items)}건 복원")
+
+    def register_target(self, target: str, sender: DeliverySender) -> None:
+        """
+        발송 대상 등록
+
+        Args:
+            target: 대상 이름 (채널명 또는 채팅 키)
+            sender: 발송 함수 (text, options) -> NotificationResult 또는 bool
+        """
+        with self._cond:
+            self._senders[target] = sender
+            self._cond.notify()
+
+    def submit(
+        self,
+        target: str,
+        text: str,
+        coalesce_key: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> DeliveryHandle:
+        """
+        발송 요청 (즉시 반환)
+
+        Args:
+            target: 발송 대상
+            text: 메시지
+            coalesce_key: 병합 키 (같은 키의 메시지는 윈도우 내에서 하나로 병합)
+            options: 발송 옵션 (sender에 전달)
+
+        Returns:
+            DeliveryHandle: 발송 핸들
+        """
+        item = DeliveryItem(
+            item_id=uuid.uuid4().hex[:12],
+            target=target,
+            text=text,
+            coalesce_key=coalesce_key,
+            options=dict(options or {}),
+        )
+        handle = DeliveryHandle(item.item_id, target)
+
+        with self._cond:
+            # 아웃박스 기록과 대기열 추가를 같은 락 안에서 처리 (압축 시 누락 방지)
+            try:
+                self._outbox.append(item)
+            except Exception as e:
+                # 영속화 실패해도 메모리 큐로 발송은 계속
+                logger.warning(f"아웃박스 기록 실패: {e}")
+
+            self._pending.append(item)
+            self._handles[item.item_id] = handle
+            self._submitted_count += 1
+            self._cond.notify()
+
+        if not self._running:
+            self.start()
+
+        return handle
+
+    def start(self) -> None:
+        """워커 스레드 시작"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+
+        self._worker_thread = threading.Thread(
+            target=self._worker_loop,
+            name="notification-delivery",
+            daemon=True,
+        )
+        self._worker_thread.start()
+        logger.info("알림 발송 워커 시작")
+
+    def stop(self, flush: bool = True, timeout: float = 10.0) -> None:
+        """
+        워커 스레드 중지
+
+        Args:
+            flush: 대기 중 항목을 먼저 발송할지 여부
+            timeout: 최대 대기 시간 (초)
+        """
+        if flush:
+            self.flush(timeout)
+
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+        if self._worker_thread:
+            self._worker_thread.join(timeout=timeout)
+            self._worker_thread = None
+        logger.info("알림 발송 워커 중지")
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        병합 윈도우를 무시하고 대기 항목을 즉시 발송
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 제한 시간 내 발송 가능한 항목이 모두 처리되었는지 여부
+        """
+        if not self._running:
+            self.start()
+
+        deadline = time.time() + timeout
+        with self._cond:
+            self._flushing = True
+            self._cond.notify_all()
+            try:
+                while self._has_deliverable() or self._in_flight:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return False
+                    self._cond.wait(min(remaining, self.config.idle_wait_seconds))
+                return True
+            finally:
+                self._flushing = False
+
+    def _has_deliverable(self) -> bool:
+        return any(item.target in self._senders for item in self._pending)
+
+    def _worker_loop(self) -> None:
+        """워커 루프"""
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+
+                group, wait_seconds = self._take_ready_group(time.time())
+                if group is None:
+                    self._cond.wait(wait_seconds)
+                    continue
+                self._in_flight += 1
+
+            try:
+                self._deliver_group(group)
+            except Exception as e:
+                logger.error(f"알림 발송 워커 오류: {e}", exc_info=True)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def _take_ready_group(
+        self,
+        now: float,
+    ) -> Tuple[Optional[List[DeliveryItem]], float]:
+        """
+        발송 가능한 그룹을 대기열에서 꺼냄 (락 보유 상태에서 호출)
+
+        Returns:
+            (발송 그룹 또는 None, 다음 확인까지 대기 시간)
+        """
+        next_check = now + self.config.idle_wait_seconds
+        groups: Dict[Tuple[str, str], List[DeliveryItem]] = {}
+
+        for item in self._pending:
+            if item.target not in self._senders:
+                continue
+            key = (item.target, item.coalesce_key or item.item_id)
+            groups.setdefault(key, []).append(item)
+
+        for (target, _), items in groups.items():
+            due_at = max(item.next_attempt_at for item in items)
+
+            coalesce_key = items[0].coalesce_key
+            if coalesce_key and not self._flushing and len(items) < self.config.coalesce_max_items:
+                due_at = max(due_at, items[0].created_at + self.config.coalesce_window_seconds)
+
+            due_at = max(due_at, self._limiter.next_allowed_at(target, now))
+
+            if due_at > now:
+                next_check = min(next_check, due_at)
+                continue
+
+            group = self._cap_group(items)
+            taken = {item.item_id for item in group}
+            self._pending = [item for item in self._pending if item.item_id not in taken]
+            self._limiter.record(target, now)
+            return group, 0.0
+
+        return None, max(0.01, next_check - now)
+
+    def _cap_group(self, items: List[DeliveryItem]) -> List[DeliveryItem]:
+        """메시지 길이/개수 한도 내로 그룹 제한"""
+        group: List[DeliveryItem] = []
+        total_chars = 0
+        separator_len = len(self.config.coalesce_separator)
+
+        for item in items[:self.config.coalesce_max_items]:
+            added = len(item.text) + (separator_len if group else 0)
+            if group and total_chars + added > self.config.coalesce_max_chars:
+                break
+            group.append(item)
+            total_chars += added
+
+        return group
+
+    def _merge(self, group: List[DeliveryItem]) -> Tuple[str, Dict[str, Any]]:
+        """그룹을 단일 메시지로 병합"""
+        if len(group) == 1:
+            return group[0].text, group[0].options
+
+        text = self.config.coalesce_separator.join(item.text for item in group)
+        options = dict(group[0].options)
+        # 하나라도 알림음 대상이면 알림음 유지
+        if 'disable_notification' in options:
+            options['disable_notification'] = all(
+                item.options.get('disable_notification', False) for item in group
+            )
+        return text, options
+
+    def _deliver_group(self, group: List[DeliveryItem]) -> None:
+        """그룹 발송 및 결과 처리"""
+        target = group[0].target
+        sender = self._senders.get(target)
+        text, options = self._merge(group)
+
+        try:
+            raw_result = sender(text, options)
+        except Exception as e:
+            raw_result = NotificationResult(success=False, alert_id=group[0].item_id, error=str(e))
+
+        result = self._normalize_result(raw_result, group[0].item_id)
+
+        if result.success:
+            self._complete(group, DeliveryStatus.DELIVERED, result)
+            if len(group) > 1:
+                self._coalesced_count += len(group) - 1
+            return
+
+        retry_after = None
+        retryable = True
+        if isinstance(result.response, dict):
+            retry_after = result.response.get('retry_after')
+            # 발송기가 재시도 불가로 표시한 실패 (예: 텔레그램 400/403)
+            retryable = result.response.get('retryable', True)
+
+        now = time.time()
+        finished: List[DeliveryItem] = []
+        retry: List[DeliveryItem] = []
+        for item in group:
+            item.attempts += 1
+            if not retryable or item.attempts >= self.config.max_attempts:
+                finished.append(item)
+            else:
+                delay = min(
+                    self.config.retry_base_delay * (2 ** (item.attempts - 1)),
+                    self.config.retry_max_delay,
+                )
+                if retry_after:
+                    delay = max(delay, float(retry_after))
+                item.next_attempt_at = now + delay
+                retry.append(item)
+
+        # 재시도 항목을 먼저 대기열에 되돌린 뒤 완료 처리 (압축 스냅샷에 포함되도록)
+        if retry:
+            logger.warning(
+                f"알림 발송 실패, 재시도 예약 ({target}, {len(retry)}건): {result.error}"
+            )
+            with self._cond:
+                if retry_after:
+                    self._limiter.defer(target, now + float(retry_after))
+                self._retry_count += len(retry)
+                # 원래 순서 유지를 위해 앞에 삽입
+                self._pending[:0] = retry
+
+        if finished:
+            logger.error(
+                f"알림 발송 최종 실패 ({target}, {len(finished)}건): {result.error}"
+            )
+            self._complete(finished, DeliveryStatus.FAILED, result)
+
+    def _complete(
+        self,
+        items: List[DeliveryItem],
+        status: DeliveryStatus,
+        result: NotificationResult,
+    ) -> None:
+        with self._cond:
+            for item in items:
+                handle = self._handles.pop(item.item_id, None)
+                if handle:
+                    handle._resolve(status, result)
+
+            if status == DeliveryStatus.DELIVERED:
+                self._delivered_count += len(items)
+            else:
+                self._failed_count += len(items)
+
+            # 압축은 대기열 스냅샷으로 파일을 재작성하므로 submit과 같은 락 안에서 수행
+            try:
+                self._outbox.ack([item.item_id for item in items], list(self._pending))
+            except Exception as e:
+                logger.warning(f"아웃박스 ack 기록 실패: {e}")
+
+    @staticmethod
+    def _normalize_result(raw_result: Any, alert_id: str) -> NotificationResult:
+        if isinstance(raw_result, NotificationResult):
+            return raw_result
+        return NotificationResult(
+            success=bool(raw_result),
+            alert_id=alert_id,
+            error="" if raw_result else "Sender returned failure",
+        )
+
+    def pending_count(self) -> int:
+        """대기 항목 수"""
+        with self._cond:
+            return len(self._pending) + self._in_flight
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 조회"""
+        with self._cond:
+            return {
+                'running': self._running,
+                'pending': len(self._pending),
+                'in_flight': self._in_flight,
+                'submitted_count': self._submitted_count,
+                'delivered_count': self._delivered_count,
+                'failed_count': self._failed_count,
+                'retry_count': self._retry_count,
+                'coalesced_count': self._coalesced_count,
+                'recovered_count': self._recovered_count,
+                'targets': sorted(self._senders.keys()),
+                'outbox_enabled': self._outbox.enabled,
+            }
@@ -6,7 +6,7 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Union
 from dataclasses import dataclass, field
 import hashlib
 import threading
@@ -14,6 +14,7 @@ import threading
 from .alert import Alert, AlertType, AlertFormatter
 from .notifier import BaseNotifier, NotificationResult
 from .telegram_bot import TelegramNotifier, TelegramConfig
+from .delivery_queue import DeliveryQueue, DeliveryConfig, DeliveryHandle, DeliveryStatus
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,12 @@ class RateLimitConfig:
     # 종목당 시간당 최대 알림 수
     max_per_stock_per_hour: int = 10
 
+    # 채팅(발송 대상)별 분당 최대 발송 수 (DeliveryQueue)
+    per_chat_max_per_minute: int = 20
+
+    # 채팅(발송 대상)별 최소 발송 간격 (초)
+    per_chat_min_interval_seconds: float = 1.0
+
     # 유형별 쿨다운 (초)
     type_cooldown: Dict[AlertType, int] = field(default_factory=lambda: {
         AlertType.SIGNAL_BUY: 60,
@@ -60,13 +67,16 @@ class NotificationManager:
 
     def __init__(
         self,
-        rate_limit_config: Optional[RateLimitConfig] = None
+        rate_limit_config: Optional[RateLimitConfig] = None,
+        delivery_queue: Optional[DeliveryQueue] = None,
     ):
         """
         Args:
             rate_limit_config: 레이트 리밋 설정
+            delivery_queue: 비동기 발송 큐 (None이면 send_alert(wait=False) 첫 호출 시 생성)
         """
         self.rate_config = rate_limit_config or RateLimitConfig()
+        self._delivery_queue: Optional[DeliveryQueue] = delivery_queue
 
         # 알림 발송기
         self._notifiers: Dict[str, BaseNotifier] = {}
@@ -102,6 +112,9 @@ class NotificationManager:
             self._notifiers[name] = notifier
             logger.info(f"Notifier registered: {name}")
 
+        if self._delivery_queue is not None:
+            self._register_delivery_target(name, notifier)
+
     def register_telegram(
         self,
         bot_token: str,
@@ -137,20 +150,62 @@ class NotificationManager:
                 return True
         return False
 
+    def enable_async_delivery(
+        self,
+        config: Optional[DeliveryConfig] = None
+    ) -> DeliveryQueue:
+        """
+        비동기 발송 큐 활성화
+
+        Args:
+            config: 발송 큐 설정 (아웃박스 경로, 병합 윈도우 등)
+
+        Returns:
+            DeliveryQueue: 활성화된 발송 큐
+        """
+        with self._lock:
+            if self._delivery_queue is None:
+                self._delivery_queue = DeliveryQueue(config, self.rate_config)
+            notifiers = dict(self._notifiers)
+
+        for name, notifier in notifiers.items():
+            self._register_delivery_target(name, notifier)
+
+        self._delivery_queue.start()
+        return self._delivery_queue
+
+    def _register_delivery_target(self, name: str, notifier: BaseNotifier) -> None:
+        """발송기를 발송 큐 대상으로 등록"""
+        self._delivery_queue.register_target(
+            name,
+            lambda text, options, _notifier=notifier: _notifier.send_raw(text),
+        )
+
+    def flush_deliveries(self, timeout: float = 10.0) -> bool:
+        """대기 중인 비동기 알림 발송 완료 대기"""
+        if self._delivery_queue is None:
+            return True
+        return self._delivery_queue.flush(timeout)
+
     def send_alert(
         self,
         alert: Alert,
-        channels: Optional[List[str]] = None
-    ) -> Dict[str, NotificationResult]:
+        channels: Optional[List[str]] = None,
+        wait: bool = True,
+        coalesce_key: Optional[str] = None,
+    ) -> Union[Dict[str, NotificationResult], Dict[str, DeliveryHandle]]:
         """
         알림 발송
 
         Args:
             alert: 알림 객체
             channels: 발송 채널 (None이면 모든 채널)
+            wait: False이면 발송 큐에 넣고 즉시 반환
+            coalesce_key: 병합 키 (wait=False일 때 같은 키 알림을 하나로 병합)
 
         Returns:
-            Dict[str, NotificationResult]: 채널별 발송 결과
+            wait=True: Dict[str, NotificationResult] 채널별 발송 결과
+            wait=False: Dict[str, DeliveryHandle] 채널별 발송 핸들
         """
         results = {}
 
@@ -158,6 +213,10 @@ class NotificationManager:
         if not self._check_rate_limit(alert):
             self._filtered_count += 1
             logger.debug(f"Alert rate limited: {alert.alert_type.value}")
+            if not wait:
+                return {'_rate_limited': DeliveryHandle.resolved(
+                    '_rate_limited', DeliveryStatus.FILTERED, "Rate limited"
+                )}
             return {'_rate_limited': NotificationResult(
                 success=False,
                 alert_id=str(id(alert)),
@@ -168,12 +227,19 @@ class NotificationManager:
         if self._is_duplicate(alert):
             self._filtered_count += 1
             logger.debug(f"Alert deduplicated: {alert.alert_type.value}")
+            if not wait:
+                return {'_duplicate': DeliveryHandle.resolved(
+                    '_duplicate', DeliveryStatus.FILTERED, "Duplicate alert"
+                )}
             return {'_duplicate': NotificationResult(
                 success=False,
                 alert_id=str(id(alert)),
                 error="Duplicate alert",
             )}
 
+        if not wait:
+            return self._enqueue_alert(alert, channels, coalesce_key)
+
         # 발송
         with self._lock:
             target_channels = channels or list(self._notifiers.keys())
@@ -207,6 +273,47 @@ class NotificationManager:
 
         return results
 
+    def _enqueue_alert(
+        self,
+        alert: Alert,
+        channels: Optional[List[str]],
+        coalesce_key: Optional[str],
+    ) -> Dict[str, DeliveryHandle]:
+        """알림을 발송 큐에 넣고 채널별 핸들 반환"""
+        if self._delivery_queue is None:
+            self.enable_async_delivery()
+
+        handles = {}
+        with self._lock:
+            target_channels = channels or list(self._notifiers.keys())
+            targets = [
+                (name, self._notifiers[name])
+                for name in target_channels
+                if name in self._notifiers
+            ]
+
+        for channel_name, notifier in targets:
+            # 채널 필터(레벨/조용한 시간)는 큐잉 시점에 적용
+            if not notifier.should_send(alert):
+                handles[channel_name] = DeliveryHandle.resolved(
+                    channel_name, DeliveryStatus.FILTERED, "Alert filtered out"
+                )
+                continue
+
+            handles[channel_name] = self._delivery_queue.submit(
+                channel_name,
+                AlertFormatter.format_telegram(alert),
+                coalesce_key=coalesce_key,
+            )
+
+        # 큐에 들어간 알림은 발송된 것으로 간주하여 중복/레이트 리밋에 반영
+        queued = any(
+            h.status == DeliveryStatus.PENDING for h in handles.values()
+        )
+        self._record_history(alert, queued)
+
+        return handles
+
     def send_raw(
         self,
         message: str,
@@ -500,6 +607,10 @@ class NotificationManager:
             'filtered_count': self._filtered_count,
             'error_count': self._error_count,
             'notifiers': notifier_stats,
+            'delivery': (
+                self._delivery_queue.get_stats()
+                if self._delivery_queue is not None else None
+            ),
             'history_size': len(self._history),
             'rate_config': {
                 'max_per_hour': self.rate_config.max_per_hour,
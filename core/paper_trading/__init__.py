@@ -17,6 +17,7 @@ from .order_executor import (
     OrderStatus,
     ExecutionResult,
 )
+from .order_book import PendingOrderBook
 from .position_tracker import (
     PositionTracker,
     Position,
@@ -28,6 +29,15 @@ from .paper_trader import (
     PaperTradingConfig,
     TradingSession,
 )
+from .replay import (
+    ReplayConfig,
+    ReplayEngine,
+    ReplayEvent,
+    ReplayResult,
+    ReplaySessionSpec,
+    ReplayStrategy,
+    VirtualClock,
+)
 from .order_state_machine import (
     OrderStateMachine,
     OrderStateMachineManager,
@@ -49,6 +59,7 @@ __all__ = [
     'OrderSide',
     'OrderStatus',
     'ExecutionResult',
+    'PendingOrderBook',
     # Position
     'PositionTracker',
     'Position',
@@ -58,6 +69,14 @@ __all__ = [
     'PaperTrader',
     'PaperTradingConfig',
     'TradingSession',
+    # Replay
+    'ReplayConfig',
+    'ReplayEngine',
+    'ReplayEvent',
+    'ReplayResult',
+    'ReplaySessionSpec',
+    'ReplayStrategy',
+    'VirtualClock',
     # State Machine
     'OrderStateMachine',
     'OrderStateMachineManager',
@@ -0,0 +1,225 @@
+"""
+대기 주문 장부 모듈
+
+종목별로 대기 주문을 트리거 가격 순으로 정렬해 보관하여,
+가격 업데이트 시 트리거 가격을 실제로 통과한 주문만 꺼냅니다.
+
+- 하향 사다리: 가격이 트리거 이하로 내려오면 발동 (매수 지정가, 매도 스탑)
+- 상향 사다리: 가격이 트리거 이상으로 올라가면 발동 (매도 지정가, 매수 스탑)
+- 시장가 주문: 해당 종목 가격이 들어오면 즉시 발동
+"""
+
+import itertools
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Tuple
+
+from .order_executor import Order, OrderSide, OrderType
+
+_INF = float('inf')
+
+# 주문 위치 구분
+_MARKET = "market"
+_BELOW = "below"
+_ABOVE = "above"
+_DORMANT = "dormant"   # 트리거 규칙이 없는 주문 (스탑 리밋 등) - 취소 전까지 대기
+
+
+class TriggerLadder:
+    """트리거 가격 정렬 사다리
+
+    항목은 (트리거 가격, 제출 순번, 주문 ID) 튜플로 정렬 보관합니다.
+    """
+
+    __slots__ = ('fire_below', '_entries')
+
+    def __init__(self, fire_below: bool):
+        """
+        Args:
+            fire_below: True면 가격이 트리거 이하일 때, False면 이상일 때 발동
+        """
+        self.fire_below = fire_below
+        self._entries: List[Tuple[float, int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, level: float, seq: int, order_id: str):
+        insort(self._entries, (level, seq, order_id))
+
+    def remove(self, level: float, seq: int, order_id: str) -> bool:
+        key = (level, seq, order_id)
+        index = bisect_left(self._entries, key)
+        if index < len(self._entries) and self._entries[index] == key:
+            del self._entries[index]
+            return True
+        return False
+
+    def pop_crossed(self, price: float) -> List[Tuple[int, str]]:
+        """가격이 통과한 트리거 꺼내기
+
+        Returns:
+            List[Tuple[int, str]]: (제출 순번, 주문 ID)
+        """
+        if self.fire_below:
+            # 트리거 >= 가격 인 항목 (정렬 뒤쪽)
+            index = bisect_left(self._entries, (price,))
+            crossed = self._entries[index:]
+            del self._entries[index:]
+        else:
+            # 트리거 <= 가격 인 항목 (정렬 앞쪽)
+            index = bisect_right(self._entries, (price, _INF))
+            crossed = self._entries[:index]
+            del self._entries[:index]
+        return [(seq, order_id) for _, seq, order_id in crossed]
+
+    def entries(self) -> List[Tuple[int, str]]:
+        return [(seq, order_id) for _, seq, order_id in self._entries]
+
+    def levels(self) -> List[float]:
+        return [level for level, _, _ in self._entries]
+
+
+class SymbolOrderBook:
+    """단일 종목 대기 주문"""
+
+    __slots__ = ('market', 'below', 'above', 'dormant')
+
+    def __init__(self):
+        self.market: List[Tuple[int, str]] = []
+        self.below = TriggerLadder(fire_below=True)
+        self.above = TriggerLadder(fire_below=False)
+        self.dormant: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.market) + len(self.below) + len(self.above) + len(self.dormant)
+
+    def entries(self) -> List[Tuple[int, str]]:
+        """전체 대기 주문 (제출 순번, 주문 ID), 제출 순서"""
+        entries = list(self.market) + self.below.entries() + self.above.entries()
+        entries.extend((seq, order_id) for order_id, seq in self.dormant.items())
+        entries.sort()
+        return entries
+
+    def pop_triggered(self, price: float) -> List[Tuple[int, str]]:
+        triggered = self.market
+        self.market = []
+        triggered.extend(self.below.pop_crossed(price))
+        triggered.extend(self.above.pop_crossed(price))
+        return triggered
+
+
+def _classify(order: Order) -> Tuple[str, Optional[float]]:
+    """주문 → (위치, 트리거 가격)"""
+    if order.order_type == OrderType.MARKET:
+        return _MARKET, None
+
+    if order.order_type == OrderType.LIMIT and order.price is not None:
+        return (_BELOW if order.side == OrderSide.BUY else _ABOVE), order.price
+
+    if order.order_type == OrderType.STOP and order.stop_price is not None:
+        return (_ABOVE if order.side == OrderSide.BUY else _BELOW), order.stop_price
+
+    return _DORMANT, None
+
+
+class PendingOrderBook:
+    """종목별 대기 주문 장부
+
+    대기 주문 조회 순서와 발동 주문 실행 순서는 제출 순서를 따릅니다.
+    """
+
+    def __init__(self):
+        self._books: Dict[str, SymbolOrderBook] = {}
+        # 주문 ID → (종목 코드, 위치, 트리거 가격, 제출 순번), 삽입 순서 = 제출 순서
+        self._locations: Dict[str, Tuple[str, str, Optional[float], int]] = {}
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._locations
+
+    def add(self, order: Order) -> bool:
+        """대기 주문 등록 (이미 등록된 주문이면 False)"""
+        if order.id in self._locations:
+            return False
+
+        seq = next(self._seq)
+        kind, level = _classify(order)
+        book = self._books.get(order.stock_code)
+        if book is None:
+            book = self._books[order.stock_code] = SymbolOrderBook()
+
+        if kind == _MARKET:
+            book.market.append((seq, order.id))
+        elif kind == _BELOW:
+            book.below.add(level, seq, order.id)
+        elif kind == _ABOVE:
+            book.above.add(level, seq, order.id)
+        else:
+            book.dormant[order.id] = seq
+
+        self._locations[order.id] = (order.stock_code, kind, level, seq)
+        return True
+
+    def remove(self, order_id: str) -> bool:
+        """대기 주문 제거 (체결/취소/거부 시)"""
+        location = self._locations.pop(order_id, None)
+        if location is None:
+            return False
+
+        stock_code, kind, level, seq = location
+        book = self._books[stock_code]
+        if kind == _MARKET:
+            book.market.remove((seq, order_id))
+        elif kind == _BELOW:
+            book.below.remove(level, seq, order_id)
+        elif kind == _ABOVE:
+            book.above.remove(level, seq, order_id)
+        else:
+            book.dormant.pop(order_id, None)
+
+        if not book:
+            del self._books[stock_code]
+        return True
+
+    def pop_triggered(self, prices: Dict[str, float]) -> List[Tuple[str, float]]:
+        """가격 업데이트로 발동된 주문 꺼내기
+
+        대기 주문이 있는 종목의 사다리만 확인하며, 발동된 주문만 장부에서 제거합니다.
+
+        Args:
+            prices: {종목코드: 현재가}
+
+        Returns:
+            List[Tuple[str, float]]: 제출 순서로 정렬된 (주문 ID, 체결 기준가)
+        """
+        triggered: List[Tuple[int, str, float]] = []
+        for stock_code, price in prices.items():
+            book = self._books.get(stock_code)
+            if book is None or price is None:
+                continue
+
+            for seq, order_id in book.pop_triggered(price):
+                self._locations.pop(order_id, None)
+                triggered.append((seq, order_id, price))
+
+            if not book:
+                del self._books[stock_code]
+
+        triggered.sort()
+        return [(order_id, price) for _, order_id, price in triggered]
+
+    def order_ids(self, stock_code: Optional[str] = None) -> List[str]:
+        """대기 주문 ID (제출 순서)"""
+        if stock_code is None:
+            return list(self._locations)
+        book = self._books.get(stock_code)
+        return [order_id for _, order_id in book.entries()] if book else []
+
+    def symbols(self) -> List[str]:
+        return list(self._books)
+
+    def get_book(self, stock_code: str) -> Optional[SymbolOrderBook]:
+        return self._books.get(stock_code)
@@ -6,7 +6,7 @@
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
@@ -141,21 +141,39 @@ class OrderExecutor:
     주문 실행기
 
     가상 주문을 생성하고 실행합니다.
+    대기 주문은 종목별 트리거 가격 정렬 장부(PendingOrderBook)로 관리하여
+    가격 업데이트 시 트리거를 통과한 주문만 확인합니다.
     """
 
-    def __init__(self, portfolio):
+    def __init__(self, portfolio, clock: Optional[Callable[[], datetime]] = None):
         """
         Args:
             portfolio: VirtualPortfolio 인스턴스
+            clock: 현재 시각 함수 (None이면 datetime.now, 리플레이 시 가상 시계)
         """
         from .virtual_portfolio import VirtualPortfolio
+        from .order_book import PendingOrderBook
         self.portfolio: VirtualPortfolio = portfolio
+        self._clock = clock or datetime.now
 
         # 주문 관리
         self._orders: Dict[str, Order] = {}
-        self._pending_orders: List[str] = []
+        self._pending_book = PendingOrderBook()
         self._order_history: List[Order] = []
 
+        # 보조 인덱스 (종목별 주문/체결 이력, 상태별 주문)
+        self._orders_by_code: Dict[str, List[str]] = {}
+        self._history_by_code: Dict[str, List[Order]] = {}
+        self._orders_by_status: Dict[OrderStatus, Dict[str, None]] = {
+            status: {} for status in OrderStatus
+        }
+
+    def _set_status(self, order: Order, status: OrderStatus):
+        """주문 상태 변경 (상태 인덱스 동기화)"""
+        self._orders_by_status[order.status].pop(order.id, None)
+        order.status = status
+        self._orders_by_status[status][order.id] = None
+
     def create_order(
         self,
         stock_code: str,
@@ -201,9 +219,12 @@ class OrderExecutor:
             strategy=strategy,
             signal_source=signal_source or [],
             notes=notes,
+            created_at=self._clock(),
         )
 
         self._orders[order_id] = order
+        self._orders_by_code.setdefault(stock_code, []).append(order_id)
+        self._orders_by_status[order.status][order_id] = None
 
         logger.info(
             f"Order created: {order_id} - {side.value.upper()} "
@@ -240,16 +261,11 @@ class OrderExecutor:
                 message="Order already complete",
             )
 
-        order.status = OrderStatus.SUBMITTED
-        order.submitted_at = datetime.now()
+        self._set_status(order, OrderStatus.SUBMITTED)
+        order.submitted_at = self._clock()
 
-        # 시장가 주문은 즉시 실행 시도
-        if order.order_type == OrderType.MARKET:
-            self._pending_orders.append(order_id)
-
-        # 지정가/스탑 주문은 대기열에 추가
-        else:
-            self._pending_orders.append(order_id)
+        # 시장가 주문은 다음 가격에 즉시 발동, 지정가/스탑 주문은 트리거 사다리에 등록
+        self._pending_book.add(order)
 
         return ExecutionResult(
             success=True,
@@ -297,19 +313,19 @@ class OrderExecutor:
                 quantity=order.quantity,
             )
 
+        # 대기열에서 제거 (체결/거부 모두 완료 상태)
+        self._pending_book.remove(order_id)
+
         if result['success']:
-            order.status = OrderStatus.FILLED
+            self._set_status(order, OrderStatus.FILLED)
             order.filled_quantity = order.quantity
             order.filled_price = result['price']
             order.commission = result['commission']
-            order.filled_at = datetime.now()
-
-            # 대기열에서 제거
-            if order_id in self._pending_orders:
-                self._pending_orders.remove(order_id)
+            order.filled_at = self._clock()
 
             # 히스토리 추가
             self._order_history.append(order)
+            self._history_by_code.setdefault(order.stock_code, []).append(order)
 
             return ExecutionResult(
                 success=True,
@@ -322,7 +338,7 @@ class OrderExecutor:
                 pnl=result.get('realized_pnl', 0.0),
             )
         else:
-            order.status = OrderStatus.REJECTED
+            self._set_status(order, OrderStatus.REJECTED)
 
             return ExecutionResult(
                 success=False,
@@ -346,35 +362,10 @@ class OrderExecutor:
         """
         results = []
 
-        for order_id in list(self._pending_orders):
-            order = self._orders.get(order_id)
-            if not order:
-                continue
-
-            price = current_prices.get(order.stock_code)
-            if price is None:
-                continue
-
-            should_execute = False
-
-            if order.order_type == OrderType.MARKET:
-                should_execute = True
-
-            elif order.order_type == OrderType.LIMIT:
-                if order.is_buy and price <= order.price:
-                    should_execute = True
-                elif order.is_sell and price >= order.price:
-                    should_execute = True
-
-            elif order.order_type == OrderType.STOP:
-                if order.is_buy and price >= order.stop_price:
-                    should_execute = True
-                elif order.is_sell and price <= order.stop_price:
-                    should_execute = True
-
-            if should_execute:
-                result = self.execute_market_order(order_id, price)
-                results.append(result)
+        # 트리거를 통과한 주문만 제출 순서대로 실행
+        for order_id, price in self._pending_book.pop_triggered(current_prices):
+            if order_id in self._orders:
+                results.append(self.execute_market_order(order_id, price))
 
         return results
 
@@ -406,10 +397,8 @@ class OrderExecutor:
                 message="Order already complete",
             )
 
-        order.status = OrderStatus.CANCELLED
-
-        if order_id in self._pending_orders:
-            self._pending_orders.remove(order_id)
+        self._set_status(order, OrderStatus.CANCELLED)
+        self._pending_book.remove(order_id)
 
         return ExecutionResult(
             success=True,
@@ -426,7 +415,7 @@ class OrderExecutor:
             int: 취소된 주문 수
         """
         count = 0
-        for order_id in list(self._pending_orders):
+        for order_id in self._pending_book.order_ids():
             result = self.cancel_order(order_id)
             if result.success:
                 count += 1
@@ -437,34 +426,50 @@ class OrderExecutor:
         """주문 조회"""
         return self._orders.get(order_id)
 
-    def get_pending_orders(self) -> List[Order]:
-        """대기 주문 목록"""
+    def get_pending_orders(self, stock_code: Optional[str] = None) -> List[Order]:
+        """대기 주문 목록 (제출 순서)"""
         return [
-            self._orders[oid] for oid in self._pending_orders
+            self._orders[oid] for oid in self._pending_book.order_ids(stock_code)
             if oid in self._orders
         ]
 
+    def get_orders(
+        self,
+        stock_code: Optional[str] = None,
+        status: Optional[OrderStatus] = None
+    ) -> List[Order]:
+        """주문 조회 (종목/상태 인덱스 사용, 생성 순서)"""
+        if stock_code is not None:
+            orders = [self._orders[oid] for oid in self._orders_by_code.get(stock_code, [])]
+            if status is not None:
+                orders = [o for o in orders if o.status == status]
+            return orders
+
+        if status is not None:
+            return [self._orders[oid] for oid in self._orders_by_status[status]]
+
+        return list(self._orders.values())
+
     def get_order_history(
         self,
         stock_code: Optional[str] = None,
         limit: Optional[int] = None
     ) -> List[Order]:
-        """주문 이력"""
+        """주문 이력 (내부 목록의 사본)"""
         history = self._order_history
 
         if stock_code:
-            history = [o for o in history if o.stock_code == stock_code]
+            history = self._history_by_code.get(stock_code, [])
 
         if limit:
-            history = history[-limit:]
+            return history[-limit:]
 
-        return history
+        return list(history)
 
     def get_stats(self) -> Dict[str, Any]:
         """통계"""
         filled_orders = [
-            o for o in self._order_history
-            if o.status == OrderStatus.FILLED
+            self._orders[oid] for oid in self._orders_by_status[OrderStatus.FILLED]
         ]
 
         buy_orders = [o for o in filled_orders if o.is_buy]
@@ -472,7 +477,7 @@ class OrderExecutor:
 
         return {
             'total_orders': len(self._orders),
-            'pending_orders': len(self._pending_orders),
+            'pending_orders': len(self._pending_book),
             'filled_orders': len(filled_orders),
             'buy_orders': len(buy_orders),
             'sell_orders': len(sell_orders),
@@ -79,13 +79,16 @@ class TradingSession:
     # 기록
     trade_log: List[Dict] = field(default_factory=list)
 
+    # 현재 시각 함수 (PaperTrader의 clock, 리플레이 시 가상 시계)
+    clock: Callable[[], datetime] = field(default=datetime.now, repr=False, compare=False)
+
     @property
     def is_active(self) -> bool:
         return self.end_time is None
 
     @property
     def duration_minutes(self) -> float:
-        end = self.end_time or datetime.now()
+        end = self.end_time or self.clock()
         return (end - self.start_time).total_seconds() / 60
 
     @property
@@ -123,15 +126,18 @@ class PaperTrader:
     def __init__(
         self,
         config: Optional[PaperTradingConfig] = None,
-        notification_callback: Optional[Callable] = None
+        notification_callback: Optional[Callable] = None,
+        clock: Optional[Callable[[], datetime]] = None,
     ):
         """
         Args:
             config: 페이퍼 트레이딩 설정
             notification_callback: 알림 콜백 함수
+            clock: 현재 시각 함수 (None이면 datetime.now, 리플레이 시 가상 시계)
         """
         self.config = config or PaperTradingConfig()
         self._notify = notification_callback
+        self._clock = clock or datetime.now
 
         # 포트폴리오 설정
         portfolio_config = PortfolioConfig(
@@ -142,9 +148,9 @@ class PaperTrader:
         )
 
         # 핵심 컴포넌트
-        self.portfolio = VirtualPortfolio(portfolio_config)
-        self.executor = OrderExecutor(self.portfolio)
-        self.tracker = PositionTracker()
+        self.portfolio = VirtualPortfolio(portfolio_config, clock=self._clock)
+        self.executor = OrderExecutor(self.portfolio, clock=self._clock)
+        self.tracker = PositionTracker(clock=self._clock)
 
         # 세션 관리
         self._current_session: Optional[TradingSession] = None
@@ -176,12 +182,13 @@ class PaperTrader:
             logger.warning("Session already active, closing previous session")
             self.end_session()
 
-        session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        session_id = session_id or self._clock().strftime("%Y%m%d_%H%M%S")
 
         self._current_session = TradingSession(
             session_id=session_id,
-            start_time=datetime.now(),
+            start_time=self._clock(),
             start_balance=self.portfolio.total_value,
+            clock=self._clock,
         )
 
         # 일일 통계 리셋 (새 날짜일 경우)
@@ -205,7 +212,7 @@ class PaperTrader:
             return None
 
         session = self._current_session
-        session.end_time = datetime.now()
+        session.end_time = self._clock()
         session.end_balance = self.portfolio.total_value
         session.unrealized_pnl = self._calculate_unrealized_pnl()
 
@@ -629,7 +636,7 @@ class PaperTrader:
 
         # 거래 로그
         session.trade_log.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._clock().isoformat(),
             'side': side,
             'order_id': result.order_id,
             'price': result.filled_price,
@@ -648,7 +655,7 @@ class PaperTrader:
         """일일 통계 리셋 (필요시)"""
         # 세션이 없거나 새 날짜인 경우
         if (not self._session_history or
-            self._session_history[-1].start_time.date() != datetime.now().date()):
+            self._session_history[-1].start_time.date() != self._clock().date()):
             self._daily_pnl = 0.0
             self._daily_trades = 0
             self._trading_paused = False
@@ -659,7 +666,7 @@ class PaperTrader:
         days: int = 30
     ) -> List[Dict]:
         """세션 이력"""
-        cutoff = datetime.now() - timedelta(days=days)
+        cutoff = self._clock() - timedelta(days=days)
         sessions = [
             s for s in self._session_history
             if s.start_time >= cutoff
@@ -718,7 +725,7 @@ class PaperTrader:
     def export_state(self) -> Dict[str, Any]:
         """상태 내보내기"""
         return {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._clock().isoformat(),
             'config': {
                 'initial_capital': self.config.initial_capital,
                 'commission_rate': self.config.commission_rate,
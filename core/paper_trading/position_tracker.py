@@ -6,7 +6,7 @@
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -52,6 +52,9 @@ class Position:
     take_profit: Optional[float] = None
     trailing_stop: Optional[float] = None
 
+    # 현재 시각 함수 (PositionTracker의 clock, 리플레이 시 가상 시계)
+    clock: Callable[[], datetime] = field(default=datetime.now, repr=False, compare=False)
+
     @property
     def unrealized_pnl(self) -> float:
         """미실현 손익"""
@@ -82,7 +85,7 @@ class Position:
     @property
     def holding_days(self) -> int:
         """보유 일수"""
-        return (datetime.now() - self.entry_date).days
+        return (self.clock() - self.entry_date).days
 
     @property
     def market_value(self) -> float:
@@ -204,7 +207,13 @@ class PositionTracker:
     모든 포지션의 상태와 성과를 추적합니다.
     """
 
-    def __init__(self):
+    def __init__(self, clock: Optional[Callable[[], datetime]] = None):
+        """
+        Args:
+            clock: 현재 시각 함수 (None이면 datetime.now, 리플레이 시 가상 시계)
+        """
+        self._clock = clock or datetime.now
+
         # 활성 포지션 {stock_code: Position}
         self._positions: Dict[str, Position] = {}
 
@@ -254,7 +263,7 @@ class PositionTracker:
             stock_name=stock_name,
             entry_price=entry_price,
             entry_quantity=quantity,
-            entry_date=datetime.now(),
+            entry_date=self._clock(),
             current_quantity=quantity,
             current_price=entry_price,
             strategy=strategy,
@@ -262,6 +271,7 @@ class PositionTracker:
             stop_loss=stop_loss,
             take_profit=take_profit,
             trailing_stop=trailing_stop,
+            clock=self._clock,
         )
 
         self._positions[stock_code] = position
@@ -341,7 +351,7 @@ class PositionTracker:
         # 포지션 업데이트
         position.exit_prices.append(exit_price)
         position.exit_quantities.append(close_qty)
-        position.exit_dates.append(datetime.now())
+        position.exit_dates.append(self._clock())
         position.realized_pnl += pnl
         position.current_quantity -= close_qty
 
@@ -590,7 +600,7 @@ class PositionTracker:
     ) -> None:
         """이벤트 기록"""
         self._position_history.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._clock().isoformat(),
             'event_type': event_type,
             'stock_code': position.stock_code,
             'stock_name': position.stock_name,
@@ -617,7 +627,7 @@ class PositionTracker:
     def export_positions(self) -> Dict[str, Any]:
         """포지션 데이터 내보내기"""
         return {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._clock().isoformat(),
             'open_positions': [p.to_dict() for p in self._positions.values()],
             'closed_positions': [p.to_dict() for p in self._closed_positions],
             'summary': self.get_summary().to_dict(),
@@ -0,0 +1,442 @@
+"""
+과거 분봉/체결 리플레이 모듈
+
+디스크에 저장된 분봉(get_minute_bars) 또는 체결(get_tick_conclusions) 데이터를
+가상 시계 기준으로 PaperTrader에 최대 속도로 흘려보내, PositionTracker 손절/익절과
+OrderExecutor 대기 주문 로직을 실시간보다 빠르게 평가합니다.
+
+- 이벤트 순서: (시각, 종목 코드, 원본 순번) 으로 결정적 정렬
+- 같은 시각 이벤트는 하나의 update_prices 호출로 묶음 (같은 종목이 반복되면 분리)
+- 세션(일자 × 종목)을 프로세스 풀에서 병렬 실행, 결과는 입력 순서 유지
+
+저장 구조: {root}/{YYYYMMDD}/{종목코드}_{bars|ticks}.csv (KIS 원본 컬럼 그대로 저장 가능)
+"""
+
+import heapq
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from .paper_trader import PaperTrader, PaperTradingConfig
+from .order_executor import ExecutionResult
+
+logger = logging.getLogger(__name__)
+
+REPLAY_DATA_DIR = "data/replay"
+
+KIND_BARS = "bars"
+KIND_TICKS = "ticks"
+
+# 분봉 내부 가격 경로 (보수적 경로: 양봉은 시가→저가→고가→종가, 음봉은 시가→고가→저가→종가)
+BAR_PATH_OHLC = "ohlc"
+BAR_PATH_CLOSE = "close"
+_BAR_PATH_OFFSETS = (0, 15, 30, 45)   # 초
+
+# KIS 원본 컬럼 → 표준 컬럼
+_COLUMN_ALIASES = {
+    'date': ('stck_bsop_date', 'date'),
+    'time': ('stck_cntg_hour', 'time'),
+    'open': ('stck_oprc', 'open'),
+    'high': ('stck_hgpr', 'high'),
+    'low': ('stck_lwpr', 'low'),
+    'close': ('stck_prpr', 'close', 'price'),
+    'volume': ('cntg_vol', 'volume'),
+}
+
+
+class ReplayEvent(NamedTuple):
+    """가격 이벤트 (튜플 비교 = 결정적 정렬 순서)"""
+    timestamp: datetime
+    stock_code: str
+    seq: int
+    price: float
+    volume: float
+
+
+class VirtualClock:
+    """리플레이 가상 시계 (PaperTrader 등의 clock 인자로 전달)"""
+
+    def __init__(self, start: Optional[datetime] = None):
+        self._now = start or datetime(1970, 1, 1)
+
+    def __call__(self) -> datetime:
+        return self._now
+
+    def now(self) -> datetime:
+        return self._now
+
+    def advance_to(self, timestamp: datetime):
+        if timestamp < self._now:
+            raise ValueError(f"가상 시계는 되돌릴 수 없습니다: {timestamp} < {self._now}")
+        self._now = timestamp
+
+
+class ReplayStrategy:
+    """리플레이 전략 기본 클래스
+
+    필요한 훅만 재정의합니다. 프로세스 병렬 실행 시 모듈 최상위에 정의된
+    클래스(또는 팩토리 함수)여야 합니다.
+    """
+
+    def on_start(self, trader: PaperTrader, session_id: str) -> None:
+        pass
+
+    def on_prices(self, trader: PaperTrader, timestamp: datetime,
+                  prices: Dict[str, float], fills: List[ExecutionResult]) -> None:
+        pass
+
+    def on_end(self, trader: PaperTrader) -> None:
+        pass
+
+
+@dataclass
+class ReplayConfig:
+    """리플레이 설정"""
+    trading: PaperTradingConfig = field(default_factory=PaperTradingConfig)
+    bar_path: str = BAR_PATH_OHLC
+    close_at_end: bool = True            # 세션 종료 시 잔여 포지션 청산
+    max_workers: int = 0                 # 0이면 CPU 수
+    quiet: bool = True                   # 워커 프로세스의 주문 단위 INFO 로그 억제
+
+
+@dataclass
+class ReplaySessionSpec:
+    """리플레이 세션 (일자 × 종목)"""
+    session_id: str
+    trade_date: str                      # YYYYMMDD
+    stock_codes: List[str]
+    kind: str = KIND_BARS
+    root: str = REPLAY_DATA_DIR
+
+
+@dataclass
+class ReplayResult:
+    """리플레이 세션 결과"""
+    session_id: str
+    events: int = 0
+    steps: int = 0
+    trades: int = 0
+    realized_pnl: float = 0.0
+    commission: float = 0.0
+    start_value: float = 0.0
+    final_value: float = 0.0
+    elapsed_seconds: float = 0.0
+    trade_log: List[Dict] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def return_pct(self) -> float:
+        if self.start_value <= 0:
+            return 0.0
+        return (self.final_value - self.start_value) / self.start_value * 100
+
+    @property
+    def events_per_sec(self) -> float:
+        return self.events / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'session_id': self.session_id,
+            'events': self.events,
+            'steps': self.steps,
+            'trades': self.trades,
+            'realized_pnl': self.realized_pnl,
+            'commission': self.commission,
+            'start_value': self.start_value,
+            'final_value': self.final_value,
+            'return_pct': self.return_pct,
+            'elapsed_seconds': self.elapsed_seconds,
+            'events_per_sec': self.events_per_sec,
+            'error': self.error,
+        }
+
+
+# =============================================================================
+# 저장/로드
+# =============================================================================
+
+def replay_file_path(stock_code: str, trade_date: str, kind: str = KIND_BARS,
+                     root: str = REPLAY_DATA_DIR) -> Path:
+    return Path(root) / trade_date / f"{stock_code}_{kind}.csv"
+
+
+def save_replay_frame(df: pd.DataFrame, stock_code: str, trade_date: str,
+                      kind: str = KIND_BARS, root: str = REPLAY_DATA_DIR) -> Path:
+    """get_minute_bars / get_tick_conclusions 결과 저장 (원본 컬럼 유지)"""
+    path = replay_file_path(stock_code, trade_date, kind, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, index=False)
+    return path
+
+
+def _column(df: pd.DataFrame, name: str) -> Optional[pd.Series]:
+    for alias in _COLUMN_ALIASES[name]:
+        if alias in df.columns:
+            return df[alias]
+    return None
+
+
+def _numeric(series: Optional[pd.Series], default: float = 0.0) -> np.ndarray:
+    if series is None:
+        return None
+    return pd.to_numeric(series, errors='coerce').fillna(default).to_numpy(dtype=float)
+
+
+def _timestamps(df: pd.DataFrame, trade_date: str) -> pd.Series:
+    times = _column(df, 'time')
+    if times is None:
+        raise ValueError("시각 컬럼이 없습니다 (stck_cntg_hour/time)")
+    times = times.astype(str).str.replace(':', '', regex=False).str.zfill(6)
+
+    dates = _column(df, 'date')
+    dates = dates.astype(str).str.replace('-', '', regex=False) if dates is not None else trade_date
+    return pd.to_datetime(dates + times, format="%Y%m%d%H%M%S")
+
+
+def frame_to_events(df: pd.DataFrame, stock_code: str, trade_date: str,
+                    kind: str = KIND_BARS, bar_path: str = BAR_PATH_OHLC) -> List[ReplayEvent]:
+    """저장된 분봉/체결 DataFrame → 시간순 이벤트
+
+    KIS 응답은 최신순이므로 시간 역순이면 뒤집은 뒤 안정 정렬합니다
+    (같은 시각 체결은 원본 순서 유지).
+    """
+    if df is None or df.empty:
+        return []
+
+    timestamps = _timestamps(df, trade_date)
+    if len(timestamps) > 1 and timestamps.iloc[0] > timestamps.iloc[-1]:
+        df = df.iloc[::-1].reset_index(drop=True)
+        timestamps = timestamps.iloc[::-1].reset_index(drop=True)
+
+    order = np.argsort(timestamps.to_numpy(), kind='stable')
+    stamps = timestamps.to_numpy()[order]
+    close = _numeric(_column(df, 'close'))
+    if close is None:
+        raise ValueError("가격 컬럼이 없습니다 (stck_prpr/close)")
+    close = close[order]
+    volume = _numeric(_column(df, 'volume'))
+    volume = volume[order] if volume is not None else np.zeros(len(close))
+
+    if kind == KIND_TICKS or bar_path == BAR_PATH_CLOSE:
+        points = [(stamps, close, volume)]
+    else:
+        opens = _numeric(_column(df, 'open'))
+        highs = _numeric(_column(df, 'high'))
+        lows = _numeric(_column(df, 'low'))
+        if opens is None or highs is None or lows is None:
+            points = [(stamps, close, volume)]
+        else:
+            opens, highs, lows = opens[order], highs[order], lows[order]
+            rising = close >= opens
+            first = np.where(rising, lows, highs)
+            second = np.where(rising, highs, lows)
+            zero = np.zeros(len(close))
+            points = [
+                (stamps + np.timedelta64(offset, 's'), prices, vols)
+                for offset, prices, vols in zip(
+                    _BAR_PATH_OFFSETS, (opens, first, second, close), (zero, zero, zero, volume)
+                )
+            ]
+
+    columns = [
+        (pd.DatetimeIndex(stamp_array).to_pydatetime(), prices.tolist(), vols.tolist())
+        for stamp_array, prices, vols in points
+    ]
+
+    events: List[ReplayEvent] = []
+    seq = 0
+    # 같은 분봉의 경로 지점이 시간순이 되도록 봉 단위로 교차 배치
+    for row in range(len(close)):
+        for stamps_list, prices, vols in columns:
+            if prices[row] > 0:
+                events.append(ReplayEvent(stamps_list[row], stock_code, seq, prices[row], vols[row]))
+                seq += 1
+    return events
+
+
+def load_events(stock_code: str, trade_date: str, kind: str = KIND_BARS,
+                root: str = REPLAY_DATA_DIR, bar_path: str = BAR_PATH_OHLC) -> List[ReplayEvent]:
+    """저장된 파일에서 단일 종목 이벤트 로드"""
+    path = replay_file_path(stock_code, trade_date, kind, root)
+    df = pd.read_csv(path, dtype=str)
+    return frame_to_events(df, stock_code, trade_date, kind, bar_path)
+
+
+def merge_events(*streams: Iterable[ReplayEvent]) -> Iterator[ReplayEvent]:
+    """정렬된 종목별 이벤트 스트림 병합 (결정적 순서)"""
+    return heapq.merge(*streams)
+
+
+def discover_sessions(root: str = REPLAY_DATA_DIR, kind: str = KIND_BARS,
+                      start_date: Optional[str] = None, end_date: Optional[str] = None,
+                      stock_codes: Optional[List[str]] = None,
+                      per_symbol: bool = True) -> List[ReplaySessionSpec]:
+    """저장 디렉토리에서 세션 목록 생성
+
+    Args:
+        per_symbol: True면 (일자, 종목)마다, False면 일자마다 전 종목을 한 세션으로
+    """
+    base = Path(root)
+    if not base.exists():
+        return []
+
+    specs = []
+    suffix = f"_{kind}.csv"
+    for day_dir in sorted(p for p in base.iterdir() if p.is_dir()):
+        trade_date = day_dir.name
+        if (start_date and trade_date < start_date) or (end_date and trade_date > end_date):
+            continue
+
+        codes = sorted(p.name[:-len(suffix)] for p in day_dir.glob(f"*{suffix}"))
+        if stock_codes:
+            codes = [code for code in codes if code in stock_codes]
+        if not codes:
+            continue
+
+        if per_symbol:
+            specs.extend(
+                ReplaySessionSpec(f"{trade_date}_{code}", trade_date, [code], kind, root)
+                for code in codes
+            )
+        else:
+            specs.append(ReplaySessionSpec(trade_date, trade_date, codes, kind, root))
+    return specs
+
+
+# =============================================================================
+# 실행
+# =============================================================================
+
+class ReplayEngine:
+    """PaperTrader 리플레이 실행기"""
+
+    def __init__(self, config: Optional[ReplayConfig] = None,
+                 strategy_factory: Optional[Callable[[], ReplayStrategy]] = None):
+        """
+        Args:
+            config: 리플레이 설정
+            strategy_factory: 세션마다 새 전략 인스턴스를 만드는 함수/클래스
+        """
+        self.config = config or ReplayConfig()
+        self.strategy_factory = strategy_factory or ReplayStrategy
+
+    def run(self, events: Iterable[ReplayEvent], session_id: str = "replay") -> ReplayResult:
+        """정렬된 이벤트 스트림으로 세션 1회 실행"""
+        started = time.perf_counter()
+        result = ReplayResult(session_id=session_id)
+        iterator = iter(events)
+        first = next(iterator, None)
+        if first is None:
+            return result
+
+        clock = VirtualClock(first.timestamp)
+        trader = PaperTrader(self.config.trading, clock=clock)
+        strategy = self.strategy_factory()
+        result.start_value = trader.portfolio.total_value
+
+        trader.start_session(session_id)
+        strategy.on_start(trader, session_id)
+
+        prices: Dict[str, float] = {first.stock_code: first.price}
+        current = first.timestamp
+        result.events = 1
+
+        for event in iterator:
+            if event.timestamp != current or event.stock_code in prices:
+                self._step(trader, strategy, current, prices)
+                result.steps += 1
+                prices = {}
+                if event.timestamp != current:
+                    clock.advance_to(event.timestamp)
+                    current = event.timestamp
+            prices[event.stock_code] = event.price
+            result.events += 1
+
+        self._step(trader, strategy, current, prices)
+        result.steps += 1
+
+        strategy.on_end(trader)
+        if self.config.close_at_end:
+            trader.close_all_positions(reason="replay_end")
+        session = trader.end_session()
+
+        result.trades = session.trades_executed
+        result.realized_pnl = session.realized_pnl
+        result.commission = session.commission_paid
+        result.final_value = trader.portfolio.total_value
+        result.trade_log = session.trade_log
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
+
+    @staticmethod
+    def _step(trader: PaperTrader, strategy: ReplayStrategy, timestamp: datetime,
+              prices: Dict[str, float]):
+        fills = trader.update_prices(prices)
+        strategy.on_prices(trader, timestamp, prices, fills)
+
+    def load_session_events(self, spec: ReplaySessionSpec) -> Iterator[ReplayEvent]:
+        streams = [
+            load_events(code, spec.trade_date, spec.kind, spec.root, self.config.bar_path)
+            for code in spec.stock_codes
+        ]
+        return merge_events(*streams)
+
+    def run_session(self, spec: ReplaySessionSpec) -> ReplayResult:
+        """저장된 데이터로 세션 실행 (실패 시 error에 기록)"""
+        try:
+            return self.run(self.load_session_events(spec), spec.session_id)
+        except Exception as e:
+            logger.error(f"리플레이 세션 실패 ({spec.session_id}): {e}", exc_info=True)
+            return ReplayResult(session_id=spec.session_id, error=f"{type(e).__name__}: {e}")
+
+    def run_sessions(self, specs: List[ReplaySessionSpec],
+                     max_workers: Optional[int] = None) -> List[ReplayResult]:
+        """여러 세션을 프로세스 병렬 실행 (결과는 specs 순서)"""
+        workers = max_workers or self.config.max_workers or os.cpu_count() or 1
+        workers = min(workers, len(specs))
+        if workers <= 1:
+            return [self.run_session(spec) for spec in specs]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.config.quiet,),
+        ) as pool:
+            return list(pool.map(
+                _run_session_worker,
+                [(self.config, self.strategy_factory, spec) for spec in specs],
+            ))
+
+
+def _init_worker(quiet: bool):
+    if quiet:
+        logging.getLogger("core.paper_trading").setLevel(logging.WARNING)
+
+
+def _run_session_worker(args) -> ReplayResult:
+    config, strategy_factory, spec = args
+    return ReplayEngine(config, strategy_factory).run_session(spec)
+
+
+def summarize_results(results: List[ReplayResult]) -> Dict[str, Any]:
+    """세션 결과 요약"""
+    completed = [r for r in results if r.error is None]
+    returns = [r.return_pct for r in completed]
+    return {
+        'sessions': len(results),
+        'failed': len(results) - len(completed),
+        'events': sum(r.events for r in completed),
+        'trades': sum(r.trades for r in completed),
+        'realized_pnl': sum(r.realized_pnl for r in completed),
+        'commission': sum(r.commission for r in completed),
+        'avg_return_pct': float(np.mean(returns)) if returns else 0.0,
+        'win_sessions': sum(1 for r in returns if r > 0),
+    }
@@ -6,7 +6,7 @@
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
@@ -112,12 +112,15 @@ class VirtualPortfolio:
     페이퍼 트레이딩용 자산 관리 시스템입니다.
     """
 
-    def __init__(self, config: Optional[PortfolioConfig] = None):
+    def __init__(self, config: Optional[PortfolioConfig] = None,
+                 clock: Optional[Callable[[], datetime]] = None):
         """
         Args:
             config: 포트폴리오 설정
+            clock: 현재 시각 함수 (None이면 datetime.now, 리플레이 시 가상 시계)
         """
         self.config = config or PortfolioConfig()
+        self._clock = clock or datetime.now
 
         # 자금
         self._cash: float = self.config.initial_capital
@@ -245,6 +248,7 @@ class VirtualPortfolio:
                 quantity=quantity,
                 avg_price=exec_price,
                 current_price=exec_price,
+                first_buy_date=self._clock(),
             )
 
         logger.info(
@@ -371,7 +375,7 @@ class VirtualPortfolio:
     def get_snapshot(self) -> PortfolioSnapshot:
         """현재 스냅샷 조회 (이력에 저장 안함)"""
         return PortfolioSnapshot(
-            timestamp=datetime.now(),
+            timestamp=self._clock(),
             cash=self._cash,
             holdings_value=self.holdings_value,
             total_value=self.total_value,
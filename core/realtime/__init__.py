@@ -2,8 +2,9 @@
 Real-time data processing package.
 """
 
-from .processor import DataProcessor, RealtimeProcessor
+from .processor import DataProcessor, RealtimeProcessor, get_realtime_processor
 from .handlers import EventHandler, PositionMonitor
+from .bars import MinuteBar, MinuteBarAggregator, get_bar_aggregator
 from .indicators import (
     RealtimeIndicatorCalculator,
     IndicatorConfig,
@@ -14,8 +15,12 @@ from .indicators import (
 __all__ = [
     'DataProcessor',
     'RealtimeProcessor',
+    'get_realtime_processor',
     'EventHandler',
     'PositionMonitor',
+    'MinuteBar',
+    'MinuteBarAggregator',
+    'get_bar_aggregator',
     'RealtimeIndicatorCalculator',
     'IndicatorConfig',
     'IndicatorType',
@@ -0,0 +1,333 @@
+"""실시간 분봉 집계 모듈
+
+WebSocket H0STCNT0 체결 틱으로 1/3/5/15분 OHLCV·VWAP 분봉을 직접 만듭니다.
+이미 구독 중인 체결 스트림을 쓰므로 장중 분봉을 REST(get_minute_bars)로 폴링할 필요가 없습니다.
+
+- 틱당 O(1): 종목별·주기별 진행 중 분봉 하나만 갱신
+- 분봉 마감: 다음 구간 틱 도착(틱 경계) 또는 advance()/run_clock() 시각 경계 (close_delay 유예 후)
+  (공용 집계기의 run_clock은 KISAPI.connect_websocket이 시작하고 close()가 종료)
+- 구간은 장 시작(09:00) 기준으로 나눔 (예: 15분봉 09:00, 09:15, ...)
+- 완성된 분봉은 리스너(RealtimeProcessor.on_bar 등)에 전달하고 종목·주기별 최근 N개를 보관
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from core.utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_INTERVALS = (1, 3, 5, 15)
+DEFAULT_CLOSE_DELAY = 2.0  # 시각 경계 마감 유예 (초, 네트워크·프레임 배치 지연)
+SESSION_START = time(9, 0)
+
+
+@dataclass
+class MinuteBar:
+    """분봉
+
+    Attributes:
+        stock_code: 종목코드
+        interval: 주기 (분)
+        start: 구간 시작 시각
+        value: 체결대금 합계 (가격 × 수량, VWAP 계산용)
+        ticks: 체결 건수
+    """
+    stock_code: str
+    interval: int
+    start: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int = 0
+    value: float = 0.0
+    ticks: int = 0
+
+    @property
+    def end(self) -> datetime:
+        return self.start + timedelta(minutes=self.interval)
+
+    @property
+    def vwap(self) -> float:
+        return self.value / self.volume if self.volume > 0 else self.close
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 변환 (분봉 소비 코드가 읽는 open/high/low/close/volume 컬럼)"""
+        return {
+            "stock_code": self.stock_code,
+            "interval": self.interval,
+            "date": self.start.strftime("%Y%m%d"),
+            "time": self.start.strftime("%H%M%S"),
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+            "vwap": self.vwap,
+            "ticks": self.ticks,
+        }
+
+
+class MinuteBarAggregator:
+    """체결 틱 → 다중 주기 분봉 집계기"""
+
+    def __init__(
+        self,
+        intervals: Sequence[int] = DEFAULT_INTERVALS,
+        history: int = 400,
+        session_start: time = SESSION_START,
+        session_date: Optional[date] = None,
+        close_delay: float = DEFAULT_CLOSE_DELAY,
+    ):
+        """초기화
+
+        Args:
+            intervals: 분봉 주기 목록 (분)
+            history: 종목·주기별 보관할 완성 분봉 수
+            session_start: 구간 기준 시각 (장 시작)
+            session_date: HHMMSS 체결시각에 붙일 거래일 (None이면 오늘)
+            close_delay: advance()가 구간 종료 후 이 시간(초)이 지나야 마감 (경계 직후 도착하는
+                직전 구간 틱 반영용, 틱 경계 마감에는 적용하지 않음)
+        """
+        self.intervals = tuple(sorted(set(intervals)))
+        self.history = history
+        self.session_date = session_date
+        self.close_delay = close_delay
+        self._session_minute = session_start.hour * 60 + session_start.minute
+
+        # 종목 → 주기 순서대로 [진행 중 분봉, 구간 키] / 마지막으로 마감된 구간 키
+        self._open: Dict[str, List[Optional[MinuteBar]]] = {}
+        self._open_keys: Dict[str, List[int]] = {}
+        self._closed_keys: Dict[str, List[int]] = {}
+        self._bars: Dict[Tuple[str, int], Deque[MinuteBar]] = {}
+        self._listeners: List[Callable[[MinuteBar], Any]] = []
+        self._clock_running = False
+
+        self.tick_count = 0
+        self.late_ticks = 0
+        self.completed_count = 0
+
+        logger.info(f"MinuteBarAggregator 초기화 (주기: {self.intervals}분, 보관: {history}개)")
+
+    # ========== 리스너 ==========
+
+    def add_listener(self, callback: Callable[[MinuteBar], Any]):
+        """완성 분봉 수신 함수 등록"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[MinuteBar], Any]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def attach(self, ws_client):
+        """KISWebSocketClient 체결 프레임(H0STCNT0) 배치 콜백으로 연결"""
+        ws_client.add_batch_callback("H0STCNT0", self.on_batch)
+
+    # ========== 틱 입력 ==========
+
+    def on_tick(self, stock_code: str, price: float, volume: int, timestamp: datetime) -> List[MinuteBar]:
+        """체결 틱 반영
+
+        Returns:
+            이 틱으로 마감된 분봉 목록 (틱 경계)
+        """
+        return self._update(
+            stock_code, price, volume,
+            timestamp.toordinal(), timestamp.hour * 60 + timestamp.minute,
+        )
+
+    def on_trade(self, data: Dict[str, Any]) -> List[MinuteBar]:
+        """정규화된 체결 데이터 반영 (_normalize_kis_message 형식, timestamp는 HHMMSS)"""
+        stock_code = data.get("stock_code")
+        price = data.get("current_price", 0)
+        if not stock_code or not price or price <= 0:
+            return []
+        hhmmss = str(data.get("timestamp", ""))
+        if len(hhmmss) < 4:
+            return []
+        return self._update(
+            stock_code, price, data.get("volume", 0) or 0,
+            self._session_ordinal(), int(hhmmss[0:2]) * 60 + int(hhmmss[2:4]),
+        )
+
+    def on_batch(self, batch) -> List[MinuteBar]:
+        """디코딩된 체결 프레임(FrameBatch) 반영"""
+        ordinal = self._session_ordinal()
+        completed = []
+        for stock_code, hhmmss, price, volume in zip(
+            batch["stock_code"], batch["timestamp"], batch["current_price"], batch["volume"]
+        ):
+            if price > 0 and len(hhmmss) >= 4:
+                completed.extend(self._update(
+                    stock_code, price, volume, ordinal, int(hhmmss[0:2]) * 60 + int(hhmmss[2:4])
+                ))
+        return completed
+
+    def _session_ordinal(self) -> int:
+        return (self.session_date or date.today()).toordinal()
+
+    def _update(self, stock_code: str, price: float, volume: int, ordinal: int, minute: int) -> List[MinuteBar]:
+        bars = self._open.get(stock_code)
+        if bars is None:
+            n = len(self.intervals)
+            bars = self._open[stock_code] = [None] * n
+            self._open_keys[stock_code] = [-1] * n
+            self._closed_keys[stock_code] = [-1] * n
+        open_keys = self._open_keys[stock_code]
+        closed_keys = self._closed_keys[stock_code]
+
+        self.tick_count += 1
+        completed = []
+        day_base = ordinal * 1440
+        offset = minute - self._session_minute
+
+        for i, interval in enumerate(self.intervals):
+            key = day_base + minute - offset % interval
+            bar = bars[i]
+
+            if key != open_keys[i]:
+                if key < open_keys[i] or key <= closed_keys[i]:
+                    # 이미 지난 구간의 늦은 틱
+                    self.late_ticks += 1
+                    continue
+                if bar is not None:
+                    completed.append(self._close(i, stock_code, bar, open_keys[i]))
+                bar = bars[i] = MinuteBar(
+                    stock_code, interval, self._key_to_datetime(key), price, price, price, price
+                )
+                open_keys[i] = key
+            else:
+                if price > bar.high:
+                    bar.high = price
+                elif price < bar.low:
+                    bar.low = price
+                bar.close = price
+
+            bar.volume += volume
+            bar.value += price * volume
+            bar.ticks += 1
+
+        if completed:
+            self._emit(completed)
+        return completed
+
+    @staticmethod
+    def _key_to_datetime(key: int) -> datetime:
+        ordinal, minute = divmod(key, 1440)
+        return datetime.combine(date.fromordinal(ordinal), time(minute // 60, minute % 60))
+
+    def _close(self, index: int, stock_code: str, bar: MinuteBar, key: int) -> MinuteBar:
+        self._open[stock_code][index] = None
+        self._open_keys[stock_code][index] = -1
+        self._closed_keys[stock_code][index] = key
+
+        buffer = self._bars.get((stock_code, bar.interval))
+        if buffer is None:
+            buffer = self._bars[(stock_code, bar.interval)] = deque(maxlen=self.history)
+        buffer.append(bar)
+        self.completed_count += 1
+        return bar
+
+    def _emit(self, bars: List[MinuteBar]):
+        for bar in bars:
+            for listener in self._listeners:
+                try:
+                    listener(bar)
+                except Exception as e:
+                    logger.error(f"분봉 리스너 오류: {e}", exc_info=True)
+
+    # ========== 시각 경계 ==========
+
+    def advance(self, now: Optional[datetime] = None) -> List[MinuteBar]:
+        """구간이 끝난 진행 중 분봉 마감 (틱이 없는 종목도 정시에 마감)
+
+        구간 종료 후 close_delay초가 지난 분봉만 마감합니다.
+
+        Args:
+            now: 기준 시각 (None이면 현재 시각)
+
+        Returns:
+            마감된 분봉 목록
+        """
+        now = (now or datetime.now()) - timedelta(seconds=self.close_delay)
+        now_key = now.toordinal() * 1440 + now.hour * 60 + now.minute
+        completed = []
+        for stock_code, bars in self._open.items():
+            open_keys = self._open_keys[stock_code]
+            for i, interval in enumerate(self.intervals):
+                bar = bars[i]
+                if bar is not None and open_keys[i] + interval <= now_key:
+                    completed.append(self._close(i, stock_code, bar, open_keys[i]))
+        if completed:
+            self._emit(completed)
+        return completed
+
+    async def run_clock(self, poll_interval: float = 1.0):
+        """시각 경계 마감 루프 (stop_clock()으로 종료)"""
+        self._clock_running = True
+        while self._clock_running:
+            self.advance()
+            await asyncio.sleep(poll_interval)
+
+    def stop_clock(self):
+        self._clock_running = False
+
+    # ========== 조회 ==========
+
+    def get_bars(self, stock_code: str, interval: int = 1, limit: Optional[int] = None) -> List[MinuteBar]:
+        """완성된 분봉 (오래된 순)"""
+        buffer = self._bars.get((stock_code, interval))
+        if not buffer:
+            return []
+        bars = list(buffer)
+        return bars[-limit:] if limit else bars
+
+    def get_open_bar(self, stock_code: str, interval: int = 1) -> Optional[MinuteBar]:
+        """진행 중 분봉"""
+        bars = self._open.get(stock_code)
+        if bars is None or interval not in self.intervals:
+            return None
+        return bars[self.intervals.index(interval)]
+
+    def to_frame(self, stock_code: str, interval: int = 1, limit: Optional[int] = None) -> pd.DataFrame:
+        """완성된 분봉 DataFrame (get_minute_bars 대체용, open/high/low/close/volume/vwap 컬럼)"""
+        return pd.DataFrame([bar.to_dict() for bar in self.get_bars(stock_code, interval, limit)])
+
+    def stock_codes(self) -> Iterable[str]:
+        return list(self._open)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "intervals": list(self.intervals),
+            "stocks": len(self._open),
+            "ticks": self.tick_count,
+            "late_ticks": self.late_ticks,
+            "completed_bars": self.completed_count,
+        }
+
+    def reset(self):
+        """전체 상태 초기화 (거래일 변경 시)"""
+        self._open.clear()
+        self._open_keys.clear()
+        self._closed_keys.clear()
+        self._bars.clear()
+        self.tick_count = 0
+        self.late_ticks = 0
+        self.completed_count = 0
+
+
+_bar_aggregator: Optional[MinuteBarAggregator] = None
+
+
+def get_bar_aggregator() -> MinuteBarAggregator:
+    """공용 분봉 집계기 (WebSocket 체결 스트림이 채우고 전략 계층이 조회)"""
+    global _bar_aggregator
+    if _bar_aggregator is None:
+        _bar_aggregator = MinuteBarAggregator()
+    return _bar_aggregator
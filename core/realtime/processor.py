@@ -5,8 +5,10 @@ from decimal import Decimal
 from typing import Dict, Any, List, Callable, Optional
 from collections import deque
 import json
+import math
 
 from core.utils import get_logger
+from .ring_buffer import TickRingBuffer, TickWindow, buffer_memory, to_epoch_seconds
 
 logger = get_logger(__name__)
 
@@ -173,15 +175,18 @@ class RealtimeProcessor:
         - CALC-002: 익절가 계산 (고정비율 vs ATR 기반, 큰 값 선택)
     """
 
-    def __init__(self, buffer_maxlen: int = 1000):
+    def __init__(self, buffer_maxlen: int = 1000, bar_aggregator=None, feed_bars: bool = True):
         """초기화
 
         Args:
             buffer_maxlen: deque 버퍼 최대 길이 (기본값: 1000)
+            bar_aggregator: MinuteBarAggregator (지정 시 완성 분봉을 수신해 보관)
+            feed_bars: 체결가를 bar_aggregator에 전달할지 여부
+                (집계기가 WebSocket 체결 프레임에 직접 연결된 경우 False, 틱 중복 집계 방지)
         """
-        # 실시간 가격 버퍼 (종목코드별)
-        # FIFO 방식으로 자동 overflow 처리
-        self.price_buffers: Dict[str, deque] = {}
+        # 실시간 가격 버퍼 (종목코드별 컬럼형 링 버퍼)
+        # 고정 용량, 가득 차면 가장 오래된 틱을 덮어씀
+        self.price_buffers: Dict[str, TickRingBuffer] = {}
         self.buffer_maxlen = buffer_maxlen
 
         # 포지션 정보 (종목코드 -> 포지션 데이터)
@@ -191,6 +196,13 @@ class RealtimeProcessor:
         self.default_stop_loss_ratio = 0.03  # 3% 손절
         self.default_take_profit_ratio = 0.05  # 5% 익절
 
+        # 완성 분봉 버퍼 ((종목코드, 주기) -> deque)
+        self.bar_buffers: Dict[tuple, deque] = {}
+        self.bar_aggregator = bar_aggregator
+        self.feed_bars = feed_bars
+        if bar_aggregator is not None:
+            bar_aggregator.add_listener(self.on_bar)
+
         logger.info(f"RealtimeProcessor 초기화 완료 (버퍼 크기: {buffer_maxlen})")
 
     def add_position(
@@ -320,15 +332,16 @@ class RealtimeProcessor:
             return None
 
         # 가격 버퍼 초기화 (필요시)
-        if stock_code not in self.price_buffers:
-            self.price_buffers[stock_code] = deque(maxlen=self.buffer_maxlen)
+        buffer = self.price_buffers.get(stock_code)
+        if buffer is None:
+            buffer = self.price_buffers[stock_code] = TickRingBuffer(self.buffer_maxlen)
 
         # 버퍼에 추가 (자동 overflow)
-        self.price_buffers[stock_code].append({
-            "price": current_price,
-            "timestamp": data.get("timestamp"),
-            "volume": data.get("volume", 0),
-        })
+        buffer.add(current_price, data.get("volume", 0) or 0, to_epoch_seconds(data.get("timestamp")))
+
+        # 분봉 집계 (완성 분봉은 on_bar로 수신)
+        if self.bar_aggregator is not None and self.feed_bars:
+            self.bar_aggregator.on_trade(data)
 
         # 포지션이 있는 경우 손익 계산
         if stock_code in self.positions:
@@ -355,6 +368,42 @@ class RealtimeProcessor:
 
         return None
 
+    def on_bar(self, bar) -> None:
+        """완성 분봉 수신 (MinuteBarAggregator 리스너)
+
+        Args:
+            bar: MinuteBar
+        """
+        key = (bar.stock_code, bar.interval)
+        if key not in self.bar_buffers:
+            self.bar_buffers[key] = deque(maxlen=self.buffer_maxlen)
+        self.bar_buffers[key].append(bar.to_dict())
+
+    def get_minute_bars(
+        self,
+        stock_code: str,
+        interval: int = 1,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """완성 분봉 조회
+
+        Args:
+            stock_code: 종목코드
+            interval: 분봉 주기 (분)
+            limit: 최대 개수 (기본값: 전체)
+
+        Returns:
+            분봉 데이터 리스트 (오래된 순)
+        """
+        buffer = self.bar_buffers.get((stock_code, interval))
+        if not buffer:
+            return []
+
+        bars = list(buffer)
+        if limit:
+            return bars[-limit:]
+        return bars
+
     def get_position(self, stock_code: str) -> Optional[Dict[str, Any]]:
         """포지션 조회
 
@@ -384,15 +433,41 @@ class RealtimeProcessor:
             limit: 최대 개수 (기본값: 전체)
 
         Returns:
-            가격 데이터 리스트
+            가격 데이터 리스트 (timestamp는 HHMMSS, 시각을 알 수 없던 틱은 None)
         """
-        if stock_code not in self.price_buffers:
+        buffer = self.price_buffers.get(stock_code)
+        if buffer is None:
             return []
 
-        buffer = list(self.price_buffers[stock_code])
-        if limit:
-            return buffer[-limit:]
-        return buffer
+        window = buffer.window(limit or None)
+        return [
+            {
+                "price": price,
+                "timestamp": (
+                    None if math.isnan(timestamp)
+                    else datetime.fromtimestamp(timestamp).strftime("%H%M%S")
+                ),
+                "volume": volume,
+            }
+            for price, volume, timestamp in zip(
+                window.price.tolist(), window.volume.tolist(), window.timestamp.tolist()
+            )
+        ]
+
+    def get_price_window(self, stock_code: str, limit: Optional[int] = None) -> Optional[TickWindow]:
+        """가격 버퍼 창 조회 (복사 없는 NumPy view, 지표/이상 감지 계산용)
+
+        Args:
+            stock_code: 종목코드
+            limit: 최근 개수 (기본값: 전체)
+
+        Returns:
+            TickWindow(price, volume, timestamp) 또는 None
+        """
+        buffer = self.price_buffers.get(stock_code)
+        if buffer is None:
+            return None
+        return buffer.window(limit)
 
     def get_buffer_stats(self) -> Dict[str, Any]:
         """버퍼 상태 조회 (모니터링용)
@@ -408,6 +483,7 @@ class RealtimeProcessor:
             "total_items": total_items,
             "buffer_maxlen": self.buffer_maxlen,
             "usage_percent": (total_items / max_capacity * 100) if max_capacity > 0 else 0.0,
+            "memory_bytes": buffer_memory(self.price_buffers)["bytes"],
             "stocks": [],
         }
 
@@ -444,4 +520,17 @@ class RealtimeProcessor:
             )
             return warning_msg
 
-        return None
\ No newline at end of file
+        return None
+
+
+_realtime_processor: Optional[RealtimeProcessor] = None
+
+
+def get_realtime_processor() -> RealtimeProcessor:
+    """공용 실시간 처리기 (WebSocket 체결 스트림 소비, 공용 분봉 집계기의 완성 분봉 수신)"""
+    global _realtime_processor
+    if _realtime_processor is None:
+        from .bars import get_bar_aggregator
+        # 공용 집계기는 KISAPI가 체결 프레임에 직접 연결하므로 틱은 전달하지 않음
+        _realtime_processor = RealtimeProcessor(bar_aggregator=get_bar_aggregator(), feed_bars=False)
+    return _realtime_processor
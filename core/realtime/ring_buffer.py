@@ -0,0 +1,239 @@
+"""컬럼형 링 버퍼 모듈
+
+종목별 틱을 dict 대신 고정 크기 NumPy 컬럼(가격/거래량/시각)에 기록합니다.
+세션 내내 메모리가 일정하고 틱마다 객체를 만들지 않아 GC 부담이 없습니다.
+
+- 쓰기 커서 방식 O(1) 추가, 가득 차면 가장 오래된 값을 덮어씀
+- 미러링(용량 2배 배열에 두 번 기록)으로 최근 N개가 항상 연속 구간 → 복사 없는 창(view) 제공
+- 창은 읽기 전용 view이며 다음 기록 시 내용이 바뀔 수 있으므로, 보관하려면 copy() 하십시오
+"""
+
+import math
+import time
+from datetime import date, datetime, time as dtime
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from core.utils import get_logger
+
+logger = get_logger(__name__)
+
+# 기본 틱 컬럼: (이름, dtype)
+TICK_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("price", "float64"),
+    ("volume", "int64"),
+    ("timestamp", "float64"),  # epoch 초
+)
+
+
+class TickWindow(NamedTuple):
+    """최근 틱 창 (읽기 전용 view)"""
+    price: np.ndarray
+    volume: np.ndarray
+    timestamp: np.ndarray
+
+
+class ColumnarRingBuffer:
+    """고정 용량 컬럼형 링 버퍼
+
+    Args:
+        capacity: 최대 보관 행 수
+        fields: (컬럼명, dtype) 목록 (기본: price/volume/timestamp)
+    """
+
+    def __init__(self, capacity: int, fields: Tuple[Tuple[str, str], ...] = TICK_FIELDS):
+        if capacity <= 0:
+            raise ValueError(f"capacity는 1 이상이어야 합니다: {capacity}")
+        self.capacity = capacity
+        self.fields = tuple(name for name, _ in fields)
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros(capacity * 2, dtype=dtype) for name, dtype in fields
+        }
+        self._cursor = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def is_full(self) -> bool:
+        return self._count >= self.capacity
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self._columns.values())
+
+    def append(self, *values, **named) -> None:
+        """한 행 기록 (fields 순서의 위치 인자 또는 컬럼명 키워드)"""
+        i = self._cursor
+        j = i + self.capacity
+        if values:
+            for column, value in zip(self._columns.values(), values):
+                column[i] = column[j] = value
+        for name, value in named.items():
+            column = self._columns[name]
+            column[i] = column[j] = value
+        self._cursor = i + 1 if i + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+
+    def extend(self, **columns: np.ndarray) -> None:
+        """여러 행 일괄 기록 (컬럼명 → 같은 길이의 배열)"""
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) != 1:
+            raise ValueError("컬럼 길이가 서로 다릅니다")
+        n = lengths.pop()
+        if n == 0:
+            return
+        if n > self.capacity:
+            columns = {name: np.asarray(values)[-self.capacity:] for name, values in columns.items()}
+            n = self.capacity
+
+        positions = (self._cursor + np.arange(n)) % self.capacity
+        for name, values in columns.items():
+            column = self._columns[name]
+            column[positions] = values
+            column[positions + self.capacity] = values
+        self._cursor = (self._cursor + n) % self.capacity
+        self._count = min(self.capacity, self._count + n)
+
+    def _bounds(self, n: Optional[int]) -> Tuple[int, int]:
+        n = self._count if n is None else max(0, min(n, self._count))
+        end = self._cursor + self.capacity
+        return end - n, end
+
+    def column(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        """컬럼의 최근 n개 (오래된 순, 읽기 전용 view)"""
+        start, end = self._bounds(n)
+        view = self._columns[name][start:end]
+        view.flags.writeable = False
+        return view
+
+    def columns(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """전체 컬럼의 최근 n개 view"""
+        start, end = self._bounds(n)
+        views = {}
+        for name, column in self._columns.items():
+            view = column[start:end]
+            view.flags.writeable = False
+            views[name] = view
+        return views
+
+    def since(self, name: str, threshold: float) -> int:
+        """정렬된 컬럼(시각 등)에서 threshold 초과 행 수 (창 크기로 사용)"""
+        values = self.column(name)
+        return len(values) - int(np.searchsorted(values, threshold, side="right"))
+
+    def last(self, name: str):
+        """컬럼의 마지막 값 (비어 있으면 None)"""
+        if not self._count:
+            return None
+        return self._columns[name][self._cursor + self.capacity - 1].item()
+
+    def rows(self, n: Optional[int] = None) -> Iterator[Dict[str, float]]:
+        """행 단위 딕셔너리 (조회/호환용, 계산에는 column()/columns() 사용)"""
+        views = self.columns(n)
+        for values in zip(*(view.tolist() for view in views.values())):
+            yield dict(zip(views, values))
+
+    def clear(self) -> None:
+        self._cursor = 0
+        self._count = 0
+
+
+class TickRingBuffer(ColumnarRingBuffer):
+    """종목 틱 링 버퍼 (가격/거래량/시각)"""
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity, TICK_FIELDS)
+
+    def add(self, price: float, volume: int, timestamp: float) -> None:
+        i = self._cursor
+        j = i + self.capacity
+        columns = self._columns
+        columns["price"][i] = columns["price"][j] = price
+        columns["volume"][i] = columns["volume"][j] = volume
+        columns["timestamp"][i] = columns["timestamp"][j] = timestamp
+        self._cursor = i + 1 if i + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+
+    def window(self, n: Optional[int] = None) -> TickWindow:
+        """최근 n개 틱 창 (복사 없음)"""
+        views = self.columns(n)
+        return TickWindow(views["price"], views["volume"], views["timestamp"])
+
+
+_midnight_epoch = 0.0  # 오늘 0시 epoch 초 (HHMMSS 변환용 캐시)
+
+
+def _today_midnight() -> float:
+    global _midnight_epoch
+    if not 0 <= time.time() - _midnight_epoch < 86400:
+        _midnight_epoch = datetime.combine(date.today(), dtime()).timestamp()
+    return _midnight_epoch
+
+
+def _seconds_of_day(text: str) -> Optional[int]:
+    """시각 문자열(HHMMSS, HHMM, HH:MM[:SS]) → 0시 기준 초 (형식이 아니면 None)"""
+    if text.isdigit() and len(text) in (4, 6):
+        hour, minute, second = int(text[0:2]), int(text[2:4]), int(text[4:6] or 0)
+    elif ":" in text and "-" not in text:
+        try:
+            parsed = dtime.fromisoformat(text)
+        except ValueError:
+            return None
+        hour, minute, second = parsed.hour, parsed.minute, parsed.second
+    else:
+        return None
+    if hour >= 24 or minute >= 60 or second >= 60:
+        return None
+    return hour * 3600 + minute * 60 + second
+
+
+def _parse_timestamp(text: str, reference: Optional[datetime]) -> float:
+    seconds = _seconds_of_day(text)
+    if seconds is not None:
+        if reference is None:
+            midnight = _today_midnight()
+        else:
+            midnight = datetime.combine(reference.date(), dtime()).timestamp()
+        return midnight + seconds
+    try:
+        if text.isdigit() and len(text) == 14:
+            return datetime.strptime(text, "%Y%m%d%H%M%S").timestamp()
+        return datetime.fromisoformat(text).timestamp()
+    except ValueError:
+        return math.nan
+
+
+def to_epoch_seconds(timestamp: Union[str, int, float, datetime, None],
+                     reference: Optional[datetime] = None) -> float:
+    """틱 시각을 epoch 초로 변환
+
+    Args:
+        timestamp: datetime, epoch 초, 또는 체결시각 문자열
+            (KIS HHMMSS/HHMM, HH:MM[:SS], YYYYMMDDHHMMSS, ISO 형식)
+        reference: 시각만 있는 문자열에 붙일 날짜 (None이면 오늘)
+
+    Returns:
+        epoch 초 (시각이 없거나 해석할 수 없으면 NaN, 예외를 내지 않음)
+    """
+    if isinstance(timestamp, str):
+        return _parse_timestamp(timestamp.strip(), reference)
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    if isinstance(timestamp, (int, float, np.integer, np.floating)) and not isinstance(timestamp, bool):
+        return float(timestamp)
+    return math.nan
+
+
+def buffer_memory(buffers: Dict[str, ColumnarRingBuffer]) -> Dict[str, int]:
+    """버퍼 묶음 메모리 사용량 (모니터링용)"""
+    return {
+        "buffers": len(buffers),
+        "rows": sum(len(buffer) for buffer in buffers.values()),
+        "bytes": sum(buffer.nbytes for buffer in buffers.values()),
+    }
+
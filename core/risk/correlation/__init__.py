@@ -4,12 +4,14 @@
 포트폴리오 상관관계 및 분산투자 분석
 """
 
+from .rolling_moments import RollingMoments
 from .correlation_matrix import CorrelationMatrix, CorrelationResult
 from .diversification_score import DiversificationScore, DiversificationResult
 from .portfolio_optimizer import PortfolioOptimizer, OptimizationResult
 from .correlation_monitor import CorrelationMonitor, CorrelationCheckResult
 
 __all__ = [
+    'RollingMoments',
     'CorrelationMatrix',
     'CorrelationResult',
     'DiversificationScore',
@@ -6,9 +6,11 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+from core.scoring.ranking import upper_triangle_pairs
+from core.risk.correlation.rolling_moments import RollingMoments
 from core.utils.log_utils import get_logger
 
 logger = get_logger(__name__)
@@ -49,17 +51,20 @@ class CorrelationMatrix:
         self,
         lookback_days: int = 60,
         high_correlation_threshold: float = 0.7,
-        low_correlation_threshold: float = 0.3
+        low_correlation_threshold: float = 0.3,
+        moments: Optional[RollingMoments] = None
     ):
         """
         Args:
             lookback_days: 상관관계 계산 기간
             high_correlation_threshold: 고상관 기준
             low_correlation_threshold: 저상관 기준
+            moments: 롤링 모멘트 엔진 (기본: 인스턴스 전용 lookback_days 윈도우 엔진)
         """
         self.lookback_days = lookback_days
         self.high_threshold = high_correlation_threshold
         self.low_threshold = low_correlation_threshold
+        self.moments = moments or RollingMoments(lookback_days)
 
     def calculate(
         self,
@@ -124,17 +129,23 @@ class CorrelationMatrix:
         if returns_df.empty:
             return pd.DataFrame()
 
-        # 각 시점의 평균 상관계수 계산
+        # 각 시점의 평균 상관계수 계산 (직전 window개 수익률, 봉마다 O(N²) 갱신)
+        moments = RollingMoments(window)
+        columns = [str(code) for code in returns_df.columns]
+        values = returns_df.to_numpy(dtype=float)
         rolling_corrs = []
 
-        for i in range(window, len(returns_df)):
-            window_returns = returns_df.iloc[i - window:i]
-            corr = window_returns.corr()
-            avg_corr = self._calculate_avg_correlation(corr)
-            rolling_corrs.append({
-                'date': returns_df.index[i],
-                'avg_correlation': avg_corr
-            })
+        for i, date in enumerate(returns_df.index):
+            if i >= window:
+                avg_corr = self._calculate_avg_correlation(moments.correlation(columns))
+                rolling_corrs.append({
+                    'date': date,
+                    'avg_correlation': avg_corr
+                })
+            moments.update(dict(zip(columns, values[i])), date)
+
+        if not rolling_corrs:
+            return pd.DataFrame()
 
         return pd.DataFrame(rolling_corrs).set_index('date')
 
@@ -148,19 +159,14 @@ class CorrelationMatrix:
         if stock1 not in price_data or stock2 not in price_data:
             return 0.0
 
-        returns1 = price_data[stock1]['close'].pct_change().dropna().tail(self.lookback_days)
-        returns2 = price_data[stock2]['close'].pct_change().dropna().tail(self.lookback_days)
-
-        # 인덱스 정렬
-        aligned = pd.DataFrame({
-            'stock1': returns1,
-            'stock2': returns2
-        }).dropna()
+        # 롤링 모멘트 엔진 (새 봉만 증분 반영)
+        self.moments.sync_prices(price_data, [stock1, stock2])
+        corr = self.moments.pair_correlation(stock1, stock2, min_periods=10)
 
-        if len(aligned) < 10:
+        if self.moments.nobs(stock1, stock2) < 10:
             return 0.0
 
-        return aligned['stock1'].corr(aligned['stock2'])
+        return corr
 
     def _build_returns_df(self, price_data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         """수익률 DataFrame 구성"""
@@ -198,32 +204,33 @@ class CorrelationMatrix:
         corr_matrix: pd.DataFrame
     ) -> List[Tuple[str, str, float]]:
         """고상관 쌍 찾기"""
-        pairs = []
-        stocks = corr_matrix.columns.tolist()
-
-        for i, stock1 in enumerate(stocks):
-            for stock2 in stocks[i + 1:]:
-                corr = corr_matrix.loc[stock1, stock2]
-                if abs(corr) >= self.high_threshold:
-                    pairs.append((stock1, stock2, corr))
-
-        return sorted(pairs, key=lambda x: abs(x[2]), reverse=True)
+        rows, cols, values = upper_triangle_pairs(
+            corr_matrix.values, lambda v: np.abs(v) >= self.high_threshold
+        )
+        order = np.argsort(-np.abs(values), kind='stable')
+        return self._to_pairs(corr_matrix.columns, rows[order], cols[order], values[order])
 
     def _find_low_correlation_pairs(
         self,
         corr_matrix: pd.DataFrame
     ) -> List[Tuple[str, str, float]]:
         """저상관 쌍 찾기"""
-        pairs = []
-        stocks = corr_matrix.columns.tolist()
-
-        for i, stock1 in enumerate(stocks):
-            for stock2 in stocks[i + 1:]:
-                corr = corr_matrix.loc[stock1, stock2]
-                if abs(corr) <= self.low_threshold:
-                    pairs.append((stock1, stock2, corr))
-
-        return sorted(pairs, key=lambda x: abs(x[2]))
+        rows, cols, values = upper_triangle_pairs(
+            corr_matrix.values, lambda v: np.abs(v) <= self.low_threshold
+        )
+        order = np.argsort(np.abs(values), kind='stable')
+        return self._to_pairs(corr_matrix.columns, rows[order], cols[order], values[order])
+
+    @staticmethod
+    def _to_pairs(
+        columns: pd.Index,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        values: np.ndarray
+    ) -> List[Tuple[str, str, float]]:
+        """인덱스 배열을 (종목1, 종목2, 상관계수) 리스트로 변환"""
+        names = columns.to_numpy()
+        return list(zip(names[rows].tolist(), names[cols].tolist(), values.tolist()))
 
     def _estimate_clusters(self, corr_matrix: pd.DataFrame) -> int:
         """클러스터 수 추정 (간단한 방법)"""
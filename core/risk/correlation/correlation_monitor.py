@@ -6,10 +6,13 @@
 
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 
 from core.utils.log_utils import get_logger
+from core.scoring.ranking import upper_triangle_pairs
 from core.risk.correlation.correlation_matrix import CorrelationMatrix
+from core.risk.correlation.rolling_moments import RollingMoments
 
 logger = get_logger(__name__)
 
@@ -29,12 +32,14 @@ class CorrelationMonitor:
     def __init__(
         self,
         correlation_threshold: float = 0.7,
-        max_high_corr_pairs: int = 2
+        max_high_corr_pairs: int = 2,
+        moments: Optional[RollingMoments] = None
     ):
         """
         Args:
             correlation_threshold: 높은 상관관계 임계값 (기본 0.7)
             max_high_corr_pairs: 허용 가능한 고상관 쌍 개수 (기본 2)
+            moments: 롤링 모멘트 엔진 (기본: 인스턴스 전용 엔진)
         """
         # 입력 검증
         if not (0.0 <= correlation_threshold <= 1.0):
@@ -49,8 +54,10 @@ class CorrelationMonitor:
         self.correlation_threshold = correlation_threshold
         self.max_high_corr_pairs = max_high_corr_pairs
         self.correlation_matrix = CorrelationMatrix(
-            high_correlation_threshold=correlation_threshold
+            high_correlation_threshold=correlation_threshold,
+            moments=moments
         )
+        self.moments = self.correlation_matrix.moments
 
         logger.info(
             f"CorrelationMonitor 초기화: threshold={correlation_threshold}, "
@@ -95,6 +102,13 @@ class CorrelationMonitor:
             # 2. 기존 포지션 종목 코드 추출
             existing_codes = list(existing_positions.keys())
 
+            # 보유 + 신규 종목을 한 번에 엔진에 반영 (이후 조회는 캐시 사용)
+            self.moments.sync_prices(
+                price_data,
+                [code for code in dict.fromkeys([new_stock_code] + existing_codes)
+                 if code in price_data]
+            )
+
             # 3. 신규 종목과 기존 종목들 간 상관계수 계산
             high_corr_stocks = []
             max_corr = 0.0
@@ -183,17 +197,14 @@ class CorrelationMonitor:
         price_data: Dict[str, pd.DataFrame]
     ) -> int:
         """기존 포지션 간 고상관 쌍 개수 계산"""
-        high_corr_pairs = 0
-
-        for i, code1 in enumerate(stock_codes):
-            for code2 in stock_codes[i+1:]:
-                if code1 not in price_data or code2 not in price_data:
-                    continue
+        codes = [code for code in stock_codes if code in price_data]
+        if len(codes) < 2:
+            return 0
 
-                corr_value = self.correlation_matrix.get_pairwise_correlation(
-                    price_data, code1, code2
-                )
-                if abs(corr_value) >= self.correlation_threshold:
-                    high_corr_pairs += 1
+        self.moments.sync_prices(price_data, codes)
+        corr_matrix = self.moments.correlation(codes, min_periods=10)
 
-        return high_corr_pairs
+        rows, _, _ = upper_triangle_pairs(
+            corr_matrix.values, lambda v: np.abs(v) >= self.correlation_threshold
+        )
+        return len(rows)
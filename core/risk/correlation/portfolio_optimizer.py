@@ -11,6 +11,7 @@ from dataclasses import dataclass, field
 
 from core.utils.log_utils import get_logger
 from core.config.constants import RISK_FREE_RATE
+from core.risk.correlation.rolling_moments import RollingMoments, Shrinkage
 
 logger = get_logger(__name__)
 
@@ -47,17 +48,24 @@ class PortfolioOptimizer:
         self,
         risk_free_rate: float = None,
         max_weight: float = 0.25,
-        min_weight: float = 0.02
+        min_weight: float = 0.02,
+        shrinkage: Shrinkage = None,
+        moments: Optional[RollingMoments] = None
     ):
         """
         Args:
             risk_free_rate: 무위험 수익률 (연간, 기본값: RISK_FREE_RATE 상수 사용)
             max_weight: 최대 종목 비중
             min_weight: 최소 종목 비중
+            shrinkage: 공분산 축소 추정 (None, 0~1 고정 강도, 'ledoit_wolf')
+            moments: 롤링 모멘트 엔진 (기본: 인스턴스 전용 lookback_days 윈도우 엔진)
         """
         self.risk_free_rate = risk_free_rate if risk_free_rate is not None else RISK_FREE_RATE
         self.max_weight = max_weight
         self.min_weight = min_weight
+        self.shrinkage = shrinkage
+        self.moments = moments
+        self._own_moments: Dict[int, RollingMoments] = {}
 
     def optimize_min_variance(
         self,
@@ -284,7 +292,19 @@ class PortfolioOptimizer:
             return pd.DataFrame(), pd.DataFrame()
 
         returns_df = pd.DataFrame(returns).dropna()
-        cov_matrix = returns_df.cov()
+        stocks = returns_df.columns.tolist()
+
+        # 공분산은 롤링 모멘트 엔진에서 조회 (새 봉만 증분 반영)
+        moments = self.moments
+        if moments is None or moments.window != lookback_days:
+            moments = self._own_moments.get(lookback_days)
+            if moments is None:
+                moments = self._own_moments[lookback_days] = RollingMoments(lookback_days)
+        moments.sync_prices(price_data, stocks, min_length=lookback_days)
+        cov_matrix = moments.covariance(stocks, shrinkage=self.shrinkage)
+
+        if cov_matrix.shape != (len(stocks), len(stocks)) or cov_matrix.isna().values.any():
+            cov_matrix = returns_df.cov()
 
         return returns_df, cov_matrix
 
@@ -0,0 +1,437 @@
+"""
+롤링 모멘트 엔진
+
+윈도우 내 수익률의 합/제곱합/교차곱을 누적 관리하여 새 봉마다 O(N²)로 갱신하고,
+상관계수/공분산/베타를 하나의 캐시에서 제공합니다.
+
+- 결측값은 쌍별(pairwise)로 처리 (pandas DataFrame.corr()/cov()와 동일)
+- 누적 오차 방지를 위해 일정 갱신 횟수마다 버퍼로부터 재계산
+- 선택적 축소 추정 (고정 강도 또는 Ledoit-Wolf)
+"""
+
+import threading
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+SHRINKAGE_LEDOIT_WOLF = "ledoit_wolf"
+
+Shrinkage = Optional[Union[float, str]]
+
+
+def ledoit_wolf_intensity(returns: np.ndarray) -> float:
+    """Ledoit-Wolf 축소 강도 (목표: 스케일된 단위행렬)
+
+    Args:
+        returns: 결측 없는 (관측 수 × 종목 수) 수익률
+
+    Returns:
+        float: 0~1 축소 강도
+    """
+    n, p = returns.shape
+    if n < 2 or p < 2:
+        return 0.0
+
+    centered = returns - returns.mean(axis=0)
+    sample = centered.T @ centered / n
+    mu = np.trace(sample) / p
+    d2 = np.sum((sample - mu * np.eye(p)) ** 2)
+    if d2 <= 0:
+        return 0.0
+
+    # 관측별 외적과 표본 공분산의 거리 평균
+    row_norms = np.sum(centered ** 2, axis=1)
+    b2_bar = (np.sum(row_norms ** 2) - n * np.sum(sample ** 2)) / n ** 2
+    return float(min(max(b2_bar, 0.0), d2) / d2)
+
+
+class RollingMoments:
+    """롤링 윈도우 수익률 모멘트
+
+    최근 window개 수익률 행을 링 버퍼로 보관하고, 종목 쌍별 누적 통계
+    (관측 수, 합, 제곱합, 교차곱)를 행 추가/제거 시 갱신합니다.
+    """
+
+    def __init__(self, window: int = 60, recompute_interval: Optional[int] = None):
+        """
+        Args:
+            window: 롤링 윈도우 (봉 수)
+            recompute_interval: 누적 통계 재계산 주기 (기본: window * 10회 갱신마다)
+        """
+        if window < 2:
+            raise ValueError(f"window must be >= 2, got {window}")
+
+        self.window = window
+        self.recompute_interval = recompute_interval or window * 10
+        self._lock = threading.RLock()
+        self.clear()
+
+    # ------------------------------------------------------------------
+    # 상태 관리
+    # ------------------------------------------------------------------
+
+    def clear(self):
+        """전체 초기화"""
+        with self._lock:
+            self._symbols: List[str] = []
+            self._positions: Dict[str, int] = {}
+            self._buffer = np.full((self.window, 0), np.nan)
+            self._timestamps: List = [None] * self.window
+            self._head = 0      # 다음 쓰기 위치
+            self._size = 0
+            self._updates = 0
+            self._reset_moments()
+
+    def _reset_moments(self):
+        n = len(self._symbols)
+        self._count = np.zeros((n, n))
+        self._sum = np.zeros((n, n))      # [i, j] = Σ r_i (i, j 모두 관측된 행)
+        self._sumsq = np.zeros((n, n))    # [i, j] = Σ r_i² (i, j 모두 관측된 행)
+        self._cross = np.zeros((n, n))    # [i, j] = Σ r_i r_j
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def last_timestamp(self):
+        if self._size == 0:
+            return None
+        return self._timestamps[(self._head - 1) % self.window]
+
+    def _add_symbols(self, codes: Sequence[str]):
+        new = [code for code in codes if code not in self._positions]
+        if not new:
+            return
+
+        for code in new:
+            self._positions[code] = len(self._symbols)
+            self._symbols.append(code)
+
+        k = len(new)
+        self._buffer = np.hstack([self._buffer, np.full((self.window, k), np.nan)])
+        for name in ('_count', '_sum', '_sumsq', '_cross'):
+            setattr(self, name, np.pad(getattr(self, name), ((0, k), (0, k))))
+
+    def _apply(self, row: np.ndarray, sign: float):
+        observed = ~np.isnan(row)
+        values = np.where(observed, row, 0.0)
+        mask = observed.astype(float)
+
+        self._count += sign * np.outer(mask, mask)
+        self._sum += sign * np.outer(values, mask)
+        self._sumsq += sign * np.outer(values * values, mask)
+        self._cross += sign * np.outer(values, values)
+
+    def _ordered_rows(self) -> Tuple[np.ndarray, List]:
+        """버퍼 행 (오래된 순)"""
+        if self._size < self.window:
+            return self._buffer[:self._size], self._timestamps[:self._size]
+        order = list(range(self._head, self.window)) + list(range(self._head))
+        return self._buffer[order], [self._timestamps[i] for i in order]
+
+    def _recompute(self):
+        """버퍼로부터 누적 통계 재계산 - O(window·N²)"""
+        rows, _ = self._ordered_rows()
+        observed = ~np.isnan(rows)
+        values = np.where(observed, rows, 0.0)
+        mask = observed.astype(float)
+
+        self._count = mask.T @ mask
+        self._sum = values.T @ mask
+        self._sumsq = (values * values).T @ mask
+        self._cross = values.T @ values
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def update(self, returns: Mapping[str, float], timestamp=None):
+        """새 봉 수익률 추가 - O(N²)
+
+        Args:
+            returns: {종목코드: 수익률} (없는 종목은 결측)
+            timestamp: 봉 시각
+        """
+        with self._lock:
+            self._add_symbols(list(returns))
+
+            row = np.full(len(self._symbols), np.nan)
+            for code, value in returns.items():
+                if value is not None:
+                    row[self._positions[code]] = value
+
+            if self._size == self.window:
+                self._apply(self._buffer[self._head], -1.0)
+            else:
+                self._size += 1
+
+            self._buffer[self._head] = row
+            self._timestamps[self._head] = timestamp
+            self._head = (self._head + 1) % self.window
+            self._apply(row, 1.0)
+
+            self._updates += 1
+            if self._updates % self.recompute_interval == 0:
+                self._recompute()
+
+    def reset(self, returns_df: pd.DataFrame):
+        """수익률 DataFrame 최근 window행으로 재구성"""
+        with self._lock:
+            frame = returns_df.tail(self.window)
+            self._symbols = [str(code) for code in frame.columns]
+            self._positions = {code: i for i, code in enumerate(self._symbols)}
+            self._buffer = np.full((self.window, len(self._symbols)), np.nan)
+            self._timestamps = [None] * self.window
+
+            self._size = len(frame)
+            self._buffer[:self._size] = frame.to_numpy(dtype=float)
+            self._timestamps[:self._size] = list(frame.index)
+            self._head = self._size % self.window
+            self._recompute()
+
+    def to_frame(self) -> pd.DataFrame:
+        """버퍼 내용 (오래된 순)"""
+        with self._lock:
+            rows, timestamps = self._ordered_rows()
+            return pd.DataFrame(rows.copy(), index=timestamps, columns=list(self._symbols))
+
+    def sync(self, returns_df: pd.DataFrame):
+        """수익률 DataFrame과 동기화
+
+        마지막으로 반영한 시각 이후의 행만 갱신하고, 새 종목이 추가되었거나
+        기존 데이터와 어긋나면 (다른 데이터 소스/정정) 버퍼를 재구성합니다.
+        """
+        if returns_df.empty:
+            return
+
+        with self._lock:
+            if self._needs_rebuild(returns_df):
+                self._rebuild(returns_df)
+                return
+
+            new_rows = returns_df[returns_df.index > self.last_timestamp]
+            if len(new_rows) >= self.window:
+                self._rebuild(returns_df)
+                return
+
+            columns = [str(code) for code in new_rows.columns]
+            for timestamp, values in zip(new_rows.index, new_rows.to_numpy(dtype=float)):
+                self.update(dict(zip(columns, values)), timestamp)
+
+    def sync_prices(
+        self,
+        price_data: Dict[str, pd.DataFrame],
+        codes: Optional[Sequence[str]] = None,
+        min_length: int = 0
+    ):
+        """가격 데이터({종목코드: OHLCV DataFrame})와 동기화
+
+        Args:
+            price_data: 가격 데이터 ('close' 컬럼, 인덱스 기준 정렬)
+            codes: 대상 종목 (None이면 전체)
+            min_length: 최소 가격 데이터 길이 (미만이면 제외)
+        """
+        self.sync(self.returns_frame(price_data, codes, min_length))
+
+    def returns_frame(
+        self,
+        price_data: Dict[str, pd.DataFrame],
+        codes: Optional[Sequence[str]] = None,
+        min_length: int = 0
+    ) -> pd.DataFrame:
+        """가격 데이터 → 최근 window개 수익률 DataFrame"""
+        returns = {}
+        for code in (codes if codes is not None else list(price_data)):
+            data = price_data.get(code)
+            if data is None or len(data) < max(min_length, 2):
+                continue
+            returns[code] = data['close'].tail(self.window + 1).pct_change().iloc[1:]
+
+        if not returns:
+            return pd.DataFrame()
+        return pd.DataFrame(returns).dropna(how='all')
+
+    def _needs_rebuild(self, returns_df: pd.DataFrame) -> bool:
+        if self._size == 0:
+            return True
+        if any(str(code) not in self._positions for code in returns_df.columns):
+            return True
+
+        last = self.last_timestamp
+        try:
+            if last not in returns_df.index:
+                return True
+        except TypeError:
+            return True
+
+        # 마지막 반영 행이 일치하는지 확인 (다른 데이터 혼입 방지)
+        incoming = returns_df.loc[last]
+        if isinstance(incoming, pd.DataFrame):
+            return True
+        stored = self._buffer[(self._head - 1) % self.window]
+        columns = [self._positions[str(code)] for code in returns_df.columns]
+        return not np.allclose(
+            incoming.to_numpy(dtype=float), stored[columns], equal_nan=True
+        )
+
+    def _rebuild(self, returns_df: pd.DataFrame):
+        if self._size:
+            try:
+                # 전달된 종목은 새 데이터로 교체, 나머지 종목은 기존 버퍼 유지
+                others = self.to_frame().drop(columns=list(returns_df.columns), errors='ignore')
+                merged = pd.concat([returns_df, others], axis=1).sort_index()
+                self.reset(merged[merged.index <= returns_df.index.max()])
+                return
+            except TypeError:
+                # 인덱스 유형이 다르면 (날짜 ↔ 정수) 기존 버퍼 폐기
+                pass
+        self.reset(returns_df.sort_index())
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _indices(self, codes: Optional[Sequence[str]]) -> Tuple[List[str], np.ndarray]:
+        if codes is None:
+            return list(self._symbols), np.arange(len(self._symbols))
+        present = [code for code in dict.fromkeys(codes) if code in self._positions]
+        return present, np.array([self._positions[code] for code in present], dtype=int)
+
+    def nobs(self, code1: str, code2: str) -> int:
+        """두 종목 공통 관측 수"""
+        with self._lock:
+            if code1 not in self._positions or code2 not in self._positions:
+                return 0
+            return int(round(self._count[self._positions[code1], self._positions[code2]]))
+
+    def mean(self, codes: Optional[Sequence[str]] = None) -> pd.Series:
+        """종목별 평균 수익률"""
+        with self._lock:
+            names, ix = self._indices(codes)
+            count = np.diag(self._count)[ix]
+            total = np.diag(self._sum)[ix]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return pd.Series(np.where(count > 0, total / count, np.nan), index=names)
+
+    def _pairwise(self, ix: np.ndarray):
+        grid = np.ix_(ix, ix)
+        return (
+            self._count[grid].copy(), self._sum[grid].copy(),
+            self._sumsq[grid].copy(), self._cross[grid].copy(),
+        )
+
+    def covariance(
+        self,
+        codes: Optional[Sequence[str]] = None,
+        shrinkage: Shrinkage = None,
+        min_periods: int = 2
+    ) -> pd.DataFrame:
+        """공분산 행렬 (표본, ddof=1)
+
+        Args:
+            codes: 대상 종목 (None이면 전체)
+            shrinkage: None, 0~1 고정 강도, 또는 'ledoit_wolf'
+                (목표: 평균 분산 × 단위행렬)
+            min_periods: 최소 공통 관측 수 (미만이면 NaN)
+        """
+        with self._lock:
+            names, ix = self._indices(codes)
+            count, total, _, cross = self._pairwise(ix)
+            intensity = self._intensity(ix, shrinkage, standardize=False)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = (cross - total * total.T / count) / (count - 1)
+        cov[count < max(min_periods, 2)] = np.nan
+
+        if intensity > 0 and len(names):
+            target = np.nanmean(np.diag(cov)) * np.eye(len(names))
+            cov = (1 - intensity) * cov + intensity * target
+
+        return pd.DataFrame(cov, index=names, columns=names)
+
+    def correlation(
+        self,
+        codes: Optional[Sequence[str]] = None,
+        shrinkage: Shrinkage = None,
+        min_periods: int = 2
+    ) -> pd.DataFrame:
+        """상관계수 행렬 (쌍별 관측 기준)
+
+        Args:
+            codes: 대상 종목 (None이면 전체)
+            shrinkage: None, 0~1 고정 강도, 또는 'ledoit_wolf' (목표: 단위행렬)
+            min_periods: 최소 공통 관측 수 (미만이면 NaN)
+        """
+        with self._lock:
+            names, ix = self._indices(codes)
+            count, total, sumsq, cross = self._pairwise(ix)
+            intensity = self._intensity(ix, shrinkage, standardize=True)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            numerator = count * cross - total * total.T
+            var_row = count * sumsq - total * total
+            denominator = np.sqrt(np.maximum(var_row, 0) * np.maximum(var_row.T, 0))
+            corr = numerator / denominator
+        corr = np.clip(corr, -1.0, 1.0)
+        corr[count < max(min_periods, 2)] = np.nan
+
+        diagonal = np.diag(count) >= max(min_periods, 2)
+        corr[np.diag_indices_from(corr)] = np.where(
+            diagonal & ~np.isnan(np.diag(corr)), 1.0, np.nan
+        )
+
+        if intensity > 0 and len(names):
+            corr = (1 - intensity) * corr + intensity * np.eye(len(names))
+
+        return pd.DataFrame(corr, index=names, columns=names)
+
+    def pair_correlation(self, code1: str, code2: str, min_periods: int = 2) -> float:
+        """두 종목 상관계수 (관측 부족 시 NaN)"""
+        corr = self.correlation([code1, code2], min_periods=min_periods)
+        if code1 not in corr.index or code2 not in corr.index:
+            return float('nan')
+        return float(corr.loc[code1, code2])
+
+    def beta(self, code: str, market_code: str, min_periods: int = 2) -> Tuple[float, float]:
+        """시장 대비 베타와 R-squared (관측 부족 시 NaN)"""
+        with self._lock:
+            if code not in self._positions or market_code not in self._positions:
+                return float('nan'), float('nan')
+            i, m = self._positions[code], self._positions[market_code]
+            n = self._count[i, m]
+            if n < max(min_periods, 2):
+                return float('nan'), float('nan')
+            sum_s, sum_m = self._sum[i, m], self._sum[m, i]
+            cov = self._cross[i, m] - sum_s * sum_m / n
+            var_m = self._sumsq[m, i] - sum_m * sum_m / n
+            var_s = self._sumsq[i, m] - sum_s * sum_s / n
+
+        if var_m <= 0:
+            return float('nan'), float('nan')
+        r_squared = cov * cov / (var_s * var_m) if var_s > 0 else 0.0
+        return float(cov / var_m), float(min(r_squared, 1.0))
+
+    def _intensity(self, ix: np.ndarray, shrinkage: Shrinkage, standardize: bool) -> float:
+        if shrinkage is None or len(ix) < 2:
+            return 0.0
+        if shrinkage == SHRINKAGE_LEDOIT_WOLF:
+            rows, _ = self._ordered_rows()
+            rows = rows[:, ix]
+            rows = rows[~np.isnan(rows).any(axis=1)]
+            if standardize and len(rows) > 1:
+                std = rows.std(axis=0)
+                rows = rows[:, std > 0] / std[std > 0]
+            return ledoit_wolf_intensity(rows)
+        if isinstance(shrinkage, str):
+            raise ValueError(f"Unknown shrinkage: {shrinkage}")
+        return float(min(max(shrinkage, 0.0), 1.0))
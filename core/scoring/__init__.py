@@ -5,9 +5,19 @@ from .multi_factor_scorer import (
     FactorScores,
     get_multi_factor_scorer
 )
+from .ranking import (
+    percentile_ranks,
+    descending_order,
+    top_k_indices,
+    upper_triangle_pairs,
+)
 
 __all__ = [
     'MultiFactorScorer',
     'FactorScores',
-    'get_multi_factor_scorer'
+    'get_multi_factor_scorer',
+    'percentile_ranks',
+    'descending_order',
+    'top_k_indices',
+    'upper_triangle_pairs',
 ]
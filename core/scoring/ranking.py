@@ -0,0 +1,115 @@
+"""
+횡단면 순위 유틸리티
+
+종목 유니버스 전체에 대한 백분위 순위, 상위 K개 선택, 상관행렬 쌍 추출을
+numpy 정렬/탐색 연산으로 한 번에 처리합니다 (O(N log N), 쌍 추출은 벡터화).
+
+- 동점 처리는 기존 파이썬 구현(sorted의 안정 정렬)과 동일하게 입력 순서를 유지
+- NaN 값은 순위 계산에서 가장 낮은 값으로 취급
+"""
+
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def _as_float_array(values: Sequence[float]) -> np.ndarray:
+    return np.asarray(values, dtype=float).ravel()
+
+
+def percentile_ranks(values: Sequence[float]) -> np.ndarray:
+    """
+    백분위 순위 계산
+
+    각 값에 대해 (자신 이하인 값의 개수 / 전체 개수) * 100 을 반환합니다.
+    NaN은 어떤 값과도 비교되지 않으므로 0이며, 다른 값의 개수에도 포함되지 않습니다.
+
+    Args:
+        values: 점수 배열
+
+    Returns:
+        np.ndarray: 백분위 순위 [0-100], 입력 순서와 동일
+    """
+    arr = _as_float_array(values)
+    if arr.size == 0:
+        return np.empty(0, dtype=float)
+
+    valid = ~np.isnan(arr)
+    sorted_values = np.sort(arr[valid])
+    counts = np.zeros(arr.size)
+    counts[valid] = np.searchsorted(sorted_values, arr[valid], side='right')
+    return counts / arr.size * 100
+
+
+def descending_order(values: Sequence[float]) -> np.ndarray:
+    """
+    내림차순 정렬 인덱스 (동점은 입력 순서 유지)
+
+    Args:
+        values: 점수 배열
+
+    Returns:
+        np.ndarray: 정렬 인덱스
+    """
+    arr = _as_float_array(values)
+    keys = np.where(np.isnan(arr), np.inf, -arr)
+    return np.argsort(keys, kind='stable')
+
+
+def top_k_indices(values: Sequence[float], k: int) -> np.ndarray:
+    """
+    상위 K개 인덱스 (내림차순, 동점은 입력 순서 유지)
+
+    전체 정렬 없이 argpartition으로 K번째 값을 찾은 뒤 후보만 정렬합니다.
+    descending_order(values)[:k]와 결과가 동일합니다.
+
+    Args:
+        values: 점수 배열
+        k: 선택 개수
+
+    Returns:
+        np.ndarray: 상위 K개 인덱스
+    """
+    arr = _as_float_array(values)
+    n = arr.size
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= n:
+        return descending_order(arr)
+
+    keys = np.where(np.isnan(arr), np.inf, -arr)
+    kth_key = keys[np.argpartition(keys, k - 1)[k - 1]]
+
+    # K번째 값보다 확실히 앞선 항목 + 동점 중 입력 순서가 빠른 항목
+    ahead = np.flatnonzero(keys < kth_key)
+    ties = np.flatnonzero(keys == kth_key)[:k - ahead.size]
+    candidates = np.concatenate([ahead, ties])
+
+    # (키, 입력 인덱스) 순으로 정렬하여 안정 정렬과 같은 순서 보장
+    order = np.lexsort((candidates, keys[candidates]))
+    return candidates[order]
+
+
+def upper_triangle_pairs(
+    matrix: np.ndarray,
+    condition: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    대칭 행렬의 상삼각(대각선 제외) 쌍 추출
+
+    Args:
+        matrix: 정방 행렬 (예: 상관계수 행렬)
+        condition: 값 배열을 받아 선택 마스크를 반환하는 함수 (None이면 전체)
+
+    Returns:
+        (행 인덱스, 열 인덱스, 값) - 행 우선 순서, NaN 제외
+    """
+    values_2d = np.asarray(matrix, dtype=float)
+    rows, cols = np.triu_indices(values_2d.shape[0], k=1)
+    values = values_2d[rows, cols]
+
+    mask = ~np.isnan(values)
+    if condition is not None:
+        mask &= condition(values)
+
+    return rows[mask], cols[mask], values[mask]
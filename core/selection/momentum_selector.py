@@ -13,6 +13,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 
+from core.scoring.ranking import percentile_ranks, top_k_indices
 from core.utils.log_utils import get_logger
 from core.selection.quant_config import (
     get_quant_config, QuantConfig, MarketRegime
@@ -256,12 +257,11 @@ class MomentumSelector:
                 self.logger.debug(f"모멘텀 계산 오류 ({stock.get('stock_code')}): {e}")
                 continue
 
-        # 백분위 순위 계산
+        # 백분위 순위 계산 (정렬 + 이진 탐색)
         if scores:
-            momentum_values = [s.momentum_score for s in scores]
-            for score in scores:
-                rank = sum(1 for v in momentum_values if v <= score.momentum_score)
-                score.percentile_rank = (rank / len(scores)) * 100
+            ranks = percentile_ranks([s.momentum_score for s in scores])
+            for score, rank in zip(scores, ranks):
+                score.percentile_rank = float(rank)
 
         return scores
 
@@ -387,12 +387,10 @@ class MomentumSelector:
         adjusted = self.config.get_adjusted_config()
         max_stocks = adjusted.get('max_stocks', mom.max_stocks)
 
-        # 점수 순 정렬
-        sorted_scores = sorted(scores, key=lambda x: x.momentum_score, reverse=True)
-
-        # 상위 N% 필터
-        cutoff_idx = max(1, int(len(sorted_scores) * mom.top_percentile))
-        top_candidates = sorted_scores[:cutoff_idx]
+        # 상위 N% 필터 (전체 정렬 없이 상위 후보만 정렬)
+        cutoff_idx = max(1, int(len(scores) * mom.top_percentile))
+        top_idx = top_k_indices([s.momentum_score for s in scores], cutoff_idx)
+        top_candidates = [scores[i] for i in top_idx]
 
         # 섹터별 제한 적용
         selected = []
@@ -6,6 +6,7 @@
 import os
 import asyncio
 import json
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any, Literal
 from dataclasses import dataclass, asdict
@@ -16,6 +17,7 @@ from ..config.api_config import APIConfig
 from ..trading.trade_journal import TradeJournal
 from ..trading.dynamic_stop_loss import DynamicStopLossCalculator, StopLossResult
 from ..utils.log_utils import get_logger
+from ..utils.latency_metrics import get_latency_registry, record_latency, STAGE_TRADING_CYCLE
 from ..utils.telegram_notifier import get_telegram_notifier
 from ..risk.position.kelly_calculator import KellyCalculator
 from ..market.market_regime import MarketRegimeDetector
@@ -1428,6 +1430,8 @@ class TradingEngine:
                     await asyncio.sleep(60)  # 1분 대기
                     continue
 
+                _v_cycle_started = time.perf_counter()
+
                 # 포지션 현재가 업데이트
                 await self._update_positions()
 
@@ -1473,6 +1477,9 @@ class TradingEngine:
                                 # 매수 후 잠시 대기 (한 번에 너무 많이 매수하지 않도록)
                                 break
 
+                # 사이클 소요 시간 (API 호출 간격 대기 포함, 사이클 간 대기 제외)
+                record_latency(STAGE_TRADING_CYCLE, time.perf_counter() - _v_cycle_started)
+
                 # 30초 대기 후 다음 사이클
                 await asyncio.sleep(30)
 
@@ -1571,6 +1578,7 @@ class TradingEngine:
 
             # 매매 실행
             self.is_running = True
+            get_latency_registry().start_snapshot_writer("trading")
             await self._trading_loop()
 
             return True
@@ -0,0 +1,390 @@
+"""
+구간별 지연 시간 히스토그램 수집 모듈
+
+log_utils의 SpanContext/trace_operation은 개별 span을 로그로 남길 뿐 집계하지 않으므로,
+API 호출(엔드포인트별), rate limit 대기, 지표 계산, 점수 산정, DB 커밋, 알림 발송 등
+핫패스 구간의 지연 분포를 낮은 오버헤드로 누적합니다.
+
+- HDR 방식 로그-선형 버킷 (마이크로초 정수, 2의 거듭제곱 구간마다 32개 하위 버킷 → 상대 오차 약 3%)
+- 샘플링 비율(sample_rate)로 기록 빈도 조절, enabled=False면 타이머가 즉시 반환
+- 주기적으로 프로세스별 압축 스냅샷(JSON)을 기록하여 api-server에서 조회
+"""
+
+import asyncio
+import functools
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+# 하위 버킷 비트 수 (2^5 = 32개)
+SUB_BUCKET_BITS = 5
+_SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+_LINEAR_LIMIT = _SUB_BUCKET_COUNT * 2
+
+# 작업 디렉토리와 무관하게 `hantu profile latency` CLI와 같은 위치 사용 (프로젝트 루트 기준)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_SNAPSHOT_DIR = str(PROJECT_ROOT / "data" / "metrics")
+SNAPSHOT_PREFIX = "latency_"
+
+# 구간 이름 (호출부에서 공통으로 사용)
+STAGE_API_CALL = "api.call"
+STAGE_RATE_LIMIT_WAIT = "api.rate_limit_wait"
+STAGE_INDICATOR = "indicator.compute"
+STAGE_SCORING = "selection.scoring"
+STAGE_DB_COMMIT = "db.commit"
+STAGE_NOTIFICATION = "notification.send"
+STAGE_TRADING_CYCLE = "trading.cycle"
+
+
+def bucket_index(value_us: int) -> int:
+    """마이크로초 값 → 버킷 인덱스"""
+    if value_us < _LINEAR_LIMIT:
+        return max(value_us, 0)
+    shift = value_us.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift + 1) * _SUB_BUCKET_COUNT + (value_us >> shift) - _SUB_BUCKET_COUNT
+
+
+def bucket_bounds(index: int) -> tuple:
+    """버킷 인덱스 → (하한, 상한) 마이크로초 (양끝 포함)"""
+    if index < _LINEAR_LIMIT:
+        return index, index
+    shift = index // _SUB_BUCKET_COUNT - 1
+    sub = index % _SUB_BUCKET_COUNT + _SUB_BUCKET_COUNT
+    return sub << shift, ((sub + 1) << shift) - 1
+
+
+def stage_name(stage: str, label: Optional[str] = None) -> str:
+    """라벨이 붙은 구간 이름 (예: api.call:/uapi/domestic-stock/v1/quotations/inquire-price)"""
+    return f"{stage}:{label}" if label else stage
+
+
+class LatencyHistogram:
+    """로그-선형 버킷 지연 시간 히스토그램 (마이크로초 단위)"""
+
+    __slots__ = ('_counts', 'count', 'total_us', 'min_us', 'max_us', '_lock')
+
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        value = int(seconds * 1_000_000)
+        index = bucket_index(value)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.total_us += value
+            if self.min_us is None or value < self.min_us:
+                self.min_us = value
+            if value > self.max_us:
+                self.max_us = value
+
+    def merge(self, other: 'LatencyHistogram'):
+        """다른 히스토그램 누적 (프로세스 스냅샷 병합용)"""
+        with self._lock:
+            for index, count in other._counts.items():
+                self._counts[index] = self._counts.get(index, 0) + count
+            self.count += other.count
+            self.total_us += other.total_us
+            if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+                self.min_us = other.min_us
+            self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, q: float) -> float:
+        """백분위 지연 시간 (밀리초, 버킷 상한 기준)"""
+        with self._lock:
+            if self.count == 0:
+                return 0.0
+            rank = max(1, int(round(q / 100.0 * self.count)))
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= rank:
+                    return min(bucket_bounds(index)[1], self.max_us) / 1000.0
+            return self.max_us / 1000.0
+
+    def summary(self) -> Dict[str, Any]:
+        """요약 통계 (밀리초)"""
+        count = self.count
+        return {
+            'count': count,
+            'mean_ms': round(self.total_us / count / 1000.0, 3) if count else 0.0,
+            'min_ms': round((self.min_us or 0) / 1000.0, 3),
+            'p50_ms': round(self.percentile(50), 3),
+            'p90_ms': round(self.percentile(90), 3),
+            'p99_ms': round(self.percentile(99), 3),
+            'max_ms': round(self.max_us / 1000.0, 3),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """압축 직렬화 (0이 아닌 버킷만 [인덱스, 개수] 쌍으로)"""
+        with self._lock:
+            buckets = [[index, self._counts[index]] for index in sorted(self._counts)]
+        return {**self.summary(), 'total_us': self.total_us, 'buckets': buckets}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencyHistogram':
+        histogram = cls()
+        for index, count in data.get('buckets', []):
+            histogram._counts[int(index)] = int(count)
+        histogram.count = int(data.get('count', 0))
+        histogram.total_us = int(data.get('total_us', 0))
+        if histogram.count:
+            histogram.min_us = int(round(data.get('min_ms', 0.0) * 1000))
+        histogram.max_us = int(round(data.get('max_ms', 0.0) * 1000))
+        return histogram
+
+
+@dataclass
+class LatencyConfig:
+    """지연 시간 수집 설정"""
+    enabled: bool = True
+    sample_rate: float = 1.0                        # 0~1, 기록할 호출 비율
+    snapshot_dir: str = DEFAULT_SNAPSHOT_DIR
+    snapshot_interval_seconds: float = 60.0
+    service_name: str = field(default_factory=lambda: f"pid{os.getpid()}")
+
+    @classmethod
+    def from_env(cls) -> 'LatencyConfig':
+        """환경 변수 기반 설정 (HANTU_LATENCY_ENABLED, HANTU_LATENCY_SAMPLE_RATE)"""
+        config = cls()
+        config.enabled = os.getenv('HANTU_LATENCY_ENABLED', '1').lower() not in ('0', 'false', 'no')
+        try:
+            config.sample_rate = min(1.0, max(0.0, float(os.getenv('HANTU_LATENCY_SAMPLE_RATE', '1.0'))))
+        except ValueError:
+            pass
+        config.snapshot_dir = os.getenv('HANTU_LATENCY_SNAPSHOT_DIR', config.snapshot_dir)
+        return config
+
+
+class _Timer:
+    """구간 측정 컨텍스트 (샘플에서 제외되면 시간 측정 자체를 생략)"""
+
+    __slots__ = ('_registry', '_name', '_started')
+
+    def __init__(self, registry: 'LatencyRegistry', name: str):
+        self._registry = registry
+        self._name = name
+        self._started = None
+
+    def __enter__(self) -> '_Timer':
+        if self._registry.should_sample():
+            self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._started is not None:
+            self._registry.record(self._name, time.perf_counter() - self._started)
+        return False
+
+
+class LatencyRegistry:
+    """구간 이름별 히스토그램 저장소"""
+
+    def __init__(self, config: Optional[LatencyConfig] = None):
+        self.config = config or LatencyConfig()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._started_at = datetime.now()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stop = threading.Event()
+
+    def should_sample(self) -> bool:
+        if not self.config.enabled:
+            return False
+        rate = self.config.sample_rate
+        return rate >= 1.0 or random.random() < rate
+
+    def _histogram(self, name: str) -> LatencyHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def record(self, name: str, seconds: float):
+        """측정값 기록 (샘플링 판단은 호출부 책임)"""
+        self._histogram(name).record(seconds)
+
+    def timer(self, name: str) -> _Timer:
+        """구간 측정 컨텍스트 매니저
+
+        Example:
+            with registry.timer(STAGE_DB_COMMIT):
+                session.commit()
+        """
+        return _Timer(self, name)
+
+    def get_histogram(self, name: str) -> Optional[LatencyHistogram]:
+        return self._histograms.get(name)
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return sorted(self._histograms)
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {}
+            self._started_at = datetime.now()
+
+    def snapshot(self, include_buckets: bool = False) -> Dict[str, Any]:
+        """현재 누적 통계
+
+        Args:
+            include_buckets: 버킷 분포 포함 여부 (파일 스냅샷/병합용)
+        """
+        with self._lock:
+            items = list(self._histograms.items())
+        stages = {
+            name: (histogram.to_dict() if include_buckets else histogram.summary())
+            for name, histogram in sorted(items)
+        }
+        return {
+            'service': self.config.service_name,
+            'pid': os.getpid(),
+            'timestamp': datetime.now().isoformat(),
+            'since': self._started_at.isoformat(),
+            'sample_rate': self.config.sample_rate,
+            'stages': stages,
+        }
+
+    def snapshot_path(self) -> Path:
+        return Path(self.config.snapshot_dir) / f"{SNAPSHOT_PREFIX}{self.config.service_name}.json"
+
+    def write_snapshot(self) -> Optional[Path]:
+        """압축 스냅샷 파일 기록 (임시 파일 교체로 원자적 쓰기)"""
+        path = self.snapshot_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot(include_buckets=True), f, ensure_ascii=False,
+                          separators=(',', ':'))
+            os.replace(tmp_path, path)
+            return path
+        except OSError as e:
+            logger.warning(f"지연 시간 스냅샷 기록 실패: {e}")
+            return None
+
+    def start_snapshot_writer(self, service_name: Optional[str] = None):
+        """주기적 스냅샷 기록 스레드 시작
+
+        같은 프로세스에서 이미 시작된 경우 기존 서비스 이름을 유지합니다.
+        """
+        if self._writer_thread and self._writer_thread.is_alive():
+            return
+        if service_name:
+            self.config.service_name = service_name
+        self._writer_stop.clear()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="latency-snapshot", daemon=True
+        )
+        self._writer_thread.start()
+        logger.info(
+            f"지연 시간 스냅샷 기록 시작: {self.snapshot_path()} "
+            f"({self.config.snapshot_interval_seconds:.0f}초 주기)"
+        )
+
+    def stop_snapshot_writer(self):
+        """스냅샷 기록 스레드 종료 (마지막 스냅샷 기록)"""
+        self._writer_stop.set()
+        if self._writer_thread:
+            self._writer_thread.join(timeout=5)
+            self._writer_thread = None
+        self.write_snapshot()
+
+    def _writer_loop(self):
+        while not self._writer_stop.wait(self.config.snapshot_interval_seconds):
+            self.write_snapshot()
+
+
+def load_snapshots(snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> List[Dict[str, Any]]:
+    """프로세스별 스냅샷 파일 로드"""
+    snapshots = []
+    directory = Path(snapshot_dir)
+    if not directory.exists():
+        return snapshots
+    for path in sorted(directory.glob(f"{SNAPSHOT_PREFIX}*.json")):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"지연 시간 스냅샷 로드 실패 ({path.name}): {e}")
+    return snapshots
+
+
+def merge_snapshots(snapshots: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """여러 프로세스 스냅샷을 구간별로 병합한 요약"""
+    merged: Dict[str, LatencyHistogram] = {}
+    for snapshot in snapshots:
+        for name, data in snapshot.get('stages', {}).items():
+            if 'buckets' not in data:
+                continue
+            merged.setdefault(name, LatencyHistogram()).merge(LatencyHistogram.from_dict(data))
+    return {name: histogram.summary() for name, histogram in sorted(merged.items())}
+
+
+# 글로벌 인스턴스
+_registry: Optional[LatencyRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_latency_registry() -> LatencyRegistry:
+    """지연 시간 저장소 인스턴스"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = LatencyRegistry(LatencyConfig.from_env())
+    return _registry
+
+
+def latency_timer(stage: str, label: Optional[str] = None) -> _Timer:
+    """구간 측정 컨텍스트 매니저 헬퍼 함수"""
+    return get_latency_registry().timer(stage_name(stage, label))
+
+
+def record_latency(stage: str, seconds: float, label: Optional[str] = None):
+    """측정값 직접 기록 헬퍼 함수 (샘플링 적용)"""
+    registry = get_latency_registry()
+    if registry.should_sample():
+        registry.record(stage_name(stage, label), seconds)
+
+
+def timed(stage: str) -> Callable:
+    """함수 실행 시간 측정 데코레이터 헬퍼 함수
+
+    Example:
+        @timed(STAGE_SCORING)
+        def score(...):
+            ...
+    """
+    def decorator(func: Callable):
+        # 데코레이터 적용 시점이 아니라 호출 시점의 저장소를 사용
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with get_latency_registry().timer(stage):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_latency_registry().timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
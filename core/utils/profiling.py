@@ -0,0 +1,158 @@
+"""
+요청형 배치 프로파일링
+
+`hantu profile enable` 이 요청 파일을 기록하면, 다음에 실행되는 대상 배치(Phase 1 스크리닝,
+Phase 2 일일 업데이트 등) 1회를 cProfile로 감싸 .prof 파일로 저장합니다.
+요청 파일이 없을 때는 stat 1회만 수행하므로 상시 켜두어도 비용이 거의 없습니다.
+
+저장된 .prof 파일은 `hantu profile show` (pstats) 또는 snakeviz 등으로 확인합니다.
+장시간 실행 중인 프로세스의 스택 샘플링이 필요하면 py-spy(`py-spy record --pid`)를 별도로 사용합니다.
+"""
+
+import cProfile
+import fnmatch
+import json
+import os
+import pstats
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from io import StringIO
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+# 작업 디렉토리와 무관하게 `hantu profile` CLI와 같은 위치 사용 (프로젝트 루트 기준)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_PROFILE_DIR = os.getenv('HANTU_PROFILE_DIR', str(PROJECT_ROOT / "data" / "profiling"))
+REQUEST_FILE = "request.json"
+
+# 프로파일링 대상 배치 이름
+BATCH_PHASE1_SCREENING = "phase1.screening"
+BATCH_PHASE2_UPDATE = "phase2.daily_update"
+
+# cProfile은 스레드당 하나만 활성화 가능하므로 동시 배치는 첫 번째만 프로파일링
+_active_lock = threading.Lock()
+
+
+def _request_path(profile_dir: str) -> Path:
+    return Path(profile_dir) / REQUEST_FILE
+
+
+def request_profile(target: str = "*", batches: int = 1,
+                    profile_dir: str = DEFAULT_PROFILE_DIR) -> Dict[str, Any]:
+    """프로파일링 요청 등록
+
+    Args:
+        target: 대상 배치 이름 (glob 패턴, 예: "phase2.*")
+        batches: 프로파일링할 배치 횟수
+        profile_dir: 요청/결과 디렉토리
+
+    Returns:
+        Dict: 기록된 요청
+    """
+    request = {
+        'target': target,
+        'remaining': max(1, int(batches)),
+        'requested_at': datetime.now().isoformat(),
+    }
+    path = _request_path(profile_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_json(path, request)
+    return request
+
+
+def cancel_profile(profile_dir: str = DEFAULT_PROFILE_DIR) -> bool:
+    """프로파일링 요청 취소"""
+    try:
+        _request_path(profile_dir).unlink()
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def get_profile_request(profile_dir: str = DEFAULT_PROFILE_DIR) -> Optional[Dict[str, Any]]:
+    """대기 중인 프로파일링 요청 (없으면 None)"""
+    path = _request_path(profile_dir)
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def list_profiles(profile_dir: str = DEFAULT_PROFILE_DIR) -> List[Path]:
+    """저장된 프로파일 결과 (최신순)"""
+    directory = Path(profile_dir)
+    if not directory.exists():
+        return []
+    return sorted(directory.glob("*.prof"), key=lambda p: p.stat().st_mtime, reverse=True)
+
+
+def format_profile(path: str, limit: int = 30, sort_by: str = "cumulative") -> str:
+    """프로파일 결과 상위 함수 목록 문자열"""
+    stream = StringIO()
+    stats = pstats.Stats(str(path), stream=stream)
+    stats.strip_dirs().sort_stats(sort_by).print_stats(limit)
+    return stream.getvalue()
+
+
+def _write_json(path: Path, data: Dict[str, Any]):
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _claim_request(batch_name: str, profile_dir: str) -> bool:
+    """요청이 이 배치에 해당하면 남은 횟수를 차감하고 True"""
+    request = get_profile_request(profile_dir)
+    if not request or not fnmatch.fnmatch(batch_name, request.get('target', '*')):
+        return False
+
+    remaining = int(request.get('remaining', 1)) - 1
+    if remaining > 0:
+        request['remaining'] = remaining
+        _write_json(_request_path(profile_dir), request)
+    else:
+        cancel_profile(profile_dir)
+    return True
+
+
+@contextmanager
+def profile_batch(batch_name: str, profile_dir: Optional[str] = None) -> Iterator[Optional[Path]]:
+    """요청이 있을 때만 배치 1회를 cProfile로 프로파일링
+
+    데코레이터로도 사용할 수 있습니다.
+
+    Example:
+        with profile_batch(BATCH_PHASE2_UPDATE):
+            run_daily_update()
+    """
+    profile_dir = profile_dir or DEFAULT_PROFILE_DIR
+    if not _request_path(profile_dir).exists() or not _active_lock.acquire(blocking=False):
+        yield None
+        return
+
+    try:
+        if not _claim_request(batch_name, profile_dir):
+            yield None
+            return
+
+        output = Path(profile_dir) / f"{batch_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.prof"
+        profiler = cProfile.Profile()
+        logger.info(f"배치 프로파일링 시작: {batch_name}")
+        profiler.enable()
+        try:
+            yield output
+        finally:
+            profiler.disable()
+            profiler.dump_stats(str(output))
+            logger.info(f"배치 프로파일링 완료: {output}")
+    finally:
+        _active_lock.release()
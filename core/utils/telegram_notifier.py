@@ -9,7 +9,7 @@ import requests
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, TYPE_CHECKING
 
 # 성과 지표 계산 모듈 import
 try:
@@ -18,9 +18,16 @@ except ImportError:
     get_performance_metrics = None
 
 from core.utils.log_utils import get_logger
+from core.utils.latency_metrics import latency_timer, STAGE_NOTIFICATION
+
+if TYPE_CHECKING:
+    from core.notification.delivery_queue import DeliveryConfig, DeliveryQueue
 
 logger = get_logger(__name__)
 
+# 배치 요약 알림 병합 키
+BATCH_SUMMARY_COALESCE_KEY = "phase2_batch_summary"
+
 
 class TelegramNotifier:
     """텔레그램 알림 전송 클래스"""
@@ -36,6 +43,9 @@ class TelegramNotifier:
         self._chat_ids = []
         self._enabled = False
 
+        # 비동기 발송 큐 (enable_async_delivery 호출 시 활성화)
+        self._delivery_queue: Optional["DeliveryQueue"] = None
+
         self._load_config()
 
     def _load_config(self):
@@ -76,11 +86,125 @@ class TelegramNotifier:
             logger.error(f"텔레그램 설정 로드 실패: {e}", exc_info=True)
             self._enabled = False
 
+    def enable_async_delivery(
+        self, config: Optional["DeliveryConfig"] = None
+    ) -> Optional["DeliveryQueue"]:
+        """비동기 발송 큐 활성화
+
+        활성화 이후 send_message는 큐에 넣고 즉시 반환하며, 실제 전송과 재시도는
+        백그라운드 워커가 채팅방별 속도 제한에 맞춰 수행합니다.
+
+        Args:
+            config: 발송 큐 설정 (아웃박스 경로, 병합 윈도우 등)
+
+        Returns:
+            활성화된 발송 큐 (텔레그램 비활성화 시 None)
+        """
+        if not self._enabled:
+            return None
+
+        if self._delivery_queue is None:
+            from core.notification.delivery_queue import DeliveryQueue
+
+            queue = DeliveryQueue(config)
+            for chat_id in self._chat_ids:
+                queue.register_target(
+                    self._delivery_target(chat_id),
+                    lambda text, options, _chat_id=chat_id: self._post_to_chat(
+                        _chat_id, text, options.get("disable_notification", False)
+                    ),
+                )
+            self._delivery_queue = queue
+
+        self._delivery_queue.start()
+        logger.info("텔레그램 비동기 발송 활성화")
+        return self._delivery_queue
+
+    def disable_async_delivery(self, timeout: float = 10.0) -> None:
+        """대기 중인 메시지를 발송한 뒤 비동기 발송 큐 중지
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+        """
+        if self._delivery_queue is None:
+            return
+
+        self._delivery_queue.stop(flush=True, timeout=timeout)
+        self._delivery_queue = None
+
+    @staticmethod
+    def _delivery_target(chat_id) -> str:
+        return f"telegram:{chat_id}"
+
+    def _submit_message(
+        self, formatted_message: str, priority: str, coalesce_key: Optional[str]
+    ) -> bool:
+        """발송 큐에 메시지 등록 (즉시 반환)"""
+        options = {
+            "disable_notification": self._should_silent_notification(priority),
+        }
+        for chat_id in self._chat_ids:
+            self._delivery_queue.submit(
+                self._delivery_target(chat_id),
+                formatted_message,
+                coalesce_key=coalesce_key,
+                options=options,
+            )
+        logger.debug(f"텔레그램 알림 큐 등록 ({priority}): {len(self._chat_ids)}개 채팅방")
+        return True
+
+    def _post_to_chat(self, chat_id, text: str, disable_notification: bool):
+        """단일 채팅방으로 1회 전송 (발송 큐 워커 전용, 재시도는 큐가 담당)
+
+        Returns:
+            NotificationResult: 429 응답 시 response에 retry_after 포함,
+                그 외 4xx(잘못된 요청, 차단 등)는 재시도해도 실패하므로 retryable=False
+        """
+        from core.notification.notifier import NotificationResult
+
+        url = f"https://api.telegram.org/bot{self._bot_token}/sendMessage"
+        payload = {
+            "chat_id": chat_id,
+            "text": text,
+            "disable_web_page_preview": False,
+            "disable_notification": disable_notification,
+        }
+
+        try:
+            with latency_timer(STAGE_NOTIFICATION):
+                response = requests.post(url, json=payload, timeout=10)
+            if response.status_code == 429:
+                retry_after = int(response.headers.get("Retry-After", 5))
+                return NotificationResult(
+                    success=False,
+                    alert_id=str(chat_id),
+                    error="Rate limited (429)",
+                    response={"retry_after": min(retry_after, 60)},
+                )
+            if 400 <= response.status_code < 500:
+                return NotificationResult(
+                    success=False,
+                    alert_id=str(chat_id),
+                    error=f"HTTP {response.status_code}: {response.text[:200]}",
+                    response={"retryable": False},
+                )
+            response.raise_for_status()
+            return NotificationResult(success=True, alert_id=str(chat_id))
+
+        except Exception as e:
+            return NotificationResult(success=False, alert_id=str(chat_id), error=str(e))
+
     def send_message(
-        self, message: str, priority: str = "normal", max_retries: int = 3
+        self,
+        message: str,
+        priority: str = "normal",
+        max_retries: int = 3,
+        coalesce_key: Optional[str] = None,
     ) -> bool:
         """텔레그램 메시지 전송 (재시도 로직 포함)
 
+        비동기 발송이 활성화되어 있으면 큐에 등록하고 즉시 반환합니다.
+
         Args:
             message: 전송할 메시지
             priority: 우선순위
@@ -91,9 +215,10 @@ class TelegramNotifier:
                 - low: ℹ️ 정보성 알림
                 - info: 💡 참고 정보
             max_retries: 최대 재시도 횟수 (기본값 3)
+            coalesce_key: 병합 키 (비동기 발송 시 같은 키 메시지를 하나로 병합)
 
         Returns:
-            전송 성공 여부
+            전송 성공 여부 (비동기 발송 시 큐 등록 여부)
         """
         if not self._enabled:
             logger.warning("텔레그램 알림이 비활성화됨")
@@ -101,6 +226,9 @@ class TelegramNotifier:
 
         # 우선순위에 따른 메시지 포맷 추가
         formatted_message = self._format_message_by_priority(message, priority)
+
+        if self._delivery_queue is not None and self._delivery_queue.is_running():
+            return self._submit_message(formatted_message, priority, coalesce_key)
         url = f"https://api.telegram.org/bot{self._bot_token}/sendMessage"
 
         # 우선순위에 따른 알림 설정
@@ -122,7 +250,8 @@ class TelegramNotifier:
             sent = False
             for attempt in range(max_retries):
                 try:
-                    response = requests.post(url, json=payload, timeout=10)
+                    with latency_timer(STAGE_NOTIFICATION):
+                        response = requests.post(url, json=payload, timeout=10)
                     response.raise_for_status()
 
                     # 성공
@@ -869,7 +998,9 @@ KIS_ACCOUNT_NO=your_account
                 message += f"\n❌ 에러: {errors}건"
 
             priority = "high" if errors > 0 else "normal"
-            return self.send_message(message, priority=priority)
+            return self.send_message(
+                message, priority=priority, coalesce_key=BATCH_SUMMARY_COALESCE_KEY
+            )
 
         except Exception as e:
             logger.error(f"배치 요약 알림 생성 실패: {e}", exc_info=True)
@@ -7,11 +7,13 @@ from .workflow_state_manager import (
     WorkflowCheckpoint,
     get_workflow_state_manager
 )
+from .state_journal import StateJournal
 
 __all__ = [
     'WorkflowStateManager',
     'WorkflowStage',
     'WorkflowStatus',
     'WorkflowCheckpoint',
-    'get_workflow_state_manager'
+    'get_workflow_state_manager',
+    'StateJournal'
 ]
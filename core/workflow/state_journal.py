@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+추가 전용(append-only) 상태 저널
+- 변경 사항을 JSONL 레코드로 추가만 하므로 기록 비용이 전체 상태 크기와 무관
+- fsync는 레코드 수/시간 단위로 묶어서 수행 (flush는 매 기록마다 수행하여 프로세스 종료에는 안전)
+- 주기적으로 스냅샷을 원자적으로 저장한 뒤 저널을 비움 (compaction)
+- 복구 시 스냅샷 이후 레코드만 재생하고, 중간에 끊긴 마지막 줄은 잘라냄
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from core.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class StateJournal:
+    """스냅샷 + 추가 전용 저널
+
+    Usage:
+        journal = StateJournal(dir_path, "workflow")
+        state = journal.load_snapshot() or {}
+        for record in journal.replay():
+            apply(state, record)
+        journal.append({"op": "set", ...})
+        if journal.needs_compaction():
+            journal.compact(state)
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        name: str,
+        fsync_every: int = 32,
+        fsync_interval_seconds: float = 1.0,
+        compact_threshold: int = 1000,
+    ):
+        """
+        Args:
+            directory: 저장 디렉토리
+            name: 파일 이름 접두사 ({name}_journal.jsonl, {name}_snapshot.json)
+            fsync_every: fsync 전 최대 누적 레코드 수 (1이면 매 기록마다 fsync)
+            fsync_interval_seconds: 마지막 fsync 이후 최대 경과 시간
+            compact_threshold: 스냅샷 이후 레코드가 이 수를 넘으면 압축 필요
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.journal_path = self.directory / f"{name}_journal.jsonl"
+        self.snapshot_path = self.directory / f"{name}_snapshot.json"
+
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.compact_threshold = max(1, compact_threshold)
+
+        self._file = None
+        self._seq = 0                 # 마지막으로 기록/재생된 레코드 번호
+        self._snapshot_seq = 0        # 스냅샷에 반영된 마지막 레코드 번호
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # 복구
+    # ------------------------------------------------------------------
+    def load_snapshot(self) -> Optional[Dict[str, Any]]:
+        """스냅샷 상태 로드 (없거나 손상 시 None)"""
+        if not self.snapshot_path.exists():
+            return None
+
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except Exception as e:
+            logger.error(f"스냅샷 로드 실패, 저널만 재생: {e}", exc_info=True)
+            return None
+
+        self._snapshot_seq = payload.get('seq', 0)
+        self._seq = max(self._seq, self._snapshot_seq)
+        return payload.get('state')
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """스냅샷 이후 레코드 재생
+
+        끊긴 마지막 줄(기록 중 중단)은 버리고 파일을 마지막 정상 위치로 잘라냅니다.
+        """
+        if not self.journal_path.exists():
+            return
+
+        valid_end = 0
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                valid_end += len(line)
+
+                seq = entry.get('seq', 0)
+                if seq <= self._snapshot_seq:
+                    continue
+                self._seq = max(self._seq, seq)
+                yield entry['record']
+
+        if valid_end < self.journal_path.stat().st_size:
+            logger.warning(f"저널 끝의 불완전한 기록 제거: {self.journal_path.name}")
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(valid_end)
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def append(self, record: Dict[str, Any]) -> int:
+        """레코드 추가
+
+        Returns:
+            int: 레코드 번호
+        """
+        if self._file is None:
+            self._file = open(self.journal_path, 'ab')
+
+        self._seq += 1
+        line = json.dumps(
+            {'seq': self._seq, 'record': record},
+            ensure_ascii=False, separators=(',', ':'), default=str
+        )
+        self._file.write(line.encode('utf-8') + b'\n')
+        self._file.flush()
+
+        self._unsynced += 1
+        if (self._unsynced >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval_seconds):
+            self.sync()
+        return self._seq
+
+    def sync(self):
+        """누적된 기록을 디스크에 fsync"""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    @property
+    def pending_records(self) -> int:
+        """스냅샷 이후 저널 레코드 수"""
+        return self._seq - self._snapshot_seq
+
+    def needs_compaction(self) -> bool:
+        return self.pending_records >= self.compact_threshold
+
+    def compact(self, state: Dict[str, Any]):
+        """스냅샷 저장 후 저널 비우기
+
+        스냅샷을 먼저 원자적으로 교체하므로, 저널을 비우기 전에 중단되어도
+        복구 시 스냅샷 번호 이하의 레코드는 건너뛰어 중복 적용되지 않습니다.
+
+        Args:
+            state: 현재까지의 전체 상태 (JSON 직렬화 가능)
+        """
+        tmp_path = self.snapshot_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'seq': self._seq, 'state': state}, f,
+                      ensure_ascii=False, separators=(',', ':'), default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self._snapshot_seq = self._seq
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        with open(self.journal_path, 'wb') as f:
+            os.fsync(f.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        """저널 닫기 (남은 기록 fsync)"""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
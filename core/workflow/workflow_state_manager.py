@@ -4,16 +4,20 @@
 - 작업 진행 상태 저장/복원
 - 중단된 작업 이어서 진행
 - 작업 이력 추적
+- 추가 전용 저널 + 주기적 스냅샷 저장 (체크포인트 비용이 이력 크기와 무관)
 """
 
+import atexit
 import json
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 from core.utils.log_utils import get_logger
+from core.workflow.state_journal import StateJournal
 
 logger = get_logger(__name__)
 
@@ -49,40 +53,122 @@ class WorkflowCheckpoint:
     error_message: Optional[str] = None
 
 
+HISTORY_LIMIT = 100  # 보관할 최근 체크포인트 이력 수
+
+
 class WorkflowStateManager:
-    """워크플로우 상태 관리자"""
+    """워크플로우 상태 관리자
+
+    체크포인트는 저널에 한 줄씩 추가만 하고, 단계별 최신 체크포인트와 최근 이력은
+    메모리에 유지합니다. 저널이 compact_threshold를 넘으면 스냅샷으로 압축합니다.
+    """
 
-    def __init__(self, state_dir: str = "data/workflow_state"):
-        """초기화"""
+    def __init__(self, state_dir: str = "data/workflow_state",
+                 fsync_every: int = 32, compact_threshold: int = 500):
+        """초기화
+
+        Args:
+            state_dir: 상태 저장 디렉토리
+            fsync_every: fsync 전 최대 누적 체크포인트 수
+            compact_threshold: 스냅샷 압축 기준 저널 레코드 수
+        """
         self.state_dir = Path(state_dir)
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
+        # 이전 버전 전체 재작성 방식 파일 (최초 로드 시 저널로 이전)
         self.state_file = self.state_dir / "workflow_state.json"
         self.history_file = self.state_dir / "workflow_history.json"
 
+        self.journal = StateJournal(
+            str(self.state_dir), "workflow",
+            fsync_every=fsync_every, compact_threshold=compact_threshold
+        )
+
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=HISTORY_LIMIT)
         self.current_state = self._load_current_state()
         logger.info("WorkflowStateManager 초기화 완료")
 
     def _load_current_state(self) -> Dict[str, WorkflowCheckpoint]:
-        """현재 상태 로드"""
+        """현재 상태 로드 (스냅샷 + 저널 재생)"""
+        state: Dict[str, WorkflowCheckpoint] = {}
         try:
-            if self.state_file.exists():
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            snapshot = self.journal.load_snapshot()
+            if snapshot is None:
+                snapshot = self._load_legacy_files()
 
-                state = {}
-                for stage_name, checkpoint_data in data.items():
+            if snapshot:
+                for stage_name, checkpoint_data in snapshot.get('current', {}).items():
                     state[stage_name] = WorkflowCheckpoint(**checkpoint_data)
+                self.history.extend(snapshot.get('history', []))
+
+            replayed = 0
+            for record in self.journal.replay():
+                self._apply_record(state, record)
+                replayed += 1
 
-                logger.info(f"워크플로우 상태 로드 완료: {len(state)}개 단계")
-                return state
+            if state:
+                logger.info(f"워크플로우 상태 로드 완료: {len(state)}개 단계 (저널 {replayed}건 재생)")
             else:
                 logger.info("새로운 워크플로우 상태 생성")
-                return {}
+            return state
 
         except Exception as e:
             logger.error(f"워크플로우 상태 로드 실패: {e}", exc_info=True)
-            return {}
+            return state
+
+    def _load_legacy_files(self) -> Optional[Dict[str, Any]]:
+        """이전 형식(workflow_state.json / workflow_history.json) 로드"""
+        if not self.state_file.exists():
+            return None
+
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            current = json.load(f)
+
+        history = []
+        if self.history_file.exists():
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+
+        logger.info("이전 형식 워크플로우 상태를 저널 형식으로 이전")
+        legacy = {'current': current, 'history': history[-HISTORY_LIMIT:]}
+        self.journal.compact(legacy)
+        return legacy
+
+    def _apply_record(self, state: Dict[str, WorkflowCheckpoint], record: Dict[str, Any]):
+        """저널 레코드를 메모리 상태에 반영"""
+        op = record.get('op')
+        if op == 'checkpoint':
+            checkpoint_data = record['checkpoint']
+            state[checkpoint_data['stage']] = WorkflowCheckpoint(**checkpoint_data)
+            self.history.append(checkpoint_data)
+        elif op == 'reset_stage':
+            state.pop(record['stage'], None)
+        elif op == 'reset_all':
+            state.clear()
+
+    def _write(self, record: Dict[str, Any]):
+        """레코드를 저널에 추가하고 필요 시 압축"""
+        self.journal.append(record)
+        if self.journal.needs_compaction():
+            self.compact()
+
+    def compact(self):
+        """현재 상태를 스냅샷으로 저장하고 저널 비우기"""
+        self.journal.compact({
+            'current': {
+                stage_name: asdict(checkpoint)
+                for stage_name, checkpoint in self.current_state.items()
+            },
+            'history': list(self.history),
+        })
+
+    def flush(self):
+        """누적된 체크포인트를 디스크에 동기화"""
+        self.journal.sync()
+
+    def close(self):
+        """저널 닫기"""
+        self.journal.close()
 
     def save_checkpoint(self, stage: WorkflowStage, status: WorkflowStatus,
                        progress: float, current_step: str, total_steps: int,
@@ -102,43 +188,20 @@ class WorkflowStateManager:
                 error_message=error_message
             )
 
-            self.current_state[stage.value] = checkpoint
-
-            # 파일 저장
-            state_data = {
-                stage_name: asdict(checkpoint)
-                for stage_name, checkpoint in self.current_state.items()
-            }
-
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f, ensure_ascii=False, indent=2)
+            # 메모리 상태/이력 반영 후 저널에 한 줄 추가
+            record = {'op': 'checkpoint', 'checkpoint': asdict(checkpoint)}
+            self._apply_record(self.current_state, record)
+            self._write(record)
 
             logger.info(f"체크포인트 저장: {stage.value} - {status.value} ({progress:.1f}%)")
 
-            # 히스토리에도 기록
-            self._append_to_history(checkpoint)
-
         except Exception as e:
             logger.error(f"체크포인트 저장 실패: {e}", exc_info=True)
 
-    def _append_to_history(self, checkpoint: WorkflowCheckpoint):
-        """히스토리에 기록 추가"""
-        try:
-            history = []
-            if self.history_file.exists():
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
-
-            history.append(asdict(checkpoint))
-
-            # 최근 100개만 유지
-            history = history[-100:]
-
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(history, f, ensure_ascii=False, indent=2)
-
-        except Exception as e:
-            logger.error(f"히스토리 기록 실패: {e}", exc_info=True)
+    def get_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """최근 체크포인트 이력 조회 (오래된 순)"""
+        history = list(self.history)
+        return history[-limit:] if limit else history
 
     def get_checkpoint(self, stage: WorkflowStage) -> Optional[WorkflowCheckpoint]:
         """특정 단계의 체크포인트 조회"""
@@ -213,25 +276,20 @@ class WorkflowStateManager:
         """특정 단계 초기화"""
         if stage.value in self.current_state:
             del self.current_state[stage.value]
-            self._save_state()
+            self._save_state({'op': 'reset_stage', 'stage': stage.value})
             logger.info(f"단계 초기화: {stage.value}")
 
     def reset_all(self):
         """전체 상태 초기화"""
         self.current_state = {}
-        self._save_state()
+        self._save_state({'op': 'reset_all'})
         logger.info("전체 워크플로우 상태 초기화")
 
-    def _save_state(self):
-        """상태 파일 저장"""
+    def _save_state(self, record: Dict[str, Any]):
+        """상태 변경 기록 (초기화는 즉시 디스크에 동기화)"""
         try:
-            state_data = {
-                stage_name: asdict(checkpoint)
-                for stage_name, checkpoint in self.current_state.items()
-            }
-
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f, ensure_ascii=False, indent=2)
+            self._write(record)
+            self.journal.sync()
 
         except Exception as e:
             logger.error(f"상태 저장 실패: {e}", exc_info=True)
@@ -273,4 +331,6 @@ def get_workflow_state_manager() -> WorkflowStateManager:
     """싱글톤 WorkflowStateManager 인스턴스 반환"""
     if not hasattr(get_workflow_state_manager, '_instance'):
         get_workflow_state_manager._instance = WorkflowStateManager()
+        # 종료 시 fsync 대기 중인 체크포인트 동기화
+        atexit.register(get_workflow_state_manager._instance.close)
     return get_workflow_state_manager._instance
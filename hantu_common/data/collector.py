@@ -16,6 +16,7 @@ from core.api.kis_api import KISAPI
 from core.config import settings
 from core.config.api_config import APIConfig
 from core.database import StockRepository
+from core.database.ohlcv_store import get_ohlcv_store, ohlcv_store_enabled
 from ..utils.date_utils import get_previous_business_day, is_market_closed
 from ..indicators import RSI, MovingAverage, BollingerBands, MACD, Stochastic, ATR
 
@@ -52,6 +53,9 @@ class StockDataCollector:
         for data_type in ['daily', 'minute', 'tick']:
             (self.stock_data_dir / data_type).mkdir(parents=True, exist_ok=True)
             (self.technical_data_dir / data_type).mkdir(parents=True, exist_ok=True)
+
+        # 일봉 이력 저장소 (마지막 저장일 이후만 조회)
+        self.ohlcv_store = get_ohlcv_store() if ohlcv_store_enabled() else None
             
     def collect_stock_data(self,
                           stock_codes: List[str],
@@ -95,23 +99,22 @@ class StockDataCollector:
                         market='KOSPI' if stock.get_market_ticker_section(code) == 'KOSPI' else 'KOSDAQ'
                     )
                     
+                    new_bars = None
                     if is_realtime and not is_market_closed():
                         # 실시간 데이터는 한투 API 사용
                         data = self.api.get_stock_history(code, period=data_type)
+                    elif data_type == 'daily' and self.ohlcv_store is not None:
+                        # 과거 일봉은 저장소 마지막 저장일 이후분만 pykrx 조회
+                        new_bars = self._fetch_daily_incremental(code, start_date, end_date)
+                        data = self.ohlcv_store.load(code, start=start_date, end=end_date, with_amount=True)
                     else:
                         # 과거 데이터는 pykrx 사용
-                        data = stock.get_market_ohlcv_by_date(
-                            fromdate=start_date,
-                            todate=end_date,
-                            ticker=code
-                        )
-                        # 컬럼명 통일
-                        data.columns = ['open', 'high', 'low', 'close', 'volume', 'amount']
+                        data = self._fetch_pykrx_ohlcv(code, start_date, end_date)
                         
                     if data is not None and not data.empty:
-                        # 데이터베이스에 저장
+                        # 데이터베이스에 저장 (증분 조회 시 새로 받은 봉만)
                         prices = []
-                        for idx, row in data.iterrows():
+                        for idx, row in (data if new_bars is None else new_bars).iterrows():
                             prices.append({
                                 'date': idx,
                                 'open': row['open'],
@@ -151,6 +154,47 @@ class StockDataCollector:
             logger.error(f"[collect_stock_data] 데이터 수집 중 오류 발생: {str(e)}")
             raise
             
+    def _fetch_pykrx_ohlcv(self, code: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """pykrx 일봉 조회 (컬럼명 통일)"""
+        data = stock.get_market_ohlcv_by_date(
+            fromdate=start_date,
+            todate=end_date,
+            ticker=code
+        )
+        data.columns = ['open', 'high', 'low', 'close', 'volume', 'amount']
+        return data
+
+    def _fetch_daily_incremental(self, code: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """저장소에 없는 구간만 조회하여 저장
+
+        저장 이력이 시작일을 덮으면 마지막 저장일(부분 봉 갱신)부터, 아니면 전체 구간을 조회합니다.
+        전체 구간 조회는 기존 연속 저장 구간의 시작일(없으면 마지막 저장일)까지 이어서 조회하므로,
+        과거 구간을 나중에 채워도 저장 구간 사이에 빈 곳이 생기지 않습니다.
+
+        Returns:
+            pd.DataFrame: 새로 조회한 봉
+        """
+        fetch_from, fetch_to, full = start_date, end_date, True
+        last = self.ohlcv_store.last_date(code)
+        covered = self.ohlcv_store.covered_from(code)
+        requested = datetime.strptime(start_date, '%Y%m%d').date()
+        if last is not None and covered is not None and covered <= requested:
+            fetch_from, full = last.strftime('%Y%m%d'), False
+        elif last is not None:
+            joined = (covered or last).strftime('%Y%m%d')
+            fetch_to = max(end_date, joined)
+
+        if fetch_from > fetch_to:
+            return pd.DataFrame()
+
+        data = self._fetch_pykrx_ohlcv(code, fetch_from, fetch_to)
+        if not data.empty:
+            self.ohlcv_store.append(
+                code, data.rename_axis('date'), covered_from=start_date if full else None
+            )
+            logger.debug(f"[collect_stock_data] {code} 일봉 {len(data)}개 조회 ({fetch_from}~{fetch_to})")
+        return data
+
     def process_technical_indicators(self,
                                    data: pd.DataFrame,
                                    indicators: List[Dict[str, any]] = None) -> pd.DataFrame:
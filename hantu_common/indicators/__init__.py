@@ -7,6 +7,7 @@ from .trend import MovingAverage, MACD, SlopeIndicator
 from .momentum import RSI, Stochastic, MomentumScore
 from .volatility import BollingerBands, ATR
 from .volume import OBV, VolumeProfile, VolumePriceAnalyzer, RelativeVolumeStrength, VolumeClusterAnalyzer
+from .vectorized import make_panel, is_panel
 from .volume_indicators import (
     VolumeIndicators,
     OBVAnalyzer,
@@ -32,6 +33,8 @@ __all__ = [
     'VolumePriceAnalyzer',
     'RelativeVolumeStrength',
     'VolumeClusterAnalyzer',
+    'make_panel',
+    'is_panel',
     # Volume Indicators (P1-4)
     'VolumeIndicators',
     'OBVAnalyzer',
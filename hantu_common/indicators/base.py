@@ -4,34 +4,63 @@ Base class for technical indicators.
 
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import Union
+from typing import Callable, Sequence, Union
+
+from .vectorized import OHLCV_FIELDS, apply_ragged, is_panel, present_rows
 
 class Indicator(ABC):
     """기술지표 기본 클래스"""
+
+    # 종목별 스칼라/딕셔너리를 반환하는 분석기는 패널 입력을 받지 않음
+    supports_panel = True
     
     def __init__(self, data: pd.DataFrame):
         """
         Args:
             data: OHLCV 데이터를 포함하는 DataFrame
                 - required columns: ['open', 'high', 'low', 'close', 'volume']
+                - (필드, 종목) 2단 컬럼 패널(make_panel)이면 전 종목을 한 번에 계산하며,
+                  결과는 Series 대신 (날짜 × 종목) DataFrame
+                - 패널에서 종목에 없는 날짜(상장 전, 거래정지)는 결과도 NaN
+                - supports_panel이 False인 지표는 패널 입력 시 ValueError
         """
-        required_columns = ['open', 'high', 'low', 'close', 'volume']
+        required_columns = OHLCV_FIELDS
         if not all(col in data.columns for col in required_columns):
             raise ValueError(f"데이터프레임에 필수 컬럼이 없습니다: {required_columns}")
             
+        if is_panel(data) and not self.supports_panel:
+            raise ValueError("패널 입력 미지원")
+
         self.data = data.copy()
+        self.is_panel = is_panel(self.data)
+        self._present = None
         self._validate_data()
         
     def _validate_data(self):
         """데이터 유효성 검증"""
-        # 데이터 타입 검증
-        numeric_columns = ['open', 'high', 'low', 'close', 'volume']
-        for col in numeric_columns:
-            if not pd.api.types.is_numeric_dtype(self.data[col]):
+        # 데이터 타입 검증 (패널은 종목 컬럼별)
+        for col, dtype in self.data.dtypes.items():
+            field = col[0] if self.is_panel else col
+            if field in OHLCV_FIELDS and not pd.api.types.is_numeric_dtype(dtype):
                 self.data[col] = pd.to_numeric(self.data[col], errors='coerce')
                 
         # 결측치 처리
-        self.data = self.data.ffill().bfill()
+        filled = self.data.ffill().bfill()
+        if self.is_panel:
+            # 종목에 없는 행(상장 전, 거래정지)은 다른 행 값으로 채우지 않음
+            present = present_rows(self.data)
+            if not present.to_numpy().all():
+                mask = present.reindex(columns=self.data.columns.get_level_values(1)).to_numpy()
+                filled = filled.where(mask)
+                self._present = present
+        self.data = filled
+
+    def _compute(self, kernel: Callable, fields: Sequence[str], *args):
+        """필드 컬럼으로 벡터화 커널 계산 (행 구성이 다른 패널은 종목별 행만 사용)"""
+        inputs = [self.data[field] for field in fields]
+        if self._present is None:
+            return kernel(*inputs, *args)
+        return apply_ragged(kernel, inputs, self._present, *args)
         
     @abstractmethod
     def calculate(self) -> Union[pd.Series, pd.DataFrame]:
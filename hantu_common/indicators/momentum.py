@@ -5,6 +5,7 @@ Momentum indicators module.
 import pandas as pd
 from typing import Tuple, Optional
 from .base import Indicator
+from . import vectorized
 
 class RSI(Indicator):
     """RSI (Relative Strength Index) 지표"""
@@ -16,26 +17,10 @@ class RSI(Indicator):
             period: RSI 계산 기간
             
         Returns:
-            pd.Series: RSI 값
+            pd.Series: RSI 값 (패널이면 날짜 × 종목 DataFrame)
         """
         self._validate_period(period)
-        
-        # 가격 변화
-        delta = self.data['close'].diff()
-        
-        # 상승/하락 구분
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        
-        # 평균 계산
-        avg_gain = gain.rolling(window=period).mean()
-        avg_loss = loss.rolling(window=period).mean()
-        
-        # RSI 계산
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
+        return self._compute(vectorized.rsi, ['close'], period)
 
     def get_latest(self, period: int = 14) -> Optional[float]:
         """최신 RSI 값 반환
@@ -44,7 +29,7 @@ class RSI(Indicator):
             period: RSI 계산 기간
             
         Returns:
-            Optional[float]: 최신 RSI 값
+            Optional[float]: 최신 RSI 값 (패널이면 종목별 Series)
         """
         try:
             rsi = self.calculate(period)
@@ -130,18 +115,7 @@ class Stochastic(Indicator):
             Tuple[pd.Series, pd.Series]: (K%, D%)
         """
         self._validate_period(k_period)
-        
-        # 최저가/최고가 계산
-        low_min = self.data['low'].rolling(window=k_period).min()
-        high_max = self.data['high'].rolling(window=k_period).max()
-        
-        # Fast %K 계산
-        fast_k = 100 * (self.data['close'] - low_min) / (high_max - low_min)
-        
-        # Slow %K 계산 (Fast %K의 이동평균)
-        slow_k = fast_k.rolling(window=smooth_k).mean()
-        
-        # Slow %D 계산 (Slow %K의 이동평균)
-        slow_d = slow_k.rolling(window=d_period).mean()
-        
-        return slow_k, slow_d 
\ No newline at end of file
+        return self._compute(
+            vectorized.stochastic, ['high', 'low', 'close'],
+            k_period, d_period, smooth_k,
+        )
\ No newline at end of file
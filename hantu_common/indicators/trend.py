@@ -6,6 +6,7 @@ import pandas as pd
 import numpy as np
 from typing import Union, Tuple
 from .base import Indicator
+from . import vectorized
 
 class MovingAverage(Indicator):
     """이동평균선 지표"""
@@ -18,19 +19,16 @@ class MovingAverage(Indicator):
             ma_type: 이동평균 유형 ('sma', 'ema', 'wma')
             
         Returns:
-            pd.Series: 이동평균선
+            pd.Series: 이동평균선 (패널이면 날짜 × 종목 DataFrame)
         """
         self._validate_period(period)
         
         if ma_type == 'sma':
-            return self.data['close'].rolling(window=period).mean()
+            return self._compute(vectorized.sma, ['close'], period)
         elif ma_type == 'ema':
-            return self.data['close'].ewm(span=period, adjust=False).mean()
+            return self._compute(vectorized.ema, ['close'], period)
         elif ma_type == 'wma':
-            weights = np.arange(1, period + 1)
-            return self.data['close'].rolling(window=period).apply(
-                lambda x: np.sum(weights * x) / weights.sum(), raw=True
-            )
+            return self._compute(vectorized.wma, ['close'], period)
         else:
             raise ValueError("지원하지 않는 이동평균 유형입니다")
 
@@ -51,23 +49,12 @@ class MACD(Indicator):
         Returns:
             Tuple[pd.Series, pd.Series, pd.Series]: (MACD, Signal, Histogram)
         """
-        # EMA 계산
-        fast_ema = self.data['close'].ewm(span=fast_period, adjust=False).mean()
-        slow_ema = self.data['close'].ewm(span=slow_period, adjust=False).mean()
-        
-        # MACD 라인
-        macd = fast_ema - slow_ema
-        
-        # 시그널 라인
-        signal = macd.ewm(span=signal_period, adjust=False).mean()
-        
-        # MACD 히스토그램
-        histogram = macd - signal
-        
-        return macd, signal, histogram 
+        return self._compute(vectorized.macd, ['close'], fast_period, slow_period, signal_period)
 
 class SlopeIndicator(Indicator):
     """기울기(미분값) 지표 - 가격 및 이동평균의 기울기 계산"""
+
+    supports_panel = False
     
     def calculate_ma_slope(self, period: int = 20, days: int = 5) -> float:
         """이동평균 기울기 계산
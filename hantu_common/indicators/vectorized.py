@@ -0,0 +1,251 @@
+"""
+Vectorized indicator kernels.
+
+Indicator 클래스가 공유하는 계산 함수입니다. 입력은 단일 종목 Series 또는
+(날짜 × 종목) 패널 DataFrame이며, 패널이면 모든 종목을 한 번에 계산합니다.
+최적화 스윕에서 파라미터 조합마다 지표를 종목 수만큼이 아니라 한 번만 계산하기 위한 것입니다.
+"""
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Iterable, Tuple, Union
+
+Frame = Union[pd.Series, pd.DataFrame]
+
+OHLCV_FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def make_panel(frames: Dict[str, pd.DataFrame],
+               fields: Iterable[str] = OHLCV_FIELDS) -> pd.DataFrame:
+    """종목별 OHLCV → 패널 DataFrame
+
+    Args:
+        frames: 종목코드 → OHLCV DataFrame (날짜 인덱스가 달라도 되며, 종목에 없는 날짜는 NaN 행)
+        fields: 포함할 컬럼
+
+    Returns:
+        pd.DataFrame: (필드, 종목) 2단 컬럼, 날짜 인덱스.
+            panel['close']는 (날짜 × 종목) DataFrame
+    """
+    fields = list(fields)
+    panel = pd.concat({code: df[fields] for code, df in frames.items()}, axis=1)
+    return panel.swaplevel(axis=1).reindex(columns=fields, level=0)
+
+
+def is_panel(data: pd.DataFrame) -> bool:
+    """(필드, 종목) 2단 컬럼 패널 여부"""
+    return isinstance(data.columns, pd.MultiIndex) and data.columns.nlevels == 2
+
+
+def present_rows(panel: pd.DataFrame) -> pd.DataFrame:
+    """종목별 행 존재 여부 (날짜 × 종목 bool, 전 필드가 NaN인 행은 없는 행)
+
+    날짜 인덱스가 다른 종목을 make_panel로 합치면 상장 전·거래정지 구간이 NaN 행이 됩니다.
+    """
+    present = panel.notna().T.groupby(level=1, sort=False).any().T
+    return present.reindex(columns=panel.columns.get_level_values(1).unique())
+
+
+def apply_ragged(kernel, inputs: Iterable[pd.DataFrame], present: pd.DataFrame, *args):
+    """행 구성이 종목마다 다른 패널 계산
+
+    종목마다 없는 행은 빼고 계산해 종목별 계산과 같은 값을 내고, 빠진 행은 NaN으로 둡니다.
+    같은 행 구성을 가진 종목끼리 묶어 한 번에 계산합니다.
+
+    Args:
+        kernel: 계산 함수 (입력 (날짜 × 종목) DataFrame들과 args)
+        inputs: 필드별 (날짜 × 종목) DataFrame
+        present: present_rows() 결과
+
+    Returns:
+        kernel과 같은 형태 (DataFrame 또는 DataFrame 튜플), 인덱스/컬럼은 present 기준
+    """
+    inputs = list(inputs)
+    mask = present.to_numpy()
+    groups: Dict[bytes, list] = {}
+    for j in range(mask.shape[1]):
+        if mask[:, j].any():
+            groups.setdefault(mask[:, j].tobytes(), []).append(j)
+
+    parts = []
+    for columns in groups.values():
+        rows = mask[:, columns[0]]
+        codes = present.columns[columns]
+        result = kernel(*(frame.loc[rows, codes] for frame in inputs), *args)
+        parts.append(result if isinstance(result, tuple) else (result,))
+    if not parts:
+        return kernel(*inputs, *args)
+
+    outputs = tuple(
+        pd.concat([part[i] for part in parts], axis=1).reindex(index=present.index, columns=present.columns)
+        for i in range(len(parts[0]))
+    )
+    return outputs if len(outputs) > 1 else outputs[0]
+
+
+def sma(values: Frame, period: int) -> Frame:
+    return values.rolling(window=period).mean()
+
+
+def ema(values: Frame, period: int) -> Frame:
+    return values.ewm(span=period, adjust=False).mean()
+
+
+def wma(values: Frame, period: int) -> Frame:
+    """가중 이동평균 (최근 값일수록 큰 가중치 1..period)
+
+    rolling.apply 대신 슬라이딩 창 view와 가중치 내적으로 계산합니다.
+    """
+    weights = np.arange(1, period + 1, dtype=float)
+    array = values.to_numpy(dtype=float)
+    result = np.full(array.shape, np.nan)
+    if len(array) >= period:
+        windows = sliding_window_view(array, period, axis=0)
+        result[period - 1:] = windows @ weights / weights.sum()
+    if isinstance(values, pd.DataFrame):
+        return pd.DataFrame(result, index=values.index, columns=values.columns)
+    return pd.Series(result, index=values.index, name=values.name)
+
+
+def macd(close: Frame, fast_period: int = 12, slow_period: int = 26,
+         signal_period: int = 9) -> Tuple[Frame, Frame, Frame]:
+    macd_line = ema(close, fast_period) - ema(close, slow_period)
+    signal = ema(macd_line, signal_period)
+    return macd_line, signal, macd_line - signal
+
+
+def rsi(close: Frame, period: int = 14) -> Frame:
+    """RSI (단순 이동평균 방식)"""
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    rs = gain.rolling(window=period).mean() / loss.rolling(window=period).mean()
+    return 100 - (100 / (1 + rs))
+
+
+def stochastic(high: Frame, low: Frame, close: Frame, k_period: int = 14,
+               d_period: int = 3, smooth_k: int = 3) -> Tuple[Frame, Frame]:
+    """스토캐스틱 (Slow %K, Slow %D)"""
+    low_min = low.rolling(window=k_period).min()
+    high_max = high.rolling(window=k_period).max()
+    fast_k = 100 * (close - low_min) / (high_max - low_min)
+    slow_k = fast_k.rolling(window=smooth_k).mean()
+    return slow_k, slow_k.rolling(window=d_period).mean()
+
+
+def bollinger_bands(close: Frame, period: int = 20,
+                    num_std: float = 2.0) -> Tuple[Frame, Frame, Frame]:
+    """볼린저 밴드 (상단, 중간, 하단)"""
+    middle = close.rolling(window=period).mean()
+    rolling_std = close.rolling(window=period).std()
+    return middle + rolling_std * num_std, middle, middle - rolling_std * num_std
+
+
+def true_range(high: Frame, low: Frame, close: Frame) -> Frame:
+    """True Range (첫 행은 전일 종가가 없으므로 고가 - 저가)"""
+    prev_close = close.shift()
+    # fmax는 NaN을 건너뛰므로 concat(...).max(axis=1)과 같은 값
+    return np.fmax(np.fmax(high - low, (high - prev_close).abs()), (low - prev_close).abs())
+
+
+def atr(high: Frame, low: Frame, close: Frame, period: int = 14) -> Frame:
+    return ema(true_range(high, low, close), period)
+
+
+def obv(close: Frame, volume: Frame) -> Frame:
+    """OBV (상승일 +거래량, 하락일 -거래량 누적, 첫 행 0)"""
+    signed = volume.astype(float) * np.sign(close.diff())
+    signed.iloc[0] = 0.0
+    return signed.cumsum()
+
+
+def volume_profile_histogram(low: np.ndarray, high: np.ndarray, volume: np.ndarray,
+                             price_min: np.ndarray, price_step: np.ndarray,
+                             n_bins: int) -> np.ndarray:
+    """가격 구간별 거래량 (봉 거래량을 봉이 걸친 구간에 균등 분배)
+
+    봉마다 low부터 price_step 간격의 가격(np.arange(low, high, step))이 속한 구간에
+    volume / 가격 수 만큼 더합니다. 모든 봉·종목의 (구간, 가중치)를 펼쳐
+    np.bincount 한 번으로 합산하며, 같은 구간에는 봉 순서대로 더해집니다.
+
+    Args:
+        low, high, volume: (봉 수,) 또는 (봉 수 × 종목 수)
+        price_min, price_step: 종목별 첫 구간 가격과 구간 폭 (스칼라 또는 (종목 수,))
+        n_bins: 구간 수
+
+    Returns:
+        np.ndarray: (구간 수 × 종목 수) 거래량
+    """
+    low = np.asarray(low, dtype=float)
+    if low.ndim == 1:
+        low = low[:, None]
+    high = np.asarray(high, dtype=float).reshape(low.shape)
+    volume = np.asarray(volume, dtype=float).reshape(low.shape)
+    n_symbols = low.shape[1]
+    price_min = np.broadcast_to(np.asarray(price_min, dtype=float), (n_symbols,))
+    price_step = np.broadcast_to(np.asarray(price_step, dtype=float), (n_symbols,))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # 봉이 걸친 가격 수 (np.arange 길이)와 첫 구간 번호
+        counts = np.ceil((high - low) / price_step)
+        first = np.floor(np.round((low - price_min) / price_step, 9))
+    valid = (counts > 0) & np.isfinite(counts) & np.isfinite(first) & np.isfinite(volume)
+
+    counts = counts[valid].astype(np.int64)
+    first = first[valid].astype(np.int64)
+    weights = volume[valid] / counts
+    columns = np.nonzero(valid)[1]
+
+    # (봉, 가격) 쌍으로 펼침: 봉 i의 j번째 가격은 first[i] + j 구간
+    total = int(counts.sum())
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    bins = np.repeat(first, counts) + offsets
+    keep = bins < n_bins
+    index = np.repeat(columns, counts)[keep] * n_bins + bins[keep]
+
+    hist = np.bincount(index, weights=np.repeat(weights, counts)[keep],
+                       minlength=n_symbols * n_bins)
+    return hist.reshape(n_symbols, n_bins).T
+
+
+def value_area_mask(hist: np.ndarray, ratio: float = 0.68) -> np.ndarray:
+    """거래량 상위 구간부터 누적해 전체의 ratio 이하인 구간 (구간 × 종목 bool)"""
+    order = np.argsort(-hist, axis=0, kind='stable')
+    cumulative = np.cumsum(np.take_along_axis(hist, order, axis=0), axis=0)
+    inside = cumulative <= hist.sum(axis=0) * ratio
+    mask = np.zeros(hist.shape, dtype=bool)
+    np.put_along_axis(mask, order, inside, axis=0)
+    return mask
+
+
+def volume_profile_panel(low: pd.DataFrame, high: pd.DataFrame, volume: pd.DataFrame,
+                         price_levels: int = 50,
+                         value_area_ratio: float = 0.68) -> Dict[str, Union[pd.DataFrame, pd.Series]]:
+    """패널 거래량 프로파일 (종목별 최저가~최고가를 price_levels 구간으로 분할)
+
+    Returns:
+        Dict:
+            - volume_by_price: (구간 × 종목) 거래량
+            - price_levels: (구간 × 종목) 구간 시작 가격
+            - poc: 종목별 최대 거래량 구간 가격
+            - value_area: (구간 × 종목) Value Area 포함 여부
+    """
+    price_min = low.min().to_numpy(dtype=float)
+    price_step = (high.max().to_numpy(dtype=float) - price_min) / price_levels
+
+    hist = volume_profile_histogram(
+        low.to_numpy(dtype=float), high.to_numpy(dtype=float), volume.to_numpy(dtype=float),
+        price_min, price_step, price_levels,
+    )
+    prices = price_min + np.arange(price_levels)[:, None] * price_step
+    poc = prices[np.argmax(hist, axis=0), np.arange(hist.shape[1])]
+
+    columns = low.columns
+    return {
+        'volume_by_price': pd.DataFrame(hist, columns=columns),
+        'price_levels': pd.DataFrame(prices, columns=columns),
+        'poc': pd.Series(poc, index=columns),
+        'value_area': pd.DataFrame(value_area_mask(hist, value_area_ratio), columns=columns),
+    }
+
@@ -3,9 +3,9 @@ Volatility indicators module.
 """
 
 import pandas as pd
-import numpy as np
 from typing import Tuple
 from .base import Indicator
+from . import vectorized
 
 class BollingerBands(Indicator):
     """볼린저 밴드 지표"""
@@ -23,18 +23,7 @@ class BollingerBands(Indicator):
             Tuple[pd.Series, pd.Series, pd.Series]: (Upper Band, Middle Band, Lower Band)
         """
         self._validate_period(period)
-        
-        # 중간 밴드 (단순 이동평균)
-        middle_band = self.data['close'].rolling(window=period).mean()
-        
-        # 표준편차 계산
-        rolling_std = self.data['close'].rolling(window=period).std()
-        
-        # 상단/하단 밴드
-        upper_band = middle_band + (rolling_std * num_std)
-        lower_band = middle_band - (rolling_std * num_std)
-        
-        return upper_band, middle_band, lower_band
+        return self._compute(vectorized.bollinger_bands, ['close'], period, num_std)
 
 class ATR(Indicator):
     """ATR (Average True Range) 지표"""
@@ -49,16 +38,5 @@ class ATR(Indicator):
             pd.Series: ATR 값
         """
         self._validate_period(period)
-        
-        # True Range 계산
-        high_low = self.data['high'] - self.data['low']
-        high_close = np.abs(self.data['high'] - self.data['close'].shift())
-        low_close = np.abs(self.data['low'] - self.data['close'].shift())
-        
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = ranges.max(axis=1)
-        
-        # ATR 계산 (지수이동평균 사용)
-        atr = true_range.ewm(span=period, adjust=False).mean()
-        
-        return atr 
\ No newline at end of file
+        # True Range의 지수이동평균
+        return self._compute(vectorized.atr, ['high', 'low', 'close'], period) 
\ No newline at end of file
@@ -6,6 +6,7 @@ import pandas as pd
 import numpy as np
 from typing import Union, Dict, List
 from .base import Indicator
+from . import vectorized
 
 class OBV(Indicator):
     """OBV (On Balance Volume) 지표"""
@@ -14,21 +15,9 @@ class OBV(Indicator):
         """OBV 계산
         
         Returns:
-            pd.Series: OBV 값
+            pd.Series: OBV 값 (패널이면 날짜 × 종목 DataFrame)
         """
-        # 가격 변화
-        price_change = self.data['close'].diff()
-        
-        # OBV 계산
-        obv = pd.Series(index=self.data.index, dtype=float)
-        obv.iloc[0] = 0
-        
-        # 가격 변화에 따른 거래량 가감
-        obv[price_change > 0] = self.data['volume'][price_change > 0]
-        obv[price_change < 0] = -self.data['volume'][price_change < 0]
-        obv[price_change == 0] = 0
-        
-        return obv.cumsum()
+        return self._compute(vectorized.obv, ['close', 'volume'])
 
 class VolumeProfile(Indicator):
     """거래량 프로파일 지표"""
@@ -36,6 +25,9 @@ class VolumeProfile(Indicator):
     def calculate(self, price_levels: int = 50) -> Dict[str, pd.Series]:
         """거래량 프로파일 계산
         
+        각 봉의 거래량을 봉의 저가~고가가 걸친 가격 구간에 균등 분배합니다
+        (전 봉을 np.bincount 한 번으로 합산).
+        
         Args:
             price_levels: 가격 구간 수
             
@@ -44,28 +36,24 @@ class VolumeProfile(Indicator):
                 - volume_by_price: 가격대별 거래량
                 - poc: Point of Control (최대 거래량 가격)
                 - value_area: Value Area (거래량 68% 구간)
+                패널이면 vectorized.volume_profile_panel 형식 (구간 × 종목)
         """
+        if self.is_panel:
+            return vectorized.volume_profile_panel(
+                self.data['low'], self.data['high'], self.data['volume'], price_levels
+            )
+        
         # 가격 구간 설정
         price_min = self.data['low'].min()
         price_max = self.data['high'].max()
         price_step = (price_max - price_min) / price_levels
         
         # 가격 구간별 거래량 계산
-        volume_by_price = pd.Series(0.0, index=np.arange(price_min, price_max, price_step))
-        
-        for i in range(len(self.data)):
-            # 해당 봉의 거래 구간에 거래량 분배
-            low = self.data['low'].iloc[i]
-            high = self.data['high'].iloc[i]
-            volume = self.data['volume'].iloc[i]
-            
-            # 거래가 발생한 가격 구간 찾기
-            price_range = np.arange(low, high, price_step)
-            if len(price_range) > 0:
-                volume_per_level = volume / len(price_range)
-                for price in price_range:
-                    if price in volume_by_price.index:
-                        volume_by_price[price] += volume_per_level
+        price_index = np.arange(price_min, price_max, price_step)
+        volume_by_price = pd.Series(vectorized.volume_profile_histogram(
+            self.data['low'].to_numpy(), self.data['high'].to_numpy(), self.data['volume'].to_numpy(),
+            price_min, price_step, len(price_index),
+        )[:, 0], index=price_index)
         
         # Point of Control (최대 거래량 가격)
         poc = volume_by_price.idxmax()
@@ -84,6 +72,8 @@ class VolumeProfile(Indicator):
 
 class VolumePriceAnalyzer(Indicator):
     """거래량-가격 조합 분석 지표"""
+
+    supports_panel = False
     
     def calculate_volume_price_correlation(self, period: int = 20) -> float:
         """거래량-가격 변화 상관관계 계산
@@ -224,6 +214,8 @@ class VolumePriceAnalyzer(Indicator):
 
 class RelativeVolumeStrength(Indicator):
     """상대적 거래량 강도 지표"""
+
+    supports_panel = False
     
     def __init__(self, data: pd.DataFrame, market_data: pd.DataFrame = None, sector_data: pd.DataFrame = None):
         """
@@ -367,6 +359,8 @@ class RelativeVolumeStrength(Indicator):
 
 class VolumeClusterAnalyzer(Indicator):
     """거래량 클러스터링 분석 지표"""
+
+    supports_panel = False
     
     def detect_volume_clusters(self, min_cluster_size: int = 3, volume_threshold: float = 1.5) -> List[Dict]:
         """거래량 클러스터 감지
@@ -15,6 +15,7 @@ Rolling window 방식으로 전략을 Out-of-Sample 검증합니다.
 
 import argparse
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -116,6 +117,17 @@ def parse_args():
         default=10,
         help='최대 보유일 (기본값: 10일)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=max(1, (os.cpu_count() or 2) - 1),
+        help='윈도우 병렬 실행 프로세스 수 (기본값: CPU 코어 수 - 1, 1이면 순차 실행)'
+    )
+    parser.add_argument(
+        '--progress',
+        action='store_true',
+        help='윈도우 완료 즉시 결과 출력'
+    )
     parser.add_argument(
         '--output',
         type=str,
@@ -156,7 +168,8 @@ def load_config(args) -> dict:
         test_window_days=args.test_window,
         step_days=args.step,
         min_train_trades=args.min_trades,
-        purge_days=args.purge_days
+        purge_days=args.purge_days,
+        max_workers=args.workers
     )
 
     trading_config = {
@@ -178,6 +191,20 @@ def load_config(args) -> dict:
     }
 
 
+def print_window_progress(window, window_index: int, total: int):
+    """윈도우 완료 즉시 결과 출력 (--progress)"""
+    if window is None:
+        print(f"[{window_index}/{total}] 윈도우 스킵 (거래 데이터 부족)")
+        return
+
+    print(
+        f"[{window_index}/{total}] Test {window.test_start}~{window.test_end}: "
+        f"Train Sharpe {window.train_result.sharpe_ratio:.3f}, "
+        f"Test Sharpe {window.test_result.sharpe_ratio:.3f}, "
+        f"OF Ratio {window.overfitting_ratio:.3f}"
+    )
+
+
 def run_walk_forward(args) -> WalkForwardResult:
     """Walk-Forward Analysis 메인 로직
 
@@ -205,6 +232,7 @@ def run_walk_forward(args) -> WalkForwardResult:
     print("\nWalk-Forward Analysis 실행 중...")
     print(f"기간: {args.start_date} ~ {args.end_date}")
     print(f"Train: {args.train_window}일, Test: {args.test_window}일, Step: {args.step}일")
+    print(f"병렬 프로세스: {args.workers}개")
     print("=" * 80)
 
     result = analyzer.run(
@@ -212,7 +240,8 @@ def run_walk_forward(args) -> WalkForwardResult:
         end_date=args.end_date,
         selection_criteria=config['selection'],
         trading_config=config['trading'],
-        strategy_name="walk_forward_strategy"
+        strategy_name="walk_forward_strategy",
+        on_window_complete=print_window_progress if args.progress else None
     )
 
     logger.info("Walk-Forward Analysis 완료")
@@ -0,0 +1,135 @@
+"""
+TokenManager 테스트
+
+동시 갱신 단일 비행, 만료 임박 토큰 사용, 선제 갱신, 접속키 중복 발급 방지를 테스트합니다.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+from core.config.token_manager import SingleFlight, TokenManager
+
+
+class FakeConfig:
+    """APIConfig 토큰 인터페이스 대체 (발급에 시간이 걸리는 가짜 서버)"""
+
+    def __init__(self, expires_in=timedelta(hours=24), issue_delay=0.05):
+        self.access_token = None
+        self.token_expired_at = None
+        self.ws_approval_key = None
+        self.expires_in = expires_in
+        self.issue_delay = issue_delay
+        self.token_issues = 0
+        self.key_issues = 0
+        self._lock = threading.Lock()
+
+    def validate_token(self, min_validity=None):
+        if not self.access_token or not self.token_expired_at:
+            return False
+        return datetime.now() + (min_validity or timedelta(minutes=10)) < self.token_expired_at
+
+    def refresh_token(self, force=False, min_validity=None):
+        if self.validate_token(min_validity):
+            return True
+        time.sleep(self.issue_delay)
+        with self._lock:
+            self.token_issues += 1
+            self.access_token = f"token-{self.token_issues}"
+        self.token_expired_at = datetime.now() + self.expires_in
+        return True
+
+    def issue_ws_approval_key(self, force=False, requested_at=None):
+        time.sleep(self.issue_delay)
+        with self._lock:
+            self.key_issues += 1
+            self.ws_approval_key = f"key-{self.key_issues}"
+        return self.ws_approval_key
+
+
+def _run_concurrently(fn, n=8):
+    results = [None] * n
+    barrier = threading.Barrier(n)
+
+    def run(i):
+        barrier.wait()
+        results[i] = fn()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_concurrent_callers_share_one_refresh():
+    config = FakeConfig()
+    manager = TokenManager(config, background=False)
+
+    results = _run_concurrently(manager.ensure_valid)
+
+    assert results == [True] * 8
+    assert config.token_issues == 1
+    assert config.access_token == "token-1"
+
+
+def test_single_flight_propagates_errors_to_waiters():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.05)
+        raise RuntimeError("EGW00133")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("token", failing)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=call)
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert errors == ["EGW00133", "EGW00133"]
+    assert not flight.in_flight("token")
+
+
+def test_expiring_token_is_served_while_refreshing_in_background():
+    config = FakeConfig()
+    config.access_token = "old"
+    config.token_expired_at = datetime.now() + timedelta(minutes=5)
+    manager = TokenManager(config, background=True)
+    try:
+        start = time.monotonic()
+        assert manager.ensure_valid() is True
+        # 요청 경로는 발급을 기다리지 않음
+        assert time.monotonic() - start < config.issue_delay
+        assert config.access_token == "old"
+
+        deadline = time.monotonic() + 2
+        while config.token_issues == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert config.access_token == "token-1"
+        assert manager.seconds_until_refresh() > 0
+    finally:
+        manager.stop_background_refresh()
+
+
+def test_ws_approval_key_is_issued_once():
+    config = FakeConfig()
+    manager = TokenManager(config, background=False)
+
+    keys = _run_concurrently(manager.get_ws_approval_key)
+
+    assert keys == ["key-1"] * 8
+    assert config.key_issues == 1
+    assert manager.get_ws_approval_key() == "key-1"
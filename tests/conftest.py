@@ -24,6 +24,13 @@ def test_db():
     if db_path.exists():
         db_path.unlink()
 
+# 일봉 이력 저장소/토큰 선제 갱신 비활성화 (모킹 테스트가 data/에 기록하거나 네트워크를 쓰지 않도록)
+@pytest.fixture(autouse=True)
+def disable_background_io(monkeypatch):
+    """테스트에서는 일봉 전체 조회 경로 사용, 백그라운드 토큰 갱신 미사용"""
+    monkeypatch.setenv('HANTU_OHLCV_STORE_ENABLED', 'false')
+    monkeypatch.setenv('HANTU_TOKEN_BACKGROUND_REFRESH', 'false')
+
 # 테스트용 로깅 설정
 @pytest.fixture(autouse=True)
 def test_logging():
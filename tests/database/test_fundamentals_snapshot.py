@@ -0,0 +1,111 @@
+"""
+재무 데이터 스냅샷 테스트
+
+거래일 단위 일괄 upsert와 일자별 스냅샷 캐시, DB 최신 스냅샷의 종목별 최신 행 조회를 테스트합니다.
+"""
+
+import json
+from contextlib import contextmanager
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from core.database.models import Base, StockFundamental
+from core.database.fundamentals_snapshot import (
+    FundamentalsSnapshotCache,
+    normalize_fundamentals,
+    upsert_fundamentals,
+)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _krx_frame(rows):
+    return pd.DataFrame(rows, columns=['ticker', 'PER', 'PBR', 'EPS', 'BPS', 'DIV', 'DPS', 'ROE'])
+
+
+def test_upsert_inserts_then_updates_in_place(session):
+    first = _krx_frame([
+        ['005930', 12.5, 1.2, 5000, 40000, 2.0, 1400, 9.6],
+        ['000660', np.nan, 1.5, -100, 60000, 0.5, 300, np.nan],
+    ])
+    assert upsert_fundamentals(first, "20240102", session=session) == 2
+
+    second = _krx_frame([
+        ['005930', 13.0, 1.3, 5100, 41000, 2.1, 1450, 9.9],
+        ['035720', 40.0, 2.0, 800, 30000, 0.1, 50, 5.0],
+    ])
+    assert upsert_fundamentals(second, "20240102", session=session) == 2
+
+    rows = {r.stock_code: r for r in session.query(StockFundamental).all()}
+    assert set(rows) == {'005930', '000660', '035720'}
+    assert rows['005930'].per == 13.0
+    assert rows['005930'].date == date(2024, 1, 2)
+    assert rows['000660'].per is None
+
+
+def test_normalize_accepts_lowercase_and_dedupes():
+    df = pd.DataFrame({'stock_code': ['005930', '005930', ''], 'per': [1.0, 2.0, 3.0]})
+    normalized = normalize_fundamentals(df)
+
+    assert normalized['ticker'].tolist() == ['005930']
+    assert normalized['per'].tolist() == [2.0]
+    assert np.isnan(normalized['roe'].iloc[0])
+
+
+def test_file_snapshot_loaded_once_per_date(tmp_path, monkeypatch):
+    for day, per in (("20240102", 10.0), ("20240103", 11.0)):
+        with open(tmp_path / f"krx_fundamentals_{day}.json", 'w', encoding='utf-8') as f:
+            json.dump([{'ticker': '005930', 'PER': per, 'ROE': None}], f)
+
+    cache = FundamentalsSnapshotCache(stock_dir=tmp_path, use_db=False)
+    loads = []
+    original = cache._load_from_file
+    monkeypatch.setattr(cache, '_load_from_file', lambda d: loads.append(d) or original(d))
+
+    assert cache.get('005930')['per'] == 11.0
+    assert cache.get('005930')['roe'] is None
+    assert cache.get('000660') is None
+    assert cache.get('005930', "20240102")['per'] == 10.0
+    assert cache.get_snapshot().date == "20240103"
+    assert loads == [None, "20240102"]
+
+    cache.preload()
+    assert loads == [None, "20240102", None]
+
+
+def test_db_latest_snapshot_uses_each_stocks_latest_row(session, tmp_path, monkeypatch):
+    upsert_fundamentals(_krx_frame([
+        ['005930', 10.0, 1.0, 5000, 40000, 2.0, 1400, 9.0],
+        ['000660', 20.0, 1.5, 3000, 60000, 0.5, 300, 7.0],
+    ]), "20240102", session=session)
+    # 최근 거래일에는 005930만 수집됨
+    upsert_fundamentals(_krx_frame([
+        ['005930', 11.0, 1.1, 5100, 41000, 2.1, 1450, 9.5],
+    ]), "20240103", session=session)
+
+    @contextmanager
+    def test_session():
+        yield session
+
+    monkeypatch.setattr('core.database.unified_db.get_session', test_session)
+    cache = FundamentalsSnapshotCache(stock_dir=tmp_path, use_db=True)
+
+    latest = cache.get_snapshot()
+    assert latest.source == "db" and latest.date == "20240103"
+    assert latest.get('005930')['per'] == 11.0
+    assert latest.get('000660')['per'] == 20.0
+
+    # 일자 지정 조회는 해당 거래일 행만
+    assert set(cache.get_snapshot("20240103").records) == {'005930'}
@@ -0,0 +1,150 @@
+"""
+일봉 이력 저장소 테스트
+
+가짜 조회 함수로 최초 전체 조회, 증분 조회, 수정주가 재조회, 조회 실패 폴백,
+수집기의 과거 구간 보충 시 저장 구간 연속성, 거래대금(amount) 보존을 테스트합니다.
+"""
+
+import sqlite3
+from datetime import date, datetime
+
+import pandas as pd
+
+from core.database.ohlcv_store import OHLCVHistoryStore, sync_daily_history
+from hantu_common.data.collector import StockDataCollector
+
+CODE = "005930"
+
+
+class FakeDailySource:
+    """영업일 일봉을 합성하는 가짜 조회 함수"""
+
+    def __init__(self, adjust_factor: float = 1.0):
+        self.calls = []
+        self.adjust_factor = adjust_factor
+        self.fail = False
+
+    def __call__(self, stock_code, start, end):
+        self.calls.append((start.date(), end.date()))
+        if self.fail:
+            return None
+        days = pd.bdate_range(start, end)
+        closes = (10000 + (days - pd.Timestamp("2024-01-01")).days * 10.0) * self.adjust_factor
+        df = pd.DataFrame({
+            'date': days,
+            'open': closes - 5,
+            'high': closes + 20,
+            'low': closes - 20,
+            'close': closes,
+            'volume': 1000 + days.dayofyear,
+        })
+        return df.set_index('date')
+
+
+def test_incremental_sync_fetches_only_new_bars(tmp_path):
+    store = OHLCVHistoryStore(tmp_path / "ohlcv.db")
+    source = FakeDailySource()
+
+    first = sync_daily_history(store, CODE, 20, source, today=date(2024, 3, 4))
+    second = sync_daily_history(store, CODE, 20, source, today=date(2024, 3, 5))
+
+    # 최초 조회는 휴장일 버퍼(1.3배) 안의 영업일, 이후는 누적된 이력에서 최근 20개
+    assert len(first) == 19 and len(second) == 20
+    assert first.index.is_monotonic_increasing
+    # 두 번째는 마지막 저장일(부분 봉 갱신)부터 오늘까지만 조회
+    assert source.calls[1] == (date(2024, 3, 4), date(2024, 3, 5))
+    assert second.index[-1] == pd.Timestamp("2024-03-05")
+    pd.testing.assert_frame_equal(second.iloc[:-1], first, check_freq=False)
+
+    # 전체 조회 결과와 동일
+    full = source(CODE, datetime(2024, 1, 1), datetime(2024, 3, 5)).tail(len(second))
+    pd.testing.assert_frame_equal(second, full, check_dtype=False, check_freq=False)
+
+
+def test_adjusted_prices_trigger_full_refetch(tmp_path):
+    store = OHLCVHistoryStore(tmp_path / "ohlcv.db")
+    source = FakeDailySource()
+    sync_daily_history(store, CODE, 20, source, today=date(2024, 3, 4))
+
+    # 액면분할 등으로 과거 봉 수정주가가 바뀜
+    source.adjust_factor = 0.5
+    df = sync_daily_history(store, CODE, 20, source, today=date(2024, 3, 5))
+
+    assert len(source.calls) == 3
+    assert source.calls[2][0] < date(2024, 3, 1)
+    expected = source(CODE, datetime(2024, 1, 1), datetime(2024, 3, 5)).loc[df.index]
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False, check_freq=False)
+
+
+def test_failed_fetch_serves_stored_history(tmp_path):
+    store = OHLCVHistoryStore(tmp_path / "ohlcv.db")
+    source = FakeDailySource()
+    sync_daily_history(store, CODE, 20, source, today=date(2024, 3, 4))
+
+    source.fail = True
+    df = sync_daily_history(store, CODE, 20, source, today=date(2024, 3, 5))
+
+    assert len(df) == 19
+    assert df.index[-1] == pd.Timestamp("2024-03-04")
+    assert store.last_dates() == {CODE: date(2024, 3, 4)}
+
+
+def _collector(store, source):
+    """저장소와 가짜 pykrx 조회만 연결한 수집기"""
+    collector = StockDataCollector.__new__(StockDataCollector)
+    collector.ohlcv_store = store
+    collector._fetch_pykrx_ohlcv = lambda code, start, end: source(
+        code, datetime.strptime(start, '%Y%m%d'), datetime.strptime(end, '%Y%m%d')
+    )
+    return collector
+
+
+def test_backfill_older_range_keeps_coverage_contiguous(tmp_path):
+    store = OHLCVHistoryStore(tmp_path / "ohlcv.db")
+    source = FakeDailySource()
+    collector = _collector(store, source)
+
+    collector._fetch_daily_incremental(CODE, "20230101", "20230630")
+    collector._fetch_daily_incremental(CODE, "20220101", "20220331")
+
+    # 과거 구간은 기존 저장 구간 시작일까지 이어서 조회
+    assert source.calls[1] == (date(2022, 1, 1), date(2023, 1, 1))
+    assert store.covered_from(CODE) == date(2022, 1, 1)
+
+    # 이후 전체 구간 요청은 저장소만으로 빈 곳 없이 응답 (추가 조회는 마지막 저장일부터)
+    collector._fetch_daily_incremental(CODE, "20220101", "20230630")
+    assert source.calls[2][0] == date(2023, 6, 30)
+    loaded = store.load(CODE, start="20220101", end="20230630")
+    expected = source(CODE, datetime(2022, 1, 1), datetime(2023, 6, 30))
+    assert len(loaded) == len(expected) == 390
+    assert (loaded.index == expected.index).all()
+
+
+def test_amount_persisted_and_kept_on_updates_without_amount(tmp_path):
+    path = tmp_path / "ohlcv.db"
+    # 거래대금 컬럼 이전 형식의 저장 파일
+    with sqlite3.connect(str(path)) as conn:
+        conn.execute(
+            "CREATE TABLE daily_ohlcv (stock_code TEXT NOT NULL, date TEXT NOT NULL, "
+            "open REAL, high REAL, low REAL, close REAL, volume INTEGER, "
+            "PRIMARY KEY (stock_code, date)) WITHOUT ROWID"
+        )
+    store = OHLCVHistoryStore(path)
+    source = FakeDailySource()
+    collector = _collector(store, source)
+
+    def with_amount(code, start, end):
+        bars = source(code, datetime.strptime(start, '%Y%m%d'), datetime.strptime(end, '%Y%m%d'))
+        return bars.assign(amount=bars['close'] * bars['volume'])
+
+    collector._fetch_pykrx_ohlcv = with_amount
+
+    fetched = collector._fetch_daily_incremental(CODE, "20240102", "20240131")
+    loaded = store.load(CODE, start="20240102", end="20240131", with_amount=True)
+    pd.testing.assert_series_equal(loaded['amount'], fetched['amount'], check_freq=False)
+    # 기본 조회 형식은 OHLCV만
+    assert list(store.load(CODE).columns) == ['open', 'high', 'low', 'close', 'volume']
+
+    # 거래대금 없는 조회분(한투 일봉)으로 덮어써도 저장된 거래대금 유지
+    store.append(CODE, source(CODE, datetime(2024, 1, 31), datetime(2024, 1, 31)))
+    assert store.load(CODE, start="20240131", with_amount=True)['amount'].iloc[0] == fetched['amount'].iloc[-1]
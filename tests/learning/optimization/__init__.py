@@ -0,0 +1 @@
+# optimization tests
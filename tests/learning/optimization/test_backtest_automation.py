@@ -0,0 +1,93 @@
+"""
+백테스트 자동화 워커 풀 연동 테스트
+
+AutomationManager 일괄 실행이 실제 BacktestWorkerPool을 거쳐 결과·검증으로 이어지고,
+타임아웃과 취소가 결과 상태에 반영되는지 검증합니다.
+"""
+
+import threading
+import time
+
+import pytest
+
+from core.backtesting.worker_pool import BacktestWorkerPool, WorkerPoolConfig
+from core.learning.optimization.backtest_automation import (
+    AutomationManager,
+    BacktestConfig,
+    BacktestEngine,
+    BacktestStatus,
+    ValidationSystem,
+)
+from core.learning.optimization.parameter_manager import ParameterSet
+
+
+class MetricsRunner:
+    """파라미터에 따라 지연하고 성과 지표를 돌려주는 실행기"""
+
+    def run(self, strategy_name, parameters, config):
+        time.sleep(parameters.get("sleep", 0))
+        return {
+            "total_return": parameters.get("x", 0) / 100,
+            "sharpe_ratio": 1.5,
+            "total_trades": 80,
+        }
+
+
+@pytest.fixture
+def engine(tmp_path):
+    pool = BacktestWorkerPool(
+        WorkerPoolConfig(num_workers=2, poll_interval_seconds=0.01),
+        runner_factory=MetricsRunner,
+    )
+    backtest_engine = BacktestEngine(data_dir=str(tmp_path), worker_pool=pool)
+    backtest_engine.enable_worker_pool()
+    yield backtest_engine
+    backtest_engine.shutdown_worker_pool()
+
+
+def _manager(engine):
+    return AutomationManager(engine, ValidationSystem(), parameter_manager=None)
+
+
+def _sets(*parameters):
+    return [ParameterSet(name=f"set_{i}", parameters=params) for i, params in enumerate(parameters)]
+
+
+def test_automated_backtests_run_through_worker_pool(engine):
+    results = _manager(engine).run_automated_backtests("momentum", _sets({"x": 1}, {"x": 2}, {"x": 3}))
+
+    backtests = [r["backtest_result"] for r in results]
+    assert [b.status for b in backtests] == [BacktestStatus.COMPLETED] * 3
+    assert [b.total_return for b in backtests] == [0.01, 0.02, 0.03]
+    assert all(r["validation_result"] is not None for r in results)
+    assert engine._worker_pool.get_stats()["completed"] == 3
+
+
+def test_automated_backtests_timeout_and_cancel(engine):
+    manager = _manager(engine)
+    outcome = {}
+
+    def run():
+        outcome["results"] = manager.run_automated_backtests(
+            "momentum",
+            _sets({"sleep": 30}, {"sleep": 30}, {"x": 5}),
+            BacktestConfig(timeout_seconds=1),
+        )
+
+    thread = threading.Thread(target=run)
+    thread.start()
+
+    deadline = time.time() + 10
+    while len(engine._running_backtests) < 3 and time.time() < deadline:
+        time.sleep(0.01)
+    first_id = sorted(engine._running_backtests)[0]
+    assert engine.cancel_backtest(first_id)
+
+    thread.join(timeout=20)
+    assert not thread.is_alive()
+
+    statuses = [r["backtest_result"].status for r in outcome["results"]]
+    assert statuses == [BacktestStatus.CANCELLED, BacktestStatus.FAILED, BacktestStatus.COMPLETED]
+    assert "타임아웃" in outcome["results"][1]["backtest_result"].error_message
+    stats = engine._worker_pool.get_stats()
+    assert stats["cancelled"] == 1 and stats["timed_out"] == 1
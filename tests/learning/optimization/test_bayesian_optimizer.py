@@ -0,0 +1,153 @@
+"""
+BayesianOptimizer 단위 테스트
+
+테스트 대상:
+- ParameterManager 파라미터 공간(int/float/choice) 기반 최적화 루프
+- 기존 최적 파라미터를 초기 샘플로 재사용
+- 배치 획득 시 중복 후보에 대한 획득 함수 값 재사용
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from core.learning.optimization import bayesian_optimizer as bayesian_module
+from core.learning.optimization.bayesian_optimizer import BayesianConfig, BayesianOptimizer
+from core.learning.optimization.parameter_manager import (
+    OptimizationResult,
+    ParameterManager,
+    ParameterSet,
+)
+
+
+class CountingFitness:
+    """호출 횟수를 세는 적합도 함수 (k_best=12 근처일수록 높음)"""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, param_set: ParameterSet) -> float:
+        with self._lock:
+            self.calls += 1
+        params = param_set.parameters
+        return 10.0 - abs(params['k_best'] - 12) - params['variance_threshold']
+
+
+class FakeModel:
+    """첫 번째 차원이 클수록 평균이 높은 GP 대용 모델 (predict 호출 수 기록)"""
+
+    def __init__(self, counter):
+        self.counter = counter
+
+    def predict(self, X, return_std=False):
+        self.counter['predict'] += 1
+        return X[:, 0].astype(float), np.ones(len(X))
+
+    def fit(self, X, y):
+        return self
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ParameterManager(config_dir=str(tmp_path / "optimization"))
+
+
+def _optimizer(manager, fitness, tmp_path, **config):
+    return BayesianOptimizer(
+        manager, fitness, BayesianConfig(**config),
+        data_dir=str(tmp_path / "bayesian"),
+    )
+
+
+class TestBayesianOptimizerLoop:
+    """최적화 루프"""
+
+    def test_optimize_over_parameter_manager_space(self, manager, tmp_path):
+        fitness = CountingFitness()
+        optimizer = _optimizer(
+            manager, fitness, tmp_path,
+            max_iterations=12, initial_samples=4, batch_size=3,
+            early_stopping_iterations=100,
+        )
+
+        result = optimizer.optimize('feature_selection')
+
+        history = result['optimization_history']
+        assert len(history) == 8
+        assert fitness.calls <= 12
+        assert result['best_fitness'] >= max(h['fitness_score'] for h in history)
+        best = result['best_parameters']
+        assert best['name'] == 'feature_selection'
+        assert best['is_best'] is True
+        assert best['optimization_method'] == 'bayesian_optimization'
+        assert manager.validate_parameters('feature_selection', best['parameters'])
+        for entry in history:
+            assert manager.validate_parameters('feature_selection', entry['parameters'])
+        assert list((tmp_path / "bayesian").glob("bayesian_optimization_feature_selection_*.json"))
+
+    def test_choice_parameters_keep_original_values(self, manager, tmp_path):
+        seen = []
+
+        def fitness(param_set):
+            seen.append(param_set.parameters)
+            return 1.0
+
+        optimizer = _optimizer(manager, fitness, tmp_path, max_iterations=6, initial_samples=3)
+        optimizer.optimize('mlp')
+
+        choices = manager.get_parameter_space('mlp')['hidden_layer_sizes']['choices']
+        assert seen
+        assert all(params['hidden_layer_sizes'] in choices for params in seen)
+        assert all(isinstance(params['max_iter'], int) for params in seen)
+
+    def test_existing_best_seeds_initial_samples(self, manager, tmp_path):
+        best = ParameterSet(
+            name='feature_selection',
+            parameters={'k_best': 12, 'correlation_threshold': 0.8, 'variance_threshold': 0.0},
+            performance_score=50.0,
+        )
+        manager.save_optimization_result(OptimizationResult(
+            method='manual', best_parameters=best, all_tested_parameters=[best],
+            total_evaluations=1, optimization_time=0.0,
+        ))
+        fitness = CountingFitness()
+        optimizer = _optimizer(
+            manager, fitness, tmp_path, max_iterations=3, initial_samples=3,
+        )
+
+        result = optimizer.optimize('feature_selection')
+
+        assert fitness.calls == 2
+        assert result['best_fitness'] == 50.0
+        assert result['best_parameters']['parameters'] == best.parameters
+
+    def test_unknown_component_raises(self, manager, tmp_path):
+        optimizer = _optimizer(manager, CountingFitness(), tmp_path)
+        with pytest.raises(ValueError):
+            optimizer.optimize('unknown_component')
+
+
+class TestAcquireBatch:
+    """constant liar 배치 획득"""
+
+    def test_duplicate_candidates_reuse_acquisition_values(self, manager, tmp_path, monkeypatch):
+        counter = {'predict': 0}
+        optimizer = _optimizer(
+            manager, CountingFitness(), tmp_path,
+            n_candidates=64, candidate_sampler='random', acquisition_function='ucb',
+        )
+        monkeypatch.setattr(bayesian_module, 'SKLEARN_AVAILABLE', True)
+        optimizer._gp_model = FakeModel(counter)
+        monkeypatch.setattr(optimizer, '_fixed_kernel_model', lambda model: FakeModel(counter))
+        optimizer._X_samples = [[0.0]]
+        optimizer._y_samples = [0.0]
+
+        # 정수 0~3 → 후보 64개 대부분이 반올림 후 중복
+        bounds, info = optimizer._prepare_parameter_space({'x': {'type': 'int', 'range': [0, 3]}})
+        batch = optimizer._acquire_batch(3, bounds, info)
+
+        assert [params['x'] for params, _ in batch] == [3, 2, 1]
+        # 모델이 바뀔 때만 재계산: 최초 1회 + 가상 관측 갱신 2회
+        assert counter['predict'] == 3
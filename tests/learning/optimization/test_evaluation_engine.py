@@ -0,0 +1,193 @@
+"""
+EvaluationEngine 단위 테스트
+
+테스트 대상:
+- 캐시 키 정규화 (키 순서, numpy 스칼라, 실수 반올림)
+- 배치 내 중복/캐시 적중 개체 재평가 방지
+- 평가 실패 처리 (캐시하지 않음)
+- 스레드 실행기 동시 평가 및 진행 콜백
+- GeneticOptimizer 세대 평가 연동
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from core.learning.optimization.evaluation_engine import (
+    EvaluationConfig,
+    EvaluationEngine,
+    canonical_key,
+)
+from core.learning.optimization.genetic_optimizer import GeneticConfig, GeneticOptimizer
+from core.learning.optimization.parameter_manager import ParameterManager
+
+
+class CountingEvaluator:
+    """호출 기록용 평가 함수"""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+        self._lock = threading.Lock()
+        self.max_concurrent = 0
+        self._running = 0
+
+    def __call__(self, params):
+        with self._lock:
+            self.calls.append(dict(params))
+            self._running += 1
+            self.max_concurrent = max(self.max_concurrent, self._running)
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            self._running -= 1
+        return float(params['x'])
+
+
+class TestCanonicalKey:
+    """캐시 키 정규화"""
+
+    def test_order_and_numpy_types_are_ignored(self):
+        a = {'x': np.int64(3), 'y': np.float64(0.1), 'z': 'sqrt'}
+        b = {'z': 'sqrt', 'y': 0.1, 'x': 3}
+        assert canonical_key(a) == canonical_key(b)
+
+    def test_floats_are_rounded(self):
+        assert canonical_key({'x': 0.1 + 0.2}) == canonical_key({'x': 0.3})
+        assert canonical_key({'x': 0.3001}, float_precision=2) == canonical_key({'x': 0.3})
+
+    def test_unhashable_values(self):
+        key = canonical_key({'layers': [50, 25], 'size': (100,), 'feature': None})
+        assert hash(key) is not None
+
+
+class TestEvaluationEngine:
+    """평가 엔진"""
+
+    def test_duplicates_and_cache_hits_are_not_reevaluated(self):
+        evaluator = CountingEvaluator()
+        engine = EvaluationEngine(evaluator)
+
+        scores = engine.evaluate_batch([{'x': 1}, {'x': 2}, {'x': 1}])
+        assert scores == [1.0, 2.0, 1.0]
+        assert len(evaluator.calls) == 2
+
+        assert engine.evaluate_batch([{'x': 2}, {'x': 3}]) == [2.0, 3.0]
+        assert len(evaluator.calls) == 3
+
+        stats = engine.get_stats()
+        assert stats['requested'] == 5
+        assert stats['evaluated'] == 3
+        assert stats['cache_hits'] == 2
+        assert stats['cache_size'] == 3
+        assert stats['cache_hit_rate'] == pytest.approx(0.4)
+
+    def test_cache_disabled(self):
+        evaluator = CountingEvaluator()
+        engine = EvaluationEngine(evaluator, EvaluationConfig(cache_enabled=False))
+
+        engine.evaluate_batch([{'x': 1}])
+        engine.evaluate_batch([{'x': 1}])
+
+        assert len(evaluator.calls) == 2
+        assert engine.cache_size == 0
+
+    def test_failures_use_failure_score_and_are_not_cached(self):
+        attempts = {'count': 0}
+
+        def flaky(params):
+            attempts['count'] += 1
+            if params['x'] == 'raise':
+                raise RuntimeError("boom")
+            if params['x'] == 'nan':
+                return float('nan')
+            return None if attempts['count'] == 1 else 5.0
+
+        engine = EvaluationEngine(flaky, EvaluationConfig(failure_score=-1.0))
+
+        assert engine.evaluate({'x': 'retry'}) == -1.0
+        assert engine.evaluate({'x': 'retry'}) == 5.0
+        assert engine.evaluate_batch([{'x': 'raise'}, {'x': 'nan'}]) == [-1.0, -1.0]
+        assert engine.get_stats()['failures'] == 3
+        assert engine.cache_size == 1
+
+    def test_thread_executor_evaluates_concurrently_in_input_order(self):
+        evaluator = CountingEvaluator(delay=0.05)
+        progress = []
+        population = [{'x': i} for i in range(8)]
+
+        with EvaluationEngine(evaluator, EvaluationConfig(max_workers=4)) as engine:
+            scores = engine.evaluate_batch(
+                population, progress_callback=lambda done, total, best: progress.append((done, total, best))
+            )
+
+        assert scores == [float(i) for i in range(8)]
+        assert evaluator.max_concurrent > 1
+        assert [done for done, _, _ in progress] == list(range(1, 9))
+        assert all(total == 8 for _, total, _ in progress)
+        assert progress[-1][2] == 7.0
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            EvaluationConfig(max_workers=0)
+        with pytest.raises(ValueError):
+            EvaluationConfig(executor_type="gpu")
+
+
+class TestGeneticOptimizerEvaluation:
+    """GeneticOptimizer 세대 평가"""
+
+    def test_generations_reuse_cached_fitness(self, tmp_path):
+        manager = ParameterManager(config_dir=str(tmp_path))
+        calls = []
+        lock = threading.Lock()
+
+        def evaluate(component, params):
+            with lock:
+                calls.append(params)
+            return -abs(params['k_best'] - 12)
+
+        manager.set_evaluation_function(evaluate)
+        generations = []
+        optimizer = GeneticOptimizer(manager, GeneticConfig(
+            population_size=10, generations=5, elite_size=2,
+            early_stopping=False, max_workers=2,
+        ))
+
+        result = optimizer.optimize(
+            'feature_selection',
+            progress_callback=lambda generation, total, best, stats: generations.append(generation),
+        )
+
+        assert generations == list(range(5))
+        assert result.total_evaluations == len(calls)
+        # 엘리트 보존 개체는 캐시로 재사용되므로 개체 수보다 평가 수가 적음
+        assert len(calls) < 10 * 6
+        assert result.best_parameters.performance_score == max(
+            p.performance_score for p in result.all_tested_parameters
+        )
+
+    def test_engine_executors_are_shut_down(self, tmp_path, monkeypatch):
+        """optimize() 종료 후와 단독 집단 평가 후 실행기가 남지 않음"""
+        manager = ParameterManager(config_dir=str(tmp_path))
+        manager.set_evaluation_function(lambda component, params: float(params['k_best']))
+        optimizer = GeneticOptimizer(manager, GeneticConfig(
+            population_size=6, generations=2, early_stopping=False, max_workers=2,
+        ))
+        engines = []
+        create = optimizer._create_evaluation_engine
+        monkeypatch.setattr(
+            optimizer, '_create_evaluation_engine',
+            lambda component: engines.append(create(component)) or engines[-1],
+        )
+
+        optimizer.optimize('feature_selection')
+        optimizer._initialize_population('feature_selection')
+        optimizer._evaluate_population('feature_selection')
+
+        assert len(engines) == 2
+        assert optimizer._engine is None
+        assert len(optimizer._fitness_scores) == 6
+        assert all(engine._executor is None for engine in engines)
@@ -0,0 +1,141 @@
+"""
+대기 주문 장부 테스트
+
+PendingOrderBook 트리거 사다리와 OrderExecutor 인덱스를 테스트합니다.
+"""
+
+import random
+
+from core.paper_trading import (
+    OrderExecutor,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    PendingOrderBook,
+    PortfolioConfig,
+    VirtualPortfolio,
+)
+from core.paper_trading.order_executor import Order
+
+
+def _order(order_id, side, order_type, price=None, stop_price=None, code="005930"):
+    return Order(
+        id=order_id, stock_code=code, stock_name=code, side=side,
+        order_type=order_type, quantity=1, price=price, stop_price=stop_price,
+    )
+
+
+def _should_trigger(order, price):
+    """기존 전수 검사 로직 (기준)"""
+    if order.order_type == OrderType.MARKET:
+        return True
+    if order.order_type == OrderType.LIMIT:
+        return price <= order.price if order.is_buy else price >= order.price
+    if order.order_type == OrderType.STOP:
+        return price >= order.stop_price if order.is_buy else price <= order.stop_price
+    return False
+
+
+class TestPendingOrderBook:
+    """트리거 사다리"""
+
+    def test_only_crossed_triggers_fire_in_submission_order(self):
+        book = PendingOrderBook()
+        book.add(_order("buy_limit", OrderSide.BUY, OrderType.LIMIT, price=65000))
+        book.add(_order("sell_stop", OrderSide.SELL, OrderType.STOP, stop_price=66000))
+        book.add(_order("sell_limit", OrderSide.SELL, OrderType.LIMIT, price=72000))
+        book.add(_order("buy_stop", OrderSide.BUY, OrderType.STOP, stop_price=71000))
+        book.add(_order("other", OrderSide.BUY, OrderType.MARKET, code="000660"))
+
+        assert book.pop_triggered({"005930": 68000}) == []
+        assert book.pop_triggered({"005930": 65000}) == [
+            ("buy_limit", 65000), ("sell_stop", 65000),
+        ]
+        assert book.pop_triggered({"005930": 72000}) == [
+            ("sell_limit", 72000), ("buy_stop", 72000),
+        ]
+        assert book.order_ids() == ["other"]
+        assert book.symbols() == ["000660"]
+
+    def test_matches_full_scan_on_random_walk(self):
+        rng = random.Random(7)
+        book = PendingOrderBook()
+        pending = {}
+
+        for i in range(300):
+            side = rng.choice([OrderSide.BUY, OrderSide.SELL])
+            order_type = rng.choice([OrderType.LIMIT, OrderType.STOP])
+            level = rng.randint(90, 110) * 100
+            order = _order(
+                f"o{i}", side, order_type,
+                price=level if order_type == OrderType.LIMIT else None,
+                stop_price=level if order_type == OrderType.STOP else None,
+            )
+            book.add(order)
+            pending[order.id] = order
+
+        price = 10000
+        for _ in range(200):
+            price += rng.randint(-3, 3) * 100
+            expected = [oid for oid, o in pending.items() if _should_trigger(o, price)]
+            fired = [oid for oid, _ in book.pop_triggered({"005930": price})]
+            assert fired == expected
+            for oid in fired:
+                del pending[oid]
+
+            if pending and rng.random() < 0.2:
+                cancelled = rng.choice(list(pending))
+                assert book.remove(cancelled)
+                del pending[cancelled]
+
+        assert book.order_ids() == list(pending)
+
+
+class TestOrderExecutorIndexes:
+    """OrderExecutor 보조 인덱스"""
+
+    def _executor(self):
+        return OrderExecutor(VirtualPortfolio(PortfolioConfig(initial_capital=100_000_000)))
+
+    def test_status_and_code_indexes(self):
+        executor = self._executor()
+        ids = {}
+        for code in ("005930", "000660"):
+            for price in (65000, 60000):
+                order = executor.create_order(
+                    code, code, OrderSide.BUY, 10, OrderType.LIMIT, price=price,
+                )
+                executor.submit_order(order.id)
+                ids[(code, price)] = order.id
+
+        executor.cancel_order(ids[("000660", 60000)])
+        results = executor.check_pending_orders({"005930": 64000, "000660": 70000})
+
+        assert [r.order_id for r in results] == [ids[("005930", 65000)]]
+        assert [o.id for o in executor.get_pending_orders("005930")] == [ids[("005930", 60000)]]
+        assert {o.id for o in executor.get_orders(status=OrderStatus.SUBMITTED)} == {
+            ids[("005930", 60000)], ids[("000660", 65000)],
+        }
+        assert [o.id for o in executor.get_orders("000660", OrderStatus.CANCELLED)] == [
+            ids[("000660", 60000)],
+        ]
+        assert [o.id for o in executor.get_order_history("005930")] == [ids[("005930", 65000)]]
+        assert executor.get_order_history("000660") == []
+
+        # 반환 목록을 수정해도 내부 이력은 그대로
+        executor.get_order_history("005930").clear()
+        executor.get_order_history().clear()
+        assert len(executor.get_order_history("005930")) == 1
+        assert len(executor.get_order_history()) == 1
+        assert executor.get_stats()['pending_orders'] == 2
+
+    def test_rejected_order_leaves_pending_book(self):
+        executor = OrderExecutor(VirtualPortfolio(PortfolioConfig(initial_capital=100_000)))
+        order = executor.create_order("005930", "삼성전자", OrderSide.BUY, 10, OrderType.LIMIT, price=65000)
+        executor.submit_order(order.id)
+
+        results = executor.check_pending_orders({"005930": 64000})
+
+        assert results[0].status == OrderStatus.REJECTED
+        assert executor.get_pending_orders() == []
+        assert executor.check_pending_orders({"005930": 60000}) == []
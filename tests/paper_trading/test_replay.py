@@ -0,0 +1,150 @@
+"""
+과거 분봉/체결 리플레이 테스트
+
+이벤트 정렬, 가상 시계 기반 손절, 병렬 세션 실행,
+가상 시계 기준 보유 일수/세션 시간/포트폴리오 시각을 테스트합니다.
+"""
+
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from core.paper_trading import (
+    PaperTrader,
+    PaperTradingConfig,
+    ReplayConfig,
+    ReplayEngine,
+    ReplayEvent,
+    ReplayStrategy,
+)
+from core.paper_trading.replay import (
+    VirtualClock,
+    discover_sessions,
+    frame_to_events,
+    merge_events,
+    save_replay_frame,
+)
+
+TRADE_DATE = "20240102"
+
+
+def _bars(rows):
+    """KIS 분봉 원본 형식 (최신순)"""
+    return pd.DataFrame([
+        {
+            'stck_bsop_date': TRADE_DATE, 'stck_cntg_hour': hour,
+            'stck_oprc': o, 'stck_hgpr': h, 'stck_lwpr': l, 'stck_prpr': c, 'cntg_vol': 100,
+        }
+        for hour, o, h, l, c in rows
+    ][::-1])
+
+
+class BuyFirstStrategy(ReplayStrategy):
+    """종목별 첫 가격에 100주 매수"""
+
+    def on_start(self, trader, session_id):
+        self.bought = set()
+
+    def on_prices(self, trader, timestamp, prices, fills):
+        for code in prices:
+            if code not in self.bought:
+                self.bought.add(code)
+                trader.buy(code, code, 100, stop_loss_pct=3.0, take_profit_pct=50.0)
+
+
+def _config():
+    return ReplayConfig(trading=PaperTradingConfig(slippage_rate=0.0, enable_trailing_stop=False))
+
+
+class TestReplayEvents:
+    """이벤트 변환/정렬"""
+
+    def test_bar_path_is_chronological_and_conservative(self):
+        df = _bars([
+            ("090000", 10000, 10100, 9900, 10050),   # 양봉: O → L → H → C
+            ("090100", 10050, 10080, 9950, 9960),    # 음봉: O → H → L → C
+        ])
+
+        events = frame_to_events(df, "005930", TRADE_DATE)
+
+        assert [e.price for e in events] == [
+            10000, 9900, 10100, 10050, 10050, 10080, 9950, 9960,
+        ]
+        assert [e.timestamp for e in events] == sorted(e.timestamp for e in events)
+        assert events[0].timestamp == datetime(2024, 1, 2, 9, 0, 0)
+
+    def test_merge_is_deterministic_across_symbols(self):
+        ts = datetime(2024, 1, 2, 9, 0)
+        a = [ReplayEvent(ts, "000660", 0, 1.0, 0), ReplayEvent(ts, "000660", 1, 2.0, 0)]
+        b = [ReplayEvent(ts, "005930", 0, 3.0, 0)]
+
+        merged = list(merge_events(b, a))
+
+        assert [(e.stock_code, e.seq) for e in merged] == [
+            ("000660", 0), ("000660", 1), ("005930", 0),
+        ]
+
+
+class TestReplayEngine:
+    """리플레이 실행"""
+
+    def test_stop_loss_fires_at_virtual_time(self):
+        df = _bars([
+            ("090000", 10000, 10000, 10000, 10000),
+            ("090100", 10000, 10000, 9600, 9650),
+        ])
+        engine = ReplayEngine(_config(), BuyFirstStrategy)
+
+        result = engine.run(frame_to_events(df, "005930", TRADE_DATE), "stop")
+
+        sides = [(log['side'], log['price'], log['timestamp']) for log in result.trade_log]
+        assert sides[0] == ('buy', 10000, "2024-01-02T09:00:00")
+        assert sides[1] == ('sell', 9600, "2024-01-02T09:01:30")
+        assert len(sides) == 2
+        assert result.realized_pnl < 0
+        assert result.events == 8
+
+    def test_parallel_sessions_match_serial(self, tmp_path):
+        for code, drop in (("005930", 9500), ("000660", 9900)):
+            df = _bars([
+                ("090000", 10000, 10000, 10000, 10000),
+                ("090100", 10000, 10200, drop, 10100),
+            ])
+            save_replay_frame(df, code, TRADE_DATE, root=str(tmp_path))
+
+        specs = discover_sessions(str(tmp_path))
+        assert [s.session_id for s in specs] == [f"{TRADE_DATE}_000660", f"{TRADE_DATE}_005930"]
+
+        engine = ReplayEngine(_config(), BuyFirstStrategy)
+        serial = [engine.run_session(spec) for spec in specs]
+        parallel = engine.run_sessions(specs, max_workers=2)
+
+        assert [r.error for r in parallel] == [None, None]
+        # 주문 ID는 무작위이므로 제외하고 비교
+        def trades(result):
+            return [(t['timestamp'], t['side'], t['price'], t['pnl']) for t in result.trade_log]
+
+        assert [trades(r) for r in parallel] == [trades(r) for r in serial]
+        assert [r.realized_pnl for r in parallel] == [r.realized_pnl for r in serial]
+
+
+class TestVirtualClockTimestamps:
+    """PaperTrader 하위 컴포넌트가 주입된 시계를 사용"""
+
+    def test_derived_times_follow_virtual_clock(self):
+        start = datetime(2024, 1, 2, 9, 0)
+        clock = VirtualClock(start)
+        trader = PaperTrader(_config().trading, clock=clock)
+        session = trader.start_session("clock")
+        trader.update_prices({"005930": 10000})
+        result = trader.buy("005930", "005930", 10, take_profit_pct=50.0)
+        assert result.success
+
+        clock.advance_to(start + timedelta(days=3, minutes=30))
+
+        order = trader.executor.get_order(result.order_id)
+        assert order.created_at == start
+        assert trader.tracker.get_position("005930").holding_days == 3
+        assert trader.portfolio.get_holding("005930").first_buy_date == start
+        assert trader.portfolio.get_snapshot().timestamp == clock.now()
+        assert session.duration_minutes == 3 * 24 * 60 + 30
@@ -0,0 +1,40 @@
+"""
+AsyncKISClient 요청 헤더 단위 테스트
+
+토큰 확인이 이벤트 루프를 막는 동기 갱신 대신 비동기 갱신을 사용하는지 검증합니다.
+"""
+
+import asyncio
+
+from core.api.async_client import AsyncKISClient
+
+
+class FakeConfig:
+    """토큰 갱신 호출을 기록하는 설정"""
+
+    app_key = "key"
+    app_secret = "secret"
+
+    def __init__(self):
+        self.access_token = "old"
+        self.async_calls = 0
+
+    def ensure_valid_token(self):
+        raise AssertionError("동기 토큰 갱신은 이벤트 루프에서 호출하면 안 됨")
+
+    async def ensure_valid_token_async(self):
+        self.async_calls += 1
+        await asyncio.sleep(0)
+        self.access_token = "renewed"
+        return True
+
+
+def test_get_headers_awaits_async_token_renewal():
+    client = AsyncKISClient.__new__(AsyncKISClient)
+    client.config = FakeConfig()
+
+    headers = asyncio.run(client._get_headers())
+
+    assert client.config.async_calls == 1
+    assert headers["authorization"] == "Bearer renewed"
+    assert headers["appkey"] == "key"
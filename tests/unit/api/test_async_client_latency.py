@@ -0,0 +1,77 @@
+"""
+AsyncKISClient 지연 시간 계측 단위 테스트
+
+Phase 2 가격 조회 경로에서 API 호출과 Rate Limit 대기 구간이 기록되는지 검증합니다.
+"""
+
+import asyncio
+
+from core.api import async_client
+from core.api.async_client import PRICE_PATH, AsyncKISClient
+from core.utils import latency_metrics
+from core.utils.latency_metrics import (
+    STAGE_API_CALL,
+    STAGE_RATE_LIMIT_WAIT,
+    LatencyConfig,
+    LatencyRegistry,
+    stage_name,
+)
+
+
+class FakeConfig:
+    base_url = "https://example.invalid"
+    app_key = "key"
+    app_secret = "secret"
+    access_token = "token"
+
+    async def ensure_valid_token_async(self):
+        return True
+
+
+class FakeCache:
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl):
+        pass
+
+
+class FakeResponse:
+    status = 200
+
+    async def json(self):
+        return {"rt_cd": "0", "output": {"stck_prpr": "70000", "prdy_ctrt": "1.5", "acml_vol": "10"}}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, headers=None, params=None):
+        self.urls.append(url)
+        return FakeResponse()
+
+
+def test_price_fetch_records_api_call_and_rate_limit_wait(monkeypatch, tmp_path):
+    registry = LatencyRegistry(LatencyConfig(snapshot_dir=str(tmp_path)))
+    monkeypatch.setattr(latency_metrics, "_registry", registry)
+    monkeypatch.setattr(async_client, "APIConfig", FakeConfig)
+    monkeypatch.setattr(async_client, "cache", FakeCache())
+
+    async def scenario():
+        client = AsyncKISClient(rate_limit_per_sec=100)
+        client.session = FakeSession()
+        return await client.get_price("005930"), client.session.urls
+
+    price, urls = asyncio.run(scenario())
+
+    assert price.current_price == 70000
+    assert urls == [FakeConfig.base_url + PRICE_PATH]
+    assert registry.get_histogram(stage_name(STAGE_API_CALL, PRICE_PATH)).count == 1
+    assert registry.get_histogram(STAGE_RATE_LIMIT_WAIT).count == 1
@@ -0,0 +1,109 @@
+"""
+KISAPI WebSocket 분봉 연동 단위 테스트
+
+연결 시 공용 분봉 집계기의 시각 경계 루프가 시작되고 종료 시 멈추는지,
+체결 스트림을 소비하는 공용 처리기가 같은 집계기의 분봉을 받는지 검증합니다.
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from core.api import kis_api
+from core.api.kis_api import KISAPI
+from core.api.ws_frame_decoder import TR_TRADE, FrameBatch
+from core.realtime import bars, processor
+from core.realtime.bars import MinuteBarAggregator
+
+
+class FakeConfig:
+    access_token = "token"
+
+    def ensure_valid_token(self):
+        return True
+
+
+class FakeWebSocketClient:
+    """콜백 등록만 기록하는 WebSocket 클라이언트"""
+
+    def __init__(self, access_token):
+        self.callbacks = {}
+        self.batch_callbacks = {}
+        self.closed = False
+
+    def add_callback(self, tr_id, callback):
+        self.callbacks[tr_id] = callback
+
+    def add_batch_callback(self, tr_id, callback):
+        self.batch_callbacks[tr_id] = callback
+
+    async def connect(self):
+        return True
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def aggregator(monkeypatch):
+    shared = MinuteBarAggregator(intervals=(1,), session_date=date(2024, 1, 2))
+    monkeypatch.setattr(bars, "_bar_aggregator", shared)
+    monkeypatch.setattr(processor, "_realtime_processor", None)
+    monkeypatch.setattr(kis_api, "KISWebSocketClient", FakeWebSocketClient)
+    return shared
+
+
+def _api():
+    api = KISAPI.__new__(KISAPI)
+    api.config = FakeConfig()
+    api.ws_client = None
+    api._bar_clock_task = None
+    return api
+
+
+def test_connect_starts_bar_clock_and_close_stops_it(aggregator):
+    async def scenario():
+        api = _api()
+        assert await api.connect_websocket()
+        task = api._bar_clock_task
+        await asyncio.sleep(0)
+        running = aggregator._clock_running
+
+        await api.close()
+        await asyncio.sleep(0)
+        return running, task, api
+
+    running, task, api = asyncio.run(scenario())
+    assert running
+    assert task.done()
+    assert not aggregator._clock_running
+    assert api._bar_clock_task is None and api.ws_client is None
+
+
+def test_stream_processor_receives_shared_aggregator_bars(aggregator):
+    async def scenario():
+        api = _api()
+        await api.connect_websocket()
+        ws_client = api.ws_client
+        await api.close()
+        return ws_client
+
+    ws_client = asyncio.run(scenario())
+    shared_processor = processor.get_realtime_processor()
+    assert shared_processor.bar_aggregator is aggregator
+
+    batch = FrameBatch(TR_TRADE, 2, {
+        "stock_code": ("005930", "005930"),
+        "timestamp": ("090001", "090102"),
+        "current_price": (71000, 71100),
+        "volume": (3, 1),
+    })
+    ws_client.batch_callbacks[TR_TRADE](batch)
+    for record in batch.records():
+        ws_client.callbacks[TR_TRADE](record)
+
+    # 집계기는 프레임으로 한 번만 집계 (처리기는 틱을 다시 전달하지 않음)
+    assert aggregator.tick_count == 2
+    assert [bar["volume"] for bar in shared_processor.get_minute_bars("005930", interval=1)] == [3]
+    assert len(shared_processor.get_price_buffer("005930")) == 2
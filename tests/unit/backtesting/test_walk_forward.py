@@ -431,3 +431,94 @@ class TestRunFullFlow:
         assert result.valid_windows >= 1
         assert result.avg_test_sharpe > 0
         assert result.overall_overfitting_ratio > 0
+
+
+class TestSharedDataCache:
+    """겹치는 윈도우의 데이터 캐시 재사용 테스트"""
+
+    def test_overlapping_runs_reuse_cache(self, tmp_path, monkeypatch):
+        """겹치는 기간 재실행 시 선정 파일/가격 데이터를 다시 로드하지 않음"""
+        import json
+        import pandas as pd
+        from core.backtesting.data_cache import BacktestDataCache
+        from core.backtesting.strategy_backtester import StrategyBacktester
+
+        monkeypatch.chdir(tmp_path)
+        selection_dir = tmp_path / "data" / "daily_selection"
+        selection_dir.mkdir(parents=True)
+        for day in range(1, 11):
+            data = {"data": {"selected_stocks": [
+                {"stock_code": "005930", "stock_name": "삼성전자", "entry_price": 100.0}
+            ]}}
+            (selection_dir / f"daily_selection_202401{day:02d}.json").write_text(
+                json.dumps(data), encoding="utf-8"
+            )
+
+        cache = BacktestDataCache()
+        backtester = StrategyBacktester(data_cache=cache)
+        backtester.api = Mock()
+        backtester.api.get_daily_prices.return_value = pd.DataFrame(
+            {"close": [100.0 + i for i in range(10)]},
+            index=pd.date_range("2024-01-01", periods=10),
+        )
+
+        first = backtester._load_historical_selections("2024-01-01", "2024-01-07")
+        backtester._load_price_data_for_backtest(first, "2024-01-01", "2024-01-07")
+        second = backtester._load_historical_selections("2024-01-03", "2024-01-10")
+        backtester._load_price_data_for_backtest(second, "2024-01-03", "2024-01-10")
+
+        assert len(first) == 7 and len(second) == 8
+        assert second[0]["selection_date"] == "2024-01-03"
+        assert backtester.api.get_daily_prices.call_count == 1
+        # 1~10일 각 1회 + 가격 1회만 로드
+        assert cache.get_stats()["misses"] == 11
+        # 기간별 필터링은 실행마다 적용
+        assert backtester.price_data_cache["005930"].index[0] == pd.Timestamp("2024-01-03")
+
+    def test_failed_price_load_is_retried(self):
+        """가격 조회 실패(None)는 캐시하지 않고 다음 실행에서 다시 조회"""
+        import pandas as pd
+        from core.backtesting.data_cache import BacktestDataCache
+
+        cache = BacktestDataCache()
+        prices = pd.DataFrame({"close": [100.0]})
+        loader = Mock(side_effect=[None, prices])
+
+        assert cache.get_prices("005930", loader) is None
+        assert cache.get_prices("005930", loader) is prices
+        assert cache.get_prices("005930", loader) is prices
+        assert loader.call_count == 2
+        assert cache.get_stats()["price_series"] == 1
+
+
+class TestParallelWindows:
+    """윈도우 병렬 실행 테스트"""
+
+    def test_validation_max_workers_zero(self):
+        with pytest.raises(ValueError):
+            WalkForwardAnalyzer(WalkForwardConfig(max_workers=0))
+
+    def test_parallel_matches_sequential_order(self, tmp_path, monkeypatch):
+        """병렬 실행 결과가 윈도우 번호 순으로 병합되고 완료 콜백이 호출됨"""
+        monkeypatch.chdir(tmp_path)  # 선정 데이터 없음 → 빈 결과 윈도우
+
+        base = dict(train_window_days=30, test_window_days=10, step_days=10,
+                    purge_days=0, min_train_trades=0)
+        args = dict(start_date="2024-01-01", end_date="2024-04-30",
+                    selection_criteria={}, trading_config={})
+
+        sequential = WalkForwardAnalyzer(WalkForwardConfig(**base)).run(**args)
+
+        completed = []
+        parallel = WalkForwardAnalyzer(WalkForwardConfig(max_workers=3, **base)).run(
+            **args, on_window_complete=lambda w, i, total: completed.append((i, total))
+        )
+
+        assert parallel.total_windows == sequential.total_windows > 3
+        assert [w.window_index for w in parallel.windows] == [
+            w.window_index for w in sequential.windows
+        ]
+        assert [(w.train_start, w.test_end) for w in parallel.windows] == [
+            (w.train_start, w.test_end) for w in sequential.windows
+        ]
+        assert sorted(i for i, _ in completed) == list(range(1, parallel.total_windows + 1))
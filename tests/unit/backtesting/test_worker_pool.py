@@ -0,0 +1,145 @@
+"""
+상주 백테스트 워커 풀 테스트
+
+워커 재사용, 실패 전파, 타임아웃 및 취소 후 워커 교체,
+초기화 실패 시 재생성 중단을 검증합니다.
+"""
+
+import os
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from core.backtesting.worker_pool import (
+    BacktestTimeoutError,
+    BacktestWorkerError,
+    BacktestWorkerPool,
+    WorkerPoolConfig,
+)
+
+
+class FakeRunner:
+    """파라미터에 따라 지연/실패하는 테스트용 실행기"""
+
+    def __init__(self):
+        self.run_count = 0
+
+    def run(self, strategy_name, parameters, config):
+        self.run_count += 1
+        if parameters.get("fail"):
+            raise ValueError("bad parameter")
+        time.sleep(parameters.get("sleep", 0))
+        return {
+            "total_return": parameters.get("x", 0) / 100,
+            "pid": os.getpid(),
+            "run_count": self.run_count,
+        }
+
+
+class BrokenRunner:
+    """생성 시 실패하는 실행기 (워커 초기화 실패)"""
+
+    def __init__(self):
+        raise ImportError("strategy module missing")
+
+
+@pytest.fixture
+def pool():
+    worker_pool = BacktestWorkerPool(
+        WorkerPoolConfig(num_workers=2, default_timeout_seconds=10, poll_interval_seconds=0.01),
+        runner_factory=FakeRunner,
+    )
+    worker_pool.start()
+    yield worker_pool
+    worker_pool.stop()
+
+
+def test_workers_are_reused(pool):
+    """같은 워커 프로세스가 여러 작업을 처리"""
+    futures = [pool.submit("momentum", {"x": i}) for i in range(10)]
+    results = [f.result(timeout=10) for f in futures]
+
+    assert [r["total_return"] for r in results] == [i / 100 for i in range(10)]
+    assert len({r["pid"] for r in results}) <= 2
+    assert max(r["run_count"] for r in results) > 1
+    assert pool.get_stats()["completed"] == 10
+
+
+def test_runner_error_is_propagated(pool):
+    """실행기 예외는 BacktestWorkerError로 전달되고 워커는 계속 사용"""
+    failed = pool.submit("momentum", {"fail": True})
+    with pytest.raises(BacktestWorkerError, match="bad parameter"):
+        failed.result(timeout=10)
+
+    assert pool.submit("momentum", {"x": 1}).result(timeout=10)["total_return"] == 0.01
+    assert pool.get_stats()["workers_restarted"] == 0
+
+
+def test_timeout_replaces_worker(pool):
+    """타임아웃 작업은 실패 처리되고 워커가 교체됨"""
+    slow = pool.submit("momentum", {"sleep": 30}, timeout=0.3)
+    with pytest.raises(BacktestTimeoutError):
+        slow.result(timeout=10)
+
+    stats = pool.get_stats()
+    assert stats["timed_out"] == 1
+    assert stats["workers_restarted"] == 1
+    assert stats["workers"] == 2
+    assert pool.submit("momentum", {"x": 2}).result(timeout=10)["total_return"] == 0.02
+
+
+def test_cancel_pending_and_running(pool):
+    """대기 중/실행 중 작업 취소"""
+    running = [pool.submit("momentum", {"sleep": 30}, task_id=f"run_{i}") for i in range(2)]
+    pending = pool.submit("momentum", {"x": 3}, task_id="pending")
+
+    deadline = time.time() + 10
+    while pool.get_stats()["running"] < 2 and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert pool.cancel("pending")
+    assert pool.cancel("run_0")
+    assert not pool.cancel("unknown")
+
+    with pytest.raises(CancelledError):
+        pending.result(timeout=1)
+    with pytest.raises(CancelledError):
+        running[0].result(timeout=1)
+
+    assert pool.cancel("run_1")
+    assert pool.submit("momentum", {"x": 4}).result(timeout=10)["total_return"] == 0.04
+    assert pool.get_stats()["cancelled"] == 3
+
+
+def test_submit_requires_started_pool():
+    worker_pool = BacktestWorkerPool(runner_factory=FakeRunner)
+    with pytest.raises(RuntimeError):
+        worker_pool.submit("momentum", {})
+
+
+def test_init_failure_stops_respawning():
+    """초기화가 계속 실패하면 재생성을 멈추고 대기/신규 작업을 실패 처리"""
+    worker_pool = BacktestWorkerPool(
+        WorkerPoolConfig(num_workers=2, poll_interval_seconds=0.01, max_init_failures=3),
+        runner_factory=BrokenRunner,
+    )
+    worker_pool.start()
+    try:
+        pending = worker_pool.submit("momentum", {"x": 1})
+        with pytest.raises(BacktestWorkerError, match="strategy module missing"):
+            pending.result(timeout=10)
+
+        stats = worker_pool.get_stats()
+        assert stats["workers"] == 0
+        # 최초 2개 실패 → 재생성 2회, 세 번째 실패에서 재생성 중단
+        assert stats["workers_restarted"] == 2
+
+        late = worker_pool.submit("momentum", {"x": 2})
+        assert late.done()
+        with pytest.raises(BacktestWorkerError, match="strategy module missing"):
+            late.result(timeout=0)
+        time.sleep(0.1)
+        assert worker_pool.get_stats()["workers_restarted"] == 2
+    finally:
+        worker_pool.stop()
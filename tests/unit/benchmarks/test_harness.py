@@ -0,0 +1,39 @@
+"""
+벤치마크 도구 테스트
+"""
+
+from benchmarks.harness import BenchmarkSpec, compare_results, run_benchmark
+
+
+def _payload(**medians):
+    return {"results": {name: {"median": value} for name, value in medians.items()}}
+
+
+def test_run_benchmark_excludes_setup_and_counts_items():
+    calls = {"setup": 0, "run": 0}
+
+    def setup():
+        calls["setup"] += 1
+        return lambda: calls.__setitem__("run", calls["run"] + 1)
+
+    stats = run_benchmark(BenchmarkSpec("t", setup, items=10, repeat=3, warmup=2))
+
+    assert calls == {"setup": 1, "run": 5}
+    assert stats["repeat"] == 3 and stats["items"] == 10
+    assert stats["min"] <= stats["median"]
+
+
+def test_compare_results_statuses():
+    current = _payload(slower=1.3, faster=0.5, same=1.05, added=1.0)
+    current["results"]["broken"] = {"error": "boom"}
+    baseline = _payload(slower=1.0, faster=1.0, same=1.0)
+
+    statuses = {row["name"]: row["status"] for row in compare_results(current, baseline, 0.2)}
+
+    assert statuses == {
+        "slower": "regression",
+        "faster": "improved",
+        "same": "ok",
+        "added": "new",
+        "broken": "error",
+    }
@@ -0,0 +1,176 @@
+"""EventBus 디스패치 테스트
+
+Tests:
+    - 워커 여러 개에서도 타입 내 발행 순서 유지
+    - 순서는 종목 단위로 보장되며 다른 종목의 같은 타입 이벤트는 병렬 처리
+    - 발행 즉시 워커 깨움 (폴링 대기 없음)
+    - 같은 우선순위에서 대량 틱이 주문 이벤트를 굶기지 않음
+    - 배치 구독 병합 전달, inline 핸들러
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime
+
+from core.events import EventBus, EventPriority, EventType, PriceEvent
+from core.events.dispatch import LatencyStats
+from core.events.handler import AsyncEventHandler
+
+
+def _event(event_type, seq, code="005930", priority=EventPriority.NORMAL):
+    return PriceEvent(
+        event_id=f"e{seq}", event_type=event_type, timestamp=datetime.now(),
+        source="test", priority=priority, stock_code=code, price=float(seq),
+        data={"seq": seq},
+    )
+
+
+def test_events_of_one_type_are_handled_in_publish_order():
+    async def scenario():
+        seen = {EventType.PRICE_UPDATE: [], EventType.ORDER_FILLED: []}
+
+        async def handle(event):
+            await asyncio.sleep(random.random() * 0.003)
+            seen[event.event_type].append(event.data["seq"])
+            return True
+
+        bus = EventBus(max_workers=4)
+        bus.subscribe(EventType.PRICE_UPDATE, AsyncEventHandler("ticks", [EventType.PRICE_UPDATE], handle))
+        bus.subscribe(EventType.ORDER_FILLED, AsyncEventHandler("orders", [EventType.ORDER_FILLED], handle))
+        await bus.start()
+        for seq in range(40):
+            await bus.publish(_event(EventType.PRICE_UPDATE, seq))
+            await bus.publish(_event(EventType.ORDER_FILLED, seq))
+        while len(seen[EventType.PRICE_UPDATE]) < 40 or len(seen[EventType.ORDER_FILLED]) < 40:
+            await asyncio.sleep(0.005)
+        await bus.stop()
+        return seen
+
+    seen = asyncio.run(scenario())
+    assert seen[EventType.PRICE_UPDATE] == list(range(40))
+    assert seen[EventType.ORDER_FILLED] == list(range(40))
+
+
+def test_same_type_events_of_different_symbols_run_concurrently():
+    async def scenario():
+        seen = {}
+        active = 0
+        max_active = 0
+
+        async def handle(event):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(random.random() * 0.003)
+            seen.setdefault(event.stock_code, []).append(event.data["seq"])
+            active -= 1
+            return True
+
+        bus = EventBus(max_workers=4)
+        bus.subscribe(EventType.PRICE_UPDATE, AsyncEventHandler("ticks", [EventType.PRICE_UPDATE], handle))
+        await bus.start()
+        codes = ["005930", "000660", "035720", "051910"]
+        for seq in range(20):
+            for code in codes:
+                await bus.publish(_event(EventType.PRICE_UPDATE, seq, code=code))
+        while sum(len(v) for v in seen.values()) < 20 * len(codes):
+            await asyncio.sleep(0.005)
+        await bus.stop()
+        return seen, max_active
+
+    seen, max_active = asyncio.run(scenario())
+    assert max_active > 1
+    assert all(seq == list(range(20)) for seq in seen.values())
+
+
+def test_idle_worker_wakes_on_publish():
+    async def scenario():
+        handled = asyncio.Event()
+
+        def handle(event):
+            handled.set()
+            return True
+
+        bus = EventBus(max_workers=2)
+        bus.subscribe(EventType.RISK_ALERT, AsyncEventHandler("risk", [EventType.RISK_ALERT], handle), inline=True)
+        await bus.start()
+        await asyncio.sleep(0.05)  # 워커가 모두 대기 상태
+
+        started = time.perf_counter()
+        await bus.publish(_event(EventType.RISK_ALERT, 1, priority=EventPriority.CRITICAL))
+        await asyncio.wait_for(handled.wait(), timeout=1)
+        elapsed = time.perf_counter() - started
+        stats = bus.get_event_stats()
+        await bus.stop()
+        return elapsed, stats
+
+    elapsed, stats = asyncio.run(scenario())
+    assert elapsed < 0.05
+    assert stats["processed_count"] == 1
+    assert stats["queue_latency"]["count"] == 1
+
+
+def test_bulk_ticks_do_not_starve_same_priority_orders():
+    async def scenario():
+        order = []
+
+        def handle(event):
+            order.append(event.event_type)
+            return True
+
+        bus = EventBus(max_workers=1)
+        types = [EventType.PRICE_UPDATE, EventType.ORDER_CANCELLED]
+        handler = AsyncEventHandler("all", types, handle)
+        for event_type in types:
+            bus.subscribe(event_type, handler, inline=True)
+
+        # 시작 전 발행분은 큐에 쌓임
+        for seq in range(200):
+            await bus.publish(_event(EventType.PRICE_UPDATE, seq))
+        await bus.publish(_event(EventType.ORDER_CANCELLED, 0))
+
+        await bus.start()
+        while len(order) < 201:
+            await asyncio.sleep(0.005)
+        await bus.stop()
+        return order
+
+    order = asyncio.run(scenario())
+    assert order.index(EventType.ORDER_CANCELLED) <= 1
+
+
+def test_batch_subscription_delivers_coalesced_lists():
+    async def scenario():
+        batches = []
+        bus = EventBus(max_workers=2)
+        bus.subscribe_batch(
+            EventType.PRICE_UPDATE, batches.append,
+            flush_interval=60, coalesce_key=lambda e: e.stock_code,
+        )
+        await bus.start()
+        for seq in range(30):
+            await bus.publish(_event(EventType.PRICE_UPDATE, seq, code=f"{seq % 3:06d}"))
+        while bus.get_event_stats()["queue_sizes"]["normal"]:
+            await asyncio.sleep(0.005)
+        await asyncio.sleep(0.01)
+        await bus.stop()  # 남은 배치 전달
+        return batches
+
+    batches = asyncio.run(scenario())
+    assert len(batches) == 1
+    assert [(e.stock_code, e.data["seq"]) for e in batches[0]] == [
+        ("000000", 27), ("000001", 28), ("000002", 29),
+    ]
+
+
+def test_latency_stats_ring_buffer_keeps_recent_values():
+    stats = LatencyStats(capacity=4)
+    for value in range(1, 11):
+        stats.record(float(value))
+
+    assert stats.values() == [7.0, 8.0, 9.0, 10.0]
+    assert stats.mean() == 8.5
+    assert stats.summary()["max"] == 10.0
+    stats.clear()
+    assert stats.mean() == 0.0
@@ -0,0 +1,97 @@
+"""
+횡단면 순위 유틸리티 테스트
+
+기존 파이썬 구현(sorted, 이중 루프)과 결과가 동일한지 검증합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+from core.risk.correlation.correlation_matrix import CorrelationMatrix
+from core.scoring.ranking import (
+    descending_order,
+    percentile_ranks,
+    top_k_indices,
+    upper_triangle_pairs,
+)
+
+
+def _random_scores(rng, n):
+    # 동점이 자주 생기도록 반올림
+    return np.round(rng.normal(size=n), 1)
+
+
+class TestRanking:
+
+    def test_percentile_ranks_match_count(self):
+        rng = np.random.default_rng(0)
+        values = _random_scores(rng, 300)
+        expected = [sum(1 for v in values if v <= x) / len(values) * 100 for x in values]
+        np.testing.assert_allclose(percentile_ranks(values), expected)
+
+    def test_percentile_ranks_nan_is_lowest(self):
+        values = [1.0, float("nan"), 2.0, 2.0]
+        expected = [sum(1 for v in values if v <= x) / len(values) * 100 for x in values]
+        np.testing.assert_allclose(percentile_ranks(values), expected)
+        assert percentile_ranks(values)[1] == 0.0
+
+    def test_percentile_ranks_empty(self):
+        assert percentile_ranks([]).size == 0
+
+    def test_descending_order_is_stable(self):
+        values = [1.0, 3.0, 3.0, 2.0, float("nan"), 3.0]
+        assert descending_order(values).tolist() == [1, 2, 5, 3, 0, 4]
+
+    def test_top_k_matches_stable_sort(self):
+        rng = np.random.default_rng(1)
+        for _ in range(50):
+            n = int(rng.integers(1, 200))
+            values = _random_scores(rng, n)
+            expected = sorted(range(n), key=lambda i: values[i], reverse=True)
+            for k in (1, n // 3, n, n + 5):
+                assert top_k_indices(values, k).tolist() == expected[:k]
+
+    def test_top_k_zero(self):
+        assert top_k_indices([1.0, 2.0], 0).size == 0
+
+    def test_upper_triangle_pairs(self):
+        matrix = np.array([
+            [1.0, 0.9, np.nan],
+            [0.9, 1.0, 0.2],
+            [np.nan, 0.2, 1.0],
+        ])
+        rows, cols, values = upper_triangle_pairs(matrix, lambda v: v > 0.5)
+        assert rows.tolist() == [0]
+        assert cols.tolist() == [1]
+        assert values.tolist() == [0.9]
+
+
+class TestCorrelationPairs:
+    """상관관계 쌍 추출 결과가 이중 루프 구현과 동일"""
+
+    @staticmethod
+    def _loop_pairs(corr, predicate, reverse):
+        stocks = corr.columns.tolist()
+        pairs = []
+        for i, s1 in enumerate(stocks):
+            for s2 in stocks[i + 1:]:
+                c = corr.loc[s1, s2]
+                if predicate(abs(c)):
+                    pairs.append((s1, s2, c))
+        return sorted(pairs, key=lambda x: abs(x[2]), reverse=reverse)
+
+    def test_matches_loop_implementation(self):
+        rng = np.random.default_rng(2)
+        returns = pd.DataFrame(
+            rng.normal(size=(60, 25)), columns=[f"{i:06d}" for i in range(25)]
+        )
+        returns.iloc[:, 1] = returns.iloc[:, 0] * 0.9 + returns.iloc[:, 1] * 0.1
+        corr = returns.corr().round(2)
+
+        cm = CorrelationMatrix(high_correlation_threshold=0.7, low_correlation_threshold=0.1)
+        high = cm._find_high_correlation_pairs(corr)
+        low = cm._find_low_correlation_pairs(corr)
+
+        assert high == self._loop_pairs(corr, lambda c: c >= 0.7, reverse=True)
+        assert low == self._loop_pairs(corr, lambda c: c <= 0.1, reverse=False)
+        assert high and low
@@ -0,0 +1,108 @@
+"""
+추가 전용 상태 저널 및 WorkflowStateManager 복구 테스트
+"""
+
+import json
+
+from core.workflow.state_journal import StateJournal
+from core.workflow.workflow_state_manager import (
+    WorkflowStage,
+    WorkflowStateManager,
+    WorkflowStatus,
+)
+
+
+def _save(manager, stage, status, progress, step="step"):
+    manager.save_checkpoint(stage, status, progress, step, 4, [step], {"p": progress})
+
+
+class TestStateJournal:
+    """저널 기록/재생/압축"""
+
+    def test_replay_after_snapshot_only(self, tmp_path):
+        journal = StateJournal(str(tmp_path), "t", fsync_every=1)
+        journal.append({"v": 1})
+        journal.append({"v": 2})
+        journal.compact({"total": 3})
+        journal.append({"v": 3})
+        journal.close()
+
+        reopened = StateJournal(str(tmp_path), "t")
+        assert reopened.load_snapshot() == {"total": 3}
+        assert list(reopened.replay()) == [{"v": 3}]
+        assert reopened.pending_records == 1
+
+        # 이어서 기록하는 번호는 재생된 마지막 번호 다음
+        assert reopened.append({"v": 4}) == 4
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        journal = StateJournal(str(tmp_path), "t")
+        journal.append({"v": 1})
+        journal.close()
+        with open(journal.journal_path, "ab") as f:
+            f.write(b'{"seq":2,"record":{"v"')
+
+        reopened = StateJournal(str(tmp_path), "t")
+        assert list(reopened.replay()) == [{"v": 1}]
+        reopened.append({"v": 2})
+        reopened.close()
+
+        lines = journal.journal_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["record"]["v"] for line in lines] == [1, 2]
+
+    def test_records_before_snapshot_not_reapplied(self, tmp_path):
+        """스냅샷 교체 후 저널 비우기 전에 중단된 경우"""
+        journal = StateJournal(str(tmp_path), "t")
+        journal.append({"v": 1})
+        journal.close()
+        saved = journal.journal_path.read_bytes()
+        journal.compact({"total": 1})
+        journal.journal_path.write_bytes(saved)
+
+        reopened = StateJournal(str(tmp_path), "t")
+        assert reopened.load_snapshot() == {"total": 1}
+        assert list(reopened.replay()) == []
+
+
+class TestWorkflowStateManagerJournal:
+    """WorkflowStateManager 저널 기반 저장/복구"""
+
+    def test_restore_latest_checkpoint_per_stage(self, tmp_path):
+        manager = WorkflowStateManager(str(tmp_path), compact_threshold=1000)
+        for progress in (10.0, 50.0, 100.0):
+            _save(manager, WorkflowStage.STAGE_A, WorkflowStatus.IN_PROGRESS, progress)
+        _save(manager, WorkflowStage.STAGE_B, WorkflowStatus.FAILED, 5.0)
+        manager.reset_stage(WorkflowStage.STAGE_B)
+        manager.close()
+
+        restored = WorkflowStateManager(str(tmp_path))
+        assert restored.get_checkpoint(WorkflowStage.STAGE_A).progress_percentage == 100.0
+        assert restored.get_checkpoint(WorkflowStage.STAGE_B) is None
+        assert [h["progress_percentage"] for h in restored.get_history()] == [10.0, 50.0, 100.0, 5.0]
+
+    def test_compaction_bounds_journal_and_history(self, tmp_path):
+        manager = WorkflowStateManager(str(tmp_path), compact_threshold=10)
+        for i in range(150):
+            _save(manager, WorkflowStage.STAGE_C, WorkflowStatus.IN_PROGRESS, float(i))
+        manager.close()
+
+        assert manager.journal.pending_records < 10
+        restored = WorkflowStateManager(str(tmp_path))
+        history = restored.get_history()
+        assert len(history) == 100
+        assert history[-1]["progress_percentage"] == 149.0
+        assert restored.get_checkpoint(WorkflowStage.STAGE_C).progress_percentage == 149.0
+
+    def test_migrates_legacy_files(self, tmp_path):
+        checkpoint = {
+            "stage": "stage_a", "status": "completed", "timestamp": "2025-01-01T00:00:00",
+            "progress_percentage": 100.0, "current_step": "done", "total_steps": 1,
+            "completed_steps": ["done"], "metadata": {}, "error_message": None,
+        }
+        (tmp_path / "workflow_state.json").write_text(json.dumps({"stage_a": checkpoint}))
+        (tmp_path / "workflow_history.json").write_text(json.dumps([checkpoint]))
+
+        manager = WorkflowStateManager(str(tmp_path))
+        assert manager.is_stage_completed(WorkflowStage.STAGE_A)
+        assert len(manager.get_history()) == 1
+        assert manager.journal.snapshot_path.exists()
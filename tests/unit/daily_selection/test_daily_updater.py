@@ -8,10 +8,14 @@ P1 요구사항:
 - _passes_basic_filters 안전 필터 테스트
 """
 
+import asyncio
+import tempfile
 import unittest
 import sys
 import os
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 # 프로젝트 루트 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -22,6 +26,7 @@ os.environ["REDIS_URL"] = ""  # Redis 비활성화
 
 from core.daily_selection.daily_updater import DailyUpdater
 from core.daily_selection.price_analyzer import PriceAttractivenessLegacy
+from core.daily_selection.phase2_work_queue import CheckpointStatus, Phase2Checkpoint
 
 
 class TestDailyUpdaterCompositeScore(unittest.TestCase):
@@ -381,5 +386,86 @@ class TestDailyUpdaterSafetyFilter(unittest.TestCase):
         self.assertTrue(self.updater._passes_basic_filters(result_volume_boundary))
 
 
+class FakeAsyncClient:
+    """AsyncKISClient 대체 (down 종목은 현재가 조회 실패 → None)"""
+
+    down = set()
+    rate_limit_per_sec = None
+
+    def __init__(self, *args, **kwargs):
+        FakeAsyncClient.rate_limit_per_sec = kwargs.get("rate_limit_per_sec")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get_price(self, stock_code):
+        if stock_code in self.down:
+            return None
+        return SimpleNamespace(current_price=10000)
+
+    async def get_stock_history(self, stock_code, period="D", count=30):
+        return None
+
+
+class TestDailyUpdaterWorkQueue(unittest.TestCase):
+    """작업 큐 경로의 실패 처리와 재개"""
+
+    def setUp(self):
+        self.updater = DailyUpdater()
+        self.updater._config["api_retry"]["max_retries"] = 0
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "progress.jsonl")
+        self.stocks = [{"stock_code": f"{i:06d}", "stock_name": f"종목{i}"} for i in range(3)]
+        self.analysis = PriceAttractivenessLegacy(
+            stock_code="000000", stock_name="테스트", analysis_date="2026-01-29",
+            current_price=10000.0, total_score=70.0, technical_score=80.0,
+            volume_score=60.0, pattern_score=70.0, technical_signals=[],
+            risk_score=30.0, entry_price=10000.0, target_price=12000.0,
+            stop_loss=9000.0, expected_return=0.2, confidence=0.8,
+            selection_reason="테스트", market_condition="neutral", sector_momentum=0.5
+        )
+
+    def tearDown(self):
+        FakeAsyncClient.down = set()
+        self.tmp.cleanup()
+
+    def _run(self):
+        with patch("core.api.async_client.AsyncKISClient", FakeAsyncClient), \
+                patch.object(self.updater._price_analyzer, "analyze_price_attractiveness",
+                             return_value=self.analysis):
+            return asyncio.run(self.updater._run_work_queue(self.stocks, Phase2Checkpoint(self.path)))
+
+    def test_price_failure_is_retried_and_recorded_failed(self):
+        """현재가 조회 실패는 완료(None)가 아니라 재시도 후 FAILED로 기록"""
+        FakeAsyncClient.down = {"000001"}
+
+        progress = self._run()
+
+        self.assertEqual(progress.failed, 1)
+        self.assertEqual(progress.processed, 2)
+        records = Phase2Checkpoint(self.path).load()
+        self.assertEqual(records["000001"]["status"], CheckpointStatus.FAILED)
+        self.assertNotIn("000001", Phase2Checkpoint(self.path).completed_codes())
+        # 워커 수/클라이언트 한도는 설정된 초당 요청 한도 기준
+        from core.config import settings
+        self.assertEqual(FakeAsyncClient.rate_limit_per_sec, settings.RATE_LIMIT_PER_SEC)
+
+    def test_resume_reprocesses_failed_stock(self):
+        """재개 시 실패 종목만 다시 처리하여 선정 결과에 포함"""
+        FakeAsyncClient.down = {"000001"}
+        self._run()
+
+        FakeAsyncClient.down = set()
+        progress = self._run()
+
+        self.assertEqual(progress.skipped, 2)
+        self.assertEqual(progress.processed, 1)
+        selected = [r["stock_code"] for r in Phase2Checkpoint(self.path).selected_results()]
+        self.assertEqual(sorted(selected), ["000000", "000001", "000002"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,184 @@
+"""
+Phase 2 작업 큐 테스트
+
+우선순위 순서, 종목 단위 체크포인트 재개, 재시도, 워커 수 계산을 검증합니다.
+"""
+
+import asyncio
+
+from core.daily_selection.phase2_work_queue import (
+    CheckpointStatus,
+    Phase2Checkpoint,
+    Phase2WorkQueue,
+    resolve_worker_count,
+)
+
+
+def _stocks(n):
+    return [{"stock_code": f"{i:06d}", "priority": i} for i in range(n)]
+
+
+class TestPhase2WorkQueue:
+    """작업 큐 동작"""
+
+    def test_processes_in_priority_order(self, tmp_path):
+        """단일 워커에서 우선순위 내림차순 처리"""
+        order = []
+
+        async def process(stock):
+            order.append(stock["stock_code"])
+            return {"stock_code": stock["stock_code"]}
+
+        checkpoint = Phase2Checkpoint(str(tmp_path / "progress.jsonl"))
+        queue = Phase2WorkQueue(
+            process, checkpoint, worker_count=1,
+            priority_fn=lambda s: s["priority"],
+        )
+        progress = asyncio.run(queue.run(_stocks(5)))
+
+        assert order == ["000004", "000003", "000002", "000001", "000000"]
+        assert progress.processed == 5
+        assert progress.selected == 5
+        assert progress.remaining == 0
+
+    def test_resume_skips_checkpointed_stocks(self, tmp_path):
+        """체크포인트에 완료된 종목은 재처리하지 않음"""
+        path = str(tmp_path / "progress.jsonl")
+        checkpoint = Phase2Checkpoint(path)
+        checkpoint.record("000000", CheckpointStatus.DONE, result={"stock_code": "000000"})
+        checkpoint.record("000001", CheckpointStatus.DONE, result=None)
+
+        processed = []
+
+        async def process(stock):
+            processed.append(stock["stock_code"])
+            return None
+
+        queue = Phase2WorkQueue(process, Phase2Checkpoint(path), worker_count=3)
+        progress = asyncio.run(queue.run(_stocks(4)))
+
+        assert sorted(processed) == ["000002", "000003"]
+        assert progress.skipped == 2
+        # 재개 이전에 통과한 결과도 최종 후보에 포함
+        assert [r["stock_code"] for r in checkpoint.selected_results()] == ["000000"]
+        assert checkpoint.completed_codes() == {"000000", "000001", "000002", "000003"}
+
+    def test_truncated_checkpoint_line_is_ignored(self, tmp_path):
+        """중단으로 잘린 마지막 줄은 무시하고 해당 종목 재처리"""
+        path = tmp_path / "progress.jsonl"
+        checkpoint = Phase2Checkpoint(str(path))
+        checkpoint.record("000000", CheckpointStatus.DONE)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"stock_code": "000001", "sta')
+
+        assert checkpoint.completed_codes() == {"000000"}
+
+    def test_retries_then_records_failure(self, tmp_path):
+        """예외 발생 종목은 재시도 후 실패로 기록"""
+        attempts = {}
+
+        async def process(stock):
+            code = stock["stock_code"]
+            attempts[code] = attempts.get(code, 0) + 1
+            if code == "000001":
+                raise RuntimeError("api error")
+            return None
+
+        checkpoint = Phase2Checkpoint(str(tmp_path / "progress.jsonl"))
+        queue = Phase2WorkQueue(process, checkpoint, worker_count=2, max_attempts=2)
+        progress = asyncio.run(queue.run(_stocks(3)))
+
+        assert attempts["000001"] == 2
+        assert progress.failed == 1
+        assert progress.processed == 2
+        # 실패 종목은 재시작 시 다시 처리 대상
+        assert "000001" not in checkpoint.completed_codes()
+
+    def test_transient_failure_retried_then_done(self, tmp_path):
+        """일시 실패 종목은 재시도에서 성공하면 완료로 기록"""
+        calls = {"count": 0}
+
+        async def process(stock):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise RuntimeError("timeout")
+            return {"stock_code": stock["stock_code"]}
+
+        checkpoint = Phase2Checkpoint(str(tmp_path / "progress.jsonl"))
+        queue = Phase2WorkQueue(process, checkpoint, worker_count=1, max_attempts=2)
+        progress = asyncio.run(queue.run(_stocks(1)))
+
+        assert calls["count"] == 2
+        assert progress.failed == 0
+        assert checkpoint.load()["000000"]["status"] == CheckpointStatus.DONE
+
+    def test_failed_stock_reprocessed_on_resume(self, tmp_path):
+        """최종 실패 종목은 재개 시 다시 처리되고, 완료 종목은 건너뜀"""
+        path = str(tmp_path / "progress.jsonl")
+        down = {"000001"}
+        processed = []
+
+        async def process(stock):
+            processed.append(stock["stock_code"])
+            if stock["stock_code"] in down:
+                raise RuntimeError("api down")
+            return None
+
+        first = asyncio.run(Phase2WorkQueue(process, Phase2Checkpoint(path), worker_count=2).run(_stocks(3)))
+        assert first.failed == 1
+
+        down.clear()
+        processed.clear()
+        second = asyncio.run(Phase2WorkQueue(process, Phase2Checkpoint(path), worker_count=2).run(_stocks(3)))
+
+        assert processed == ["000001"]
+        assert second.skipped == 2
+        assert Phase2Checkpoint(path).completed_codes() == {"000000", "000001", "000002"}
+
+    def test_checkpoint_write_error_does_not_hang(self, tmp_path):
+        """체크포인트 기록 실패에도 워커가 살아 있어 큐가 끝까지 처리됨"""
+
+        class BrokenCheckpoint(Phase2Checkpoint):
+            def record(self, stock_code, status, result=None, error=""):
+                raise OSError("disk full")
+
+        processed = []
+
+        async def process(stock):
+            processed.append(stock["stock_code"])
+            return None
+
+        queue = Phase2WorkQueue(process, BrokenCheckpoint(str(tmp_path / "progress.jsonl")), worker_count=2)
+        asyncio.run(asyncio.wait_for(queue.run(_stocks(5)), timeout=5))
+
+        assert len(processed) == 5
+
+    def test_workers_run_concurrently(self, tmp_path):
+        """워커 수만큼 동시 처리"""
+        active = {"now": 0, "max": 0}
+
+        async def process(stock):
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return None
+
+        checkpoint = Phase2Checkpoint(str(tmp_path / "progress.jsonl"))
+        queue = Phase2WorkQueue(process, checkpoint, worker_count=4)
+        asyncio.run(queue.run(_stocks(12)))
+
+        assert active["max"] == 4
+
+
+class TestResolveWorkerCount:
+    """Rate Limit 예산 기반 워커 수"""
+
+    def test_bounded_by_rate_budget(self):
+        assert resolve_worker_count(rate_limit_per_sec=5, max_concurrent=20) == 5
+
+    def test_bounded_by_config(self):
+        assert resolve_worker_count(rate_limit_per_sec=20, max_concurrent=5) == 5
+
+    def test_minimum_one(self):
+        assert resolve_worker_count(rate_limit_per_sec=0, max_concurrent=0) == 1
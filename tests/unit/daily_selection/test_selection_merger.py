@@ -0,0 +1,180 @@
+"""
+Phase 2 스트리밍 병합 테스트
+
+섹터별 상위 K 병합 결과가 전체 후보 정렬 선정과 동일한지,
+압축 체크포인트와 체크포인트 꼬리 재병합이 올바른지 검증합니다.
+"""
+
+import asyncio
+import json
+import os
+import random
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from core.daily_selection.daily_updater import DailyUpdater
+from core.daily_selection.phase2_work_queue import (
+    CheckpointStatus,
+    Phase2Checkpoint,
+    Phase2WorkQueue,
+)
+from core.daily_selection.selection_merger import StreamingSelectionMerger
+
+SECTORS = ["반도체", "자동차", "은행", "바이오", "기타", ""]
+
+
+def _random_stocks(rng, n):
+    return [
+        {
+            "stock_code": f"{i:06d}",
+            "sector": rng.choice(SECTORS),
+            # 동점 처리 검증을 위해 점수 범위를 좁게 둠
+            "technical_score": rng.choice([40, 60, 80]),
+            "volume_score": rng.choice([50, 70]),
+            "risk_score": rng.choice([20, 40]),
+            "confidence": 0.5,
+        }
+        for i in range(n)
+    ]
+
+
+def _codes(stocks):
+    return [s["stock_code"] for s in stocks]
+
+
+class TestStreamingSelectionMerger:
+    """병합기 동작"""
+
+    def test_matches_full_selection(self, tmp_path):
+        """무작위 후보에서 전체 정렬 선정과 결과 동일"""
+        updater = DailyUpdater(p_output_dir=str(tmp_path))
+        rng = random.Random(7)
+
+        for _ in range(20):
+            stocks = _random_stocks(rng, rng.randint(0, 200))
+            merger = updater._create_selection_merger()
+            merger.extend([dict(s) for s in stocks])
+
+            for condition in ("bullish", "neutral", "bearish"):
+                expected = updater._select_top_n_adaptive([dict(s) for s in stocks], condition)
+                actual = updater._select_top_n_adaptive(merger.candidates(), condition)
+                assert _codes(actual) == _codes(expected)
+
+    def test_bounded_retention(self):
+        """섹터당 K개, 미분류는 overflow_capacity개만 보관"""
+        merger = StreamingSelectionMerger(lambda s: s["score"], max_per_sector=2, overflow_capacity=3)
+        for i in range(10):
+            merger.add({"stock_code": f"A{i}", "sector": "반도체", "score": i})
+            merger.add({"stock_code": f"B{i}", "sector": "기타", "score": i})
+
+        assert len(merger) == 5
+        assert merger.seen_count == 20
+        assert _codes(merger.candidates()) == ["A9", "B9", "A8", "B8", "B7"]
+
+    def test_first_result_wins_for_duplicate_code(self):
+        """같은 종목 코드는 처음 결과만 사용"""
+        merger = StreamingSelectionMerger(lambda s: s["score"], max_per_sector=3, overflow_capacity=3)
+        assert merger.add({"stock_code": "A", "sector": "", "score": 1})
+        assert not merger.add({"stock_code": "A", "sector": "", "score": 99})
+        assert merger.candidates()[0]["score"] == 1
+
+    def test_checkpoint_round_trip(self, tmp_path):
+        """압축 체크포인트 저장 후 복원하여 이어서 병합"""
+        score = lambda s: s["score"]  # noqa: E731
+        path = str(tmp_path / "merge.json")
+
+        merger = StreamingSelectionMerger(score, max_per_sector=2, overflow_capacity=2)
+        for i in range(5):
+            merger.add({"stock_code": f"S{i}", "sector": "은행", "score": i % 3})
+        merger.save_checkpoint(path, {"checkpoint_offset": 123})
+
+        with open(path, encoding="utf-8") as f:
+            raw = f.read()
+        assert "\n" not in raw and ": " not in raw
+
+        restored, extra = StreamingSelectionMerger.load_checkpoint(path, score)
+        assert extra == {"checkpoint_offset": 123}
+        assert _codes(restored.candidates()) == _codes(merger.candidates())
+
+        # 이미 본 종목은 무시, 새 종목은 도착 순서가 이어짐
+        assert not restored.add({"stock_code": "S0", "sector": "은행", "score": 9})
+        restored.add({"stock_code": "S9", "sector": "은행", "score": 2})
+        assert _codes(restored.candidates()) == ["S2", "S9"]
+
+    def test_missing_checkpoint(self, tmp_path):
+        merger, extra = StreamingSelectionMerger.load_checkpoint(str(tmp_path / "none.json"), len)
+        assert merger is None and extra == {}
+
+
+class TestWorkQueueStreamingMerge:
+    """작업 큐 결과 콜백과 체크포인트 꼬리 재병합"""
+
+    def test_result_callback_offsets(self, tmp_path):
+        """결과 콜백 오프셋 이후 꼬리만 읽으면 남은 레코드만 반환"""
+        checkpoint = Phase2Checkpoint(str(tmp_path / "progress.jsonl"))
+        seen = []
+
+        async def process(stock):
+            return {"stock_code": stock["stock_code"]}
+
+        queue = Phase2WorkQueue(
+            process, checkpoint, worker_count=1,
+            result_callback=lambda result, offset: seen.append((result["stock_code"], offset)),
+        )
+        asyncio.run(queue.run([{"stock_code": f"{i:06d}"} for i in range(4)]))
+
+        assert [code for code, _ in seen] == ["000000", "000001", "000002", "000003"]
+        assert seen[-1][1] == checkpoint.path.stat().st_size
+
+        tail = [record["stock_code"] for record, _ in checkpoint.iter_records(seen[1][1])]
+        assert tail == ["000002", "000003"]
+
+    def test_restore_replays_tail_after_snapshot(self, tmp_path):
+        """스냅샷 이후 기록만 재병합하여 전체 결과와 동일한 후보 복원"""
+        updater = DailyUpdater(p_output_dir=str(tmp_path))
+        checkpoint = Phase2Checkpoint(str(tmp_path / "progress.jsonl"))
+        snapshot_path = str(tmp_path / "merge.json")
+        stocks = _random_stocks(random.Random(3), 30)
+
+        merger = updater._create_selection_merger()
+        for i, stock in enumerate(stocks):
+            offset = checkpoint.record(stock["stock_code"], CheckpointStatus.DONE, result=dict(stock))
+            merger.add(dict(stock))
+            if i == 14:
+                merger.save_checkpoint(snapshot_path, {"checkpoint_offset": offset})
+                snapshot_candidates = len(merger)
+        checkpoint.record("999999", CheckpointStatus.FAILED, error="boom")
+
+        # 스냅샷 이전 레코드가 다시 읽히지 않도록 앞부분을 손상
+        with open(checkpoint.path, "r+b") as f:
+            f.write(b"X" * 10)
+
+        restored = updater._restore_phase2_merger(checkpoint, snapshot_path)
+        assert restored.seen_count == 30
+        assert _codes(restored.candidates()) == _codes(merger.candidates())
+        assert snapshot_candidates <= len(restored)
+
+    def test_distributed_merge_reads_only_missing_batches(self, tmp_path, monkeypatch):
+        """메모리에 누적된 배치는 파일을 다시 읽지 않음"""
+        updater = DailyUpdater(p_output_dir=str(tmp_path))
+        captured = {}
+        monkeypatch.setattr(
+            updater, "_finalize_selection",
+            lambda candidates, condition, metadata=None: captured.setdefault("c", candidates),
+        )
+
+        stocks = _random_stocks(random.Random(5), 20)
+        updater._merge_batch_into_memory(0, [dict(s) for s in stocks[:10]])
+
+        # 배치 0 파일은 손상, 배치 1 파일만 정상
+        (tmp_path / "batch_0.json").write_text("not json", encoding="utf-8")
+        (tmp_path / "batch_1.json").write_text(
+            json.dumps({"selected_stocks": stocks[10:]}), encoding="utf-8"
+        )
+
+        assert updater._merge_batch_results(2, "neutral")
+        expected = updater._select_top_n_adaptive([dict(s) for s in stocks], "neutral")
+        actual = updater._select_top_n_adaptive(captured["c"], "neutral")
+        assert _codes(actual) == _codes(expected)
+        # 병합 완료 후 상태 초기화
+        assert updater._batch_merger is None
@@ -0,0 +1,121 @@
+"""
+종목 정보 병렬 업데이트 테스트
+
+결정적 가짜 API로 공유 호출 제한, 재시도 큐, 진행 지표를 테스트합니다.
+"""
+
+import threading
+import time
+
+import pytest
+import schedule
+
+from core.data.stock_updater import RateBudget, StockInfo, StockUpdater
+
+
+class FakeStockAPI:
+    """종목별 실패 횟수가 정해진 가짜 상세 조회 API"""
+
+    def __init__(self, failures=None):
+        self.failures = dict(failures or {})
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, stock_code):
+        with self._lock:
+            self.calls.append(stock_code)
+            remaining = self.failures.get(stock_code, 0)
+            if remaining:
+                self.failures[stock_code] = remaining - 1
+                raise ConnectionError("EGW00201 초당 거래건수 초과")
+        return StockInfo(
+            stock_code=stock_code,
+            stock_name=f"종목{stock_code}",
+            market_type='KOSPI',
+            sector=f"섹터{int(stock_code) % 3}",
+            industry="업종",
+            last_updated="2024-01-02 06:00:00",
+            data_source="FAKE_API",
+        )
+
+
+class CountingLimiter:
+    """공유 호출 제한 대체 (호출 횟수만 기록)"""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.count += 1
+
+
+@pytest.fixture
+def updater(tmp_path):
+    updater = StockUpdater(db_path=str(tmp_path / "stock_info.db"))
+    updater.configure(retry_backoff=0.001, retry_backoff_max=0.01)
+    yield updater
+    schedule.clear()
+
+
+CODES = [f"{i:06d}" for i in range(1, 41)]
+
+
+def test_concurrent_update_retries_failures(updater):
+    api = FakeStockAPI(failures={"000003": 2, "000007": 1})
+    limiter = CountingLimiter()
+    updater.set_rate_limiter(limiter)
+    snapshots = []
+
+    result = updater.update_stocks_concurrently(
+        CODES, fetch=api, max_workers=4, progress_callback=lambda p: snapshots.append(p.completed)
+    )
+
+    assert result.updated_stocks == len(CODES)
+    assert result.new_stocks == len(CODES)
+    assert result.errors == []
+    # 모든 조회(재시도 포함)가 공유 제한을 거침
+    assert limiter.count == len(api.calls) == len(CODES) + 3
+    assert snapshots == list(range(1, len(CODES) + 1))
+
+    progress = updater.get_update_progress()
+    assert progress['succeeded'] == len(CODES)
+    assert progress['retried'] == 3
+    assert progress['throughput'] > 0
+    assert updater.get_stock_info("000003").data_source == "FAKE_API"
+
+
+def test_exhausted_retries_are_reported(updater):
+    updater.configure(max_retries=2)
+    updater.set_rate_limiter(CountingLimiter())
+    api = FakeStockAPI(failures={"000005": 10})
+
+    result = updater.update_stocks_concurrently(CODES[:10], fetch=api, max_workers=3)
+
+    assert result.updated_stocks == 9
+    assert len(result.errors) == 1 and "000005" in result.errors[0]
+    assert api.calls.count("000005") == 3
+    assert updater.get_stock_info("000005") is None
+    assert updater.get_update_history()[0].updated_stocks == 9
+
+
+def test_rate_budget_spaces_calls_across_threads():
+    budget = RateBudget(min_interval=0.01)
+    stamps = []
+    lock = threading.Lock()
+
+    def call():
+        for _ in range(5):
+            budget.acquire()
+            with lock:
+                stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stamps.sort()
+    assert stamps[-1] - stamps[0] >= 0.01 * (len(stamps) - 1) * 0.9
@@ -0,0 +1,193 @@
+"""hantu_common 지표 벡터화 / 패널 계산 테스트
+
+Tests:
+    - 패널(날짜 × 종목) 계산 결과가 종목별 계산과 일치
+    - 날짜 인덱스가 다른 종목(상장 전, 거래정지)도 패널 결과가 종목별 계산과 일치
+    - 벡터화 WMA / ATR / OBV가 기존 pandas 구현과 일치
+    - VolumeProfile bincount 집계가 기존 구간 루프와 일치 (구간 경계에 맞는 가격)
+    - 패널 VolumeProfile이 종목별 결과와 일치
+    - 종목별 스칼라를 반환하는 분석기는 패널 입력을 명시적으로 거부
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import make_universe
+from hantu_common.indicators import (
+    ATR,
+    MACD,
+    OBV,
+    RSI,
+    BollingerBands,
+    MovingAverage,
+    RelativeVolumeStrength,
+    SlopeIndicator,
+    Stochastic,
+    VolumeClusterAnalyzer,
+    VolumePriceAnalyzer,
+    VolumeProfile,
+    make_panel,
+)
+
+
+@pytest.fixture(scope="module")
+def universe():
+    return make_universe(12, days=120)
+
+
+@pytest.fixture(scope="module")
+def panel(universe):
+    return make_panel(universe)
+
+
+def _as_tuple(result):
+    return result if isinstance(result, tuple) else (result,)
+
+
+@pytest.mark.parametrize("indicator, params", [
+    (MovingAverage, {"period": 10, "ma_type": "sma"}),
+    (MovingAverage, {"period": 10, "ma_type": "ema"}),
+    (MovingAverage, {"period": 10, "ma_type": "wma"}),
+    (MACD, {}),
+    (RSI, {"period": 14}),
+    (Stochastic, {}),
+    (BollingerBands, {"period": 20, "num_std": 2.0}),
+    (ATR, {"period": 14}),
+    (OBV, {}),
+])
+def test_panel_matches_per_series(universe, panel, indicator, params):
+    panel_result = _as_tuple(indicator(panel).calculate(**params))
+
+    for code, df in universe.items():
+        expected = _as_tuple(indicator(df).calculate(**params))
+        for series, frame in zip(expected, panel_result):
+            assert isinstance(frame, pd.DataFrame)
+            pd.testing.assert_series_equal(frame[code], series, check_names=False)
+
+
+@pytest.fixture(scope="module")
+def ragged_universe(universe):
+    """상장일이 늦은 종목, 거래정지 구간이 있는 종목이 섞인 유니버스"""
+    frames = dict(universe)
+    codes = list(frames)
+    frames[codes[0]] = frames[codes[0]].iloc[30:]
+    halted = frames[codes[1]]
+    frames[codes[1]] = pd.concat([halted.iloc[:50], halted.iloc[58:]])
+    both = frames[codes[2]].iloc[10:]
+    frames[codes[2]] = both.drop(both.index[40:45])
+    return frames
+
+
+@pytest.mark.parametrize("indicator, params", [
+    (MovingAverage, {"period": 10, "ma_type": "sma"}),
+    (MovingAverage, {"period": 10, "ma_type": "ema"}),
+    (MovingAverage, {"period": 10, "ma_type": "wma"}),
+    (MACD, {}),
+    (RSI, {"period": 14}),
+    (Stochastic, {}),
+    (BollingerBands, {"period": 20, "num_std": 2.0}),
+    (ATR, {"period": 14}),
+    (OBV, {}),
+])
+def test_ragged_panel_matches_per_series(ragged_universe, indicator, params):
+    panel = make_panel(ragged_universe)
+    panel_result = _as_tuple(indicator(panel).calculate(**params))
+
+    for code, df in ragged_universe.items():
+        expected = _as_tuple(indicator(df).calculate(**params))
+        for series, frame in zip(expected, panel_result):
+            column = frame[code]
+            pd.testing.assert_series_equal(column.reindex(df.index), series, check_names=False)
+            # 종목에 없는 날짜는 채우지 않음
+            assert column.drop(df.index).isna().all()
+
+
+def test_vectorized_kernels_match_pandas_reference(universe):
+    df = universe["000003"]
+    close, high, low, volume = df["close"], df["high"], df["low"], df["volume"]
+
+    weights = np.arange(1, 11)
+    wma = close.rolling(window=10).apply(lambda x: np.sum(weights * x) / weights.sum(), raw=True)
+    pd.testing.assert_series_equal(
+        MovingAverage(df).calculate(10, "wma"), wma, check_names=False, rtol=1e-12
+    )
+
+    ranges = pd.concat([
+        high - low, np.abs(high - close.shift()), np.abs(low - close.shift())
+    ], axis=1)
+    atr = ranges.max(axis=1).ewm(span=14, adjust=False).mean()
+    pd.testing.assert_series_equal(ATR(df).calculate(14), atr, check_names=False)
+
+    change = close.diff()
+    obv = pd.Series(index=df.index, dtype=float)
+    obv.iloc[0] = 0
+    obv[change > 0] = volume[change > 0]
+    obv[change < 0] = -volume[change < 0]
+    obv[change == 0] = 0
+    pd.testing.assert_series_equal(OBV(df).calculate(), obv.cumsum(), check_names=False)
+
+
+def _legacy_volume_by_price(data: pd.DataFrame, price_levels: int) -> pd.Series:
+    """기존 구간 루프 구현 (참조용)"""
+    price_min = data["low"].min()
+    price_max = data["high"].max()
+    price_step = (price_max - price_min) / price_levels
+    volume_by_price = pd.Series(0.0, index=np.arange(price_min, price_max, price_step))
+    for i in range(len(data)):
+        price_range = np.arange(data["low"].iloc[i], data["high"].iloc[i], price_step)
+        if len(price_range) > 0:
+            volume_per_level = data["volume"].iloc[i] / len(price_range)
+            for price in price_range:
+                if price in volume_by_price.index:
+                    volume_by_price[price] += volume_per_level
+    return volume_by_price
+
+
+def _grid_bars(n: int, seed: int, tick: float = 1.0) -> pd.DataFrame:
+    """가격이 구간 경계(tick 간격)에 맞는 봉 (최저 100, 최고 100 + 50 tick)"""
+    rng = np.random.default_rng(seed)
+    low = 100 + rng.integers(0, 45, n) * tick
+    high = low + rng.integers(0, 6, n) * tick
+    low[0], high[1] = 100, 100 + 50 * tick
+    return pd.DataFrame({
+        "open": low, "high": high, "low": low, "close": high,
+        "volume": rng.integers(1, 10_000, n),
+    })
+
+
+@pytest.mark.parametrize("tick", [1.0, 0.5])
+def test_volume_profile_matches_legacy_loop(tick):
+    df = _grid_bars(200, seed=int(tick * 10), tick=tick)
+
+    result = VolumeProfile(df).calculate(price_levels=50)
+    expected = _legacy_volume_by_price(df, 50)
+
+    pd.testing.assert_series_equal(result["volume_by_price"], expected)
+    assert result["poc"] == expected.idxmax()
+    assert result["volume_by_price"].sum() == pytest.approx(df["volume"][df["high"] > df["low"]].sum())
+
+
+def test_volume_profile_panel_matches_per_series(universe, panel):
+    result = VolumeProfile(panel).calculate(price_levels=40)
+
+    for code, df in universe.items():
+        expected = VolumeProfile(df).calculate(price_levels=40)
+        np.testing.assert_allclose(
+            result["volume_by_price"][code].to_numpy(),
+            expected["volume_by_price"].to_numpy()[:40],
+        )
+        np.testing.assert_allclose(result["price_levels"][code].to_numpy(), expected["volume_by_price"].index[:40])
+        assert result["poc"][code] == pytest.approx(expected["poc"])
+        value_area = result["price_levels"][code][result["value_area"][code]]
+        np.testing.assert_allclose(np.sort(value_area.to_numpy()), np.sort(expected["value_area"].index))
+
+
+@pytest.mark.parametrize("analyzer", [
+    SlopeIndicator, VolumePriceAnalyzer, RelativeVolumeStrength, VolumeClusterAnalyzer,
+])
+def test_scalar_analyzers_reject_panel(universe, panel, analyzer):
+    with pytest.raises(ValueError, match="패널 입력 미지원"):
+        analyzer(panel)
+    # 단일 종목 입력은 그대로 허용
+    analyzer(next(iter(universe.values())))
@@ -0,0 +1,98 @@
+"""배열 기반 호가창 테스트
+
+Tests:
+    - 배열 일괄 분석과 기존 종목별 analyze 결과 일치
+    - 프레임 배치 제자리 갱신
+    - 가중 중간가 / 깊이 기울기 / 호가벽 탐지
+"""
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import make_orderbooks
+from core.api.ws_frame_decoder import TR_ORDERBOOK, FrameBatch
+from core.indicators import OrderBookAnalyzer, OrderBookArrays, compute_metrics, detect_walls
+
+
+def _assert_same(expected, actual):
+    assert actual.stock_code == expected.stock_code
+    assert actual.bid_volume == expected.bid_volume
+    assert actual.ask_volume == expected.ask_volume
+    assert actual.total_volume == expected.total_volume
+    assert actual.signal == expected.signal
+    assert actual.confidence == expected.confidence
+    assert actual.imbalance_ratio == pytest.approx(expected.imbalance_ratio, abs=1e-12)
+    assert actual.bid_price_weighted == pytest.approx(expected.bid_price_weighted)
+    assert actual.ask_price_weighted == pytest.approx(expected.ask_price_weighted)
+    assert actual.spread == pytest.approx(expected.spread)
+
+
+@pytest.mark.parametrize("levels", [10, 5])
+def test_analyze_book_matches_per_symbol_analyze(levels):
+    books = make_orderbooks(40)
+    # 신호 구간별 케이스: 매수 우위, 매도 우위, 빈 호가, 잔여 레벨 부족
+    books.append(("900001", [(10000, 9000), (9990, 100)], [(10010, 100)]))
+    books.append(("900002", [(10000, 10)], [(10010, 500), (10020, 700)]))
+    books.append(("900003", [], []))
+    books.append(("900004", [(5000, 0)], [(5010, 0)]))
+
+    legacy = OrderBookAnalyzer(levels=levels)
+    vectorized = OrderBookAnalyzer(levels=levels)
+    book = OrderBookArrays(capacity=8)  # 용량 확장 경로 포함
+    for code, bids, asks in books:
+        book.update_levels(code, bids, asks)
+
+    results = vectorized.analyze_book(book)
+
+    assert [r.stock_code for r in results] == [code for code, _, _ in books]
+    for (code, bids, asks), actual in zip(books, results):
+        _assert_same(legacy.analyze(code, bids, asks), actual)
+    assert vectorized.get_signal_summary() == legacy.get_signal_summary()
+
+
+def test_update_batch_overwrites_rows_in_place():
+    book = OrderBookArrays(levels=10)
+    book.update_levels("005930", [(70000, 1)] * 10, [(70100, 1)] * 10)
+    bid_prices = book.bid_prices
+
+    batch = FrameBatch(TR_ORDERBOOK, 2, {
+        "stock_code": ("005930", "000660"),
+        "bid_prices": (tuple(range(70000, 69000, -100)), tuple(range(130000, 129000, -100))),
+        "bid_volumes": ((500,) * 10, (10,) * 10),
+        "ask_prices": (tuple(range(70100, 71100, 100)), tuple(range(130100, 131100, 100))),
+        "ask_volumes": ((100,) * 10, (900,) * 10),
+    })
+    rows = book.update_batch(batch)
+
+    assert rows.tolist() == [0, 1]
+    assert book.bid_prices is bid_prices
+    assert book.levels_of("005930")[0][1] == (69900, 500)
+
+    results = OrderBookAnalyzer().analyze_book(book, ["000660"])
+    assert len(results) == 1
+    assert results[0].signal.value == "strong_sell"
+
+
+def test_weighted_mid_slope_and_walls():
+    book = OrderBookArrays(levels=5)
+    book.update_levels(
+        "A",
+        [(1000, 250), (999, 100), (998, 100), (997, 1000), (996, 100)],
+        [(1001, 100), (1002, 100), (1003, 100), (1004, 100), (1005, 100)],
+    )
+    book.update_levels("B", [(2000, 10)], [])
+
+    metrics = compute_metrics(book)
+
+    # 매수 1호가 잔량이 많으면 중간가는 매도호가 쪽으로 이동
+    assert metrics["weighted_mid"][0] == pytest.approx((1000 * 100 + 1001 * 250) / 350)
+    assert metrics["weighted_mid"][1] == 0.0
+    assert metrics["bid_slope"][0] > 0 and metrics["ask_slope"][0] > 0
+    assert metrics["bid_slope"][1] == 0.0
+    assert np.isfinite(metrics["spread"]).all()
+
+    walls = detect_walls(book, multiple=3.0)
+    assert walls == [{
+        "stock_code": "A", "side": "bid", "level": 4,
+        "price": 997, "volume": 1000, "ratio": 10.0,
+    }]
@@ -0,0 +1,97 @@
+"""
+이상 감지 통계 분석기 테스트
+
+Tests:
+    - 겹쳐 전달되는 스냅샷/늦게 도착한 스냅샷은 히스토리에 한 번만, 시각 오름차순으로 기록
+    - 보관 기간 창 밖의 스냅샷은 통계에서 제외
+    - 히스토리 용량은 보관 기간과 스냅샷 간격으로 산정 (상한 적용)
+    - 상관관계 이상은 상삼각 쌍만 보고
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from core.market_monitor.anomaly_detector import (
+    MAX_HISTORY_CAPACITY,
+    AnomalyConfig,
+    AnomalyType,
+    StatisticalAnalyzer,
+)
+from core.market_monitor.market_monitor import MarketSnapshot, MarketStatus, StockSnapshot
+
+
+def _stock(code, change_rate, timestamp, volume_ratio=1.0):
+    return StockSnapshot(
+        stock_code=code, stock_name=code, timestamp=timestamp,
+        current_price=10000 * (1 + change_rate), previous_close=10000,
+        price_change=10000 * change_rate, price_change_rate=change_rate,
+        volume=1000, volume_avg_20d=1000, volume_ratio=volume_ratio,
+        market_cap=1e12, trading_value=1e9,
+    )
+
+
+def _snapshot(timestamp, changes):
+    return MarketSnapshot(
+        timestamp=timestamp, market_status=MarketStatus.NORMAL,
+        kospi_index=2500, kosdaq_index=800, kospi_change=0.0, kosdaq_change=0.0,
+        total_trading_value=1e12, advance_decline_ratio=1.0,
+        total_stocks=len(changes), rising_stocks=0, declining_stocks=0, unchanged_stocks=0,
+        limit_up_stocks=0, limit_down_stocks=0,
+        stock_snapshots=[_stock(code, change, timestamp) for code, change in changes.items()],
+    )
+
+
+def test_overlapping_and_late_snapshots_are_recorded_once_in_order():
+    analyzer = StatisticalAnalyzer(history_capacity=16)
+    base = datetime.now() - timedelta(hours=1)
+    snapshots = [_snapshot(base + timedelta(minutes=i), {"005930": i / 100}) for i in range(5)]
+
+    # detect_anomalies는 매번 최근 스냅샷 목록을 겹쳐 전달
+    analyzer.update_historical_data(snapshots[:3])
+    analyzer.update_historical_data(snapshots[1:5])
+    analyzer.update_historical_data([snapshots[2]])
+
+    timestamps = analyzer._price_history["005930"].column("timestamp")
+    assert len(timestamps) == 5
+    assert np.all(np.diff(timestamps) > 0)
+    assert len(analyzer._volume_history["005930"]) == 5
+    assert analyzer._get_price_statistics("005930")["mean_change"] == pytest.approx(0.02)
+
+
+def test_statistics_use_retention_window_only():
+    analyzer = StatisticalAnalyzer(history_capacity=16, retention_days=1)
+    now = datetime.now()
+    analyzer.update_historical_data([
+        _snapshot(now - timedelta(days=3), {"005930": 0.5}),
+        _snapshot(now - timedelta(hours=2), {"005930": 0.1}),
+        _snapshot(now - timedelta(hours=1), {"005930": 0.2}),
+    ])
+
+    stats = analyzer._get_price_statistics("005930")
+    assert stats["mean_change"] == pytest.approx(0.15)
+    assert stats["max_change"] == pytest.approx(0.2)
+    assert analyzer._get_price_statistics("000660") == {}
+
+
+def test_history_capacity_covers_retention_period():
+    assert StatisticalAnalyzer(retention_days=30)._history_capacity == 30 * 390
+    assert StatisticalAnalyzer(retention_days=30, snapshot_interval_seconds=1800)._history_capacity == 30 * 13
+    assert StatisticalAnalyzer(retention_days=30, snapshot_interval_seconds=1)._history_capacity == MAX_HISTORY_CAPACITY
+    assert StatisticalAnalyzer(history_capacity=100)._history_capacity == 100
+
+
+def test_correlation_break_reports_each_pair_once():
+    analyzer = StatisticalAnalyzer(history_capacity=16)
+    base = datetime.now() - timedelta(hours=1)
+    rng = np.random.default_rng(0)
+    snapshots = []
+    for i, x in enumerate(rng.normal(0, 0.01, 12)):
+        snapshots.append(_snapshot(base + timedelta(minutes=i), {"A": x, "B": x * 2, "C": -x}))
+
+    anomalies = analyzer.detect_correlation_anomalies(snapshots, AnomalyConfig(correlation_threshold=0.3))
+
+    assert all(a["type"] == AnomalyType.CORRELATION_BREAK for a in anomalies)
+    assert sorted((a["stock1"], a["stock2"]) for a in anomalies) == [("A", "C"), ("B", "C")]
+    assert all(a["correlation"] == pytest.approx(-1.0) for a in anomalies)
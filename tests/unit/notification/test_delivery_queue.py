@@ -0,0 +1,285 @@
+"""
+DeliveryQueue 테스트
+
+비동기 발송, 병합, 아웃박스 복원, 재시도(재시도 불가 실패 포함), 대상별 속도 제한을 검증합니다.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.notification.alert import Alert, AlertLevel, AlertType
+from core.notification.delivery_queue import (
+    DeliveryConfig,
+    DeliveryQueue,
+    DeliveryStatus,
+    TargetRateLimiter,
+)
+from core.notification.notification_manager import NotificationManager, RateLimitConfig
+from core.notification.notifier import MockNotifier, NotificationResult
+from core.utils.telegram_notifier import TelegramNotifier
+
+
+def _fast_rate_config():
+    return RateLimitConfig(per_chat_max_per_minute=0, per_chat_min_interval_seconds=0.0)
+
+
+class RecordingSender:
+    """발송 기록용 sender"""
+
+    def __init__(self, fail_times: int = 0, delay: float = 0.0):
+        self.messages = []
+        self.fail_times = fail_times
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, text, options):
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            if self.fail_times > 0:
+                self.fail_times -= 1
+                return NotificationResult(success=False, alert_id="x", error="boom")
+            self.messages.append((text, options))
+        return NotificationResult(success=True, alert_id="x")
+
+
+class TestDeliveryQueue:
+    """발송 큐 기본 동작"""
+
+    def test_submit_returns_immediately(self):
+        """느린 sender가 호출자를 막지 않음"""
+        sender = RecordingSender(delay=0.3)
+        queue = DeliveryQueue(DeliveryConfig(), _fast_rate_config())
+        queue.register_target("chat", sender)
+
+        start = time.time()
+        handle = queue.submit("chat", "hello")
+        assert time.time() - start < 0.1
+        assert not handle.done()
+
+        assert handle.wait(timeout=2)
+        assert handle.status == DeliveryStatus.DELIVERED
+        assert sender.messages[0][0] == "hello"
+        queue.stop()
+
+    def test_coalesce_burst_into_single_message(self):
+        """같은 병합 키 메시지는 하나로 발송"""
+        sender = RecordingSender()
+        config = DeliveryConfig(coalesce_window_seconds=0.2)
+        queue = DeliveryQueue(config, _fast_rate_config())
+        queue.register_target("chat", sender)
+
+        handles = [
+            queue.submit("chat", f"batch {i}", coalesce_key="summary")
+            for i in range(5)
+        ]
+        for handle in handles:
+            assert handle.wait(timeout=2)
+
+        assert len(sender.messages) == 1
+        text = sender.messages[0][0]
+        assert all(f"batch {i}" in text for i in range(5))
+        assert queue.get_stats()['coalesced_count'] == 4
+        queue.stop()
+
+    def test_coalesce_respects_max_chars(self):
+        """병합 메시지 길이 한도 초과 시 분할 발송"""
+        sender = RecordingSender()
+        config = DeliveryConfig(coalesce_window_seconds=0.0, coalesce_max_chars=25)
+        queue = DeliveryQueue(config, _fast_rate_config())
+        queue.register_target("chat", sender)
+
+        handles = [queue.submit("chat", "x" * 10, coalesce_key="k") for _ in range(4)]
+        for handle in handles:
+            assert handle.wait(timeout=2)
+
+        assert all(len(text) <= 25 for text, _ in sender.messages)
+        assert sum(text.count("x" * 10) for text, _ in sender.messages) == 4
+        queue.stop()
+
+    def test_retry_then_deliver(self):
+        """실패 시 백오프 후 재시도"""
+        sender = RecordingSender(fail_times=2)
+        config = DeliveryConfig(retry_base_delay=0.01, max_attempts=5)
+        queue = DeliveryQueue(config, _fast_rate_config())
+        queue.register_target("chat", sender)
+
+        handle = queue.submit("chat", "retry me")
+        assert handle.wait(timeout=3)
+        assert queue.get_stats()['retry_count'] == 2
+        queue.stop()
+
+    def test_gives_up_after_max_attempts(self):
+        """최대 시도 횟수 초과 시 실패 처리"""
+        sender = RecordingSender(fail_times=10)
+        config = DeliveryConfig(retry_base_delay=0.01, max_attempts=2)
+        queue = DeliveryQueue(config, _fast_rate_config())
+        queue.register_target("chat", sender)
+
+        handle = queue.submit("chat", "doomed")
+        assert not handle.wait(timeout=3)
+        assert handle.status == DeliveryStatus.FAILED
+        assert queue.get_stats()['failed_count'] == 1
+        queue.stop()
+
+    def test_non_retryable_failure_fails_immediately(self):
+        """발송기가 재시도 불가로 표시한 실패는 바로 실패 처리"""
+        calls = []
+
+        def sender(text, options):
+            calls.append(text)
+            return NotificationResult(
+                success=False, alert_id="x", error="HTTP 403", response={"retryable": False}
+            )
+
+        config = DeliveryConfig(retry_base_delay=0.01, max_attempts=5)
+        queue = DeliveryQueue(config, _fast_rate_config())
+        queue.register_target("chat", sender)
+
+        handle = queue.submit("chat", "blocked")
+        assert not handle.wait(timeout=3)
+        assert handle.status == DeliveryStatus.FAILED
+        assert calls == ["blocked"]
+        assert queue.get_stats()['retry_count'] == 0
+        queue.stop()
+
+    def test_outbox_survives_restart(self, tmp_path):
+        """미발송 메시지는 재시작 후 복원되어 발송"""
+        outbox = str(tmp_path / "outbox.jsonl")
+
+        # 대상 미등록 상태로 종료 → 발송되지 않고 아웃박스에 남음
+        first = DeliveryQueue(DeliveryConfig(outbox_path=outbox), _fast_rate_config())
+        first.submit("chat", "persist me")
+        first.stop(flush=False)
+
+        sender = RecordingSender()
+        second = DeliveryQueue(DeliveryConfig(outbox_path=outbox), _fast_rate_config())
+        assert second.get_stats()['recovered_count'] == 1
+        second.register_target("chat", sender)
+        assert second.flush(timeout=2)
+        assert sender.messages[0][0] == "persist me"
+        second.stop()
+
+        third = DeliveryQueue(DeliveryConfig(outbox_path=outbox), _fast_rate_config())
+        assert third.get_stats()['recovered_count'] == 0
+
+    def test_compaction_keeps_retried_items(self, tmp_path):
+        """최종 실패 처리 중 압축되어도 같은 그룹의 재시도 항목은 아웃박스에 남음"""
+        outbox = str(tmp_path / "outbox.jsonl")
+        config = DeliveryConfig(
+            outbox_path=outbox, compact_threshold=1, max_attempts=2,
+            coalesce_window_seconds=0.0, retry_base_delay=60.0,
+        )
+        queue = DeliveryQueue(config, _fast_rate_config())
+        first = queue.submit("chat", "last try", coalesce_key="k")
+        second = queue.submit("chat", "first try", coalesce_key="k")
+        queue.stop(flush=False)
+
+        # 첫 항목만 마지막 시도 → 한 그룹에서 최종 실패 1건 + 재시도 1건
+        queue._pending[0].attempts = 1
+        queue.register_target("chat", RecordingSender(fail_times=1))
+        with queue._cond:
+            group, _ = queue._take_ready_group(time.time())
+        queue._deliver_group(group)
+
+        assert first.status == DeliveryStatus.FAILED
+        assert not second.done()
+        restored = DeliveryQueue(DeliveryConfig(outbox_path=outbox), _fast_rate_config())
+        assert restored.get_stats()['recovered_count'] == 1
+
+    def test_compaction_keeps_concurrent_submissions(self, tmp_path):
+        """발송 완료 압축과 동시에 접수된 항목이 아웃박스에서 사라지지 않음"""
+        outbox = str(tmp_path / "outbox.jsonl")
+        config = DeliveryConfig(outbox_path=outbox, compact_threshold=1)
+        queue = DeliveryQueue(config, _fast_rate_config())
+        queue.register_target("chat", RecordingSender())
+
+        def submit_unroutable():
+            # 미등록 대상 → 발송되지 않고 아웃박스에 남아야 함
+            for i in range(200):
+                queue.submit("offline", f"keep {i}")
+
+        writer = threading.Thread(target=submit_unroutable)
+        writer.start()
+        handles = [queue.submit("chat", f"send {i}") for i in range(200)]
+        writer.join()
+        for handle in handles:
+            assert handle.wait(timeout=5)
+        queue.stop(flush=False)
+
+        restored = DeliveryQueue(DeliveryConfig(outbox_path=outbox), _fast_rate_config())
+        assert restored.get_stats()['recovered_count'] == 200
+
+
+class TestTelegramPostClassification:
+    """텔레그램 응답 코드별 재시도 여부"""
+
+    @pytest.mark.parametrize("status, retryable", [
+        (400, False), (403, False), (500, True), (502, True),
+    ])
+    def test_only_server_errors_are_retryable(self, tmp_path, status, retryable):
+        notifier = TelegramNotifier(config_file=str(tmp_path / "missing.json"))
+        response = MagicMock(status_code=status, text="error", headers={})
+        response.raise_for_status.side_effect = Exception(f"HTTP {status}")
+
+        with patch("core.utils.telegram_notifier.requests.post", return_value=response):
+            result = notifier._post_to_chat("chat", "hello", disable_notification=False)
+
+        assert not result.success
+        assert (result.response or {}).get("retryable", True) is retryable
+
+    def test_rate_limit_carries_retry_after(self, tmp_path):
+        notifier = TelegramNotifier(config_file=str(tmp_path / "missing.json"))
+        response = MagicMock(status_code=429, headers={"Retry-After": "7"})
+
+        with patch("core.utils.telegram_notifier.requests.post", return_value=response):
+            result = notifier._post_to_chat("chat", "hello", disable_notification=False)
+
+        assert result.response == {"retry_after": 7}
+
+
+class TestTargetRateLimiter:
+    """대상별 속도 제한"""
+
+    def test_min_interval(self):
+        limiter = TargetRateLimiter(max_per_minute=100, min_interval_seconds=1.0)
+        limiter.record("chat", 100.0)
+        assert limiter.next_allowed_at("chat", 100.2) == pytest.approx(101.0)
+        assert limiter.next_allowed_at("other", 100.2) == 100.2
+
+    def test_max_per_minute(self):
+        limiter = TargetRateLimiter(max_per_minute=2, min_interval_seconds=0.0)
+        limiter.record("chat", 0.0)
+        limiter.record("chat", 1.0)
+        assert limiter.next_allowed_at("chat", 2.0) == pytest.approx(60.0)
+        assert limiter.next_allowed_at("chat", 61.0) == 61.0
+
+
+class TestNotificationManagerAsync:
+    """NotificationManager 비동기 발송"""
+
+    def test_send_alert_nowait_returns_handles(self):
+        manager = NotificationManager(_fast_rate_config())
+        mock = MockNotifier()
+        manager.register_notifier('mock', mock)
+        manager.enable_async_delivery(DeliveryConfig())
+
+        alert = Alert(
+            alert_type=AlertType.SYSTEM_START,
+            level=AlertLevel.INFO,
+            title="시작",
+            message="시스템 시작",
+        )
+        handles = manager.send_alert(alert, wait=False)
+
+        assert set(handles) == {'mock'}
+        assert handles['mock'].wait(timeout=2)
+        assert "시작" in mock.get_sent_messages()[0]
+
+        # 큐잉된 알림도 중복 방지에 반영
+        duplicate = manager.send_alert(alert, wait=False)
+        assert duplicate['_duplicate'].status == DeliveryStatus.FILTERED
+        manager.flush_deliveries()
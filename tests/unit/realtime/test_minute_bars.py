@@ -0,0 +1,114 @@
+"""체결 틱 분봉 집계 테스트
+
+Tests:
+    - 합성 틱 리플레이 결과가 pandas 재표본화 기준과 일치 (1/3/5/15분)
+    - 시각 경계 마감과 늦은 틱 처리
+    - 경계 직후 도착한 직전 구간 틱은 마감 유예 안에 반영
+    - 체결 프레임/RealtimeProcessor 연동
+"""
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.api.ws_frame_decoder import TR_TRADE, FrameBatch
+from core.realtime.bars import MinuteBarAggregator
+from core.realtime.processor import RealtimeProcessor
+
+
+def _ticks(n=3000, seed=3):
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 2, 9, 0, 0)
+    seconds = np.sort(rng.integers(0, 60 * 60, n))
+    prices = 70000 + np.cumsum(rng.integers(-2, 3, n)) * 100
+    volumes = rng.integers(1, 500, n)
+    return [
+        (start + timedelta(seconds=int(s)), float(p), int(v))
+        for s, p, v in zip(seconds, prices, volumes)
+    ]
+
+
+@pytest.mark.parametrize("interval", [1, 3, 5, 15])
+def test_replay_matches_resampled_reference(interval):
+    ticks = _ticks()
+    aggregator = MinuteBarAggregator()
+    for ts, price, volume in ticks:
+        aggregator.on_tick("005930", price, volume, ts)
+    aggregator.advance(datetime(2024, 1, 2, 10, 0) + timedelta(seconds=aggregator.close_delay))
+
+    frame = pd.DataFrame(ticks, columns=["ts", "price", "volume"]).set_index("ts")
+    frame["value"] = frame["price"] * frame["volume"]
+    grouped = frame.resample(f"{interval}min")
+    expected = pd.DataFrame({
+        "open": grouped["price"].first(),
+        "high": grouped["price"].max(),
+        "low": grouped["price"].min(),
+        "close": grouped["price"].last(),
+        "volume": grouped["volume"].sum(),
+        "vwap": grouped["value"].sum() / grouped["volume"].sum(),
+    }).dropna()
+
+    bars = aggregator.get_bars("005930", interval)
+    assert [bar.start for bar in bars] == list(expected.index)
+    actual = aggregator.to_frame("005930", interval)
+    for column in ("open", "high", "low", "close", "volume"):
+        assert actual[column].tolist() == expected[column].tolist()
+    assert np.allclose(actual["vwap"], expected["vwap"])
+
+
+def test_clock_closes_bars_and_late_ticks_are_counted():
+    aggregator = MinuteBarAggregator(intervals=(1, 5), close_delay=0.0)
+    completed = []
+    aggregator.add_listener(completed.append)
+
+    aggregator.on_tick("000660", 130000, 10, datetime(2024, 1, 2, 9, 0, 30))
+    assert aggregator.advance(datetime(2024, 1, 2, 9, 0, 59)) == []
+
+    closed = aggregator.advance(datetime(2024, 1, 2, 9, 1, 0))
+    assert [(bar.interval, bar.close) for bar in closed] == [(1, 130000)]
+    assert completed == closed
+
+    # 이미 마감된 09:00 구간 틱은 1분봉에 반영하지 않음 (5분봉은 진행 중)
+    aggregator.on_tick("000660", 131000, 5, datetime(2024, 1, 2, 9, 0, 50))
+    assert aggregator.late_ticks == 1
+    assert aggregator.get_open_bar("000660", 5).volume == 15
+    assert aggregator.get_open_bar("000660", 1) is None
+
+
+def test_clock_waits_close_delay_for_ticks_after_boundary():
+    aggregator = MinuteBarAggregator(intervals=(1,), close_delay=2.0)
+
+    aggregator.on_tick("005930", 71000, 5, datetime(2024, 1, 2, 9, 0, 30))
+    assert aggregator.advance(datetime(2024, 1, 2, 9, 1, 0, 100000)) == []
+
+    # 09:00:59 체결이 경계 직후 도착
+    aggregator.on_tick("005930", 71100, 7, datetime(2024, 1, 2, 9, 0, 59))
+    assert aggregator.late_ticks == 0
+
+    closed = aggregator.advance(datetime(2024, 1, 2, 9, 1, 2))
+    assert [(bar.volume, bar.close) for bar in closed] == [(12, 71100)]
+
+
+def test_trade_frames_feed_processor_bars():
+    aggregator = MinuteBarAggregator(intervals=(1,), session_date=date(2024, 1, 2))
+    processor = RealtimeProcessor(bar_aggregator=aggregator)
+
+    processor.process_realtime_price(
+        {"stock_code": "005930", "current_price": 71000, "volume": 3, "timestamp": "090001"}
+    )
+    batch = FrameBatch(TR_TRADE, 2, {
+        "stock_code": ("005930", "005930"),
+        "timestamp": ("090045", "090102"),
+        "current_price": (71200, 71100),
+        "volume": (7, 1),
+    })
+    completed = aggregator.on_batch(batch)
+
+    assert len(completed) == 1
+    bars = processor.get_minute_bars("005930", interval=1)
+    assert bars == [completed[0].to_dict()]
+    assert bars[0]["time"] == "090000"
+    assert bars[0]["high"] == 71200 and bars[0]["volume"] == 10
+    assert bars[0]["vwap"] == pytest.approx((71000 * 3 + 71200 * 7) / 10)
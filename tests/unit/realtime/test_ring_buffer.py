@@ -0,0 +1,98 @@
+"""컬럼형 링 버퍼 테스트
+
+Tests:
+    - 덮어쓰기 후 최근 창 순서
+    - 복사 없는 읽기 전용 view
+    - 일괄 기록, 시각 기준 창
+    - RealtimeProcessor 가격 창 조회
+    - 체결 시각 형식 해석 (해석 불가 시 예외 없이 NaN)
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from core.realtime.processor import RealtimeProcessor
+from core.realtime.ring_buffer import ColumnarRingBuffer, TickRingBuffer, to_epoch_seconds
+
+
+def test_wraparound_keeps_latest_rows_in_order():
+    buffer = TickRingBuffer(capacity=4)
+    for i in range(10):
+        buffer.add(100 + i, i, 1000.0 + i)
+
+    window = buffer.window()
+    assert len(buffer) == 4
+    assert window.price.tolist() == [106, 107, 108, 109]
+    assert buffer.window(2).volume.tolist() == [8, 9]
+    assert buffer.window(10).timestamp.tolist() == [1006.0, 1007.0, 1008.0, 1009.0]
+    assert buffer.last("price") == 109
+
+
+def test_windows_are_read_only_views():
+    buffer = TickRingBuffer(capacity=8)
+    for i in range(5):
+        buffer.add(float(i), 1, float(i))
+
+    window = buffer.window(3)
+    assert np.shares_memory(window.price, buffer.window().price)
+    with pytest.raises(ValueError):
+        window.price[0] = 0.0
+
+
+def test_extend_and_since_match_appends():
+    fields = (("timestamp", "float64"), ("value", "float64"))
+    appended = ColumnarRingBuffer(5, fields)
+    extended = ColumnarRingBuffer(5, fields)
+    for i in range(7):
+        appended.append(float(i), i * 10.0)
+    extended.append(0.0, 0.0)
+    extended.extend(timestamp=np.arange(1, 7, dtype=float), value=np.arange(1, 7) * 10.0)
+
+    assert extended.column("value").tolist() == appended.column("value").tolist() == [20, 30, 40, 50, 60]
+    assert appended.since("timestamp", 4.0) == 2
+    assert list(appended.rows(1)) == [{"timestamp": 6.0, "value": 60.0}]
+
+
+def test_processor_exposes_price_window():
+    processor = RealtimeProcessor(buffer_maxlen=3)
+    for i in range(5):
+        processor.process_realtime_price(
+            {"stock_code": "005930", "current_price": 70000 + i, "volume": i, "timestamp": f"09000{i}"}
+        )
+
+    window = processor.get_price_window("005930")
+    assert window.price.tolist() == [70002, 70003, 70004]
+    assert window.timestamp[-1] - window.timestamp[0] == 2
+    assert processor.get_price_buffer("005930")[-1]["timestamp"] == "090004"
+    assert processor.get_price_window("000660") is None
+    assert processor.get_buffer_stats()["memory_bytes"] > 0
+
+
+def test_hhmmss_uses_reference_date():
+    reference = datetime(2024, 1, 2, 15, 0)
+    assert to_epoch_seconds("090130", reference) == datetime(2024, 1, 2, 9, 1, 30).timestamp()
+    assert to_epoch_seconds(reference) == reference.timestamp()
+
+
+def test_timestamp_formats_parse_without_raising():
+    reference = datetime(2024, 1, 2, 15, 0)
+    assert to_epoch_seconds("15:30:00", reference) == datetime(2024, 1, 2, 15, 30).timestamp()
+    assert to_epoch_seconds("20240101093000") == datetime(2024, 1, 1, 9, 30).timestamp()
+    assert to_epoch_seconds("2024-01-01T09:30:00") == datetime(2024, 1, 1, 9, 30).timestamp()
+    assert np.isnan(to_epoch_seconds(None))
+    assert np.isnan(to_epoch_seconds("99:99:99"))
+    assert np.isnan(to_epoch_seconds("abc"))
+
+
+def test_price_buffer_keeps_hhmmss_and_missing_timestamps():
+    processor = RealtimeProcessor()
+    for timestamp in ("090001", "15:30:00", None, "093000"):
+        processor.process_realtime_price(
+            {"stock_code": "005930", "current_price": 70000, "volume": 1, "timestamp": timestamp}
+        )
+
+    assert [row["timestamp"] for row in processor.get_price_buffer("005930")] == [
+        "090001", "153000", None, "093000"
+    ]
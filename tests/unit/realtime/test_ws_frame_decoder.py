@@ -0,0 +1,105 @@
+"""WebSocket 실시간 프레임 배치 디코더 테스트
+
+Tests:
+    - 다건 체결/호가 프레임 디코딩
+    - 기존 정규화(_normalize_kis_message)와 동일한 레코드
+    - 배치/레코드 콜백 디스패치
+    - 녹화 파일 재생 측정
+"""
+
+import asyncio
+
+from core.api.websocket_client import KISWebSocketClient
+from core.api.ws_frame_decoder import (
+    FrameDecoder,
+    FrameRecorder,
+    is_data_frame,
+    measure_replay,
+)
+
+
+def _trade_fields(code, price, volume):
+    fields = [code, "153000", str(price), "2", "500", "0.71"] + ["0"] * 40
+    fields[9] = str(volume)
+    fields[12] = "50000000"
+    fields[16:19] = ["70500", "71500", "70000"]
+    return fields
+
+
+def _frame(tr_id, records):
+    return f"0|{tr_id}|{len(records):03d}|" + "^".join("^".join(r) for r in records)
+
+
+def test_decodes_all_records_in_trade_frame():
+    records = [_trade_fields("005930", 71000, 10), _trade_fields("000660", 130000, 3)]
+    records[1][4] = ""  # 빈 필드 → 0
+
+    batch = FrameDecoder().decode(_frame("H0STCNT0", records))
+
+    assert len(batch) == 2
+    assert batch["stock_code"] == ("005930", "000660")
+    assert batch["current_price"] == (71000, 130000)
+    assert batch["change_price"] == (500, 0)
+    assert batch.array("volume").tolist() == [10, 3]
+
+    client = KISWebSocketClient(approval_key="test_key")
+    expected = [client._normalize_kis_message("H0STCNT0", "|".join(r)) for r in records]
+    assert list(batch.records()) == expected
+
+
+def test_decodes_orderbook_levels():
+    asks = [str(71000 + i * 100) for i in range(10)]
+    bids = [str(70900 - i * 100) for i in range(10)]
+    sizes = [str(100 * (i + 1)) for i in range(20)]
+    fields = ["005930", "153000", "0", *asks, *bids, *sizes, "5500", "11000"] + ["0"] * 15
+
+    batch = FrameDecoder().decode(_frame("H0STASP0", [fields, fields]))
+
+    assert batch.array("ask_prices").shape == (2, 10)
+    assert batch["bid_prices"][1][0] == 70900
+    assert batch["total_bid_volume"] == (11000, 11000)
+    record = next(batch.records())
+    assert record["ask_volumes"] == [100 * (i + 1) for i in range(10)]
+
+
+def test_rejects_non_data_and_malformed_frames():
+    decoder = FrameDecoder()
+
+    assert not is_data_frame('{"header":{"tr_id":"PINGPONG"}}')
+    assert is_data_frame("0|H0STCNT0|001|005930")
+    assert decoder.decode("1|H0STCNT0|001|encrypted") is None
+    assert decoder.decode("0|H0STCNT0|002|" + "^".join(["1"] * 45)) is None   # 건수와 필드 수 불일치
+    assert decoder.decode("0|H0STCNT0|001|005930^153000") is None           # 필드 부족
+    assert decoder.errors == 2
+
+
+def test_client_dispatches_batch_and_record_callbacks():
+    client = KISWebSocketClient(approval_key="test_key")
+    batches, records = [], []
+    client.add_batch_callback("H0STCNT0", batches.append)
+
+    async def on_record(record):
+        records.append(record["stock_code"])
+
+    client.add_callback("H0STCNT0", on_record)
+    frame = _frame("H0STCNT0", [_trade_fields("005930", 71000, 1), _trade_fields("000660", 1, 1)])
+
+    asyncio.run(client._handle_message(frame))
+
+    assert len(batches) == 1 and len(batches[0]) == 2
+    assert records == ["005930", "000660"]
+
+
+def test_replay_measures_recorded_frames(tmp_path):
+    path = tmp_path / "frames.txt"
+    with FrameRecorder(path) as recorder:
+        for _ in range(3):
+            recorder.write(_frame("H0STCNT0", [_trade_fields("005930", 71000, 1)] * 4))
+        recorder.write('{"header":{"tr_id":"PINGPONG"}}')
+
+    stats = measure_replay(path, repeat=1)
+
+    assert stats["frames"] == 4
+    assert stats["data_frames"] == 3
+    assert stats["records"] == 12
+    assert stats["records_per_sec"] > 0
@@ -0,0 +1,140 @@
+"""
+RollingMoments 단위 테스트
+
+증분 갱신 결과가 pandas 전체 재계산과 일치하는지 검증합니다.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.risk.correlation.rolling_moments import RollingMoments, ledoit_wolf_intensity
+from core.risk.correlation.correlation_matrix import CorrelationMatrix
+from core.hedging.futures_hedger import FuturesHedger
+
+
+@pytest.fixture
+def returns_df():
+    rng = np.random.default_rng(42)
+    base = rng.normal(0, 0.01, 200)
+    df = pd.DataFrame({
+        'A': base + rng.normal(0, 0.005, 200),
+        'B': base * 1.5 + rng.normal(0, 0.01, 200),
+        'C': rng.normal(0, 0.02, 200),
+    }, index=pd.date_range('2024-01-01', periods=200))
+    df.iloc[40:55, 2] = np.nan   # 쌍별 결측 처리 확인
+    return df
+
+
+def test_incremental_matches_full_recompute(returns_df):
+    moments = RollingMoments(window=30, recompute_interval=17)
+    for timestamp, row in returns_df.iterrows():
+        moments.update(row.to_dict(), timestamp)
+
+        window = returns_df.loc[:timestamp].tail(30)
+        if len(window) >= 5:
+            np.testing.assert_allclose(
+                moments.correlation().values, window.corr().values, atol=1e-10
+            )
+            np.testing.assert_allclose(
+                moments.covariance().values, window.cov().values, atol=1e-12
+            )
+
+
+def test_sync_appends_new_rows_and_rebuilds_on_mismatch(returns_df):
+    moments = RollingMoments(window=50)
+    moments.sync(returns_df.iloc[:100])
+    moments.sync(returns_df.iloc[:130])
+
+    assert moments.last_timestamp == returns_df.index[129]
+    pd.testing.assert_frame_equal(
+        moments.correlation(), returns_df.iloc[80:130].corr(), atol=1e-10
+    )
+
+    # 같은 구간의 다른 데이터가 들어오면 재구성
+    altered = returns_df.iloc[:130] * 2
+    altered['A'] = -altered['A']
+    moments.sync(altered)
+    assert moments.pair_correlation('A', 'B') == pytest.approx(
+        altered.iloc[80:130]['A'].corr(altered.iloc[80:130]['B'])
+    )
+
+
+def test_beta_and_shrinkage(returns_df):
+    moments = RollingMoments(window=60)
+    moments.sync(returns_df)
+    window = returns_df.tail(60)
+
+    beta, r_squared = moments.beta('B', 'A')
+    expected = window['B'].cov(window['A']) / window['A'].var()
+    assert beta == pytest.approx(expected)
+    assert r_squared == pytest.approx(window['A'].corr(window['B']) ** 2)
+
+    plain = moments.correlation()
+    shrunk = moments.correlation(shrinkage=0.5)
+    assert shrunk.loc['A', 'B'] == pytest.approx(plain.loc['A', 'B'] * 0.5)
+    assert np.allclose(np.diag(shrunk), 1.0)
+
+    intensity = ledoit_wolf_intensity(window[['A', 'B']].to_numpy())
+    assert 0.0 <= intensity < 0.5
+    lw = moments.covariance(['A', 'B'], shrinkage='ledoit_wolf')
+    assert abs(lw.loc['A', 'B']) < abs(moments.covariance(['A', 'B']).loc['A', 'B'])
+
+
+def test_consumers_share_engine_results(returns_df):
+    prices = {
+        code: pd.DataFrame({'close': 10000 * (1 + returns_df[code].fillna(0)).cumprod()})
+        for code in ('A', 'B')
+    }
+    market = prices['A']
+    engine = RollingMoments(window=60)
+
+    matrix = CorrelationMatrix(lookback_days=60, moments=engine)
+    corr = matrix.get_pairwise_correlation(prices, 'A', 'B')
+    returns = pd.DataFrame({c: p['close'].pct_change() for c, p in prices.items()}).tail(60)
+    assert corr == pytest.approx(returns['A'].corr(returns['B']))
+
+    hedger = FuturesHedger(moments=engine)
+    result = hedger.calculate_portfolio_beta(
+        {'A': {'weight': 0.5}, 'B': {'weight': 0.5}}, prices, market
+    )
+    assert result.stock_betas['A'] == pytest.approx(1.0)
+    beta_b, _ = hedger.calculate_stock_beta(returns['B'], returns['A'])
+    assert result.stock_betas['B'] == pytest.approx(beta_b)
+
+
+def test_default_consumers_do_not_share_engines(returns_df):
+    prices = {
+        code: pd.DataFrame({'close': 10000 * (1 + returns_df[code].fillna(0)).cumprod()})
+        for code in ('A', 'B', 'C')
+    }
+    other = {code: frame * np.linspace(1, 2, len(frame))[:, None] for code, frame in prices.items()}
+    first = CorrelationMatrix(lookback_days=60)
+    second = CorrelationMatrix(lookback_days=60)
+    assert first.moments is not second.moments
+
+    expected = first.get_pairwise_correlation(prices, 'A', 'B')
+    second.get_pairwise_correlation(other, 'A', 'B')
+    # 다른 소비자가 다른 가격을 적재해도 결과가 바뀌지 않음
+    assert first.get_pairwise_correlation(prices, 'A', 'B') == pytest.approx(expected)
+    assert first.moments.last_timestamp == second.moments.last_timestamp
+    assert first.moments.pair_correlation('A', 'B') != pytest.approx(second.moments.pair_correlation('A', 'B'))
+
+    hedgers = [FuturesHedger(), FuturesHedger()]
+    for hedger in hedgers:
+        hedger.calculate_portfolio_beta({'A': {'weight': 1.0}}, prices, prices['B'])
+    assert hedgers[0]._own_moments[60] is not hedgers[1]._own_moments[60]
+
+
+def test_calculate_rolling_matches_window_corr(returns_df):
+    prices = {
+        code: pd.DataFrame({'close': 10000 * (1 + returns_df[code].fillna(0)).cumprod()})
+        for code in ('A', 'B', 'C')
+    }
+    matrix = CorrelationMatrix(lookback_days=100)
+    rolling = matrix.calculate_rolling(prices, window=20)
+
+    returns = matrix._build_returns_df(prices)
+    expected = matrix._calculate_avg_correlation(returns.iloc[30:50].corr())
+    assert rolling.loc[returns.index[50], 'avg_correlation'] == pytest.approx(expected)
+    assert len(rolling) == len(returns) - 20
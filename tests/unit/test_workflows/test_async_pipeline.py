@@ -0,0 +1,134 @@
+"""
+비동기 파이프라인 스트리밍 테스트
+
+워커 프로세스의 종목 단위 스트리밍, 단계별 지표, 워커 오류 시 종료 처리를 검증합니다.
+"""
+
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from core.interfaces.trading import ScreeningResult
+from workflows.async_pipeline import AsyncPipeline
+
+
+class FakeScreener:
+    """짝수 종목만 통과시키는 스크리너"""
+
+    def comprehensive_screening(self, stock_codes):
+        return [
+            {
+                "stock_code": code,
+                "stock_name": f"종목{code}",
+                "overall_score": 90.0,
+                "overall_passed": int(code) % 2 == 0,
+            }
+            for code in stock_codes
+        ]
+
+
+class DataclassScreener:
+    """실제 StockScreener처럼 ScreeningResult를 반환 (짝수 종목 통과)"""
+
+    def comprehensive_screening(self, stock_codes):
+        return [
+            ScreeningResult(
+                stock_code=code,
+                stock_name=f"종목{code}",
+                passed=int(code) % 2 == 0,
+                score=80.0 + int(code) % 10,
+                details={},
+                signals=[],
+                timestamp=datetime.now(),
+            )
+            for code in stock_codes
+        ]
+
+
+class FailingScreener:
+    def comprehensive_screening(self, stock_codes):
+        raise RuntimeError("screening failed")
+
+
+class BrokenFactory:
+    def __call__(self):
+        raise RuntimeError("init failed")
+
+
+class FakeWatchlistManager:
+    def __init__(self, delay=0.0):
+        self.added = []
+        self.delay = delay
+
+    def list_stocks(self, p_status=None):
+        return [SimpleNamespace(stock_code="000000")]
+
+    def add_stock(self, **kwargs):
+        time.sleep(self.delay)
+        self.added.append(kwargs["p_stock_code"])
+        return True
+
+
+def _pipeline(factory, manager, **kwargs):
+    workflow = SimpleNamespace(max_workers=2, _get_all_stock_codes=lambda: [])
+    return AsyncPipeline(
+        screener_factory=factory,
+        phase1_workflow=workflow,
+        watchlist_manager=manager,
+        **kwargs,
+    )
+
+
+class TestAsyncPipelineStreaming:
+
+    def test_streams_passed_results_to_watchlist(self):
+        manager = FakeWatchlistManager()
+        pipeline = _pipeline(FakeScreener, manager, num_workers=3)
+        codes = [f"{i:06d}" for i in range(20)]
+
+        assert pipeline.run_async_pipeline(codes)
+
+        # 통과 종목(짝수) 중 기존 종목(000000)을 제외하고 추가
+        assert sorted(manager.added) == [c for c in codes if int(c) % 2 == 0][1:]
+        metrics = pipeline.get_metrics()
+        assert metrics["phase1"]["items_in"] == 20
+        assert metrics["phase1"]["items_out"] == 10
+        assert metrics["phase2"]["items_in"] == 10
+        assert metrics["watchlist"]["items_out"] == 9
+        assert metrics["end_to_end"]["added_to_watchlist"] == 9
+
+    def test_streams_screening_result_dataclasses(self):
+        """ScreeningResult 결과도 passed/score 기준으로 스트리밍되어 감시 리스트까지 전달"""
+        manager = FakeWatchlistManager()
+        pipeline = _pipeline(DataclassScreener, manager, num_workers=2)
+        codes = [f"{i:06d}" for i in range(10)]
+
+        assert pipeline.run_async_pipeline(codes)
+
+        assert sorted(manager.added) == ["000002", "000004", "000006", "000008"]
+        assert pipeline.get_metrics()["phase1"]["items_out"] == 5
+        assert all(stats["errors"] == 0 for stats in pipeline.worker_stats.values())
+
+    def test_backpressure_from_slow_consumer(self):
+        """느린 감시 리스트 단계가 앞 단계를 대기시킴"""
+        manager = FakeWatchlistManager(delay=0.02)
+        pipeline = _pipeline(FakeScreener, manager, num_workers=1,
+                             channel_size=1, results_queue_size=1)
+        codes = [f"{i:06d}" for i in range(2, 42, 2)]
+
+        assert pipeline.run_async_pipeline(codes)
+
+        assert len(manager.added) == 20
+        metrics = pipeline.get_metrics()
+        assert metrics["phase2"]["blocked_seconds"] > 0
+        assert metrics["phase1"]["blocked_seconds"] > 0
+
+    def test_worker_errors_do_not_hang(self):
+        """스크리닝/초기화 오류가 있어도 종료 신호로 파이프라인 종료"""
+        for factory in (FailingScreener, BrokenFactory()):
+            manager = FakeWatchlistManager()
+            pipeline = _pipeline(factory, manager, num_workers=2)
+
+            assert pipeline.run_async_pipeline(["000001", "000002", "000003"])
+            assert manager.added == []
+            assert len(pipeline.worker_stats) == 2
@@ -0,0 +1,99 @@
+"""
+구간별 지연 시간 히스토그램 및 요청형 프로파일링 테스트
+"""
+
+import pytest
+
+from core.utils.latency_metrics import (
+    LatencyConfig,
+    LatencyHistogram,
+    LatencyRegistry,
+    bucket_bounds,
+    bucket_index,
+    load_snapshots,
+    merge_snapshots,
+)
+from core.utils.profiling import get_profile_request, profile_batch, request_profile
+
+
+class TestLatencyHistogram:
+    """로그-선형 버킷 히스토그램"""
+
+    @pytest.mark.parametrize("value", [0, 1, 63, 64, 65, 127, 128, 1_000, 123_456, 3_600_000_000])
+    def test_bucket_contains_value(self, value):
+        low, high = bucket_bounds(bucket_index(value))
+        assert low <= value <= high
+        # 상대 오차 약 3% 이내
+        assert high - low <= max(0, value) / 32 + 1
+
+    def test_percentiles_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000.0)
+
+        summary = histogram.summary()
+        assert summary['count'] == 1000
+        assert summary['p50_ms'] == pytest.approx(500, rel=0.04)
+        assert summary['p99_ms'] == pytest.approx(990, rel=0.04)
+        assert summary['max_ms'] == pytest.approx(1000)
+        assert summary['mean_ms'] == pytest.approx(500.5)
+
+    def test_round_trip_and_merge(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        for _ in range(10):
+            a.record(0.002)
+            b.record(0.200)
+
+        merged = LatencyHistogram.from_dict(a.to_dict())
+        merged.merge(LatencyHistogram.from_dict(b.to_dict()))
+
+        assert merged.count == 20
+        assert merged.summary()['min_ms'] == pytest.approx(2.0)
+        assert merged.percentile(90) == pytest.approx(200, rel=0.04)
+
+
+class TestLatencyRegistry:
+    """저장소 샘플링/스냅샷"""
+
+    def test_disabled_registry_records_nothing(self):
+        registry = LatencyRegistry(LatencyConfig(enabled=False))
+        with registry.timer("api.call"):
+            pass
+        assert registry.names() == []
+
+    def test_snapshot_files_are_merged_per_stage(self, tmp_path):
+        for service, seconds in (("scheduler", 0.01), ("trading", 0.03)):
+            registry = LatencyRegistry(LatencyConfig(snapshot_dir=str(tmp_path), service_name=service))
+            with registry.timer("db.commit"):
+                pass
+            registry.record("db.commit", seconds)
+            assert registry.write_snapshot() is not None
+
+        snapshots = load_snapshots(str(tmp_path))
+        assert sorted(s['service'] for s in snapshots) == ["scheduler", "trading"]
+
+        merged = merge_snapshots(snapshots)
+        assert merged['db.commit']['count'] == 4
+        assert merged['db.commit']['max_ms'] == pytest.approx(30.0)
+
+
+class TestProfileBatch:
+    """요청형 배치 프로파일링"""
+
+    def test_no_request_is_noop(self, tmp_path):
+        with profile_batch("phase2.daily_update", str(tmp_path)) as output:
+            assert output is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_request_consumed_by_matching_batches(self, tmp_path):
+        request_profile("phase2.*", batches=2, profile_dir=str(tmp_path))
+
+        with profile_batch("phase1.screening", str(tmp_path)) as output:
+            assert output is None
+
+        for remaining in (1, None):
+            with profile_batch("phase2.daily_update", str(tmp_path)) as output:
+                sum(range(1000))
+            assert output.exists()
+            request = get_profile_request(str(tmp_path))
+            assert (request or {}).get('remaining') == remaining
@@ -0,0 +1,97 @@
+"""
+요청형 배치 프로파일링 테스트
+
+기본 디렉토리(프로젝트 루트 기준), 요청 등록/취소, 결과 목록과 출력,
+동시 배치 처리를 검증합니다.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from core.utils import latency_metrics, profiling
+from core.utils.profiling import (
+    cancel_profile,
+    format_profile,
+    get_profile_request,
+    list_profiles,
+    profile_batch,
+    request_profile,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+class TestDefaultDirectories:
+    """CLI와 수집 측이 같은 디렉토리를 사용"""
+
+    def test_defaults_are_under_project_root(self):
+        assert Path(latency_metrics.DEFAULT_SNAPSHOT_DIR) == PROJECT_ROOT / "data" / "metrics"
+        if 'HANTU_PROFILE_DIR' not in os.environ:
+            assert Path(profiling.DEFAULT_PROFILE_DIR) == PROJECT_ROOT / "data" / "profiling"
+
+    def test_defaults_do_not_depend_on_cwd(self, tmp_path):
+        env = {k: v for k, v in os.environ.items() if k != 'HANTU_PROFILE_DIR'}
+        env['PYTHONPATH'] = str(PROJECT_ROOT)
+        output = subprocess.run(
+            [sys.executable, "-c",
+             "from core.utils import latency_metrics, profiling;"
+             "print(profiling.DEFAULT_PROFILE_DIR); print(latency_metrics.DEFAULT_SNAPSHOT_DIR)"],
+            cwd=str(tmp_path), env=env, capture_output=True, text=True, check=True,
+        ).stdout.split()
+
+        assert [Path(line) for line in output[-2:]] == [
+            PROJECT_ROOT / "data" / "profiling",
+            PROJECT_ROOT / "data" / "metrics",
+        ]
+
+
+class TestProfileRequests:
+    """요청 등록 / 취소 / 결과 조회"""
+
+    def test_request_and_cancel(self, tmp_path):
+        request = request_profile("phase1.*", batches=0, profile_dir=str(tmp_path / "nested"))
+
+        assert request['remaining'] == 1
+        assert get_profile_request(str(tmp_path / "nested"))['target'] == "phase1.*"
+        assert cancel_profile(str(tmp_path / "nested"))
+        assert not cancel_profile(str(tmp_path / "nested"))
+        assert get_profile_request(str(tmp_path / "nested")) is None
+
+    def test_corrupt_request_is_ignored(self, tmp_path):
+        (tmp_path / profiling.REQUEST_FILE).write_text("{broken", encoding='utf-8')
+        assert get_profile_request(str(tmp_path)) is None
+
+        with profile_batch("phase2.daily_update", str(tmp_path)) as output:
+            assert output is None
+
+    def test_list_and_format_profiles(self, tmp_path):
+        assert list_profiles(str(tmp_path / "missing")) == []
+
+        request_profile("*", profile_dir=str(tmp_path))
+        with profile_batch(profiling.BATCH_PHASE1_SCREENING, str(tmp_path)) as newest:
+            sorted(range(1000), key=lambda x: -x)
+        older = tmp_path / "phase2.daily_update_20240101_090000.prof"
+        older.write_bytes(newest.read_bytes())
+        os.utime(older, (1, 1))
+
+        assert list_profiles(str(tmp_path)) == [newest, older]
+        assert "function calls" in format_profile(str(newest), limit=5)
+
+    def test_concurrent_batch_is_not_profiled(self, tmp_path):
+        request_profile("*", batches=2, profile_dir=str(tmp_path))
+        inner_outputs = []
+
+        with profile_batch("phase2.daily_update", str(tmp_path)) as outer:
+            thread = threading.Thread(target=lambda: inner_outputs.append(
+                profile_batch("phase1.screening", str(tmp_path)).__enter__()
+            ))
+            thread.start()
+            thread.join()
+
+        assert outer is not None and outer.exists()
+        assert inner_outputs == [None]
+        # 동시 배치는 요청을 소비하지 않음
+        assert get_profile_request(str(tmp_path))['remaining'] == 1
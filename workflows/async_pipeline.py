@@ -3,12 +3,16 @@
 비동기 파이프라인: Phase1과 Phase2 독립 실행
 - Phase1 결과를 실시간으로 Phase2에 전달
 - 큐(Queue) 기반 비동기 처리
+- Phase1 워커 프로세스가 종목 단위로 통과 결과를 스트리밍 (bounded 채널, backpressure)
+- 단계별 처리량/지연/대기 시간 지표 수집
 - 전체 처리 시간 최적화
 """
 
+import multiprocessing as mp
 import time
-from typing import List, Dict, Optional
-from queue import Queue, Empty
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Dict, Optional, Set
+from queue import Queue, Empty, Full
 import threading
 import sys
 import os
@@ -16,215 +20,363 @@ import os
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from workflows.phase1_parallel import Phase1ParallelWorkflow
+from workflows.phase1_parallel import (
+    Phase1ParallelWorkflow,
+    STREAM_DONE,
+    STREAM_RESULT,
+    stream_screening_worker,
+)
 from workflows.phase2_daily_selection import Phase2CLI
 from core.watchlist.watchlist_manager import WatchlistManager
 from core.utils.log_utils import get_logger
 
 logger = get_logger(__name__)
 
+
+@dataclass
+class StageMetrics:
+    """파이프라인 단계별 처리 지표"""
+    name: str
+    items_in: int = 0
+    items_out: int = 0
+    busy_seconds: float = 0.0     # 실제 처리에 사용한 시간
+    blocked_seconds: float = 0.0  # 다음 단계 큐가 가득 차 대기한 시간 (backpressure)
+    latency_total: float = 0.0    # 스크리닝 결과 생성 → 이 단계 처리 완료까지 지연 합
+    latency_max: float = 0.0
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    def record(self, p_busy: float, p_created_at: Optional[float] = None) -> None:
+        """항목 하나 처리 기록"""
+        self.items_in += 1
+        self.busy_seconds += p_busy
+        if p_created_at is not None:
+            latency = max(0.0, time.time() - p_created_at)
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+
+    def finish(self) -> None:
+        self.finished_at = time.time()
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return (self.finished_at or time.time()) - self.started_at
+
+    @property
+    def throughput_per_sec(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.items_in / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        return self.latency_total / self.items_in if self.items_in else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'items_in': self.items_in,
+            'items_out': self.items_out,
+            'busy_seconds': round(self.busy_seconds, 3),
+            'blocked_seconds': round(self.blocked_seconds, 3),
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+            'throughput_per_sec': round(self.throughput_per_sec, 2),
+            'avg_latency_seconds': round(self.avg_latency, 4),
+            'max_latency_seconds': round(self.latency_max, 4),
+        }
+
+
 class AsyncPipeline:
-    """비동기 파이프라인 클래스"""
-    
-    def __init__(self):
-        """초기화"""
-        self.phase1_workflow = Phase1ParallelWorkflow()
+    """비동기 파이프라인 클래스
+
+    Phase1 스크리닝은 워커 프로세스들이 종목 단위로 수행하며, 통과 종목을 프로세스 간
+    bounded 채널로 즉시 흘려보냅니다. Phase2 분석과 감시 리스트 업데이트는 각각의 스레드에서
+    동시에 소비하며, 각 단계 큐가 가득 차면 앞 단계가 대기하여 전체 속도가 조절됩니다.
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        channel_size: int = 100,
+        results_queue_size: int = 50,
+        screener_factory: Optional[Callable[[], Any]] = None,
+        phase1_workflow: Optional[Phase1ParallelWorkflow] = None,
+        watchlist_manager: Optional[WatchlistManager] = None,
+    ):
+        """초기화
+
+        Args:
+            num_workers: Phase1 스크리닝 워커 프로세스 수 (기본값: Phase1 워크플로우 설정)
+            channel_size: Phase1 → Phase2 프로세스 간 채널 크기
+            results_queue_size: Phase2 → 감시 리스트 큐 크기
+            screener_factory: 워커 프로세스에서 사용할 스크리너 생성 함수
+            phase1_workflow: Phase1 워크플로우 (종목 목록 조회용)
+            watchlist_manager: 감시 리스트 관리자
+        """
+        self.phase1_workflow = phase1_workflow or Phase1ParallelWorkflow()
         self.phase2_cli = Phase2CLI()
-        
+        self.watchlist_manager = watchlist_manager
+
+        self.num_workers = max(1, num_workers or self.phase1_workflow.max_workers)
+        self.screener_factory = screener_factory
+
         # 큐 설정
-        self.screening_queue = Queue(maxsize=100)  # Phase1 → Phase2 데이터 전달 큐
-        self.results_queue = Queue(maxsize=50)     # Phase2 결과 수집 큐
-        
+        self._mp_context = mp.get_context()
+        self.screening_queue = self._mp_context.Queue(maxsize=channel_size)  # Phase1 → Phase2 (프로세스 간)
+        self.results_queue = Queue(maxsize=results_queue_size)               # Phase2 → Watchlist
+        self._stop_event = self._mp_context.Event()
+        self._screened_counter = self._mp_context.Value('i', 0)
+        self._workers: List[mp.Process] = []
+
         # 상태 관리
         self.phase1_completed = False
         self.phase2_completed = False
         self.total_stocks = 0
         self.processed_stocks = 0
-        
-        logger.info("비동기 파이프라인 초기화 완료")
-    
+        self.selected_stocks: List[Dict] = []
+        self.added_count = 0
+
+        # 단계별 지표
+        self.metrics: Dict[str, StageMetrics] = {
+            "phase1": StageMetrics("phase1"),
+            "phase2": StageMetrics("phase2"),
+            "watchlist": StageMetrics("watchlist"),
+        }
+        self.worker_stats: Dict[int, Dict] = {}
+
+        logger.info(f"비동기 파이프라인 초기화 완료 (워커 {self.num_workers}개, 채널 {channel_size})")
+
     def run_async_pipeline(self, p_stock_list: Optional[List[str]] = None) -> bool:
         """비동기 파이프라인 실행
-        
+
         Args:
             p_stock_list: 스크리닝할 종목 리스트
-            
+
         Returns:
             실행 성공 여부
         """
         try:
             start_time = time.time()
             logger.info("=== 비동기 파이프라인 시작 ===")
-            
+
             # 종목 리스트 준비
             if not p_stock_list:
                 p_stock_list = self.phase1_workflow._get_all_stock_codes()
-            
+
             self.total_stocks = len(p_stock_list)
             logger.info(f"총 처리 종목: {self.total_stocks}개")
-            
-            # 스레드 생성
-            phase1_thread = threading.Thread(
-                target=self._run_phase1_streaming,
-                args=(p_stock_list,),
-                name="Phase1-Streaming"
-            )
-            
+
+            for stage in self.metrics.values():
+                stage.started_at = start_time
+
             phase2_thread = threading.Thread(
                 target=self._run_phase2_consumer,
                 name="Phase2-Consumer"
             )
-            
+
             watchlist_thread = threading.Thread(
                 target=self._run_watchlist_updater,
                 name="Watchlist-Updater"
             )
-            
-            # 모든 스레드 시작
+
             print("[시작] 비동기 파이프라인 시작")
-            print("├─ Phase1: 스크리닝 + 스트리밍")
+            print(f"├─ Phase1: 스크리닝 워커 {self.num_workers}개 (종목 단위 스트리밍)")
             print("├─ Phase2: 실시간 분석")
             print("└─ Watchlist: 실시간 업데이트")
-            
-            phase1_thread.start()
+
+            # Phase1 워커 프로세스 시작
+            self._start_phase1_workers(p_stock_list)
             phase2_thread.start()
             watchlist_thread.start()
-            
+
             # 진행률 모니터링
             self._monitor_progress()
-            
-            # 모든 스레드 완료 대기
-            phase1_thread.join()
+
+            # 모든 단계 완료 대기
             phase2_thread.join()
             watchlist_thread.join()
-            
+            self._join_workers()
+
             total_time = time.time() - start_time
-            
+
             # 결과 요약
             self._print_pipeline_summary(total_time)
-            
+
             return True
-            
+
         except Exception as e:
             logger.error(f"비동기 파이프라인 실행 오류: {e}", exc_info=True)
+            self._stop_event.set()
+            self._join_workers()
             return False
-    
-    def _run_phase1_streaming(self, p_stock_list: List[str]):
-        """Phase1 스트리밍 실행"""
-        try:
-            logger.info("Phase1 스트리밍 시작")
-            
-            # 배치 크기 설정
-            batch_size = 10
-            (len(p_stock_list) + batch_size - 1) // batch_size
-            
-            # 배치별 처리 및 스트리밍
-            for i in range(0, len(p_stock_list), batch_size):
-                batch_num = i // batch_size + 1
-                batch_stocks = p_stock_list[i:i + batch_size]
-                
-                # 배치 스크리닝
-                batch_results = self.phase1_workflow.screener.comprehensive_screening(batch_stocks)
-                
-                if batch_results:
-                    # 결과를 큐에 스트리밍
-                    for result in batch_results:
-                        self.screening_queue.put(result)
-                        self.processed_stocks += 1
-                    
-                    passed_count = len([r for r in batch_results if r["overall_passed"]])
-                    print(f"[전송] Phase1 배치 {batch_num}: {len(batch_results)}개 처리, {passed_count}개 통과 → 스트리밍")
-            
-            # Phase1 완료 신호
-            self.screening_queue.put({"END_OF_PHASE1": True})
-            self.phase1_completed = True
-            logger.info("Phase1 스트리밍 완료")
-            
-        except Exception as e:
-            logger.error(f"Phase1 스트리밍 오류: {e}", exc_info=True)
-            self.phase1_completed = True
-    
+
+    def get_metrics(self) -> Dict[str, Dict]:
+        """단계별 처리 지표 조회"""
+        metrics = {name: stage.to_dict() for name, stage in self.metrics.items()}
+        metrics["end_to_end"] = {
+            'total_stocks': self.total_stocks,
+            'screened': self.processed_stocks,
+            'selected': len(self.selected_stocks),
+            'added_to_watchlist': self.added_count,
+            'elapsed_seconds': round(self.metrics["watchlist"].elapsed_seconds, 3),
+        }
+        return metrics
+
+    def _start_phase1_workers(self, p_stock_list: List[str]) -> None:
+        """Phase1 스크리닝 워커 프로세스 시작 (종목을 워커별로 균등 분배)"""
+        worker_count = max(1, min(self.num_workers, len(p_stock_list)))
+
+        for worker_id in range(worker_count):
+            shard = p_stock_list[worker_id::worker_count]
+            process = self._mp_context.Process(
+                target=stream_screening_worker,
+                args=(
+                    worker_id,
+                    shard,
+                    self.screening_queue,
+                    self.screener_factory,
+                    self._screened_counter,
+                    self._stop_event,
+                ),
+                name=f"Phase1-Worker-{worker_id}",
+                daemon=True,
+            )
+            process.start()
+            self._workers.append(process)
+
+        logger.info(f"Phase1 스트리밍 워커 {worker_count}개 시작")
+
+    def _join_workers(self, p_timeout: float = 5.0) -> None:
+        """워커 프로세스 종료 대기 (응답 없으면 강제 종료)"""
+        for process in self._workers:
+            process.join(timeout=p_timeout)
+            if process.is_alive():
+                logger.warning(f"{process.name} 응답 없음 - 강제 종료")
+                process.terminate()
+                process.join(timeout=1)
+
+    def _put_downstream(self, p_item: Dict, p_stage: StageMetrics) -> None:
+        """다음 단계 큐에 전달 (가득 차면 대기 시간을 backpressure로 기록)"""
+        wait_start = time.time()
+        self.results_queue.put(p_item)
+        p_stage.blocked_seconds += time.time() - wait_start
+        p_stage.items_out += 1
+
     def _run_phase2_consumer(self):
         """Phase2 실시간 분석 소비자"""
+        phase1 = self.metrics["phase1"]
+        phase2 = self.metrics["phase2"]
+
         try:
             logger.info("Phase2 실시간 분석 시작")
-            
-            processed_count = 0
-            selected_stocks = []
-            
-            while True:
+
+            done_workers: Set[int] = set()
+            worker_count = len(self._workers)
+
+            while len(done_workers) < worker_count:
                 try:
-                    # 큐에서 데이터 가져오기
-                    result = self.screening_queue.get(timeout=5)
-                    
-                    # 종료 신호 확인
-                    if isinstance(result, dict) and result.get("END_OF_PHASE1"):
-                        break
-                    
-                    # 스크리닝 통과 종목만 Phase2 분석
-                    if result.get("overall_passed"):
-                        # 가격 매력도 분석
-                        attractiveness = self._analyze_price_attractiveness(result)
-                        
-                        if attractiveness and attractiveness.get("price_attractiveness", 0) > 70:
-                            selected_stocks.append(attractiveness)
-                            print(f"[선정] Phase2 선정: {result['stock_name']} (매력도: {attractiveness['price_attractiveness']:.1f})")
-                    
-                    processed_count += 1
-                    
-                    # 결과를 watchlist 큐에 전달
-                    self.results_queue.put(result)
-                    
+                    kind, worker_id, payload, created_at = self.screening_queue.get(timeout=1)
                 except Empty:
-                    if self.phase1_completed:
-                        break
+                    # 종료 신호 없이 죽은 워커는 완료로 간주
+                    dead = {
+                        i for i, process in enumerate(self._workers)
+                        if i not in done_workers and not process.is_alive()
+                    }
+                    if dead:
+                        logger.warning(f"Phase1 워커 비정상 종료: {sorted(dead)}")
+                        done_workers |= dead
                     continue
-            
-            # Phase2 완료 처리
-            self.results_queue.put({"END_OF_PHASE2": True})
-            self.phase2_completed = True
-            
-            logger.info(f"Phase2 분석 완료 - 처리: {processed_count}개, 선정: {len(selected_stocks)}개")
-            
+
+                if kind == STREAM_DONE:
+                    done_workers.add(worker_id)
+                    self.worker_stats[worker_id] = payload
+                    phase1.blocked_seconds += payload.get("blocked_seconds", 0.0)
+                    continue
+
+                if kind != STREAM_RESULT:
+                    continue
+
+                phase1.items_out += 1
+
+                # 가격 매력도 분석
+                analyze_start = time.time()
+                attractiveness = self._analyze_price_attractiveness(payload)
+                phase2.record(time.time() - analyze_start, created_at)
+
+                if attractiveness and attractiveness.get("price_attractiveness", 0) > 70:
+                    self.selected_stocks.append(attractiveness)
+                    print(f"[선정] Phase2 선정: {payload['stock_name']} (매력도: {attractiveness['price_attractiveness']:.1f})")
+
+                # 결과를 watchlist 큐에 전달 (생성 시각 유지)
+                self._put_downstream({**payload, "_created_at": created_at}, phase2)
+
+            self.phase1_completed = True
+            phase1.items_in = self.processed_stocks = self._screened_counter.value
+            phase1.finish()
+            logger.info(f"Phase1 스트리밍 완료 - 워커 통계: {self.worker_stats}")
+
         except Exception as e:
             logger.error(f"Phase2 분석 오류: {e}", exc_info=True)
+            self._stop_event.set()
+            self.phase1_completed = True
+
+        finally:
+            # Phase2 완료 처리
+            self.results_queue.put({"END_OF_PHASE2": True})
             self.phase2_completed = True
-    
+            phase2.finish()
+
+            logger.info(
+                f"Phase2 분석 완료 - 처리: {phase2.items_in}개, "
+                f"선정: {len(self.selected_stocks)}개"
+            )
+
     def _run_watchlist_updater(self):
         """감시 리스트 실시간 업데이트"""
+        stage = self.metrics["watchlist"]
+
         try:
             logger.info("감시 리스트 실시간 업데이트 시작")
-            
-            watchlist_manager = WatchlistManager()
-            added_count = 0
-            
+
+            watchlist_manager = self.watchlist_manager or WatchlistManager()
+            existing_codes = {
+                s.stock_code for s in watchlist_manager.list_stocks(p_status="active")
+            }
+
             while True:
                 try:
                     # 결과 큐에서 데이터 가져오기
                     result = self.results_queue.get(timeout=5)
-                    
-                    # 종료 신호 확인
-                    if isinstance(result, dict) and result.get("END_OF_PHASE2"):
-                        break
-                    
-                    # 통과 종목을 감시 리스트에 추가
-                    if result.get("overall_passed"):
-                        success = self._add_to_watchlist(watchlist_manager, result)
-                        if success:
-                            added_count += 1
-                            if added_count % 10 == 0:
-                                print(f"[기록] 감시 리스트: {added_count}개 종목 추가됨")
-                    
                 except Empty:
                     if self.phase2_completed:
                         break
                     continue
-            
-            logger.info(f"감시 리스트 업데이트 완료 - 총 {added_count}개 종목 추가")
-            
+
+                # 종료 신호 확인
+                if result.get("END_OF_PHASE2"):
+                    break
+
+                update_start = time.time()
+                created_at = result.pop("_created_at", None)
+
+                # 통과 종목을 감시 리스트에 추가
+                if result.get("overall_passed") and result["stock_code"] not in existing_codes:
+                    success = self._add_to_watchlist(watchlist_manager, result)
+                    if success:
+                        existing_codes.add(result["stock_code"])
+                        self.added_count += 1
+                        stage.items_out += 1
+                        if self.added_count % 10 == 0:
+                            print(f"[기록] 감시 리스트: {self.added_count}개 종목 추가됨")
+
+                stage.record(time.time() - update_start, created_at)
+
+            logger.info(f"감시 리스트 업데이트 완료 - 총 {self.added_count}개 종목 추가")
+
         except Exception as e:
             logger.error(f"감시 리스트 업데이트 오류: {e}", exc_info=True)
-    
+
+        finally:
+            stage.finish()
+
     def _analyze_price_attractiveness(self, p_result: Dict) -> Optional[Dict]:
         """가격 매력도 분석"""
         try:
@@ -258,14 +410,8 @@ class AsyncPipeline:
             stock_code = p_result["stock_code"]
             stock_name = p_result["stock_name"]
             overall_score = p_result["overall_score"]
-            
-            # 중복 확인
-            existing_stocks = p_watchlist_manager.list_stocks(p_status="active")
-            existing_codes = [s.stock_code for s in existing_stocks]
-            
-            if stock_code in existing_codes:
-                return False
-            
+
+            # 중복 확인은 호출 측에서 보유한 종목 코드 집합으로 수행
             # 감시 리스트에 추가
             success = p_watchlist_manager.add_stock(
                 p_stock_code=stock_code,
@@ -291,11 +437,16 @@ class AsyncPipeline:
             
             while not (self.phase1_completed and self.phase2_completed):
                 if self.total_stocks > 0:
+                    self.processed_stocks = self._screened_counter.value
                     phase1_progress = (self.processed_stocks / self.total_stocks) * 100
+                    try:
+                        channel_size = self.screening_queue.qsize()
+                    except NotImplementedError:  # macOS는 multiprocessing.Queue.qsize 미지원
+                        channel_size = -1
                     print(f"\r[진행중] Phase1: {phase1_progress:.1f}% | "
-                          f"Queue: {self.screening_queue.qsize()} | "
+                          f"Channel: {channel_size} | "
                           f"Results: {self.results_queue.qsize()}", end="")
-                
+
                 time.sleep(1)
             
             print("\n[완료] 모든 단계 완료")
@@ -312,6 +463,11 @@ class AsyncPipeline:
             print(f"├─ 처리 속도: {self.total_stocks / p_total_time:.1f}종목/초")
             print(f"├─ Phase1 완료: {'[완료]' if self.phase1_completed else '[실패]'}")
             print(f"└─ Phase2 완료: {'[완료]' if self.phase2_completed else '[실패]'}")
+
+            # 단계별 처리 지표
+            print("\n[단계별 지표]")
+            for name, stage in self.get_metrics().items():
+                print(f"├─ {name}: {stage}")
             
             # 순차 처리 대비 성능 향상
             sequential_time = 15 * 60  # 기존 15분
@@ -331,11 +487,12 @@ def main():
     parser = argparse.ArgumentParser(description="비동기 파이프라인: Phase1-Phase2 독립 실행")
     parser.add_argument('--stocks', nargs='+', help='스크리닝할 종목 코드 리스트')
     parser.add_argument('--queue-size', type=int, default=100, help='큐 크기')
-    
+    parser.add_argument('--workers', type=int, help='Phase1 워커 프로세스 수')
+
     args = parser.parse_args()
-    
+
     # 파이프라인 실행
-    pipeline = AsyncPipeline()
+    pipeline = AsyncPipeline(num_workers=args.workers, channel_size=args.queue_size)
     
     try:
         success = pipeline.run_async_pipeline(args.stocks)
@@ -67,6 +67,7 @@ from workflows.phase1_watchlist import Phase1Workflow
 from workflows.phase2_daily_selection import Phase2CLI
 from core.watchlist.watchlist_manager import WatchlistManager
 from core.utils.log_utils import get_logger, setup_logging
+from core.utils.latency_metrics import get_latency_registry
 
 # 텔레그램 알람 추가
 import json
@@ -92,7 +93,6 @@ from workflows.scheduler import (
     get_scheduler_core,
     get_notification_service,
 )
-from workflows.scheduler.batch_utils import get_incomplete_batches, get_batch_completion_status
 
 # 자동 매매 엔진 추가
 
@@ -271,91 +271,51 @@ class IntegratedScheduler:
             logger.warning(f"캐시 초기화 실패: {e} - 서비스 계속", exc_info=True)
             return False
 
-    def _run_distributed_batch(self, batch_index: int):
-        """Phase 2 분산 배치 실행 (07:00-08:30, 5분 간격)
+    def _run_phase2_work_queue(self, from_recovery: bool = False) -> bool:
+        """Phase 2 작업 큐 실행 (07:00, 평일)
 
-        Args:
-            batch_index: 배치 번호 (0-17)
+        감시 리스트 전체를 하나의 우선순위 작업 큐로 처리합니다.
+        종목 단위 체크포인트가 남아 있으면 중단된 지점부터 재개합니다.
 
-        처리 흐름:
-        1. 배치 시작 로깅
-        2. DailyUpdater.run_daily_update(distributed_mode=True, batch_index=batch_index)
-        3. 성공/실패 로깅
-        4. 에러 시 텔레그램 알림 (부분 실패는 다음 배치 진행)
+        Args:
+            from_recovery: 재시작 복구에서 호출되었는지 여부
 
-        특수 처리:
-        - batch_index == 0: "Phase 2 시작" 텔레그램 알림
-        - batch_index == 17: "Phase 2 완료" 텔레그램 알림 (총 선정 종목 수 포함)
+        Returns:
+            성공 여부
         """
         try:
-            logger.info(f"[배치] 배치 {batch_index}/17 시작")
-
-            # 첫 번째 배치: Phase 2 시작 알림
-            if batch_index == 0:
-                logger.info("=" * 50)
-                logger.info("[배치] Phase 2 분산 배치 실행 시작")
-                self._safe_send_telegram(
-                    f"[배치] *Phase 2 시작*\n\n"
-                    f"• 총 배치: 18개\n"
-                    f"• 예상 완료: 08:30",
-                    "normal"
-                )
-
-            # 배치 실행
-            success = self._v_daily_updater.run_daily_update(
-                distributed_mode=True,
-                batch_index=batch_index
+            logger.info("=" * 50)
+            logger.info(f"[Phase 2] 작업 큐 실행 시작 (복구: {from_recovery})")
+            self._safe_send_telegram(
+                "[배치] *Phase 2 시작*\n\n"
+                "• 방식: 우선순위 작업 큐\n"
+                f"• {'재시작 복구 (체크포인트 재개)' if from_recovery else '정규 실행'}",
+                "normal"
             )
 
-            if success:
-                logger.info(f"배치 {batch_index}/17 완료")
+            success = self._v_daily_updater.run_work_queue_update()
 
-                # 마지막 배치: Phase 2 완료 알림
-                if batch_index == 17:
-                    logger.info("=" * 50)
-                    logger.info("Phase 2 분산 배치 실행 완료")
-
-                    # 선정 결과 파일 확인
-                    today_str = datetime.now().strftime("%Y%m%d")
-                    selection_file = Path(f"data/daily_selection/daily_selection_{today_str}.json")
-
-                    total_selected = 0
-                    if selection_file.exists():
-                        try:
-                            with open(selection_file, "r", encoding="utf-8") as f:
-                                selection_data = json.load(f)
-                                total_selected = len(selection_data.get("selected_stocks", []))
-                        except Exception as e:
-                            logger.warning(f"선정 결과 파일 읽기 실패: {e}")
-
-                    self._safe_send_telegram(
-                        f"*Phase 2 완료*\n\n"
-                        f"• 총 선정 종목: {total_selected}개\n"
-                        f"• 소요 시간: 90분\n"
-                        f"• 저장: DB (`selection_results` 테이블)",
-                        "normal"
-                    )
+            if success:
+                self._v_last_daily_update = datetime.now()
+                logger.info("Phase 2 작업 큐 완료")
             else:
-                logger.error(f"배치 {batch_index}/17 실패")
-
-                # 배치 실패 알림
+                logger.error("Phase 2 작업 큐 실패")
                 self._safe_send_telegram(
-                    f"*배치 {batch_index} 실패*\n\n"
-                    f"• 에러: 배치 실행 실패\n"
-                    f"• 다음 배치 진행 중...",
+                    "*Phase 2 실패*\n\n"
+                    "• 에러: 작업 큐 실행 실패\n"
+                    "• 재시작 시 체크포인트에서 재개됩니다",
                     "high"
                 )
+            return success
 
         except Exception as e:
-            logger.error(f"배치 {batch_index}/17 실행 오류: {e}", exc_info=True)
-
-            # 에러 알림
+            logger.error(f"Phase 2 작업 큐 실행 오류: {e}", exc_info=True)
             self._safe_send_telegram(
-                f"*배치 {batch_index} 실패*\n\n"
-                f"• 에러: {str(e)[:50]}...\n"
-                f"• 다음 배치 진행 중...",
+                f"*Phase 2 실패*\n\n"
+                f"• 에러: {str(e)[:50]}...",
                 "high"
             )
+            return False
 
     def start_scheduler(self):
         """통합 스케줄러 시작"""
@@ -389,21 +349,15 @@ class IntegratedScheduler:
         schedule.every().friday.at("06:00").do(self._run_daily_screening)
 
         # ========================================
-        # Phase 2: 분산 배치 실행 (07:00-08:30, 5분 간격, 평일만)
+        # Phase 2: 작업 큐 실행 (07:00 시작, 평일만)
         # ========================================
-        # 18개 배치를 5분 간격으로 스케줄링
-        batch_times = [
-            "07:00", "07:05", "07:10", "07:15", "07:20", "07:25", "07:30", "07:35", "07:40",
-            "07:45", "07:50", "07:55", "08:00", "08:05", "08:10", "08:15", "08:20", "08:25"
-        ]
-
-        for batch_index, time_str in enumerate(batch_times):
-            # 평일에만 실행
-            schedule.every().monday.at(time_str).do(self._run_distributed_batch, batch_index)
-            schedule.every().tuesday.at(time_str).do(self._run_distributed_batch, batch_index)
-            schedule.every().wednesday.at(time_str).do(self._run_distributed_batch, batch_index)
-            schedule.every().thursday.at(time_str).do(self._run_distributed_batch, batch_index)
-            schedule.every().friday.at(time_str).do(self._run_distributed_batch, batch_index)
+        # 고정 5분 슬롯 18개 대신 감시 리스트 전체를 우선순위 작업 큐로 처리
+        # (API Rate Limit 예산이 허용하는 만큼 빨리 완료, 종목 단위 체크포인트)
+        schedule.every().monday.at("07:00").do(self._run_phase2_work_queue)
+        schedule.every().tuesday.at("07:00").do(self._run_phase2_work_queue)
+        schedule.every().wednesday.at("07:00").do(self._run_phase2_work_queue)
+        schedule.every().thursday.at("07:00").do(self._run_phase2_work_queue)
+        schedule.every().friday.at("07:00").do(self._run_phase2_work_queue)
 
         # Phase 3: 자동 매매 시작 (장 시작 시간, 주말 제외)
         schedule.every().monday.at("09:00").do(self._start_auto_trading)
@@ -491,6 +445,10 @@ class IntegratedScheduler:
 
         self._v_scheduler_running = True
         self._v_start_time = datetime.now()  # 시작 시간 기록
+
+        # 구간별 지연 시간 스냅샷 주기 기록 (api-server에서 조회)
+        get_latency_registry().start_snapshot_writer("scheduler")
+
         self._v_scheduler_thread = threading.Thread(
             target=self._run_scheduler_loop, daemon=True
         )
@@ -501,7 +459,7 @@ class IntegratedScheduler:
         print("├─ 캐시 초기화: 매일 00:00")
         print("├─ Redis 헬스 체크: 매일 00:05, 12:00")
         print("├─ 일간 스크리닝: 매일 06:00")
-        print("├─ 일일 업데이트: 07:00-08:30 (18개 배치, 5분 간격)")
+        print("├─ 일일 업데이트: 07:00~ (우선순위 작업 큐, Rate Limit 예산 내 최대 속도)")
         print("├─ 자동 매매 시작: 매일 09:00 (평일)")
         print("├─ 자동 매매 중지: 매일 15:30 (평일)")
         print("├─ 매매 헬스체크: 장 시간 중 30분마다 (평일)")
@@ -526,6 +484,14 @@ class IntegratedScheduler:
 
             notifier = get_telegram_notifier()
             if notifier.is_enabled():
+                # 스케줄러 작업이 텔레그램 응답 지연에 묶이지 않도록 비동기 발송 활성화
+                # (미발송 메시지는 아웃박스에 남아 재시작 후 재전송, 배치 요약은 병합)
+                from core.config.settings import DATA_DIR
+                from core.notification.delivery_queue import DeliveryConfig
+
+                # 실행 위치(CWD)와 무관하게 프로젝트 data 디렉토리 사용
+                outbox_path = DATA_DIR / "notifications" / "telegram_outbox.jsonl"
+                notifier.enable_async_delivery(DeliveryConfig(outbox_path=str(outbox_path)))
                 success = notifier.send_scheduler_started()
                 if success:
                     logger.info("스케줄러 시작 알림 전송 완료")
@@ -545,7 +511,7 @@ class IntegratedScheduler:
 
         복구 시나리오 (평일만):
         - 06:00~07:00: Phase 1 실행
-        - 07:00~09:00: Phase 2 미완료 배치 실행
+        - 07:00~09:00: Phase 2 작업 큐 재개 (종목 단위 체크포인트)
         - 09:00~15:30: 매매 실행
         - 15:30~16:00: 시장 마감 정리 실행
         - 16:00~17:00: 시장 마감 정리 + 일일 성과 분석 실행
@@ -564,7 +530,6 @@ class IntegratedScheduler:
             # 시간대 정의
             screening_time = now.replace(hour=6, minute=0, second=0, microsecond=0)
             phase2_start = now.replace(hour=7, minute=0, second=0, microsecond=0)
-            phase2_end = now.replace(hour=8, minute=30, second=0, microsecond=0)
             market_open = now.replace(hour=9, minute=0, second=0, microsecond=0)
             market_close = now.replace(hour=15, minute=30, second=0, microsecond=0)
             cleanup_time = now.replace(hour=16, minute=0, second=0, microsecond=0)
@@ -633,29 +598,29 @@ class IntegratedScheduler:
                 self._run_daily_screening()
                 recovered_tasks.append("일간 스크리닝")
 
-            # 2. Phase 2 미완료 배치 복구 (07:00~08:30 시간대 재시작)
+            # 2. Phase 2 미완료 작업 복구 (07:00~09:00 시간대 재시작)
             if phase2_start <= now < market_open:
-                # 파일 기반으로 미완료 배치 확인
-                completed, incomplete = get_batch_completion_status(now.date())
+                # 종목 단위 체크포인트 기준으로 중단 지점부터 재개
+                phase2_done = self._check_today_selection_in_db(now.date()) or (
+                    selection_file.exists()
+                    and datetime.fromtimestamp(selection_file.stat().st_mtime) >= phase2_start
+                )
 
-                if incomplete:
+                if not phase2_done:
+                    checkpoint = self._v_daily_updater.get_phase2_checkpoint(now)
+                    completed_count = len(checkpoint.completed_codes())
                     logger.info(
-                        f"Phase 2 미완료 배치 감지: {len(incomplete)}개 배치 복구 필요"
+                        f"Phase 2 미완료 감지: 체크포인트 완료 종목 {completed_count}개 - 재개"
                     )
-                    logger.info(f"완료된 배치: {completed}")
-                    logger.info(f"미완료 배치: {incomplete}")
-                    print(f"[배치] Phase 2 복구: {len(incomplete)}개 배치 실행...")
-
-                    for batch_id in incomplete:
-                        logger.info(f"배치 {batch_id} 복구 실행 중...")
-                        self._run_distributed_batch(batch_id)
+                    print(f"[배치] Phase 2 복구: 완료 {completed_count}개 종목 이후부터 재개...")
 
+                    self._run_phase2_work_queue(from_recovery=True)
                     recovered_tasks.append(
-                        f"Phase 2 배치 {len(incomplete)}개 (배치 ID: {incomplete})"
+                        f"Phase 2 작업 큐 재개 (완료 종목 {completed_count}개 건너뜀)"
                     )
                 else:
-                    logger.info("Phase 2 모든 배치 완료됨 - 복구 불필요")
-                    print("[배치] Phase 2 모든 배치 완료 - 복구 스킵")
+                    logger.info("Phase 2 완료됨 - 복구 불필요")
+                    print("[배치] Phase 2 완료 - 복구 스킵")
 
             # 3. 자동 매매 (09:00~15:30 장중이면 시작)
             if now >= market_open and now < market_close:
@@ -761,6 +726,8 @@ class IntegratedScheduler:
             notifier = get_telegram_notifier()
             if notifier.is_enabled():
                 success = notifier.send_scheduler_stopped(reason)
+                # 대기 중인 알림을 모두 발송한 뒤 큐 중지
+                notifier.disable_async_delivery(timeout=10)
                 if success:
                     logger.info(f"스케줄러 종료 알림 전송 완료: {reason}")
                     print("[알림] 텔레그램 종료 알림 전송됨")
@@ -774,6 +741,7 @@ class IntegratedScheduler:
         # 스케줄러 중지
         self._v_scheduler_running = False
         schedule.clear()
+        get_latency_registry().stop_snapshot_writer()
 
         if self._v_scheduler_thread and self._v_scheduler_thread.is_alive():
             self._v_scheduler_thread.join(timeout=5)
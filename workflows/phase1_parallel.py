@@ -10,7 +10,9 @@ import sys
 import os
 import time
 import multiprocessing as mp
-from typing import List, Dict, Optional
+from dataclasses import asdict, is_dataclass
+from queue import Full
+from typing import Any, Callable, List, Dict, Optional
 from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
@@ -57,6 +59,103 @@ def process_batch(batch_info: Dict) -> List[Dict]:
         print(f"[오류] 배치 {batch_num} 처리 오류: {e}")
         return []
 
+# 스트리밍 채널 메시지 종류: (종류, 워커 ID, 내용, 생성 시각)
+STREAM_RESULT = "result"
+STREAM_DONE = "done"
+
+
+def _put_with_backpressure(p_channel, p_item, p_stop_event=None, p_timeout: float = 0.5) -> bool:
+    """채널이 빌 때까지 대기하며 전달 (중단 신호 시 포기)
+
+    Returns:
+        전달 성공 여부
+    """
+    while True:
+        try:
+            p_channel.put(p_item, timeout=p_timeout)
+            return True
+        except Full:
+            if p_stop_event is not None and p_stop_event.is_set():
+                return False
+
+
+def _screening_payload(p_result) -> Dict:
+    """스크리닝 결과(ScreeningResult) → 채널 전달용 딕셔너리
+
+    소비 단계가 읽는 overall_passed/overall_score 키를 passed/score에서 채웁니다.
+    """
+    if isinstance(p_result, dict):
+        return p_result
+    payload = asdict(p_result) if is_dataclass(p_result) else dict(vars(p_result))
+    payload["overall_passed"] = bool(payload.get("passed"))
+    payload["overall_score"] = float(payload.get("score") or 0.0)
+    return payload
+
+
+def stream_screening_worker(
+    p_worker_id: int,
+    p_stock_codes: List[str],
+    p_channel,
+    p_screener_factory: Optional[Callable[[], Any]] = None,
+    p_progress_counter=None,
+    p_stop_event=None,
+) -> None:
+    """종목 단위 스트리밍 스크리닝 워커 (별도 프로세스에서 실행)
+
+    배치 전체가 끝날 때까지 기다리지 않고, 통과 종목이 나올 때마다 채널에 바로 전달합니다.
+    채널이 가득 차면 전달이 블록되어 스크리닝 속도가 소비 단계에 맞춰집니다 (backpressure).
+
+    Args:
+        p_worker_id: 워커 번호
+        p_stock_codes: 담당 종목 코드 리스트
+        p_channel: 프로세스 간 bounded 채널 (multiprocessing.Queue)
+        p_screener_factory: 스크리너 생성 함수 (기본값: StockScreener)
+        p_progress_counter: 스크리닝 완료 종목 수 공유 카운터 (multiprocessing.Value)
+        p_stop_event: 중단 신호 (multiprocessing.Event)
+    """
+    stats = {"screened": 0, "passed": 0, "errors": 0, "blocked_seconds": 0.0}
+
+    try:
+        screener = (p_screener_factory or StockScreener)()
+
+        for stock_code in p_stock_codes:
+            if p_stop_event is not None and p_stop_event.is_set():
+                break
+
+            try:
+                results = screener.comprehensive_screening([stock_code])
+                payloads = [_screening_payload(result) for result in results or []]
+            except Exception as e:
+                stats["errors"] += 1
+                print(f"[오류] 워커 {p_worker_id} 종목 {stock_code} 스크리닝 오류: {e}")
+                continue
+
+            stats["screened"] += 1
+            if p_progress_counter is not None:
+                with p_progress_counter.get_lock():
+                    p_progress_counter.value += 1
+
+            for result in payloads:
+                if not result.get("overall_passed"):
+                    continue
+                stats["passed"] += 1
+                put_start = time.time()
+                if not _put_with_backpressure(
+                    p_channel, (STREAM_RESULT, p_worker_id, result, put_start), p_stop_event
+                ):
+                    return
+                stats["blocked_seconds"] += time.time() - put_start
+
+    except Exception as e:
+        stats["errors"] += 1
+        print(f"[오류] 스트리밍 워커 {p_worker_id} 오류: {e}")
+
+    finally:
+        # 종료 신호는 항상 전달 (소비자는 모든 워커의 종료 신호로 Phase1 완료 판단)
+        _put_with_backpressure(
+            p_channel, (STREAM_DONE, p_worker_id, stats, time.time()), p_stop_event
+        )
+
 class Phase1ParallelWorkflow:
     """Phase 1 병렬 처리 워크플로우 클래스"""
     
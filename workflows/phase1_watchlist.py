@@ -11,6 +11,7 @@ import sys
 import os
 import json
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Optional
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
@@ -21,6 +22,7 @@ from core.watchlist.stock_screener_parallel import ParallelStockScreener
 from core.watchlist.watchlist_manager import WatchlistManager
 from core.watchlist.evaluation_engine import EvaluationEngine
 from core.utils.log_utils import get_logger
+from core.utils.profiling import profile_batch, BATCH_PHASE1_SCREENING
 from core.utils.telegram_notifier import get_telegram_notifier
 from core.utils.partial_result import PartialResult, save_failed_items
 from core.strategy.sector import SectorMap
@@ -90,6 +92,7 @@ class Phase1Workflow:
             logger.error(f"run_screening 오류: {e}", exc_info=True)
             return None
 
+    @profile_batch(BATCH_PHASE1_SCREENING)
     def run_full_screening(self, p_stock_list: Optional[List[str]] = None, p_send_notification: bool = True) -> bool:
         """전체 스크리닝 실행 (배치 처리 최적화)
 
@@ -111,6 +114,12 @@ class Phase1Workflow:
                 p_stock_list = self._get_all_stock_codes()
             
             logger.info(f"스크리닝 대상 종목 수: {len(p_stock_list)}개")
+
+            # 재무 스냅샷 1회 로드 (이후 종목별 조회는 메모리에서 처리)
+            try:
+                self._get_fundamentals_cache().preload()
+            except Exception as _e:
+                logger.warning(f"재무 스냅샷 사전 로드 실패 (종목별 조회 시 재시도): {_e}")
             
             # 병렬 처리 설정
             _v_batch_size = self._v_parallel_workers * 10  # 워커 수의 10배로 배치 크기 설정
@@ -603,7 +612,9 @@ class Phase1Workflow:
             return None
 
     def _load_fundamental_data(self, p_stock_code: str, p_stock_dir) -> Dict:
-        """DB에서 종목 재무 정보 로드 (파일 폴백)
+        """재무 스냅샷에서 종목 재무 정보 조회
+
+        거래일 스냅샷(DB 우선, 파일 폴백)은 실행당 한 번 로드되어 모든 워커가 공유합니다.
 
         Args:
             p_stock_code: 종목 코드
@@ -613,63 +624,34 @@ class Phase1Workflow:
             재무 데이터 딕셔너리
         """
         try:
-            # 1. DB에서 먼저 조회 시도
-            from core.api.krx_client import KRXClient
-            krx_client = KRXClient()
-            db_data = krx_client.load_fundamentals_from_db(p_stock_code)
-
-            if db_data:
-                logger.debug(f"DB에서 재무 데이터 로드 성공: {p_stock_code}")
-                return {
-                    'per': float(db_data.get('per', 0)) if db_data.get('per') is not None else 0.0,
-                    'pbr': float(db_data.get('pbr', 0)) if db_data.get('pbr') is not None else 0.0,
-                    'eps': float(db_data.get('eps', 0)) if db_data.get('eps') is not None else 0.0,
-                    'bps': float(db_data.get('bps', 0)) if db_data.get('bps') is not None else 0.0,
-                    'roe': float(db_data.get('roe', 0)) if db_data.get('roe') is not None else 0.0,
-                    'div': float(db_data.get('div', 0)) if db_data.get('div') is not None else 0.0,
-                }
-
-            # 2. DB에 없으면 파일에서 폴백 로드
-            logger.debug(f"DB에 재무 데이터 없음, 파일에서 로드 시도: {p_stock_code}")
-            import pandas as pd
-
-            # 가장 최신 재무 데이터 파일 찾기
-            _v_fundamental_files = list(p_stock_dir.glob("krx_fundamentals_*.json"))
-
-            if not _v_fundamental_files:
-                logger.debug(f"재무 데이터 파일 없음, 기본값 사용: {p_stock_code}")
-                return {}
-
-            _v_latest_file = max(_v_fundamental_files, key=lambda x: x.name)
+            _v_record = self._get_fundamentals_cache(p_stock_dir).get(p_stock_code)
 
-            # JSON 파일 로드
-            _v_df = pd.read_json(_v_latest_file)
-
-            if _v_df.empty:
-                return {}
-
-            # 종목 코드로 검색
-            _v_stock_data = _v_df[_v_df['ticker'] == p_stock_code]
-
-            if _v_stock_data.empty:
+            if not _v_record:
                 logger.debug(f"종목 {p_stock_code} 재무 데이터 없음")
                 return {}
 
-            _v_row = _v_stock_data.iloc[0]
-
             return {
-                'per': float(_v_row.get('PER', 0)) if pd.notna(_v_row.get('PER')) else 0.0,
-                'pbr': float(_v_row.get('PBR', 0)) if pd.notna(_v_row.get('PBR')) else 0.0,
-                'eps': float(_v_row.get('EPS', 0)) if pd.notna(_v_row.get('EPS')) else 0.0,
-                'bps': float(_v_row.get('BPS', 0)) if pd.notna(_v_row.get('BPS')) else 0.0,
-                'roe': float(_v_row.get('ROE', 0)) if pd.notna(_v_row.get('ROE')) else 0.0,
-                'div': float(_v_row.get('DIV', 0)) if pd.notna(_v_row.get('DIV')) else 0.0,
+                _v_key: float(_v_record[_v_key]) if _v_record.get(_v_key) is not None else 0.0
+                for _v_key in ('per', 'pbr', 'eps', 'bps', 'roe', 'div')
             }
 
         except Exception as e:
             logger.warning(f"재무 데이터 로드 실패 - {p_stock_code}: {e}")
             return {}
-    
+
+    @staticmethod
+    def _get_fundamentals_cache(p_stock_dir=None):
+        """재무 스냅샷 캐시 (기본 데이터 디렉토리면 프로세스 공유 캐시)"""
+        from core.database.fundamentals_snapshot import (
+            DEFAULT_STOCK_DIR,
+            FundamentalsSnapshotCache,
+            get_fundamentals_snapshot_cache,
+        )
+
+        if p_stock_dir is None or Path(p_stock_dir).resolve() == DEFAULT_STOCK_DIR.resolve():
+            return get_fundamentals_snapshot_cache()
+        return FundamentalsSnapshotCache(stock_dir=p_stock_dir)
+
     def _load_top_stocks_from_results(self, p_top_count: int = 100) -> List[Dict]:
         """스크리닝 결과 파일에서 상위 종목 로드
 